@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+틱 -> 봉 집계 처리량 벤치마크
+
+2,000종목 체결 틱을 시간순으로 생성해 TickBarAggregator(1분/5분/일봉)에 넣고
+단일 코어 처리량을 측정합니다. 키움 체결 이벤트(dict) 경로와 on_ticks 경로를 비교하고,
+완성 봉 DB 저장(flush) 시간도 함께 측정합니다.
+
+사용법:
+    python scripts/benchmarks/bar_aggregator_benchmark.py --symbols 2000 --ticks 1000000
+"""
+
+import sys
+import time
+import argparse
+import tempfile
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import numpy as np  # noqa: E402
+
+from src.data.bar_aggregator import TickBarAggregator  # noqa: E402
+from src.data.connection_manager import connection_manager  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description="틱 -> 봉 집계 처리량 측정")
+    parser.add_argument("--symbols", type=int, default=2000, help="종목 수")
+    parser.add_argument("--ticks", type=int, default=1_000_000, help="틱 수")
+    parser.add_argument("--minutes", type=int, default=60, help="틱을 분산할 장중 시간 (분)")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    symbols = [f"{i:06d}" for i in range(args.symbols)]
+    symbol_idx = rng.integers(0, args.symbols, args.ticks)
+    seconds = np.sort(rng.integers(0, args.minutes * 60, args.ticks))
+    prices = rng.integers(1000, 100000, args.ticks)
+    volumes = rng.integers(1, 500, args.ticks)
+
+    tick_symbols = [symbols[i] for i in symbol_idx]
+    timestamps = (seconds + 9 * 3600).tolist()
+    events = [
+        {"type": "0B", "item": s, "values": {"10": f"+{p}", "15": f"{v}", "20": f"{9 + t // 3600:02d}{t // 60 % 60:02d}{t % 60:02d}"}}
+        for s, p, v, t in zip(tick_symbols, prices.tolist(), volumes.tolist(), seconds.tolist())
+    ]
+
+    aggregator = TickBarAggregator(max_symbols=args.symbols)
+    start = time.perf_counter()
+    aggregator.on_ticks(tick_symbols, timestamps, prices.tolist(), volumes.tolist())
+    aggregator.close_all()
+    ticks_elapsed = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / "bars.db")
+        aggregator = TickBarAggregator(db_path=db_path, max_symbols=args.symbols)
+        start = time.perf_counter()
+        for i in range(0, len(events), 512):
+            aggregator.on_events(events[i:i + 512])
+        aggregator.close_all()
+        events_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        flushed = aggregator.flush()
+        flush_elapsed = time.perf_counter() - start
+        connection_manager.close_all(db_path)
+
+    print(f"\n{args.symbols}종목, {args.ticks:,}틱, 완성 봉 {aggregator.stats['bars']:,}개")
+    print(f"on_ticks : {args.ticks / ticks_elapsed:>12,.0f} 틱/초")
+    print(f"on_events: {args.ticks / events_elapsed:>12,.0f} 틱/초 (512건 배치)")
+    print(f"flush    : {flushed:,}행 {flush_elapsed * 1000:.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
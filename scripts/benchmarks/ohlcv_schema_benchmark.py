@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+stock_ohlcv 스키마 벤치마크 (기존 TEXT 날짜 테이블 vs 압축 WITHOUT ROWID 스키마)
+
+원본 DB를 임시 디렉토리에 복사하여 기존 스키마에서 범위 조회를 측정하고,
+복사본을 migrate_to_compact()로 변환한 뒤 같은 조회를 다시 측정합니다. 원본은 변경하지 않습니다.
+
+측정 항목:
+    - DB 파일 크기
+    - 종목 범위 조회: 100종목 x 1년 load_panel (종목별 DataFrame)
+    - 전 종목 패널: 1년 load_panel(as_array=True)
+    - 단면 조회: 최근 거래일 하루의 전 종목 행
+    - 거래일 목록: 전체 DISTINCT 날짜
+
+사용법:
+    python scripts/benchmarks/ohlcv_schema_benchmark.py --db data/trading.db
+"""
+
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import pandas as pd  # noqa: E402
+
+from src.data.connection_manager import connection_manager, get_pooled_connection  # noqa: E402
+from src.data.ohlcv_schema import migrate_to_compact, ohlcv_source  # noqa: E402
+from src.data.panel_loader import load_panel  # noqa: E402
+
+
+def timed(func, repeat: int) -> float:
+    """repeat회 실행 중 최소 시간 (초)"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_queries(db_path: str, repeat: int) -> dict:
+    conn = get_pooled_connection(db_path)
+    ohlcv = ohlcv_source(conn)
+    last_date = conn.execute("SELECT MAX(date) FROM stock_ohlcv").fetchone()[0]
+    start = (pd.Timestamp(last_date) - pd.Timedelta(days=365)).strftime("%Y-%m-%d")
+    symbols = [row[0] for row in conn.execute("SELECT DISTINCT symbol FROM stock_ohlcv LIMIT 100")]
+
+    def cross_section():
+        conn.execute(
+            f"SELECT symbol, close, volume FROM {ohlcv.table} WHERE {ohlcv.date_column} = ?",
+            (ohlcv.date_param(last_date),),
+        ).fetchall()
+
+    return {
+        "symbols_1y": timed(lambda: load_panel(symbols, start, last_date, db_path=db_path), repeat),
+        "panel_1y": timed(lambda: load_panel(None, start, last_date, db_path=db_path, as_array=True), repeat),
+        "cross_section": timed(cross_section, repeat),
+        "distinct_days": timed(
+            lambda: conn.execute(f"SELECT DISTINCT {ohlcv.date_column} FROM {ohlcv.table}").fetchall(), repeat
+        ),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="stock_ohlcv 압축 스키마 크기/조회 속도 비교")
+    parser.add_argument("--db", default="data/trading.db", help="원본 DB (변경하지 않음)")
+    parser.add_argument("--repeat", type=int, default=3, help="조회별 반복 횟수 (최소 시간 사용)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / "trading.db")
+        source = get_pooled_connection(args.db)
+        source.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        shutil.copyfile(args.db, db_path)
+        connection_manager.close_all(args.db)
+
+        get_pooled_connection(db_path).execute("VACUUM")
+        before = run_queries(db_path, args.repeat)
+        stats = migrate_to_compact(db_path)
+        after = run_queries(db_path, args.repeat)
+
+        print(f"\n행 수: {stats['rows']:,}  변환 시간: {stats['seconds']:.1f}초")
+        print(f"{'항목':<16}{'기존':>12}{'압축':>12}{'배율':>8}")
+        print(f"{'DB 크기(MB)':<16}{stats['size_before'] / 2**20:>12.1f}{stats['size_after'] / 2**20:>12.1f}"
+              f"{stats['size_before'] / stats['size_after']:>7.2f}x")
+        for name in before:
+            print(f"{name + '(ms)':<16}{before[name] * 1000:>12.1f}{after[name] * 1000:>12.1f}"
+                  f"{before[name] / after[name]:>7.2f}x")
+        connection_manager.close_all(db_path)
+
+
+if __name__ == "__main__":
+    main()
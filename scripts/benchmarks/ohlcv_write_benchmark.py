@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+OHLCV 저장 처리량 벤치마크
+
+기존 행 단위(SELECT COUNT + UPDATE/INSERT) 저장 방식과
+executemany 기반 UPSERT 방식의 초당 저장 행 수를 비교합니다.
+
+- bulk upsert: 종목별 저장 (_save_ohlcv_data_optimized, 종목마다 트랜잭션)
+- bulk batch: 수집 파이프라인처럼 여러 종목 행을 모아 한 번에 저장하고,
+  행 변환(_build_ohlcv_rows)과 SQLite 실행(executemany) 시간을 나눠 출력
+
+사용법:
+    python scripts/benchmarks/ohlcv_write_benchmark.py --symbols 20 --days 500
+"""
+
+import sys
+import time
+import sqlite3
+import argparse
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.data.updater import StockDataUpdater  # noqa: E402
+
+
+LEGACY_SCHEMA = (
+    "CREATE TABLE stock_ohlcv (symbol TEXT NOT NULL, date TEXT NOT NULL, open INTEGER, "
+    "high INTEGER, low INTEGER, close INTEGER, volume INTEGER, PRIMARY KEY (symbol, date))"
+)
+
+
+def make_synthetic_ohlcv(days: int, seed: int) -> pd.DataFrame:
+    """pykrx get_market_ohlcv_by_date 형식의 가상 데이터 생성"""
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range("2023-01-02", periods=days, name="날짜")
+    close = (50000 * np.exp(np.cumsum(rng.normal(0, 0.02, days)))).astype(np.int64)
+    open_ = (close * rng.uniform(0.98, 1.02, days)).astype(np.int64)
+    high = np.maximum(open_, close) + rng.integers(0, 500, days)
+    low = np.minimum(open_, close) - rng.integers(0, 500, days)
+    volume = rng.integers(10_000, 5_000_000, days)
+    return pd.DataFrame(
+        {"시가": open_, "고가": high, "저가": low, "종가": close, "거래량": volume},
+        index=index,
+    )
+
+
+def legacy_save(db_path: str, symbol: str, df: pd.DataFrame):
+    """기존 행 단위 저장 방식 (비교 기준: 호출마다 새 연결, 기본 저널 모드)"""
+    conn = sqlite3.connect(db_path)
+    df_final = df.rename(
+        columns={"시가": "open", "고가": "high", "저가": "low", "종가": "close", "거래량": "volume"}
+    )
+    df_final["symbol"] = symbol
+    df_final["date"] = pd.to_datetime(df_final.index).strftime("%Y-%m-%d")
+    with conn:
+        for _, row in df_final.iterrows():
+            exists = conn.execute(
+                "SELECT COUNT(*) FROM stock_ohlcv WHERE symbol = ? AND date = ?",
+                (row["symbol"], row["date"]),
+            ).fetchone()[0] > 0
+            if exists:
+                conn.execute(
+                    "UPDATE stock_ohlcv SET open = ?, high = ?, low = ?, close = ?, volume = ? "
+                    "WHERE symbol = ? AND date = ?",
+                    (int(row["open"]), int(row["high"]), int(row["low"]), int(row["close"]),
+                     int(row["volume"]), row["symbol"], row["date"]),
+                )
+            else:
+                conn.execute(
+                    "INSERT INTO stock_ohlcv (symbol, date, open, high, low, close, volume) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (row["symbol"], row["date"], int(row["open"]), int(row["high"]),
+                     int(row["low"]), int(row["close"]), int(row["volume"])),
+                )
+    conn.close()
+
+
+def run_case(name: str, save_func, frames: dict) -> float:
+    start = time.perf_counter()
+    for symbol, df in frames.items():
+        save_func(symbol, df)
+    elapsed = time.perf_counter() - start
+    rows = sum(len(df) for df in frames.values())
+    rate = rows / elapsed if elapsed > 0 else float("inf")
+    print(f"{name:<12} {rows:>9,}행  {elapsed:8.3f}초  {rate:>12,.0f} rows/s")
+    return rate
+
+
+def run_batch_case(updater: StockDataUpdater, frames: dict) -> float:
+    """여러 종목 행을 모아 write_batch_size 단위로 저장 (수집 파이프라인 경로)"""
+    start = time.perf_counter()
+    rows = []
+    for symbol, df in frames.items():
+        rows.extend(updater._build_ohlcv_rows(df, symbol=symbol))
+    built = time.perf_counter()
+    updater._bulk_upsert_ohlcv(rows)
+    elapsed = time.perf_counter() - start
+    rate = len(rows) / elapsed if elapsed > 0 else float("inf")
+    print(f"{'bulk batch':<12} {len(rows):>9,}행  {elapsed:8.3f}초  {rate:>12,.0f} rows/s  "
+          f"(행 변환 {(built - start) / elapsed:.0%}, SQLite {updater.write_stats['seconds'] / elapsed:.0%})")
+    return rate
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OHLCV 저장 처리량 벤치마크")
+    parser.add_argument("--symbols", type=int, default=20, help="종목 수")
+    parser.add_argument("--days", type=int, default=500, help="종목당 거래일 수 (2년 ≈ 500)")
+    args = parser.parse_args()
+
+    frames = {f"{i:06d}": make_synthetic_ohlcv(args.days, i) for i in range(args.symbols)}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"=== OHLCV 저장 벤치마크: {args.symbols}종목 x {args.days}일 ===")
+
+        # 기존 방식은 기본(rollback) 저널 모드의 DB에서 측정
+        legacy_db = str(Path(tmp) / "legacy.db")
+        with sqlite3.connect(legacy_db) as conn:
+            conn.execute(LEGACY_SCHEMA)
+        legacy_rate = run_case("row-by-row", lambda s, df: legacy_save(legacy_db, s, df), frames)
+
+        bulk_db = str(Path(tmp) / "bulk.db")
+        updater = StockDataUpdater(db_path=bulk_db)
+        bulk_rate = run_case("bulk upsert", updater._save_ohlcv_data_optimized, frames)
+
+        # 재수집(기존 행 갱신) 경로
+        run_case("bulk update", updater._save_ohlcv_data_optimized, frames)
+
+        batch_updater = StockDataUpdater(db_path=str(Path(tmp) / "batch.db"))
+        batch_rate = run_batch_case(batch_updater, frames)
+
+        print(f"속도 향상: 종목별 {bulk_rate / legacy_rate:.1f}x, 일괄 {batch_rate / legacy_rate:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
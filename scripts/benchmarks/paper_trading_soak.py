@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+모의투자 부하 시험 (시장 재생 -> 봉 -> 신호 -> 주문 -> 포트폴리오)
+
+합성 틱 또는 기록 틱 CSV를 로컬 재생 서버로 배속 재생하고, PaperTradingSession이
+가상 브로커에 주문을 내며 측정한 단계별 지연 히스토그램과 처리 통계를 출력합니다.
+
+사용법:
+    python scripts/benchmarks/paper_trading_soak.py --symbols 50 --minutes 390 --speed 1000
+    python scripts/benchmarks/paper_trading_soak.py --ticks-file data/ticks_20240102.csv --speed 100
+"""
+
+import sys
+import time
+import asyncio
+import logging
+import argparse
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.strategies import BollingerBandStrategy, MACDStrategy, RSIStrategy  # noqa: E402
+from src.trading.paper_trading import (  # noqa: E402
+    MarketReplayServer,
+    PaperTradingConfig,
+    PaperTradingSession,
+    SimulatedBroker,
+    format_latency_report,
+    load_recorded_ticks,
+    synthetic_ticks,
+)
+
+
+async def run(args):
+    if args.ticks_file:
+        ticks = load_recorded_ticks(args.ticks_file)
+        symbols = sorted({tick.symbol for tick in ticks})
+    else:
+        symbols = [f"{i:06d}" for i in range(args.symbols)]
+        ticks = synthetic_ticks(symbols, minutes=args.minutes, ticks_per_second=args.tps, seed=args.seed)
+
+    broker = SimulatedBroker(fill_latency=args.fill_latency / 1000)
+    async with MarketReplayServer(ticks, speed=args.speed, broker=broker) as server:
+        session = PaperTradingSession(
+            server.url,
+            [RSIStrategy(), MACDStrategy(), BollingerBandStrategy()],
+            PaperTradingConfig(interval=args.interval),
+        )
+        start = time.perf_counter()
+        report = await session.run(symbols)
+        elapsed = time.perf_counter() - start
+
+    span = ticks[-1].ts - ticks[0].ts if ticks else 0.0
+    print(f"재생: {len(ticks):,}틱 / {len(symbols)}종목, 장중 {span / 60:.0f}분을 {elapsed:.2f}초에 처리 "
+          f"(목표 {span / args.speed:.2f}초, {args.speed:g}배속)")
+    print(f"재생 서버: {server.stats}")
+    print(f"세션: {report['session']}")
+    print(f"주문: {report['orders']}")
+    print(f"포트폴리오: {report['portfolio']}")
+    pipeline = report["pipeline"]
+    print(f"파이프라인: 최대 지연 {pipeline['max_lag_ms']:.2f}ms, 드롭 {pipeline['frames_dropped']}프레임")
+    print()
+    print(format_latency_report(session.latency))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="모의투자 재생 부하 시험")
+    parser.add_argument("--symbols", type=int, default=50, help="합성 틱 종목 수")
+    parser.add_argument("--minutes", type=int, default=390, help="합성 틱 장중 시간 (분)")
+    parser.add_argument("--tps", type=float, default=50.0, help="합성 틱 초당 틱 수 (전 종목 합산)")
+    parser.add_argument("--seed", type=int, default=0, help="합성 틱 난수 시드")
+    parser.add_argument("--ticks-file", help="기록 틱 CSV (ts/timestamp, symbol, price, volume)")
+    parser.add_argument("--speed", type=float, default=1000.0, help="재생 배속 (1~1000)")
+    parser.add_argument("--interval", default="1m", help="신호 판정 봉 주기")
+    parser.add_argument("--fill-latency", type=float, default=0.0, help="가상 체결 응답 지연 (ms)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+포트폴리오 평가 벤치마크 (Portfolio vs ArrayPortfolio)
+
+합성 종가로 매일 일부 종목을 매매하고 전 종목을 평가(자산 기록)하는 과정을
+dict 기반 Portfolio와 배열 기반 ArrayPortfolio로 각각 실행해 소요 시간과
+최종 자산 차이를 출력합니다. Portfolio는 --legacy-days 일수만 실행합니다.
+
+사용법:
+    python scripts/benchmarks/portfolio_benchmark.py --symbols 2000 --days 2500
+"""
+
+import sys
+import time
+import logging
+import argparse
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.trading.portfolio import ArrayPortfolio, Portfolio  # noqa: E402
+
+
+def make_market(symbols: int, days: int, trades_per_day: int, seed: int):
+    rng = np.random.default_rng(seed)
+    returns = rng.normal(0.0003, 0.02, size=(days, symbols))
+    prices = np.round(10000 * np.exp(np.cumsum(returns, axis=0)), 0)
+    traded = rng.integers(0, symbols, size=(days, trades_per_day))
+    sides = rng.random((days, trades_per_day)) < 0.55  # True: 매수
+    quantities = rng.integers(1, 20, size=(days, trades_per_day))
+    return prices, traded, sides, quantities
+
+
+def run(portfolio, symbols, prices, traded, sides, quantities, days, use_array):
+    start_date = datetime(2015, 1, 2)
+    start = time.perf_counter()
+    for day in range(days):
+        date = start_date + timedelta(days=day)
+        row = prices[day]
+        for slot, is_buy, quantity in zip(traded[day].tolist(), sides[day].tolist(), quantities[day].tolist()):
+            if is_buy:
+                portfolio.buy(symbols[slot], quantity, row[slot], date)
+            else:
+                portfolio.sell(symbols[slot], quantity, row[slot], date)
+        if use_array:
+            portfolio.mark_to_market(row, date)
+        else:
+            portfolio.update_prices(dict(zip(symbols, row.tolist())), date)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="포트폴리오 평가 벤치마크")
+    parser.add_argument("--symbols", type=int, default=2000, help="종목 수")
+    parser.add_argument("--days", type=int, default=2500, help="거래일 수")
+    parser.add_argument("--trades-per-day", type=int, default=50, help="일별 매매 건수")
+    parser.add_argument("--legacy-days", type=int, default=250, help="Portfolio 비교 실행 일수")
+    parser.add_argument("--seed", type=int, default=0, help="난수 시드")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)  # 미보유 종목 매도 경고가 시간을 왜곡하지 않도록
+    symbols = [f"{i:06d}" for i in range(args.symbols)]
+    prices, traded, sides, quantities = make_market(args.symbols, args.days, args.trades_per_day, args.seed)
+    cash = 1e10
+
+    array_portfolio = ArrayPortfolio(initial_cash=cash, symbols=symbols)
+    elapsed = run(array_portfolio, symbols, prices, traded, sides, quantities, args.days, True)
+    metrics = array_portfolio.get_performance_metrics()
+    print(f"ArrayPortfolio: {args.symbols}종목 x {args.days}일 {elapsed:.2f}초 "
+          f"({elapsed / args.days * 1e3:.3f}ms/일, 매매 {len(array_portfolio.trades):,}건, "
+          f"보유 {len(array_portfolio.positions)}종목, MDD {metrics['max_drawdown']:.2%})")
+
+    legacy_days = min(args.legacy_days, args.days)
+    if legacy_days:
+        legacy = Portfolio(initial_cash=cash)
+        reference = ArrayPortfolio(initial_cash=cash, symbols=symbols)
+        legacy_elapsed = run(legacy, symbols, prices, traded, sides, quantities, legacy_days, False)
+        array_elapsed = run(reference, symbols, prices, traded, sides, quantities, legacy_days, True)
+        diff = abs(legacy.get_total_value() - reference.get_total_value())
+        print(f"Portfolio:      {legacy_days}일 {legacy_elapsed:.2f}초 ({legacy_elapsed / legacy_days * 1e3:.3f}ms/일), "
+              f"같은 구간 ArrayPortfolio {array_elapsed:.2f}초, 최종 자산 차이 {diff:.6f}원")
+
+
+if __name__ == "__main__":
+    main()
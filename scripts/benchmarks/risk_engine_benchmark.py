@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+위험 엔진 벤치마크
+
+합성 종가로 EWMA 공분산을 일괄 적재(update_many)한 뒤 일별 점진 갱신(update),
+디스크 캐시 저장/복원, 보유 종목 기준 VaR/CVaR·기여 VaR·매수 한도 계산 시간을 측정합니다.
+
+사용법:
+    python scripts/benchmarks/risk_engine_benchmark.py --symbols 2000 --days 1000 --holdings 20
+"""
+
+import sys
+import time
+import logging
+import argparse
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.trading.risk_engine import RiskEngine, RiskEngineConfig  # noqa: E402
+
+
+def make_prices(symbols: int, days: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    market = rng.normal(0, 0.01, size=(days, 1))
+    returns = rng.uniform(0.3, 1.2, size=symbols) * market + rng.normal(0, 0.015, size=(days, symbols))
+    prices = 10000 * np.exp(np.cumsum(returns, axis=0))
+    columns = [f"{i:06d}" for i in range(symbols)]
+    return pd.DataFrame(prices, index=pd.bdate_range("2015-01-02", periods=days), columns=columns)
+
+
+def timed(func, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description="위험 엔진 벤치마크")
+    parser.add_argument("--symbols", type=int, default=2000, help="종목 수")
+    parser.add_argument("--days", type=int, default=1000, help="일괄 적재 거래일 수")
+    parser.add_argument("--update-days", type=int, default=250, help="점진 갱신 거래일 수")
+    parser.add_argument("--holdings", type=int, default=20, help="보유 종목 수")
+    parser.add_argument("--seed", type=int, default=0, help="난수 시드")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    prices = make_prices(args.symbols, args.days + args.update_days, args.seed)
+    history, recent = prices.iloc[:args.days], prices.iloc[args.days:]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        config = RiskEngineConfig(cache_dir=tmp)
+        engine = RiskEngine(config)
+        start = time.perf_counter()
+        engine.update_from_prices(history, cache_name="universe")
+        print(f"일괄 적재: {args.symbols}종목 x {args.days}일 {time.perf_counter() - start:.2f}초 (캐시 저장 포함)")
+
+        start = time.perf_counter()
+        for date, row in recent.iterrows():
+            engine.update(row.to_numpy(), date.to_pydatetime())
+        elapsed = time.perf_counter() - start
+        print(f"점진 갱신: {len(recent)}일 {elapsed:.2f}초 ({elapsed / len(recent) * 1e3:.2f}ms/일)")
+
+        start = time.perf_counter()
+        engine.save("universe")
+        restored = RiskEngine.from_cache("universe", config)
+        print(f"캐시 저장+복원: {(time.perf_counter() - start) * 1e3:.1f}ms, 마지막 거래일 {restored.covariance.last_date:%Y-%m-%d}")
+
+    rng = np.random.default_rng(args.seed)
+    held = rng.choice(prices.columns, size=args.holdings, replace=False).tolist()
+    exposures = {symbol: float(rng.uniform(1e6, 5e6)) for symbol in held}
+    portfolio_value = sum(exposures.values()) * 1.5
+    candidate = prices.columns[-1]
+
+    risk = engine.portfolio_risk(exposures, portfolio_value)
+    print(f"포트폴리오: {args.holdings}종목, VaR {risk['var']:,.0f}원 ({risk['var_pct']:.2%}), "
+          f"CVaR {risk['cvar']:,.0f}원 ({risk['cvar_pct']:.2%})")
+    print(f"  portfolio_risk      {timed(lambda: engine.portfolio_risk(exposures, portfolio_value), 1000):.3f}ms")
+    print(f"  risk_contributions  {timed(lambda: engine.risk_contributions(exposures), 200):.3f}ms")
+    print(f"  max_position_value  {timed(lambda: engine.max_position_value(candidate, exposures, portfolio_value), 1000):.3f}ms "
+          f"(추가 가능 {engine.max_position_value(candidate, exposures, portfolio_value):,.0f}원)")
+    print(f"  average_correlation {timed(lambda: engine.average_correlation(held), 200):.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
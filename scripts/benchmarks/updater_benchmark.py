@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+StockDataUpdater 처리량 벤치마크 (오프라인 재생)
+
+기록된 pykrx 응답(또는 가상 데이터)을 ReplayDataSource로 재생하여
+KRX 접속 없이 전체/증분 업데이트의 종목/초, 행/초, DB 쓰기 시간을 측정합니다.
+
+사용법:
+    # 가상 데이터 (200종목 x 250일), 호출당 20ms 지연
+    python scripts/benchmarks/updater_benchmark.py --symbols 200 --days 250 --latency 0.02
+
+    # 실제 응답 기록 후 재생
+    python src/main.py update-data --symbols 005930 000660 --record-dir data/recordings
+    python scripts/benchmarks/updater_benchmark.py --recordings data/recordings --error-rate 0.01
+"""
+
+import sys
+import time
+import argparse
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = SCRIPT_DIR.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(SCRIPT_DIR))
+
+from ohlcv_write_benchmark import make_synthetic_ohlcv  # noqa: E402
+from src.data.connection_manager import get_pooled_connection  # noqa: E402
+from src.data.data_source import MarketDataSource, RecordingDataSource, ReplayDataSource  # noqa: E402
+from src.data.updater import OptimizedDataUpdateConfig, StockDataUpdater  # noqa: E402
+
+
+class SyntheticDataSource(MarketDataSource):
+    """가상 일봉 제공자 (기록 생성용)
+
+    종목 i의 일봉은 make_synthetic_ohlcv(days, i)로 고정되며, 시장 전체 시세/시가총액은
+    같은 일봉의 해당 날짜 단면으로 구성합니다.
+    """
+
+    def __init__(self, days: int, n_symbols: int = 0):
+        self.days = days
+        self.tickers = [f"{i + 1:06d}" for i in range(n_symbols)]
+        self._frames = {}
+
+    def _frame(self, ticker: str) -> pd.DataFrame:
+        df = self._frames.get(ticker)
+        if df is None:
+            df = self._frames[ticker] = make_synthetic_ohlcv(self.days, int(ticker))
+        return df
+
+    def get_market_ohlcv_by_date(self, fromdate, todate, ticker):
+        return self._frame(ticker).copy()
+
+    def get_market_ohlcv(self, date, market="ALL"):
+        day = pd.Timestamp(date)
+        rows = {ticker: self._frame(ticker).loc[day] for ticker in self.tickers if day in self._frame(ticker).index}
+        result = pd.DataFrame.from_dict(rows, orient="index")
+        result.index.name = "티커"
+        return result
+
+    def get_market_cap(self, date, market="ALL"):
+        ohlcv = self.get_market_ohlcv(date, market)
+        if ohlcv.empty:
+            return ohlcv
+        shares = np.array([1_000_000 * (int(ticker) % 97 + 1) for ticker in ohlcv.index], dtype=np.int64)
+        return pd.DataFrame(
+            {
+                "종가": ohlcv["종가"],
+                "시가총액": ohlcv["종가"].to_numpy() * shares,
+                "거래량": ohlcv["거래량"],
+                "거래대금": ohlcv["종가"] * ohlcv["거래량"],
+                "상장주식수": shares,
+            },
+            index=ohlcv.index,
+        )
+
+    def get_market_ticker_list(self, date, market="ALL"):
+        return list(self.tickers)
+
+    def get_market_ticker_name(self, ticker):
+        return ticker
+
+
+def synthesize_recordings(record_dir: Path, n_symbols: int, days: int) -> list:
+    """가상 응답을 기록 디렉토리에 저장하고 종목 목록 반환"""
+    source = SyntheticDataSource(days, n_symbols)
+    recorder = RecordingDataSource(source, record_dir)
+    symbols = source.tickers
+    for symbol in symbols:
+        recorder.get_market_ohlcv_by_date("", "", symbol)
+    return symbols
+
+
+def run_case(name: str, updater: StockDataUpdater, replay: ReplayDataSource, n_symbols: int, func):
+    """업데이트 1회 실행 후 처리량 출력"""
+    rows_before = updater.write_stats["rows"]
+    write_before = updater.write_stats["seconds"]
+    calls_before, errors_before = replay.stats["calls"], replay.stats["errors"]
+
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+
+    rows = updater.write_stats["rows"] - rows_before
+    write_time = updater.write_stats["seconds"] - write_before
+    calls = replay.stats["calls"] - calls_before
+    errors = replay.stats["errors"] - errors_before
+    print(
+        f"{name:<22} {elapsed:8.2f}초  {n_symbols / elapsed:9.1f} 종목/s  {rows / elapsed:11,.0f} 행/s  "
+        f"DB쓰기 {write_time:6.2f}초  API {calls:>6}회 (오류 {errors})"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="StockDataUpdater 오프라인 처리량 벤치마크")
+    parser.add_argument("--recordings", help="기록 디렉토리 (미지정 시 가상 데이터 생성)")
+    parser.add_argument("--symbols", type=int, default=200, help="가상 종목 수")
+    parser.add_argument("--days", type=int, default=250, help="가상 종목당 거래일 수")
+    parser.add_argument("--latency", type=float, default=0.02, help="호출당 모의 지연 (초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="모의 지연 변동폭 (초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="모의 오류율 (0~1)")
+    parser.add_argument("--workers", type=int, default=8, help="조회 스레드 수")
+    parser.add_argument("--rps", type=float, default=1000.0, help="허용 호출 속도 (회/초)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        if args.recordings:
+            record_dir = Path(args.recordings)
+            symbols = sorted(p.stem for p in (record_dir / "ohlcv_by_date").glob("*.pkl"))
+        else:
+            record_dir = tmp_path / "recordings"
+            symbols = synthesize_recordings(record_dir, args.symbols, args.days)
+        if not symbols:
+            print("재생할 종목 기록이 없습니다.")
+            return
+
+        replay = ReplayDataSource(
+            record_dir, latency=args.latency, latency_jitter=args.jitter, error_rate=args.error_rate, seed=42
+        )
+        frames = [replay._ticker_frame(s) for s in symbols]
+        first_day = min(df.index.min() for df in frames if not df.empty)
+        last_day = max(df.index.max() for df in frames if not df.empty)
+        start, end = first_day.strftime("%Y-%m-%d"), last_day.strftime("%Y-%m-%d")
+
+        config = OptimizedDataUpdateConfig(
+            max_workers=args.workers,
+            requests_per_second=args.rps,
+            rate_limit_burst=args.workers,
+            retry_delay=0.05,
+        )
+        db_path = str(tmp_path / "bench.db")
+        updater = StockDataUpdater(db_path=db_path, optimization_config=config, data_source=replay)
+        conn = get_pooled_connection(db_path)
+
+        print(f"=== 업데이터 벤치마크: {len(symbols)}종목, {start} ~ {end}, "
+              f"지연 {args.latency * 1000:.0f}ms, 오류율 {args.error_rate:.1%}, 워커 {args.workers} ===")
+
+        run_case("full (종목별)", updater, replay, len(symbols), lambda: updater.update_multiple_symbols_parallel(
+            symbols, start, end, force_update=True))
+
+        # 마지막 거래일을 지우고 1일 증분 업데이트 재현
+        with conn:
+            conn.execute("DELETE FROM stock_ohlcv WHERE date = ?", (end,))
+        run_case("incremental (종목별)", updater, replay, len(symbols), lambda: updater.update_multiple_symbols_parallel(
+            symbols, start, end))
+
+        with conn:
+            conn.execute("DELETE FROM stock_ohlcv WHERE date = ?", (end,))
+        run_case("incremental (일자별)", updater, replay, len(symbols), lambda: updater.update_missing_trading_days(
+            last_day.strftime("%Y%m%d"), last_day.strftime("%Y%m%d"), symbols=symbols))
+
+        limiter = updater.rate_limiter.get_stats()
+        print(f"limiter: 대기 {limiter['total_wait']:.2f}초, 백오프 {limiter['backoffs']}회, 현재 속도 {limiter['rate']:.1f}/s")
+
+
+if __name__ == "__main__":
+    main()
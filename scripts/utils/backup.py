@@ -1,20 +1,23 @@
 #!/usr/bin/env python3
 """
 데이터 백업 스크립트
-- SQLite 데이터베이스 백업
+- SQLite 데이터베이스 백업 (온라인 백업 API, 단계별 진행률, gzip 압축 선택)
 - 로그 파일 아카이브
 - 설정 파일 백업
 - 자동 압축 및 날짜별 관리
 """
 
-import os
-import shutil
-import sqlite3
+import sys
 import zipfile
 from datetime import datetime
 from pathlib import Path
 import logging
 
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.data.backup import DatabaseBackupManager  # noqa: E402
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
@@ -28,22 +31,26 @@ class BackupManager:
         self.backup_dir.mkdir(exist_ok=True)
         self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
-    def backup_database(self):
-        """SQLite 데이터베이스 백업"""
+    def backup_database(self, compress=False, pages_per_step=4096):
+        """SQLite 데이터베이스 백업 (업데이트 중에도 쓰기를 막지 않는 단계적 온라인 백업)"""
         try:
             source_db = Path("data/trading.db")
             if not source_db.exists():
                 logger.warning("⚠️ trading.db 파일이 없습니다.")
                 return False
 
-            backup_db = self.backup_dir / f"trading_db_{self.timestamp}.db"
+            manager = DatabaseBackupManager(
+                str(source_db), backup_dir=self.backup_dir, pages_per_step=pages_per_step
+            )
+            last_percent = [-10]
+
+            def report(done, total):
+                percent = done * 100 // max(total, 1)
+                if percent - last_percent[0] >= 10 or done == total:
+                    last_percent[0] = percent
+                    logger.info(f"   진행률 {percent}% ({done:,}/{total:,} 페이지)")
 
-            # SQLite 백업 (VACUUM으로 최적화)
-            source_conn = sqlite3.connect(source_db)
-            backup_conn = sqlite3.connect(backup_db)
-            source_conn.backup(backup_conn)
-            source_conn.close()
-            backup_conn.close()
+            backup_db = manager.backup(f"trading_db_{self.timestamp}", compress=compress, progress=report)
 
             logger.info(f"💾 데이터베이스 백업 완료: {backup_db}")
             return True
@@ -143,12 +150,12 @@ class BackupManager:
         except Exception as e:
             logger.error(f"❌ 백업 정리 실패: {e}")
 
-    def create_full_backup(self):
+    def create_full_backup(self, compress=False):
         """전체 백업 실행"""
         logger.info(f"🚀 전체 백업 시작 - {self.timestamp}")
 
         results = []
-        results.append(self.backup_database())
+        results.append(self.backup_database(compress=compress))
         results.append(self.backup_logs())
         results.append(self.backup_config())
         results.append(self.backup_historical_data())
@@ -176,6 +183,10 @@ def main():
     parser.add_argument(
         "--keep-days", type=int, default=30, help="백업 보관 일수 (기본: 30일)"
     )
+    parser.add_argument("--compress", action="store_true", help="DB 백업 gzip 압축")
+    parser.add_argument(
+        "--pages", type=int, default=4096, help="백업 단계당 복사 페이지 수 (기본: 4096)"
+    )
 
     args = parser.parse_args()
 
@@ -184,13 +195,13 @@ def main():
     if args.cleanup:
         backup_manager.cleanup_old_backups(args.keep_days)
     elif args.db_only:
-        backup_manager.backup_database()
+        backup_manager.backup_database(compress=args.compress, pages_per_step=args.pages)
     elif args.logs_only:
         backup_manager.backup_logs()
     elif args.config_only:
         backup_manager.backup_config()
     else:
-        backup_manager.create_full_backup()
+        backup_manager.create_full_backup(compress=args.compress)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+stock_ohlcv 압축 스키마 마이그레이션 스크립트
+- stock_ohlcv(TEXT 날짜) -> stock_ohlcv_days(정수 일수, WITHOUT ROWID) + (day, symbol) 인덱스
+- 기존 쿼리용 호환 뷰 stock_ohlcv 생성
+- 변환 전 스냅샷(롤백 지점) 생성, --revert로 기존 스키마 복원
+"""
+
+import sys
+from pathlib import Path
+import logging
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.data.backup import DatabaseBackupManager  # noqa: E402
+from src.data.connection_manager import get_pooled_connection  # noqa: E402
+from src.data.ohlcv_schema import migrate_to_compact, ohlcv_layout, revert_to_legacy  # noqa: E402
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    """메인 실행 함수"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="stock_ohlcv 압축 스키마 마이그레이션")
+    parser.add_argument("--db", default="data/trading.db", help="대상 DB (기본: data/trading.db)")
+    parser.add_argument("--revert", action="store_true", help="압축 스키마를 기존 테이블로 되돌리기")
+    parser.add_argument("--keep-legacy", action="store_true", help="기존 테이블을 stock_ohlcv_legacy로 남기기")
+    parser.add_argument("--no-snapshot", action="store_true", help="변환 전 스냅샷 생략")
+    parser.add_argument("--no-vacuum", action="store_true", help="변환 후 VACUUM 생략")
+    args = parser.parse_args()
+
+    if not Path(args.db).exists():
+        logger.error(f"❌ DB 파일이 없습니다: {args.db}")
+        return 1
+
+    layout = ohlcv_layout(get_pooled_connection(args.db))
+    logger.info(f"현재 stock_ohlcv 스키마: {layout}")
+
+    if not args.no_snapshot:
+        point = DatabaseBackupManager(args.db).snapshot(f"before_ohlcv_{'revert' if args.revert else 'compact'}")
+        logger.info(f"💾 롤백 지점: {point}")
+
+    try:
+        if args.revert:
+            rows = revert_to_legacy(args.db, vacuum=not args.no_vacuum)
+            logger.info(f"✅ 기존 스키마 복원 완료: {rows:,}행")
+        else:
+            stats = migrate_to_compact(args.db, keep_legacy=args.keep_legacy, vacuum=not args.no_vacuum)
+            logger.info(
+                f"✅ 변환 완료: {stats['rows']:,}행, "
+                f"{stats['size_before'] / 2**20:.1f}MB -> {stats['size_after'] / 2**20:.1f}MB, "
+                f"{stats['seconds']:.1f}초"
+            )
+    except ValueError as e:
+        logger.error(f"❌ 마이그레이션 실패: {e}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
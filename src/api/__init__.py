@@ -1,11 +1,13 @@
 """
 키움 API 관련 모듈
-- REST API 클라이언트
+- REST API 클라이언트 (연결 풀, 연속조회, 비동기)
 - WebSocket 클라이언트
+- 실시간 메시지 파이프라인
 - OAuth 인증
 """
 
-from .kiwoom_client import KiwoomApiClient as KiwoomClient
+from .kiwoom_client import AsyncKiwoomApiClient, KiwoomApiClient as KiwoomClient
+from .stream_pipeline import MessagePipeline, PipelineConfig
 from .websocket_client import WebSocketClient
 
-__all__ = ["KiwoomClient", "WebSocketClient"]
+__all__ = ["KiwoomClient", "AsyncKiwoomApiClient", "WebSocketClient", "MessagePipeline", "PipelineConfig"]
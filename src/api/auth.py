@@ -1,6 +1,9 @@
 import requests
 import logging
-from typing import Optional
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, Optional, Tuple
 
 # 프로젝트 루트를 sys.path에 추가
 import sys
@@ -12,14 +15,14 @@ from src.config_loader import get_kiwoom_env
 logger = logging.getLogger(__name__)
 
 
-def get_access_token(
+def request_access_token(
     API_KEY: str,
     API_SECRET: str,
     base_url: str = "https://api.kiwoom.com",
     timeout: int = 30,
-) -> Optional[str]:
+) -> Optional[dict]:
     """
-    키움 REST API 접근 토큰 발급
+    키움 REST API 접근 토큰 발급 (응답 전체 반환: token, expires_dt 등)
     """
     url = f"{base_url}/oauth2/token"
     headers = {"Content-Type": "application/json;charset=UTF-8"}
@@ -33,8 +36,8 @@ def get_access_token(
         response.raise_for_status()
         result = response.json()
         if result.get("token"):
-            logging.info(f"토큰 발급 성공: {result['token']}")
-            return result["token"]
+            logging.info(f"토큰 발급 성공 (만료: {result.get('expires_dt')})")
+            return result
         else:
             logging.error(f"토큰 발급 실패: {result}")
             return None
@@ -43,6 +46,102 @@ def get_access_token(
         return None
 
 
+def get_access_token(
+    API_KEY: str,
+    API_SECRET: str,
+    base_url: str = "https://api.kiwoom.com",
+    timeout: int = 30,
+) -> Optional[str]:
+    """
+    키움 REST API 접근 토큰 발급
+    """
+    result = request_access_token(API_KEY, API_SECRET, base_url=base_url, timeout=timeout)
+    return result["token"] if result else None
+
+
+def parse_token_expiry(result: dict) -> Optional[float]:
+    """발급 응답의 expires_dt(YYYYMMDDHHMMSS, 현지 시각)를 epoch 초로 변환"""
+    expires_dt = result.get("expires_dt")
+    if not expires_dt:
+        return None
+    try:
+        return datetime.strptime(str(expires_dt), "%Y%m%d%H%M%S").timestamp()
+    except ValueError:
+        return None
+
+
+class TokenCache:
+    """
+    접근 토큰 캐시
+    - 만료 refresh_margin초 전까지 같은 토큰 재사용 (재연결마다 재발급하지 않음)
+    - 응답에 만료 시각이 없으면 default_ttl 동안 유효한 것으로 간주
+    - 인증 오류 시 invalidate()로 다음 요청에서 재발급
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[], Optional[dict]],
+        refresh_margin: float = 300.0,
+        default_ttl: float = 86400.0,
+    ):
+        """
+        Args:
+            fetch: 토큰 발급 함수 (request_access_token 형식의 응답 반환)
+            refresh_margin: 만료 전 재발급 여유 (초)
+            default_ttl: 만료 시각이 없는 응답의 유효 시간 (초)
+        """
+        self.fetch = fetch
+        self.refresh_margin = refresh_margin
+        self.default_ttl = default_ttl
+        self._token: Optional[str] = None
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def expires_at(self) -> float:
+        return self._expires_at
+
+    def valid(self) -> bool:
+        return self._token is not None and time.time() < self._expires_at - self.refresh_margin
+
+    def get(self, force_refresh: bool = False) -> Optional[str]:
+        """유효한 캐시 토큰 반환, 없거나 만료 임박이면 발급"""
+        with self._lock:
+            if not force_refresh and self.valid():
+                return self._token
+            result = self.fetch()
+            if not result or not result.get("token"):
+                return None
+            self._token = result["token"]
+            self._expires_at = parse_token_expiry(result) or time.time() + self.default_ttl
+            return self._token
+
+    def invalidate(self):
+        with self._lock:
+            self._token = None
+            self._expires_at = 0.0
+
+
+_token_caches: Dict[Tuple[str, str], TokenCache] = {}
+_token_caches_lock = threading.Lock()
+
+
+def get_token_cache(kiwoom_env: Optional[dict] = None) -> TokenCache:
+    """환경(base_url, api_key)별 프로세스 공용 토큰 캐시"""
+    kiwoom_env = kiwoom_env or get_kiwoom_env()
+    key = (kiwoom_env["base_url"], kiwoom_env["api_key"] or "")
+    with _token_caches_lock:
+        cache = _token_caches.get(key)
+        if cache is None:
+            cache = TokenCache(
+                lambda: request_access_token(
+                    kiwoom_env["api_key"], kiwoom_env["api_secret"], base_url=kiwoom_env["base_url"]
+                )
+            )
+            _token_caches[key] = cache
+        return cache
+
+
 def revoke_access_token(
     API_KEY: str,
     API_SECRET: str,
@@ -1,46 +1,231 @@
+"""
+키움 REST API 클라이언트
+
+- requests.Session 연결 풀 재사용 (keep-alive, 호출마다 TCP/TLS 연결을 새로 만들지 않음)
+- 연속조회: 응답 헤더 cont-yn=Y이면 next-key로 다음 페이지를 이어서 요청하고
+  iter_pages()/iter_frames()로 페이지 단위 제너레이터 제공
+- 접근 토큰: access_token을 주지 않으면 auth.get_token_cache 공용 캐시로 발급/재사용 (만료 전까지 캐시,
+  401 응답 시 폐기 후 1회 재발급)
+- AsyncKiwoomApiClient: 같은 연결 풀과 속도 제한을 쓰는 asyncio 버전 (동시 요청 수 제한)
+
+사용 예시:
+    kiwoom_env = get_kiwoom_env()
+    client = KiwoomApiClient(kiwoom_env["api_key"], kiwoom_env["api_secret"], base_url=kiwoom_env["base_url"])
+    for frame in client.iter_daily_ohlcv("005930", "20200101", "20241231"):
+        ...
+
+    async_client = AsyncKiwoomApiClient(client, max_concurrency=4)
+    results = await async_client.gather_daily_ohlcv(symbols, "20240101", "20241231")
+"""
+
+import asyncio
 import logging
-from typing import Optional, Dict, Any
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+
+from src.api.auth import TokenCache, get_token_cache
+from src.utils.rate_limiter import TokenBucketRateLimiter, get_rate_limiter
+
+# 키움 REST API 초당 호출 허용량 (프로세스 전역 공유)
+KIWOOM_REQUESTS_PER_SECOND = 5.0
+KIWOOM_BURST = 5
+
+DEFAULT_BASE_URL = "https://api.kiwoom.com"
+ACCOUNT_PATH = "/api/dostk/acnt"
+MARKET_DATA_PATH = "/api/dostk/market-data"
+OHLCV_LIST_KEY = "output"
 
 
 class KiwoomApiClient:
-    def __init__(self, api_key: str, api_secret: str):
+    def __init__(
+        self,
+        api_key: str,
+        api_secret: str,
+        rate_limiter: Optional[TokenBucketRateLimiter] = None,
+        base_url: str = DEFAULT_BASE_URL,
+        token_cache: Optional[TokenCache] = None,
+        pool_size: int = 10,
+        session: Optional[requests.Session] = None,
+    ):
+        """
+        Args:
+            rate_limiter: 호출 속도 제한 (기본: 프로세스 공용 "kiwoom" limiter)
+            base_url: REST API 주소
+            token_cache: 접근 토큰 캐시 (기본: 같은 base_url/api_key를 쓰는 클라이언트와 공유하는 캐시)
+            pool_size: 호스트당 유지할 keep-alive 연결 수 (동시 요청 수 이상 권장)
+            session: 외부에서 관리하는 세션 (지정 시 연결 풀 설정 생략)
+        """
         self.api_key = api_key
         self.api_secret = api_secret
+        self.base_url = base_url.rstrip("/")
         self.logger = logging.getLogger(self.__class__.__name__)
+        self.rate_limiter = rate_limiter or get_rate_limiter(
+            "kiwoom", rate=KIWOOM_REQUESTS_PER_SECOND, burst=KIWOOM_BURST
+        )
+        self.token_cache = token_cache or get_token_cache(
+            {"base_url": self.base_url, "api_key": self.api_key, "api_secret": self.api_secret}
+        )
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
+
+    def close(self):
+        """연결 풀 종료"""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _post(self, url: str, headers: Dict[str, str], data: Dict[str, Any], timeout: int) -> requests.Response:
+        """속도 제한을 적용한 POST 요청 (실패 시 limiter 백오프)"""
+        self.rate_limiter.acquire()
+        try:
+            response = self.session.post(url, headers=headers, json=data, timeout=timeout)
+            response.raise_for_status()
+        except requests.exceptions.RequestException:
+            self.rate_limiter.report_error()
+            raise
+        self.rate_limiter.report_success()
+        return response
+
+    def request(
+        self,
+        path: str,
+        api_id: str,
+        data: Dict[str, Any],
+        access_token: Optional[str] = None,
+        next_key: str = "",
+        timeout: int = 30,
+    ) -> Tuple[Dict[str, Any], Optional[str]]:
+        """
+        REST API 한 페이지 요청
+
+        Args:
+            next_key: 연속조회 키 (첫 페이지는 빈 문자열)
+
+        Returns:
+            (응답 본문, 다음 페이지 next-key 또는 None)
+
+        Raises:
+            requests.exceptions.RequestException: 요청 실패
+        """
+        url = f"{self.base_url}{path}"
+        cached = access_token is None
+        for attempt in range(2):
+            token = self.token_cache.get() if cached else access_token
+            if not token:
+                raise requests.exceptions.RequestException("접근 토큰 발급 실패")
+            headers = {
+                "Content-Type": "application/json;charset=UTF-8",
+                "authorization": f"Bearer {token}",
+                "api-id": api_id,
+                "cont-yn": "Y" if next_key else "N",
+                "next-key": next_key,
+            }
+            try:
+                response = self._post(url, headers, data, timeout)
+                break
+            except requests.exceptions.HTTPError as e:
+                # 캐시 토큰이 서버에서 만료된 경우 한 번만 재발급
+                if cached and attempt == 0 and e.response is not None and e.response.status_code == 401:
+                    self.logger.warning(f"{api_id} 인증 만료 응답, 토큰 재발급 후 재시도")
+                    self.token_cache.invalidate()
+                    continue
+                raise
+
+        continues = response.headers.get("cont-yn", "N").upper() == "Y"
+        following = response.headers.get("next-key", "") if continues else ""
+        return response.json(), following or None
+
+    def iter_pages(
+        self,
+        path: str,
+        api_id: str,
+        data: Dict[str, Any],
+        access_token: Optional[str] = None,
+        max_pages: Optional[int] = None,
+        timeout: int = 30,
+    ) -> Iterator[Dict[str, Any]]:
+        """연속조회 페이지를 순서대로 돌려주는 제너레이터 (요청 실패 시 예외)"""
+        next_key = ""
+        pages = 0
+        while True:
+            body, next_key = self.request(path, api_id, data, access_token, next_key or "", timeout)
+            pages += 1
+            yield body
+            if next_key is None or (max_pages is not None and pages >= max_pages):
+                return
+
+    def iter_frames(
+        self,
+        path: str,
+        api_id: str,
+        data: Dict[str, Any],
+        list_key: str,
+        access_token: Optional[str] = None,
+        max_pages: Optional[int] = None,
+        timeout: int = 30,
+    ) -> Iterator[pd.DataFrame]:
+        """연속조회 페이지의 list_key 목록을 페이지마다 DataFrame으로 변환"""
+        for body in self.iter_pages(path, api_id, data, access_token, max_pages, timeout):
+            yield pd.DataFrame(body.get(list_key) or [])
 
     def get_account_info(
-        self, access_token: str, timeout: int = 30
+        self, access_token: Optional[str] = None, timeout: int = 30
     ) -> Optional[Dict[str, Any]]:
         """
         키움 REST API 계좌평가현황요청(kt00004)
         """
-        url = "https://api.kiwoom.com/api/dostk/acnt"
-        headers = {
-            "Content-Type": "application/json;charset=UTF-8",
-            "authorization": f"Bearer {access_token}",
-            "api-id": "kt00004",
-            "cont-yn": "N",
-            "next-key": "",
-        }
         data = {
             "qry_tp": "0",  # 0:전체, 1:상장폐지종목제외
             "dmst_stex_tp": "KRX",  # KRX:한국거래소, NXT:넥스트트레이드
         }
         try:
             self.logger.info("계좌평가현황요청(kt00004) API 호출")
-            response = requests.post(url, headers=headers, json=data, timeout=timeout)
-            response.raise_for_status()
-            result = response.json()
+            result, _ = self.request(ACCOUNT_PATH, "kt00004", data, access_token, timeout=timeout)
             self.logger.info(f"계좌 정보 조회 성공: {result}")
             return result
         except requests.exceptions.RequestException as e:
             self.logger.error(f"계좌 정보 조회 실패: {e}")
             return None
 
+    @staticmethod
+    def _daily_ohlcv_request(symbol: str, start_date: str, end_date: str) -> Dict[str, Any]:
+        return {
+            "symbol": symbol,
+            "from_dt": start_date,
+            "to_dt": end_date,
+            "period_tp": "D",  # D:일, W:주, M:월
+            "prc_tp": "1",  # 1:수정주가, 2:원주가
+            "vol_adj_tp": "1",  # 1:거래량, 2:거래대금
+        }
+
+    def iter_daily_ohlcv(
+        self,
+        symbol: str,
+        start_date: str,
+        end_date: str,
+        access_token: Optional[str] = None,
+        timeout: int = 30,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        주식일주월시분요청(CTPF1604R) 연속조회를 페이지별 DataFrame으로 스트리밍
+        """
+        data = self._daily_ohlcv_request(symbol, start_date, end_date)
+        return self.iter_frames(MARKET_DATA_PATH, "CTPF1604R", data, OHLCV_LIST_KEY, access_token, timeout=timeout)
+
     def get_daily_ohlcv(
         self,
-        access_token: str,
+        access_token: Optional[str],
         symbol: str,
         start_date: str,
         end_date: str,
@@ -48,30 +233,18 @@ class KiwoomApiClient:
     ) -> Optional[Dict[str, Any]]:
         """
         키움 REST API 주식일주월시분요청(CTPF1604R)
+
+        연속조회 페이지를 모두 받아 output을 이어 붙인 응답을 반환합니다.
         """
-        url = "https://api.kiwoom.com/api/dostk/market-data"
-        headers = {
-            "Content-Type": "application/json;charset=UTF-8",
-            "authorization": f"Bearer {access_token}",
-            "api-id": "CTPF1604R",
-            "cont-yn": "N",
-            "next-key": "",
-        }
-        data = {
-            "symbol": symbol,
-            "from_dt": start_date,
-            "to_dt": end_date,
-            "period_tp": "D",  # D:일, W:주, M:월
-            "prc_tp": "1",  # 1:수정주가, 2:원주가
-            "vol_adj_tp": "1",  # 1:거래량, 2:거래대금
-        }
+        data = self._daily_ohlcv_request(symbol, start_date, end_date)
         try:
             self.logger.info(f"주식일봉데이터요청({symbol}) API 호출")
-            response = requests.post(url, headers=headers, json=data, timeout=timeout)
-            response.raise_for_status()
-            result = response.json()
+            result = merge_pages(
+                self.iter_pages(MARKET_DATA_PATH, "CTPF1604R", data, access_token, timeout=timeout),
+                OHLCV_LIST_KEY,
+            )
             self.logger.info(
-                f"주식일봉데이터({symbol}) 조회 성공: {len(result.get('output', []))}건"
+                f"주식일봉데이터({symbol}) 조회 성공: {len(result.get(OHLCV_LIST_KEY, []))}건"
             )
             return result
         except requests.exceptions.RequestException as e:
@@ -79,10 +252,124 @@ class KiwoomApiClient:
             return None
 
 
+def merge_pages(pages: Iterable[Dict[str, Any]], list_key: str) -> Dict[str, Any]:
+    """연속조회 페이지들을 첫 페이지 본문 + list_key 목록 연결로 합침"""
+    merged: Dict[str, Any] = {}
+    rows: List[Any] = []
+    for body in pages:
+        if not merged:
+            merged = dict(body)
+        rows.extend(body.get(list_key) or [])
+    merged[list_key] = rows
+    return merged
+
+
+class AsyncKiwoomApiClient:
+    """
+    asyncio용 키움 REST API 클라이언트
+
+    요청은 KiwoomApiClient의 연결 풀/토큰 캐시/속도 제한을 그대로 쓰며 작업 스레드에서
+    실행됩니다. max_concurrency로 동시에 진행 중인 요청 수를 제한하고, 초당 호출 수는
+    공용 rate_limiter가 맞춥니다.
+    """
+
+    def __init__(self, client: KiwoomApiClient, max_concurrency: int = 4):
+        self.client = client
+        self.max_concurrency = max_concurrency
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        # 이벤트 루프 안에서 처음 사용할 때 생성
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def request(
+        self,
+        path: str,
+        api_id: str,
+        data: Dict[str, Any],
+        access_token: Optional[str] = None,
+        next_key: str = "",
+        timeout: int = 30,
+    ) -> Tuple[Dict[str, Any], Optional[str]]:
+        """KiwoomApiClient.request의 비동기 버전"""
+        async with self.semaphore:
+            return await asyncio.to_thread(
+                self.client.request, path, api_id, data, access_token, next_key, timeout
+            )
+
+    async def iter_pages(
+        self,
+        path: str,
+        api_id: str,
+        data: Dict[str, Any],
+        access_token: Optional[str] = None,
+        max_pages: Optional[int] = None,
+        timeout: int = 30,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """연속조회 페이지 비동기 제너레이터"""
+        next_key = ""
+        pages = 0
+        while True:
+            body, next_key = await self.request(path, api_id, data, access_token, next_key or "", timeout)
+            pages += 1
+            yield body
+            if next_key is None or (max_pages is not None and pages >= max_pages):
+                return
+
+    async def iter_daily_ohlcv(
+        self,
+        symbol: str,
+        start_date: str,
+        end_date: str,
+        access_token: Optional[str] = None,
+        timeout: int = 30,
+    ) -> AsyncIterator[pd.DataFrame]:
+        """주식일봉 연속조회를 페이지별 DataFrame으로 비동기 스트리밍"""
+        data = KiwoomApiClient._daily_ohlcv_request(symbol, start_date, end_date)
+        async for body in self.iter_pages(MARKET_DATA_PATH, "CTPF1604R", data, access_token, timeout=timeout):
+            yield pd.DataFrame(body.get(OHLCV_LIST_KEY) or [])
+
+    async def get_daily_ohlcv(
+        self,
+        symbol: str,
+        start_date: str,
+        end_date: str,
+        access_token: Optional[str] = None,
+        timeout: int = 30,
+    ) -> Optional[Dict[str, Any]]:
+        """전체 페이지를 합친 주식일봉 응답 (실패 시 None)"""
+        data = KiwoomApiClient._daily_ohlcv_request(symbol, start_date, end_date)
+        try:
+            pages = [
+                body async for body in
+                self.iter_pages(MARKET_DATA_PATH, "CTPF1604R", data, access_token, timeout=timeout)
+            ]
+        except requests.exceptions.RequestException as e:
+            self.client.logger.error(f"주식일봉데이터({symbol}) 조회 실패: {e}")
+            return None
+        return merge_pages(pages, OHLCV_LIST_KEY)
+
+    async def gather_daily_ohlcv(
+        self,
+        symbols: Iterable[str],
+        start_date: str,
+        end_date: str,
+        access_token: Optional[str] = None,
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """여러 종목 일봉을 동시에 조회 (종목 -> 합친 응답 또는 None)"""
+        symbols = list(symbols)
+        results = await asyncio.gather(*(
+            self.get_daily_ohlcv(symbol, start_date, end_date, access_token) for symbol in symbols
+        ))
+        return dict(zip(symbols, results))
+
+
 if __name__ == "__main__":
-    import os
     import sys
-    from src.api.auth import get_access_token, API_KEY, API_SECRET
+    from src.config_loader import get_kiwoom_env
 
     logging.basicConfig(
         level=logging.INFO,
@@ -93,12 +380,12 @@ if __name__ == "__main__":
         ],
     )
 
-    client = KiwoomApiClient(API_KEY, API_SECRET)
-    token = get_access_token(API_KEY, API_SECRET)
-    if not token:
+    kiwoom_env = get_kiwoom_env()
+    client = KiwoomApiClient(kiwoom_env["api_key"], kiwoom_env["api_secret"], base_url=kiwoom_env["base_url"])
+    if not client.token_cache.get():
         print("[ERROR] 토큰 발급 실패. 환경변수 및 네트워크 상태를 확인하세요.")
         sys.exit(1)
-    account_info = client.get_account_info(token)
+    account_info = client.get_account_info()
     if account_info:
         print("[SUCCESS] 계좌 정보:")
         print(account_info)
@@ -14,6 +14,7 @@ from datetime import datetime
 import json
 
 from src.utils.common import load_config
+from src.data.connection_manager import get_pooled_connection
 
 logger = logging.getLogger(__name__)
 
@@ -125,7 +126,7 @@ class SectorClassifier:
     def _ensure_sector_tables(self):
         """업종 관련 테이블이 없으면 생성"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with get_pooled_connection(self.db_path) as conn:
                 # 업종 마스터 테이블
                 conn.execute(
                     """
@@ -196,7 +197,7 @@ class SectorClassifier:
             업종 정보 리스트
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with get_pooled_connection(self.db_path) as conn:
                 if market:
                     query = "SELECT code, name, market, group_name, description FROM sectors WHERE market = ? ORDER BY code"
                     rows = conn.execute(query, (market,)).fetchall()
@@ -233,7 +234,7 @@ class SectorClassifier:
             종목-업종 정보 리스트
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with get_pooled_connection(self.db_path) as conn:
                 # 해당 업종에 속한 종목들 조회
                 query = """
                         SELECT ss.symbol, ss.name, ss.sector_code, s.name as sector_name, 
@@ -276,7 +277,7 @@ class SectorClassifier:
             종목-업종 정보 또는 None
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with get_pooled_connection(self.db_path) as conn:
                 query = """
                         SELECT ss.symbol, ss.name, ss.sector_code, s.name as sector_name,
                                ss.market, ss.market_cap
@@ -321,7 +322,7 @@ class SectorClassifier:
             market_cap: 시가총액
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with get_pooled_connection(self.db_path) as conn:
                 conn.execute(
                     """
                         INSERT OR REPLACE INTO stock_sectors 
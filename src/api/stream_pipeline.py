@@ -0,0 +1,377 @@
+"""
+실시간 메시지 처리 파이프라인
+
+WebSocket 수신 루프는 원본 프레임을 제한 크기 asyncio.Queue에 넣기만 하고,
+디코드 단계가 JSON을 파싱해 TR 타입별 채널로 나눈 뒤 채널 작업자가 배치 단위로
+비동기 핸들러를 호출합니다. 느린 핸들러가 있어도 소켓 수신은 멈추지 않습니다.
+
+    수신 루프 --(원본 프레임)--> 프레임 큐 --> 디코드 --> TR 채널 --(배치)--> 핸들러
+
+- 프레임 큐가 가득 차면: block(기본, 수신 대기, TCP 백프레셔) 또는 drop_oldest
+- 채널 대기열이 가득 차면: block(기본), drop_oldest, coalesce(종목별 최신 시세만 유지)
+  주문체결(00)/잔고 이벤트는 유실되면 안 되므로 block으로 두고, 시세 TR만 coalesce/drop_oldest 선택
+- 키움 REAL 메시지({"trnm": "REAL", "data": [...]})는 항목별 이벤트로 분리하여
+  항목의 type(예: "0B" 주식체결)으로 라우팅, 그 외 메시지는 trnm으로 라우팅
+- metrics(): 큐 깊이, 지연(수신~핸들러 호출), 초당 메시지 수, 드롭/병합 건수
+
+사용 예시:
+    pipeline = MessagePipeline(PipelineConfig(queue_size=10000))
+    pipeline.add_handler("0B", on_trades, policy="coalesce")
+    await pipeline.start()
+    await pipeline.put(raw_frame)
+"""
+
+import asyncio
+import inspect
+import json
+import logging
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+Event = Dict[str, Any]
+BatchHandler = Callable[[List[Event]], Union[None, Awaitable[None]]]
+
+FRAME_POLICIES = ("block", "drop_oldest")
+CHANNEL_POLICIES = ("block", "drop_oldest", "coalesce")
+
+# 등록되지 않은 TR 타입을 받는 채널
+DEFAULT_CHANNEL = "*"
+
+
+def default_json_loads() -> Callable[[Union[str, bytes]], Any]:
+    """orjson이 설치되어 있으면 orjson.loads, 없으면 표준 json.loads"""
+    try:
+        import orjson
+
+        return orjson.loads
+    except ImportError:
+        return json.loads
+
+
+def event_type(event: Event) -> Optional[str]:
+    """이벤트 라우팅 키 (REAL 항목의 type, 그 외 trnm/tr_type)"""
+    return event.get("type") or event.get("trnm") or event.get("tr_type")
+
+
+def event_symbol(event: Event) -> Optional[str]:
+    """종목별 병합 키 (REAL 항목의 item)"""
+    return event.get("item")
+
+
+@dataclass
+class PipelineConfig:
+    """메시지 파이프라인 설정"""
+
+    queue_size: int = 10_000  # 원본 프레임 큐 크기
+    frame_policy: str = "block"  # 프레임 큐 포화 시: block | drop_oldest (드롭 시 주문체결도 유실)
+    batch_size: int = 512  # 핸들러 1회 호출 최대 이벤트 수
+    max_pending: int = 50_000  # 채널별 대기 이벤트 상한 (coalesce는 종목 수가 상한)
+    yield_every: int = 256  # 디코드 단계가 이 프레임 수마다 이벤트 루프에 양보
+    metrics_log_interval: float = 0.0  # 초 단위 지표 로그 주기 (0이면 끔)
+
+    def __post_init__(self):
+        if self.frame_policy not in FRAME_POLICIES:
+            raise ValueError(f"지원하지 않는 프레임 정책: {self.frame_policy}")
+
+
+class _HandlerChannel:
+    """TR 타입 하나의 대기열과 배치 작업자"""
+
+    def __init__(
+        self,
+        name: str,
+        handler: BatchHandler,
+        policy: str,
+        batch_size: int,
+        max_pending: int,
+        key: Callable[[Event], Optional[str]],
+        pipeline: "MessagePipeline",
+    ):
+        if policy not in CHANNEL_POLICIES:
+            raise ValueError(f"지원하지 않는 채널 정책: {policy}")
+        self.name = name
+        self.handler = handler
+        self.policy = policy
+        self.batch_size = batch_size
+        self.max_pending = max_pending
+        self.key = key
+        self.pipeline = pipeline
+        # (최초 수신 시각, 이벤트). coalesce는 종목 키 -> 항목, 그 외는 도착 순서 deque
+        self.pending: Union[OrderedDict, deque] = OrderedDict() if policy == "coalesce" else deque()
+        self.ready = asyncio.Event()
+        self.space = asyncio.Event()
+        self.space.set()
+        self._seq = 0
+
+    async def push(self, event: Event, received_at: float):
+        pipeline = self.pipeline
+        if self.policy == "coalesce":
+            key = self.key(event)
+            if key is None:
+                self._seq += 1
+                key = ("_", self._seq)
+            elif key in self.pending:
+                # 자리와 최초 수신 시각은 유지하고 값만 최신으로 교체
+                self.pending[key] = (self.pending[key][0], event)
+                pipeline._counters["events_coalesced"] += 1
+                return
+            if len(self.pending) >= self.max_pending:
+                self.pending.popitem(last=False)
+                pipeline._counters["events_dropped"] += 1
+            self.pending[key] = (received_at, event)
+        else:
+            while len(self.pending) >= self.max_pending:
+                if self.policy == "block":
+                    self.space.clear()
+                    await self.space.wait()
+                else:
+                    self.pending.popleft()
+                    pipeline._counters["events_dropped"] += 1
+            self.pending.append((received_at, event))
+        self.ready.set()
+
+    def _take_batch(self) -> List[tuple]:
+        count = min(self.batch_size, len(self.pending))
+        if self.policy == "coalesce":
+            batch = [self.pending.popitem(last=False)[1] for _ in range(count)]
+        else:
+            batch = [self.pending.popleft() for _ in range(count)]
+        if not self.pending:
+            self.ready.clear()
+        self.space.set()
+        return batch
+
+    async def run(self):
+        pipeline = self.pipeline
+        while True:
+            await self.ready.wait()
+            batch = self._take_batch()
+            if not batch:
+                continue
+            pipeline._record_lag(time.monotonic() - batch[0][0])
+            try:
+                result = self.handler([event for _, event in batch])
+                if inspect.isawaitable(result):
+                    await result
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                pipeline._counters["handler_errors"] += 1
+                logger.error(f"핸들러 오류 ({self.name}): {e}", exc_info=True)
+            pipeline._counters["events_dispatched"] += len(batch)
+
+
+class MessagePipeline:
+    """수신 프레임 큐 -> 디코드 -> TR 타입별 배치 핸들러"""
+
+    def __init__(
+        self,
+        config: Optional[PipelineConfig] = None,
+        loads: Optional[Callable[[Union[str, bytes]], Any]] = None,
+    ):
+        """
+        Args:
+            config: 파이프라인 설정
+            loads: JSON 디코더 (기본: orjson 사용 가능 시 orjson.loads)
+        """
+        self.config = config or PipelineConfig()
+        self.loads = loads or default_json_loads()
+        self._frames: asyncio.Queue = asyncio.Queue(maxsize=self.config.queue_size)
+        self._channels: Dict[str, _HandlerChannel] = {}
+        self._tasks: List[asyncio.Task] = []
+        self._counters = {
+            "frames_received": 0,
+            "frames_dropped": 0,
+            "events_decoded": 0,
+            "decode_errors": 0,
+            "events_dispatched": 0,
+            "events_dropped": 0,
+            "events_coalesced": 0,
+            "handler_errors": 0,
+        }
+        self._lag_last = 0.0
+        self._lag_max = 0.0
+        self._rate = 0.0
+        self._rate_start = time.monotonic()
+        self._rate_count = 0
+
+    # ---- 구성 ----
+
+    def add_handler(
+        self,
+        tr_type: str,
+        handler: BatchHandler,
+        policy: str = "block",
+        batch_size: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        key: Callable[[Event], Optional[str]] = event_symbol,
+    ):
+        """TR 타입 배치 핸들러 등록
+
+        Args:
+            tr_type: 라우팅 키 (REAL 항목 type 또는 trnm). "*"는 미등록 타입 전체
+            handler: handler(events) - 동기 함수 또는 코루틴 함수
+            policy: 대기열 포화 시 처리 (block | drop_oldest | coalesce). 시세 TR만 drop_oldest/coalesce 사용
+            batch_size, max_pending: 채널별 설정 (기본: PipelineConfig 값)
+            key: coalesce 병합 키 (기본: 종목 코드)
+        """
+        channel = _HandlerChannel(
+            tr_type,
+            handler,
+            policy,
+            batch_size or self.config.batch_size,
+            max_pending or self.config.max_pending,
+            key,
+            self,
+        )
+        self._channels[tr_type] = channel
+        if self._tasks:
+            self._tasks.append(asyncio.create_task(channel.run(), name=f"pipeline-{tr_type}"))
+
+    def has_handler(self, tr_type: str) -> bool:
+        return tr_type in self._channels
+
+    # ---- 수명 주기 ----
+
+    @property
+    def frames_received(self) -> int:
+        return self._counters["frames_received"]
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    async def start(self):
+        """디코드/채널 작업자 시작"""
+        if self._tasks:
+            return
+        self._tasks.append(asyncio.create_task(self._decode_loop(), name="pipeline-decode"))
+        for name, channel in self._channels.items():
+            self._tasks.append(asyncio.create_task(channel.run(), name=f"pipeline-{name}"))
+        if self.config.metrics_log_interval > 0:
+            self._tasks.append(asyncio.create_task(self._metrics_loop(), name="pipeline-metrics"))
+
+    async def stop(self, drain: bool = True, timeout: float = 5.0):
+        """작업자 종료 (drain=True면 대기 중인 프레임/이벤트를 먼저 처리)"""
+        if drain and self._tasks:
+            try:
+                await asyncio.wait_for(self.drain(), timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"파이프라인 종료 대기 시간 초과: {self.metrics()}")
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def drain(self):
+        """프레임 큐와 모든 채널 대기열이 빌 때까지 대기"""
+        await self._frames.join()
+        while any(channel.pending for channel in self._channels.values()):
+            await asyncio.sleep(0.001)
+        # 마지막 배치의 핸들러 호출이 끝나도록 한 번 더 양보
+        await asyncio.sleep(0)
+
+    async def __aenter__(self) -> "MessagePipeline":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.stop()
+
+    # ---- 입력 ----
+
+    async def put(self, raw: Union[str, bytes]):
+        """수신 프레임 투입 (frame_policy=block이면 큐에 자리가 날 때까지 대기)"""
+        self._count_frame()
+        item = (time.monotonic(), raw)
+        if self.config.frame_policy == "block":
+            await self._frames.put(item)
+            return
+        if self._frames.full():
+            self._frames.get_nowait()
+            self._frames.task_done()
+            self._counters["frames_dropped"] += 1
+        self._frames.put_nowait(item)
+
+    def _count_frame(self):
+        self._counters["frames_received"] += 1
+        self._rate_count += 1
+        now = time.monotonic()
+        elapsed = now - self._rate_start
+        if elapsed >= 1.0:
+            self._rate = self._rate_count / elapsed
+            self._rate_start = now
+            self._rate_count = 0
+
+    # ---- 처리 ----
+
+    def decode(self, raw: Union[str, bytes]) -> List[Event]:
+        """원본 프레임을 이벤트 목록으로 변환 (REAL 메시지는 항목별로 분리)"""
+        message = self.loads(raw)
+        if isinstance(message, dict):
+            data = message.get("data")
+            if message.get("trnm") == "REAL" and isinstance(data, list):
+                return [entry for entry in data if isinstance(entry, dict)]
+            return [message]
+        if isinstance(message, list):
+            return [entry for entry in message if isinstance(entry, dict)]
+        return []
+
+    async def _decode_loop(self):
+        frames = self._frames
+        channels = self._channels
+        counters = self._counters
+        processed = 0
+        while True:
+            received_at, raw = await frames.get()
+            try:
+                events = self.decode(raw)
+            except Exception as e:
+                counters["decode_errors"] += 1
+                logger.debug(f"메시지 디코드 실패: {e}")
+                events = []
+            counters["events_decoded"] += len(events)
+            for event in events:
+                channel = channels.get(event_type(event)) or channels.get(DEFAULT_CHANNEL)
+                if channel is not None:
+                    await channel.push(event, received_at)
+            frames.task_done()
+            processed += 1
+            if processed % self.config.yield_every == 0:
+                await asyncio.sleep(0)
+
+    def _record_lag(self, lag: float):
+        self._lag_last = lag
+        if lag > self._lag_max:
+            self._lag_max = lag
+
+    # ---- 지표 ----
+
+    def metrics(self) -> Dict[str, Any]:
+        """큐 깊이, 지연, 초당 메시지 수 및 누적 카운터"""
+        elapsed = time.monotonic() - self._rate_start
+        # 1초 창이 끝나지 않았고 이전 측정값이 없으면 현재 창 기준으로 추정
+        rate = self._rate if self._rate or elapsed <= 0 else self._rate_count / elapsed
+        return {
+            **self._counters,
+            "queue_depth": self._frames.qsize(),
+            "queue_capacity": self.config.queue_size,
+            "messages_per_sec": rate,
+            "lag_ms": self._lag_last * 1000,
+            "max_lag_ms": self._lag_max * 1000,
+            "pending": {name: len(channel.pending) for name, channel in self._channels.items()},
+        }
+
+    async def _metrics_loop(self):
+        while True:
+            await asyncio.sleep(self.config.metrics_log_interval)
+            m = self.metrics()
+            logger.info(
+                f"실시간 수신: {m['messages_per_sec']:.0f}건/초, 큐 {m['queue_depth']}/{m['queue_capacity']}, "
+                f"지연 {m['lag_ms']:.1f}ms (최대 {m['max_lag_ms']:.1f}ms), "
+                f"드롭 {m['frames_dropped'] + m['events_dropped']}, 병합 {m['events_coalesced']}"
+            )
@@ -1,53 +1,214 @@
 import logging
-from typing import Any, Callable, List, Optional, Dict
+from typing import Any, Callable, List, Optional, Dict, Tuple
 import asyncio
 import json
+import random
+from dataclasses import dataclass
 import websockets
 import os
 from src.utils.logging_utils import log_function_trace
+from src.api.auth import TokenCache, get_token_cache
+from src.api.stream_pipeline import (
+    DEFAULT_CHANNEL,
+    BatchHandler,
+    MessagePipeline,
+    PipelineConfig,
+    event_symbol,
+)
+
+DEFAULT_WS_URL = "wss://openapi.kiwoom.com/ws"  # 실제 URL은 키움 가이드에 맞게 수정 필요
+
+
+@dataclass
+class ReconnectPolicy:
+    """연결 감시/재연결 설정"""
+
+    initial_delay: float = 1.0  # 첫 재연결 대기 (초)
+    max_delay: float = 60.0  # 재연결 대기 상한 (초)
+    multiplier: float = 2.0  # 실패마다 대기 배율
+    jitter: float = 0.5  # 대기 시간을 최대 이 비율만큼 무작위로 줄임 (동시 재접속 분산)
+    max_attempts: Optional[int] = None  # 연속 실패 허용 횟수 (None이면 무제한)
+    stale_timeout: Optional[float] = 60.0  # 이 시간 동안 수신이 없으면 끊긴 연결로 간주
+    ping_interval: Optional[float] = 20.0  # WebSocket ping 주기
+    ping_timeout: Optional[float] = 20.0  # pong 대기 한도
+    close_timeout: float = 2.0  # 종료 핸드셰이크 대기 한도
+    subscribe_batch_size: int = 100  # 구독 메시지 1건당 최대 종목 수
+
+    def delay(self, attempt: int) -> float:
+        """attempt번째(1부터) 재연결 전 대기 시간"""
+        base = min(self.max_delay, self.initial_delay * self.multiplier ** max(attempt - 1, 0))
+        return base * (1 - self.jitter * random.random())
 
 
 class WebSocketClient:
     """
     키움증권 실시간시세 WebSocket 클라이언트
     다양한 TR명(주문체결, 잔고, 주식체결 등) 구독 지원
+
+    수신 루프는 원본 프레임을 MessagePipeline 큐에 넣기만 하고, 디코드와
+    TR 타입별 배치 핸들러 호출은 파이프라인 작업자가 처리합니다.
+
+    run()/run_forever()는 연결 감시자로 동작합니다. 연결이 끊기거나 수신이
+    stale_timeout 동안 없으면 지수 백오프(지터 포함) 후 재연결하고, 캐시된 토큰을
+    재사용하며, subscribe()로 등록한 구독을 배치 메시지로 다시 요청합니다.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        pipeline_config: Optional[PipelineConfig] = None,
+        url: str = DEFAULT_WS_URL,
+        reconnect: Optional[ReconnectPolicy] = None,
+        token_cache: Optional[TokenCache] = None,
+    ):
         self.logger = logging.getLogger(self.__class__.__name__)
         self.ws = None
-        self.on_message: Optional[Callable[[Dict[str, Any]], None]] = None
+        self.url = url
+        self.reconnect = reconnect or ReconnectPolicy()
+        self.token_cache = token_cache
+        self.on_message: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self.pipeline = MessagePipeline(pipeline_config)
+        self.pipeline.add_handler("PING", self._echo_ping)
+        # (grp_no, tr_types) -> {"items": 순서 유지 종목 집합, "refresh": 최초 refresh}
+        self._subscriptions: Dict[Tuple[str, Tuple[str, ...]], Dict[str, Any]] = {}
+        self._stopping = False
+        self._connection_stats = {"connects": 0, "reconnects": 0, "stale_disconnects": 0}
+
+    @property
+    def connected(self) -> bool:
+        return self.ws is not None
 
     @log_function_trace
-    async def connect(self) -> None:
-        kiwoom_env = get_kiwoom_env()
-        token = get_access_token(
-            kiwoom_env["api_key"],
-            kiwoom_env["api_secret"],
-            base_url=kiwoom_env["base_url"],
-        )
+    async def connect(self) -> bool:
+        if self.token_cache is None:
+            self.token_cache = get_token_cache()
+        token = await asyncio.to_thread(self.token_cache.get)
         if not token:
             self.logger.error("토큰 발급 실패. 환경변수 및 네트워크 상태를 확인하세요.")
-            return
-        url = f"wss://openapi.kiwoom.com/ws"  # 실제 URL은 키움 가이드에 맞게 수정 필요
+            return False
+        policy = self.reconnect
         self.ws = await websockets.connect(
-            url, extra_headers={"authorization": f"Bearer {token}"}
+            self.url,
+            additional_headers={"authorization": f"Bearer {token}"},
+            ping_interval=policy.ping_interval,
+            ping_timeout=policy.ping_timeout,
+            close_timeout=policy.close_timeout,
         )
+        self._connection_stats["connects"] += 1
         self.logger.info("WebSocket 연결 성공")
+        return True
 
     @log_function_trace
     async def send_message(self, message: Any) -> None:
         if self.ws:
             await self.ws.send(json.dumps(message))
-            self.logger.info(f"메시지 전송: {message}")
+            self.logger.debug(f"메시지 전송: {message}")
+
+    def add_handler(
+        self,
+        tr_type: str,
+        handler: BatchHandler,
+        policy: str = "block",
+        batch_size: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        key: Callable[[Dict[str, Any]], Optional[str]] = event_symbol,
+    ) -> None:
+        """TR 타입별 배치 핸들러 등록 (MessagePipeline.add_handler 참고)
+
+        기본 정책은 block이라 주문체결(00)/잔고 이벤트가 유실되지 않습니다. 시세 TR(예: "0B" 주식체결)만
+        policy="coalesce"로 등록하면 처리가 밀릴 때 종목별 최신 시세만 전달됩니다.
+        """
+        self.pipeline.add_handler(tr_type, handler, policy, batch_size, max_pending, key)
 
     async def receive_messages(self) -> None:
-        if self.ws:
-            async for msg in self.ws:
-                data = json.loads(msg)
-                self.logger.info(f"수신 메시지: {data}")
-                if self.on_message:
-                    self.on_message(data)
+        """현재 연결이 닫힐 때까지 수신 (재연결 없음, 재연결은 run_forever 사용)"""
+        if not self.ws:
+            return
+        self._install_on_message()
+        await self.pipeline.start()
+        try:
+            await self._receive_until_closed()
+        finally:
+            await self.pipeline.stop()
+
+    def _install_on_message(self) -> None:
+        if self.on_message and not self.pipeline.has_handler(DEFAULT_CHANNEL):
+            self.pipeline.add_handler(DEFAULT_CHANNEL, self._dispatch_on_message)
+
+    async def _receive_until_closed(self) -> int:
+        """연결이 닫히거나 stale 판정될 때까지 프레임을 파이프라인에 투입, 수신 건수 반환"""
+        ws = self.ws
+        put = self.pipeline.put
+        start = self.pipeline.frames_received
+        watchdog = None
+        if self.reconnect.stale_timeout:
+            watchdog = asyncio.create_task(self._watch_stale(ws))
+        try:
+            async for msg in ws:
+                await put(msg)
+        finally:
+            if watchdog:
+                watchdog.cancel()
+        return self.pipeline.frames_received - start
+
+    async def _watch_stale(self, ws) -> None:
+        """stale_timeout 동안 프레임 수신이 없으면 연결을 닫아 재연결 유도"""
+        timeout = self.reconnect.stale_timeout
+        last = self.pipeline.frames_received
+        while True:
+            await asyncio.sleep(timeout)
+            current = self.pipeline.frames_received
+            if current == last:
+                self._connection_stats["stale_disconnects"] += 1
+                self.logger.warning(f"{timeout:.0f}초간 수신 없음, 연결 재설정")
+                await ws.close(code=1001, reason="stale")
+                return
+            last = current
+
+    async def _dispatch_on_message(self, events: List[Dict[str, Any]]) -> None:
+        """기존 on_message 콜백 호환 (이벤트 단위 호출, 코루틴 함수 지원)"""
+        for event in events:
+            result = self.on_message(event)
+            if asyncio.iscoroutine(result):
+                await result
+
+    async def _echo_ping(self, events: List[Dict[str, Any]]) -> None:
+        """서버 PING 메시지를 그대로 돌려보내 연결 유지"""
+        for event in events:
+            try:
+                await self.send_message(event)
+            except websockets.exceptions.ConnectionClosed:
+                return
+
+    def metrics(self) -> Dict[str, Any]:
+        """수신 파이프라인 지표 (큐 깊이, 지연, 초당 메시지 수, 재연결 횟수 등)"""
+        return {**self.pipeline.metrics(), **self._connection_stats, "connected": self.connected}
+
+    # ---- 구독 ----
+
+    @staticmethod
+    def _subscription_message(
+        tr_types: List[str], items: List[str], grp_no: str, refresh: str
+    ) -> Dict[str, Any]:
+        # 구독 메시지 포맷은 키움 가이드 참고
+        return {
+            "tr_type": tr_types,
+            "items": items,
+            "grp_no": grp_no,
+            "refresh": refresh,
+        }
+
+    def _batched(self, items: List[str]) -> List[List[str]]:
+        size = self.reconnect.subscribe_batch_size
+        return [items[i:i + size] for i in range(0, len(items), size)] or [[]]
+
+    async def _send_subscription(
+        self, tr_types: List[str], items: List[str], grp_no: str, refresh: str
+    ) -> None:
+        for i, chunk in enumerate(self._batched(items)):
+            # 두 번째 묶음부터는 기존 등록에 추가
+            await self.send_message(
+                self._subscription_message(tr_types, chunk, grp_no, refresh if i == 0 else "1")
+            )
 
     @log_function_trace
     async def subscribe(
@@ -57,19 +218,33 @@ class WebSocketClient:
         grp_no: str = "1",
         refresh: str = "1",
     ) -> None:
-        # 구독 메시지 포맷은 키움 가이드 참고
-        message = {
-            "tr_type": tr_types,
-            "items": items or [],
-            "grp_no": grp_no,
-            "refresh": refresh,
-        }
-        await self.send_message(message)
+        """구독 요청 (재연결 시 다시 요청하도록 등록부에 기록)"""
+        items = list(items or [])
+        key = (grp_no, tuple(tr_types))
+        entry = self._subscriptions.get(key)
+        if entry is None or refresh == "0":
+            entry = self._subscriptions[key] = {"items": {}, "refresh": refresh}
+        entry["items"].update(dict.fromkeys(items))
+        if not self.ws:
+            return
+        try:
+            await self._send_subscription(list(tr_types), items, grp_no, refresh)
+        except websockets.exceptions.ConnectionClosed:
+            self.logger.warning("연결 종료로 구독 요청 보류 (재연결 후 재요청)")
 
     @log_function_trace
     async def unsubscribe(
         self, tr_types: List[str], items: Optional[List[str]] = None, grp_no: str = "1"
     ) -> None:
+        key = (grp_no, tuple(tr_types))
+        entry = self._subscriptions.get(key)
+        if entry is not None:
+            for item in items or []:
+                entry["items"].pop(item, None)
+            if not items or not entry["items"]:
+                del self._subscriptions[key]
+        if not self.ws:
+            return
         # 해제 메시지 포맷은 키움 가이드 참고
         message = {
             "tr_type": tr_types,
@@ -79,15 +254,73 @@ class WebSocketClient:
         }
         await self.send_message(message)
 
+    def subscriptions(self) -> List[Dict[str, Any]]:
+        """재연결 시 다시 요청할 구독 목록"""
+        return [
+            {"grp_no": grp_no, "tr_types": list(tr_types), "items": list(entry["items"])}
+            for (grp_no, tr_types), entry in self._subscriptions.items()
+        ]
+
+    async def _replay_subscriptions(self) -> None:
+        for (grp_no, tr_types), entry in self._subscriptions.items():
+            await self._send_subscription(list(tr_types), list(entry["items"]), grp_no, entry["refresh"])
+        if self._subscriptions:
+            self.logger.info(f"구독 {len(self._subscriptions)}건 재요청")
+
+    # ---- 연결 감시 ----
+
     @log_function_trace
     async def run(self, tr_types: List[str], items: Optional[List[str]] = None) -> None:
-        await self.connect()
         await self.subscribe(tr_types, items)
-        await self.receive_messages()
+        await self.run_forever()
+
+    async def run_forever(self) -> None:
+        """disconnect() 호출 전까지 연결 유지 (끊기면 백오프 후 재연결 및 구독 복구)
+
+        Raises:
+            ConnectionError: 연속 실패가 ReconnectPolicy.max_attempts를 넘은 경우
+        """
+        policy = self.reconnect
+        self._stopping = False
+        self._install_on_message()
+        await self.pipeline.start()
+        failures = 0
+        try:
+            while not self._stopping:
+                try:
+                    if await self.connect():
+                        await self._replay_subscriptions()
+                        if await self._receive_until_closed():
+                            failures = 0
+                except websockets.exceptions.InvalidStatus as e:
+                    if e.response.status_code in (401, 403):
+                        self.token_cache.invalidate()
+                    self.logger.warning(f"WebSocket 연결 거부: {e}")
+                except (OSError, asyncio.TimeoutError, websockets.exceptions.WebSocketException) as e:
+                    self.logger.warning(f"WebSocket 연결 끊김: {e}")
+                finally:
+                    await self._close_socket()
+                if self._stopping:
+                    break
+                failures += 1
+                if policy.max_attempts is not None and failures > policy.max_attempts:
+                    raise ConnectionError(f"WebSocket 재연결 {policy.max_attempts}회 실패")
+                delay = policy.delay(failures)
+                self._connection_stats["reconnects"] += 1
+                self.logger.info(f"{delay:.1f}초 후 재연결 ({failures}회째)")
+                await asyncio.sleep(delay)
+        finally:
+            await self.pipeline.stop()
+
+    async def _close_socket(self) -> None:
+        ws, self.ws = self.ws, None
+        if ws is not None:
+            await ws.close()
 
     async def disconnect(self) -> None:
+        self._stopping = True
         if self.ws:
-            await self.ws.close()
+            await self._close_socket()
             self.logger.info("WebSocket 연결 종료")
 
     def set_on_message(self, callback: Callable[[Dict[str, Any]], None]) -> None:
@@ -114,9 +347,8 @@ if __name__ == "__main__":
     async def main():
         client = WebSocketClient()
         client.set_on_message(print_message)
-        await client.connect()
         # 예시: 실시간 시세 구독 (tr_types, items는 실제 사용에 맞게 수정)
-        await client.subscribe(["stock_price"], ["005930"])  # 삼성전자 예시
-        await client.receive_messages()
+        # 연결이 끊겨도 재연결 후 구독을 복구하며 계속 수신
+        await client.run(["stock_price"], ["005930"])  # 삼성전자 예시
 
     asyncio.run(main())
@@ -100,8 +100,10 @@ def show_command_help(command: str):
             "python src/main.py update-data --daily-market today",
             "python src/main.py update-data --daily-market yesterday",
             "python src/main.py update-data --daily-market 2024-01-15",
+            "python src/main.py update-data --by-date --days 7",
             "python src/main.py update-data --market-cap",
             "python src/main.py update-data --update-symbols",
+            "python src/main.py update-data --export-columnar",
         ],
         "backtest": [
             "python src/main.py backtest",
@@ -202,10 +204,13 @@ def main():
   python src/main.py update-data --daily-market today      # 오늘 전체 시장 데이터
   python src/main.py update-data --daily-market yesterday  # 어제 전체 시장 데이터
   python src/main.py update-data --daily-market 2024-01-15 # 특정일 전체 시장 데이터
+  python src/main.py update-data --by-date --days 7         # 최근 7일 중 누락 거래일만 일자별 수집
   
   # 기타 업데이트
   python src/main.py update-data --market-cap     # 시가총액 정보 업데이트
+  python src/main.py update-data --market-cap --days 365  # 최근 1년 시가총액 이력 (누락일만)
   python src/main.py update-data --update-symbols # 종목 정보 업데이트
+  python src/main.py update-data --export-columnar # 백테스트용 컬럼형 저장소 생성
   
   # 백테스팅 (기본)
   python src/main.py backtest                  # 삼성전자 180일 백테스팅 (MACD 전략)
@@ -252,7 +257,7 @@ def main():
         help="전체 종목의 기본 정보(종목코드, 종목명, 시장, 섹터)를 업데이트합니다.",
     )
     update_parser.add_argument(
-        "--market-cap", action="store_true", help="시가총액 정보 업데이트"
+        "--market-cap", action="store_true", help="시가총액 정보 업데이트 (기간 옵션과 함께 쓰면 일자별 시가총액 이력의 누락일 수집)"
     )
     update_parser.add_argument(
         "--yesterday-only", "-y", action="store_true", help="어제 데이터만 업데이트 (Ultra-Fast)"
@@ -260,6 +265,14 @@ def main():
     update_parser.add_argument(
         "--daily-market", type=str, help="특정일의 전체 시장 데이터 업데이트 (today/yesterday/YYYY-MM-DD)"
     )
+    update_parser.add_argument(
+        "--by-date",
+        action="store_true",
+        help="누락 거래일마다 전체 시장을 한 번에 조회하는 일자별 수집 모드 (일일 갱신용)",
+    )
+    update_parser.add_argument(
+        "--export-columnar", action="store_true", help="OHLCV 전체를 메모리 맵 컬럼형 저장소로 내보내기 (이후 업데이트 시 자동 동기화)"
+    )
     
     # 날짜 및 기간 옵션
     update_parser.add_argument("--days", type=int, help="수집할 일수 (기본값: 365일)")
@@ -276,7 +289,11 @@ def main():
     update_parser.add_argument("--max-workers", type=int, default=4, help="병렬 처리 워커 수 (기본값: 4)")
     update_parser.add_argument("--batch-size", type=int, default=30, help="배치 처리 크기 (기본값: 30)")
     update_parser.add_argument("--enable-cache", action="store_true", default=True, help="캐싱 활성화 (기본값: True)")
-    update_parser.add_argument("--api-delay", type=float, default=0.3, help="API 호출 간격 (초, 기본값: 0.3)")
+    update_parser.add_argument("--api-delay", type=float, default=0.3, help="API 호출 간격 (초, 기본값: 0.3). 전체 워커 합산 호출 속도는 1/api-delay 회/초")
+    
+    # 데이터 제공자 옵션 (오프라인 벤치마크/회귀 테스트용)
+    update_parser.add_argument("--record-dir", help="pykrx 응답을 지정 디렉토리에 기록")
+    update_parser.add_argument("--replay-dir", help="KRX 대신 기록된 응답을 재생")
     
     # 호환성을 위한 기존 옵션들
     update_parser.add_argument("--incremental", action="store_true", default=True, help="증분 업데이트 활성화 (기본값: True)")
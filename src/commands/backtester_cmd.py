@@ -11,7 +11,6 @@ from src.strategies.rsi_strategy import RSIStrategy
 from src.strategies.bollinger_band_strategy import BollingerBandStrategy
 from src.strategies.moving_average_strategy import MovingAverageStrategy
 from src.config_loader import get_project_root
-from src.utils.common import load_stock_data
 
 logger = logging.getLogger(__name__)
 PROJECT_ROOT = get_project_root()
@@ -67,10 +66,12 @@ def run_backtest_with_symbols(symbols, strategies, start_date, end_date, days, p
         'ma': MovingAverageStrategy
     }
     
+    # 전체 종목 데이터를 단일 쿼리로 일괄 로딩
+    panel = dm.load_panel(symbols, start_date, end_date)
+
     for symbol in symbols:
         try:
-            # StockDataManager를 직접 사용하여 데이터 로딩
-            df = dm.get_latest_data(symbol, days=days or 730)  # 2년치 데이터
+            df = panel.get(symbol, pd.DataFrame()).tail(days or 730)  # 최근 2년치 데이터
             print(f"{symbol} 원본 row: {len(df)}, 인덱스 타입: {type(df.index)}")
             
             if not df.empty:
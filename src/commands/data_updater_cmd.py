@@ -53,8 +53,18 @@ def calculate_date_range(args) -> tuple:
 def run_data_update(args):
     """데이터 업데이트 명령 실행"""
     from src.data.updater import StockDataUpdater, OptimizedDataUpdateConfig
+    from src.data.data_source import PykrxDataSource, RecordingDataSource, ReplayDataSource
     
     try:
+        # 데이터 제공자 선택 (기본 pykrx / 응답 기록 / 기록 재생)
+        data_source = None
+        if getattr(args, 'replay_dir', None):
+            logger.info(f"기록 재생 모드: {args.replay_dir}")
+            data_source = ReplayDataSource(args.replay_dir)
+        elif getattr(args, 'record_dir', None):
+            logger.info(f"응답 기록 모드: {args.record_dir}")
+            data_source = RecordingDataSource(PykrxDataSource(), args.record_dir)
+
         # 병렬 처리 설정 확인
         enable_parallel = getattr(args, 'parallel', False)
         max_workers = getattr(args, 'max_workers', 4)
@@ -78,10 +88,17 @@ def run_data_update(args):
                 check_latest_data=True,    # 최신 데이터 확인
             )
             
-            updater = StockDataUpdater(optimization_config=optimization_config)
+            updater = StockDataUpdater(optimization_config=optimization_config, data_source=data_source)
         else:
             logger.info("=== 순차 처리 모드 ===")
-            updater = StockDataUpdater()
+            updater = StockDataUpdater(data_source=data_source)
+
+        # 컬럼형 저장소 내보내기
+        if getattr(args, 'export_columnar', False):
+            logger.info("=== 컬럼형 OHLCV 저장소 내보내기 ===")
+            updater.export_columnar_store()
+            logger.info("=== 컬럼형 OHLCV 저장소 내보내기 완료 ===")
+            return
 
         # 종목 정보 업데이트
         if hasattr(args, 'update_symbols') and args.update_symbols:
@@ -92,6 +109,13 @@ def run_data_update(args):
 
         # 시가총액 데이터 업데이트
         if hasattr(args, 'market_cap') and args.market_cap:
+            if any(getattr(args, name, None) for name in ('start_date', 'end_date', 'days', 'period')):
+                # 기간 지정 시 시가총액 시계열의 누락 거래일만 일자별 수집
+                start_date, end_date = calculate_date_range(args)
+                logger.info(f"=== 시가총액 이력 업데이트: {start_date} ~ {end_date} ===")
+                results = updater.update_market_cap_history(start_date, end_date)
+                logger.info(f"=== 시가총액 이력 업데이트 완료: {len(results)}일, {sum(results.values())}행 ===")
+                return
             logger.info("=== 시가총액 데이터 업데이트 ===")
             updater.update_market_cap_data()
             logger.info("=== 시가총액 데이터 업데이트 완료 ===")
@@ -102,6 +126,7 @@ def run_data_update(args):
             yesterday = (datetime.now() - timedelta(days=1)).strftime("%Y%m%d")
             logger.info(f"=== 어제 데이터 업데이트: {yesterday} ===")
             updater.update_daily_market_data(yesterday)
+            updater.finalize_ingestion()
             logger.info("=== 어제 데이터 업데이트 완료 ===")
             return
 
@@ -121,11 +146,19 @@ def run_data_update(args):
             
             logger.info(f"=== 특정일 전체 시장 데이터 업데이트: {target_date} ===")
             updater.update_daily_market_data(target_date)
+            updater.finalize_ingestion()
             logger.info("=== 특정일 전체 시장 데이터 업데이트 완료 ===")
             return
 
         start_date, end_date = calculate_date_range(args)
 
+        # 일자별(by-date) 수집: 누락 거래일마다 전체 시장 1회 호출
+        if getattr(args, 'by_date', False):
+            logger.info(f"=== 일자별 누락 거래일 수집: {start_date} ~ {end_date} ===")
+            results = updater.update_missing_trading_days(start_date, end_date, symbols=args.symbols or None)
+            logger.info(f"=== 일자별 수집 완료: {len(results)}일, {sum(results.values())}행 ===")
+            return
+
         # 특정 종목 데이터 업데이트
         if args.symbols:
             logger.info(f"=== 특정 종목 데이터 업데이트: {start_date} ~ {end_date} ===")
@@ -171,6 +204,7 @@ def run_data_update(args):
                 logger.info(f"순차 처리로 {len(args.symbols)}개 종목 업데이트")
                 for symbol in args.symbols:
                     updater.update_specific_stock_data(symbol, start_date, end_date)
+                updater.finalize_ingestion()
         
         # 전체 시장 데이터 업데이트
         else:
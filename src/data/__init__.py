@@ -9,11 +9,18 @@
 """
 
 # 핵심 모듈들
+from .connection_manager import ConnectionManager, connection_manager, get_pooled_connection
 from .database import DatabaseManager
 from .indicators import TechnicalIndicators, TALibIndicators
 from .stock_filter import StockFilter
-from .trading_calendar import TradingCalendar
+from .trading_calendar import TradingCalendar, TradingDayIndex, get_trading_day_index, lookback_start_date
 from .stock_data_manager import StockDataManager
+from .panel_loader import OHLCVPanel, load_panel
+from .columnar_store import ColumnarOHLCV, ColumnarOHLCVStore, open_columnar_store
+from .data_source import MarketDataSource, PykrxDataSource, RecordingDataSource, ReplayDataSource
+from .backup import DatabaseBackupManager
+from .rankings import DailyRankingBuilder
+from .bar_aggregator import Bar, TickBarAggregator
 from .updater import StockDataUpdater
 
 # 설정 관리 시스템
@@ -48,12 +55,25 @@ from .config import config_manager
 
 __all__ = [
     # 핵심 클래스들
+    "ConnectionManager",
     "DatabaseManager",
     "TechnicalIndicators", 
     "TALibIndicators",
     "StockDataManager",
+    "OHLCVPanel",
+    "ColumnarOHLCV",
+    "ColumnarOHLCVStore",
+    "MarketDataSource",
+    "PykrxDataSource",
+    "RecordingDataSource",
+    "ReplayDataSource",
+    "DatabaseBackupManager",
+    "DailyRankingBuilder",
+    "Bar",
+    "TickBarAggregator",
     "StockFilter",
     "TradingCalendar",
+    "TradingDayIndex",
     "StockDataUpdater",
     
     # 설정 관리 클래스들
@@ -78,11 +98,17 @@ __all__ = [
     "get_kospi_top",
     "get_kosdaq_top", 
     "get_database_summary",
+    "get_pooled_connection",
+    "load_panel",
+    "open_columnar_store",
+    "get_trading_day_index",
+    "lookback_start_date",
     
     # 전역 인스턴스들
     "stock_filter",
     "trading_calendar",
     "config_manager",
+    "connection_manager",
 ]
 
 
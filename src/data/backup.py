@@ -0,0 +1,322 @@
+"""
+SQLite 온라인 백업
+
+sqlite3 온라인 백업 API(Connection.backup)로 페이지 단위 복사를 수행합니다.
+한 번에 pages 페이지씩 복사하고 단계 사이에 잠금을 놓으므로, 수 GB DB를 백업하는 동안에도
+업데이터의 쓰기가 멈추지 않습니다. 복사 중 원본이 변경되면 SQLite가 자동으로 다시 복사합니다.
+
+- backup(): 전체 백업 (진행률 콜백, gzip 압축 선택)
+- snapshot(): 업데이트 전 롤백 지점. 파일시스템이 지원하면 reflink(copy-on-write) 복제로
+  데이터 크기와 무관하게 즉시 생성하고, 미지원 시 단계적 온라인 백업으로 대체
+- restore(): 전체 복원 또는 지정 종목만 복원 (ATTACH 후 집합 연산 1회)
+
+사용 예시:
+    manager = DatabaseBackupManager("data/trading.db")
+    path = manager.backup(compress=True, progress=lambda done, total: print(done, total))
+    point = manager.snapshot("before_update")
+    manager.restore(point, symbols=["005930"])
+"""
+
+import os
+import gzip
+import time
+import shutil
+import sqlite3
+import logging
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Union
+
+from .connection_manager import get_pooled_connection
+from .ohlcv_schema import COMPACT_TABLE, DAY_TO_DATE_SQL, DATE_TO_DAY_SQL, LEGACY_TABLE, ohlcv_layout
+
+logger = logging.getLogger(__name__)
+
+# linux/fs.h FICLONE: 대상 파일을 원본의 copy-on-write 복제로 만듦 (btrfs, XFS, APFS 미지원)
+FICLONE = 0x40049409
+
+# 종목 단위 복원 대상 테이블 (stock_ohlcv는 압축 스키마면 stock_ohlcv_days로 대체)
+SYMBOL_TABLES = (LEGACY_TABLE, "stock_info")
+
+ProgressCallback = Callable[[int, int], None]
+
+
+def _reflink(source: Path, target: Path) -> bool:
+    """source를 target으로 reflink 복제 (지원하지 않으면 False)"""
+    try:
+        import fcntl
+    except ImportError:
+        return False
+
+    try:
+        with open(source, "rb") as src, open(target, "wb") as dst:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+        return True
+    except OSError:
+        target.unlink(missing_ok=True)
+        return False
+
+
+class DatabaseBackupManager:
+    """SQLite DB 백업/스냅샷/복원"""
+
+    def __init__(
+        self,
+        db_path: str = "data/trading.db",
+        backup_dir: Optional[Union[str, Path]] = None,
+        pages_per_step: int = 4096,
+        step_sleep: float = 0.0,
+    ):
+        """
+        Args:
+            db_path: 원본 DB 경로
+            backup_dir: 백업 저장 디렉토리 (기본: DB 디렉토리의 backups/)
+            pages_per_step: 백업 단계당 복사 페이지 수 (작을수록 쓰기 대기 짧음)
+            step_sleep: 단계 사이 대기 시간 (초)
+        """
+        self.db_path = Path(db_path)
+        self.backup_dir = Path(backup_dir) if backup_dir else self.db_path.parent / "backups"
+        self.pages_per_step = pages_per_step
+        self.step_sleep = step_sleep
+
+    def _target_path(self, name: Optional[str], prefix: str) -> Path:
+        self.backup_dir.mkdir(parents=True, exist_ok=True)
+        name = name or f"{prefix}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        return self.backup_dir / f"{name}.db"
+
+    def _online_copy(self, target: Path, progress: Optional[ProgressCallback] = None) -> int:
+        """온라인 백업 API로 target에 단계적 복사. 전체 페이지 수 반환"""
+        source = get_pooled_connection(str(self.db_path))
+        pages_total = 0
+
+        def on_step(status, remaining, total):
+            nonlocal pages_total
+            pages_total = total
+            if progress:
+                progress(total - remaining, total)
+
+        tmp = target.with_name(target.name + ".tmp")
+        tmp.unlink(missing_ok=True)
+        dest = sqlite3.connect(str(tmp))
+        try:
+            source.backup(dest, pages=self.pages_per_step, progress=on_step, sleep=self.step_sleep)
+        finally:
+            dest.close()
+        os.replace(tmp, target)
+        return pages_total
+
+    def backup(
+        self,
+        name: Optional[str] = None,
+        compress: bool = False,
+        progress: Optional[ProgressCallback] = None,
+    ) -> str:
+        """전체 백업 생성
+
+        Args:
+            name: 백업 이름 (기본: backup_<타임스탬프>)
+            compress: gzip 압축 (.db.gz)
+            progress: progress(복사한 페이지, 전체 페이지) 콜백
+
+        Returns:
+            백업 파일 경로
+        """
+        start = time.perf_counter()
+        target = self._target_path(name, "backup")
+        pages = self._online_copy(target, progress)
+
+        if compress:
+            compressed = target.with_name(target.name + ".gz")
+            tmp = compressed.with_name(compressed.name + ".tmp")
+            with open(target, "rb") as src, gzip.open(tmp, "wb", compresslevel=6) as dst:
+                shutil.copyfileobj(src, dst, 1024 * 1024)
+            os.replace(tmp, compressed)
+            target.unlink()
+            target = compressed
+
+        logger.info(
+            f"백업 완료: {target} ({pages:,}페이지, {target.stat().st_size / 1024 / 1024:.1f}MB, "
+            f"{time.perf_counter() - start:.2f}초)"
+        )
+        return str(target)
+
+    def snapshot(self, name: Optional[str] = None, progress: Optional[ProgressCallback] = None) -> str:
+        """업데이트 전 롤백 지점 생성
+
+        쓰기 잠금(BEGIN IMMEDIATE)을 잡은 상태에서 DB와 WAL 파일을 reflink로 복제하므로
+        잠금 시간은 파일 크기와 무관하게 짧습니다. reflink를 지원하지 않는 파일시스템에서는
+        단계적 온라인 백업으로 대체합니다.
+
+        Returns:
+            스냅샷 파일 경로
+        """
+        start = time.perf_counter()
+        target = self._target_path(name, "snapshot")
+        tmp = target.with_name(target.name + ".tmp")
+        cloned = False
+
+        conn = sqlite3.connect(str(self.db_path), timeout=30, isolation_level=None)
+        try:
+            conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                wal = Path(f"{self.db_path}-wal")
+                cloned = _reflink(self.db_path, tmp)
+                if cloned and wal.exists() and wal.stat().st_size > 0:
+                    cloned = _reflink(wal, Path(f"{tmp}-wal"))
+            finally:
+                conn.execute("ROLLBACK")
+        finally:
+            conn.close()
+
+        if cloned:
+            # 복제된 WAL을 스냅샷 파일에 반영하여 단일 파일로 만듦
+            snap = sqlite3.connect(str(tmp))
+            try:
+                snap.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                snap.execute("PRAGMA journal_mode=DELETE")
+            finally:
+                snap.close()
+            os.replace(tmp, target)
+            method = "reflink"
+        else:
+            tmp.unlink(missing_ok=True)
+            Path(f"{tmp}-wal").unlink(missing_ok=True)
+            self._online_copy(target, progress)
+            method = "online backup"
+
+        logger.info(f"스냅샷 생성: {target} ({method}, {time.perf_counter() - start:.2f}초)")
+        return str(target)
+
+    def restore(self, backup_path: Union[str, Path], symbols: Optional[List[str]] = None) -> bool:
+        """백업에서 복원
+
+        Args:
+            backup_path: backup()/snapshot()이 만든 파일 (.db 또는 .db.gz)
+            symbols: 복원할 종목 (None이면 DB 전체를 백업 시점으로 되돌림)
+        """
+        backup_path = Path(backup_path)
+        extracted = None
+        try:
+            if backup_path.suffix == ".gz":
+                fd, extracted = tempfile.mkstemp(suffix=".db", dir=str(self.backup_dir))
+                with os.fdopen(fd, "wb") as dst, gzip.open(backup_path, "rb") as src:
+                    shutil.copyfileobj(src, dst, 1024 * 1024)
+                source_path = Path(extracted)
+            else:
+                source_path = backup_path
+
+            if symbols is None:
+                self._restore_full(source_path)
+            else:
+                self._restore_symbols(source_path, symbols)
+            logger.info(f"복원 완료: {backup_path} ({'전체' if symbols is None else f'{len(symbols)}개 종목'})")
+            return True
+        except Exception as e:
+            logger.error(f"복원 실패: {e}")
+            return False
+        finally:
+            if extracted:
+                Path(extracted).unlink(missing_ok=True)
+
+    def _restore_full(self, source_path: Path):
+        """백업 API를 역방향으로 사용하여 원본 DB 전체 교체"""
+        source = sqlite3.connect(str(source_path))
+        try:
+            source.backup(get_pooled_connection(str(self.db_path)), pages=self.pages_per_step)
+        finally:
+            source.close()
+
+    def _restore_symbols(self, source_path: Path, symbols: List[str]):
+        """지정 종목 행만 백업 내용으로 교체 (단일 트랜잭션)
+
+        압축 스키마(stock_ohlcv가 호환 뷰)이면 stock_ohlcv_days를 직접 복원하며,
+        원본과 백업의 스키마가 다르면 date와 day를 변환합니다.
+        """
+        conn = get_pooled_connection(str(self.db_path))
+        conn.execute("ATTACH DATABASE ? AS backup_src", (str(source_path),))
+        try:
+            backup_tables = {
+                row[0] for row in conn.execute("SELECT name FROM backup_src.sqlite_master WHERE type = 'table'")
+            }
+            with conn:
+                conn.execute("CREATE TEMP TABLE IF NOT EXISTS _restore_symbols (symbol TEXT PRIMARY KEY)")
+                conn.execute("DELETE FROM _restore_symbols")
+                conn.executemany("INSERT OR IGNORE INTO _restore_symbols VALUES (?)", [(s,) for s in symbols])
+                for table in SYMBOL_TABLES:
+                    if table == LEGACY_TABLE:
+                        statements = self._ohlcv_restore_sql(conn, backup_tables)
+                    elif table in backup_tables:
+                        statements = (
+                            f"DELETE FROM main.{table} WHERE symbol IN (SELECT symbol FROM _restore_symbols)",
+                            f"INSERT INTO main.{table} SELECT * FROM backup_src.{table} "
+                            f"WHERE symbol IN (SELECT symbol FROM _restore_symbols)",
+                        )
+                    else:
+                        statements = ()
+                    for sql in statements:
+                        conn.execute(sql)
+        finally:
+            conn.execute("DETACH DATABASE backup_src")
+
+    @staticmethod
+    def _ohlcv_restore_sql(conn: sqlite3.Connection, backup_tables: set) -> tuple:
+        """OHLCV 종목 복원 DELETE/INSERT 문 (백업에 OHLCV 테이블이 없으면 빈 튜플)"""
+        target_compact = ohlcv_layout(conn) == "compact"
+        if COMPACT_TABLE in backup_tables:
+            source, source_compact = COMPACT_TABLE, True
+        elif LEGACY_TABLE in backup_tables:
+            source, source_compact = LEGACY_TABLE, False
+        else:
+            return ()
+
+        target = COMPACT_TABLE if target_compact else LEGACY_TABLE
+        source_columns = {row[1] for row in conn.execute(f"PRAGMA backup_src.table_info({source})")}
+        columns, expressions = [], []
+        for row in conn.execute(f"PRAGMA main.table_info({target})"):
+            name = row[1]
+            if name == "day" and not source_compact:
+                expression = DATE_TO_DAY_SQL.format("date")
+            elif name == "date" and source_compact:
+                expression = DAY_TO_DATE_SQL.format("day")
+            elif name in source_columns:
+                expression = name
+            else:
+                continue
+            columns.append(name)
+            expressions.append(expression)
+
+        return (
+            f"DELETE FROM main.{target} WHERE symbol IN (SELECT symbol FROM _restore_symbols)",
+            f"INSERT INTO main.{target} ({', '.join(columns)}) SELECT {', '.join(expressions)} "
+            f"FROM backup_src.{source} WHERE symbol IN (SELECT symbol FROM _restore_symbols)",
+        )
+
+    def list_backups(self) -> List[Dict]:
+        """백업 파일 목록 (최신순)"""
+        if not self.backup_dir.exists():
+            return []
+        files = [p for p in self.backup_dir.iterdir() if p.name.endswith((".db", ".db.gz"))]
+        files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
+        return [
+            {
+                "path": str(p),
+                "size": p.stat().st_size,
+                "created": datetime.fromtimestamp(p.stat().st_mtime),
+                "compressed": p.suffix == ".gz",
+            }
+            for p in files
+        ]
+
+    def cleanup(self, keep_days: int = 30, keep_min: int = 1) -> int:
+        """keep_days보다 오래된 백업 삭제 (최신 keep_min개는 유지). 삭제 개수 반환"""
+        now = datetime.now()
+        removed = 0
+        for info in self.list_backups()[keep_min:]:
+            if (now - info["created"]).days > keep_days:
+                Path(info["path"]).unlink(missing_ok=True)
+                removed += 1
+        if removed:
+            logger.info(f"오래된 백업 {removed}개 삭제")
+        return removed
@@ -0,0 +1,443 @@
+"""
+실시간 체결 틱 -> 분/일 OHLCV 봉 집계기
+
+WebSocketClient의 체결(0B) 이벤트를 종목별 1분/5분/일봉으로 집계합니다.
+
+- 종목마다 슬롯 번호를 부여하고, 진행 중인 봉은 슬롯 인덱스 리스트에, 완성된 봉은
+  미리 할당한 NumPy 링 버퍼(종목 x depth x 6)에 보관 (틱마다 DataFrame/객체 생성 없음)
+- 틱은 가장 짧은 주기 봉만 갱신하고, 긴 주기 봉은 짧은 봉이 완성될 때 합산
+- 완성된 봉은 구독자 콜백에 묶음(List[Bar])으로 전달하고, stock_bars 테이블에
+  배치 UPSERT (flush() 또는 run_flusher())
+- 시각은 거래소 현지 시각 기준 epoch 초 (KST 벽시계를 UTC로 간주한 값)
+
+사용 예시:
+    aggregator = TickBarAggregator(db_path="data/trading.db")
+    aggregator.subscribe(on_bars, intervals=["1m"])
+    client.add_handler("0B", aggregator.on_events)
+    asyncio.create_task(aggregator.run_flusher())
+"""
+
+import asyncio
+import logging
+import re
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .connection_manager import get_pooled_connection
+
+logger = logging.getLogger(__name__)
+
+BARS_TABLE = "stock_bars"
+
+BAR_FIELDS = ("start", "open", "high", "low", "close", "volume")
+
+# 키움 실시간 체결(0B) 필드 코드
+FID_PRICE = "10"
+FID_TRADE_VOLUME = "15"
+FID_TRADE_TIME = "20"
+
+_EPOCH = datetime(1970, 1, 1)
+_INTERVAL_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+BARS_SCHEMA_SQL = f"""
+    CREATE TABLE IF NOT EXISTS {BARS_TABLE} (
+        symbol TEXT NOT NULL,
+        interval INTEGER NOT NULL,
+        start INTEGER NOT NULL,
+        open INTEGER,
+        high INTEGER,
+        low INTEGER,
+        close INTEGER,
+        volume INTEGER,
+        PRIMARY KEY (symbol, interval, start)
+    ) WITHOUT ROWID
+"""
+
+BARS_UPSERT_SQL = f"INSERT OR REPLACE INTO {BARS_TABLE} VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+
+
+class Bar(NamedTuple):
+    """완성된 봉"""
+
+    symbol: str
+    interval: str
+    start: int
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+
+
+def interval_seconds(interval: str) -> int:
+    """'1m', '5m', '1d' 형식의 주기를 초로 변환"""
+    match = re.fullmatch(r"(\d+)([smhd])", interval)
+    if not match or int(match.group(1)) <= 0:
+        raise ValueError(f"지원하지 않는 봉 주기: {interval}")
+    return int(match.group(1)) * _INTERVAL_UNITS[match.group(2)]
+
+
+def local_epoch_seconds(moment: Optional[datetime] = None) -> float:
+    """현지 벽시계 시각을 epoch 초로 변환 (기본: 현재 시각)"""
+    return ((moment or datetime.now()) - _EPOCH).total_seconds()
+
+
+def bar_start_to_datetime(start: int) -> datetime:
+    """봉 시작 시각(현지 epoch 초)을 datetime으로 변환"""
+    return _EPOCH + timedelta(seconds=start)
+
+
+class _IntervalState:
+    """한 주기의 진행 중 봉(슬롯별 리스트)과 완성 봉 링 버퍼"""
+
+    def __init__(self, name: str, seconds: int, capacity: int, depth: int):
+        self.name = name
+        self.seconds = seconds
+        self.depth = depth
+        self.start = [-1] * capacity  # -1: 진행 중 봉 없음
+        self.open = [0.0] * capacity
+        self.high = [0.0] * capacity
+        self.low = [0.0] * capacity
+        self.close = [0.0] * capacity
+        self.volume = [0.0] * capacity
+        self.ring = np.zeros((capacity, depth, len(BAR_FIELDS)), dtype=np.float64)
+        self.count = np.zeros(capacity, dtype=np.int64)
+
+    def grow(self, capacity: int):
+        extra = capacity - len(self.start)
+        self.start.extend([-1] * extra)
+        for values in (self.open, self.high, self.low, self.close, self.volume):
+            values.extend([0.0] * extra)
+        ring = np.zeros((capacity, self.depth, len(BAR_FIELDS)), dtype=np.float64)
+        ring[: self.ring.shape[0]] = self.ring
+        self.ring = ring
+        count = np.zeros(capacity, dtype=np.int64)
+        count[: self.count.shape[0]] = self.count
+        self.count = count
+
+    def merge(self, slot: int, start: int, o: float, h: float, l: float, c: float, v: float):
+        """하위 주기 봉을 진행 중 봉에 합산"""
+        if self.start[slot] != start:
+            self.start[slot] = start
+            self.open[slot] = o
+            self.high[slot] = h
+            self.low[slot] = l
+            self.close[slot] = c
+            self.volume[slot] = v
+            return
+        if h > self.high[slot]:
+            self.high[slot] = h
+        if l < self.low[slot]:
+            self.low[slot] = l
+        self.close[slot] = c
+        self.volume[slot] += v
+
+
+class TickBarAggregator:
+    """종목별 체결 틱을 여러 주기의 OHLCV 봉으로 집계"""
+
+    def __init__(
+        self,
+        intervals: Sequence[str] = ("1m", "5m", "1d"),
+        db_path: Optional[str] = None,
+        max_symbols: int = 4096,
+        depth: int = 512,
+        flush_interval: float = 5.0,
+    ):
+        """
+        Args:
+            intervals: 집계 주기 (가장 짧은 주기의 배수여야 함)
+            db_path: 완성 봉 저장 DB (None이면 저장하지 않음)
+            max_symbols: 초기 종목 슬롯 수 (초과 시 2배로 확장)
+            depth: 종목/주기별 링 버퍼에 보관할 완성 봉 수
+            flush_interval: run_flusher()의 저장 주기 (초)
+        """
+        specs = sorted((interval_seconds(name), name) for name in intervals)
+        if not specs:
+            raise ValueError("봉 주기가 비어 있습니다")
+        base_seconds = specs[0][0]
+        for seconds, name in specs:
+            if seconds % base_seconds:
+                raise ValueError(f"{name}은 최소 주기 {specs[0][1]}의 배수가 아닙니다")
+        self.db_path = db_path
+        self.flush_interval = flush_interval
+        self._capacity = max_symbols
+        self._states = [_IntervalState(name, seconds, max_symbols, depth) for seconds, name in specs]
+        self._base = self._states[0]
+        self._higher = self._states[1:]
+        self._by_name = {state.name: state for state in self._states}
+        self._slots: Dict[str, int] = {}
+        self._symbols: List[str] = []
+        self._sealed: List[float] = [-1] * max_symbols  # 슬롯별 마지막으로 완성된 기본 봉 시작 시각
+        self._completed: List[Bar] = []
+        self._pending_rows: List[Tuple] = []
+        self._subscribers: List[Tuple[Callable[[List[Bar]], None], Optional[frozenset]]] = []
+        self._session_base: Optional[Tuple[date, float]] = None
+        self.stats = {"ticks": 0, "late_ticks": 0, "bars": 0, "flushed": 0}
+
+        if db_path:
+            with get_pooled_connection(db_path) as conn:
+                conn.execute(BARS_SCHEMA_SQL)
+
+    # ---- 구성 ----
+
+    @property
+    def intervals(self) -> List[str]:
+        return [state.name for state in self._states]
+
+    @property
+    def symbols(self) -> List[str]:
+        return list(self._symbols)
+
+    def subscribe(self, callback: Callable[[List[Bar]], None], intervals: Optional[Iterable[str]] = None):
+        """완성 봉 구독 (callback(bars), intervals가 있으면 해당 주기만)"""
+        names = frozenset(intervals) if intervals is not None else None
+        if names and not names <= set(self._by_name):
+            raise ValueError(f"집계하지 않는 주기: {sorted(names - set(self._by_name))}")
+        self._subscribers.append((callback, names))
+
+    def _add_symbol(self, symbol: str) -> int:
+        slot = len(self._symbols)
+        if slot >= self._capacity:
+            self._capacity *= 2
+            for state in self._states:
+                state.grow(self._capacity)
+            self._sealed.extend([-1] * (self._capacity - len(self._sealed)))
+        self._slots[symbol] = slot
+        self._symbols.append(symbol)
+        return slot
+
+    # ---- 틱 입력 ----
+
+    def _update(self, symbol: str, ts: float, price: float, volume: float):
+        """틱 한 건 반영 (완성 봉은 self._completed에 누적)"""
+        slot = self._slots.get(symbol)
+        if slot is None:
+            slot = self._add_symbol(symbol)
+        base = self._base
+        start = int(ts - ts % base.seconds)
+        if start == base.start[slot]:
+            if price > base.high[slot]:
+                base.high[slot] = price
+            elif price < base.low[slot]:
+                base.low[slot] = price
+            base.close[slot] = price
+            base.volume[slot] += volume
+            return
+        if start <= self._sealed[slot] or start < base.start[slot]:
+            # 이미 완성되어 내보낸 봉의 지연 틱
+            self.stats["late_ticks"] += 1
+            return
+        if base.start[slot] >= 0:
+            self._complete_base(slot)
+        for state in self._higher:
+            current = state.start[slot]
+            if current >= 0 and current != start - start % state.seconds:
+                self._complete(state, slot)
+        base.start[slot] = start
+        base.open[slot] = base.high[slot] = base.low[slot] = base.close[slot] = price
+        base.volume[slot] = volume
+
+    def on_tick(self, symbol: str, ts: float, price: float, volume: float) -> List[Bar]:
+        """체결 틱 한 건 반영, 이 틱으로 완성된 봉 반환"""
+        self.stats["ticks"] += 1
+        self._update(symbol, ts, price, volume)
+        return self._emit()
+
+    def on_ticks(
+        self,
+        symbols: Sequence[str],
+        timestamps: Sequence[float],
+        prices: Sequence[float],
+        volumes: Sequence[float],
+    ) -> List[Bar]:
+        """체결 틱 묶음 반영 (시간순), 완성된 봉을 한 번에 전달"""
+        update = self._update
+        for symbol, ts, price, volume in zip(symbols, timestamps, prices, volumes):
+            update(symbol, ts, price, volume)
+        self.stats["ticks"] += len(symbols)
+        return self._emit()
+
+    def on_events(self, events: List[dict]) -> List[Bar]:
+        """WebSocketClient 체결(0B) 이벤트 묶음 반영 (MessagePipeline 배치 핸들러로 사용)
+
+        체결시간(20, HHMMSS)은 당일 날짜 기준으로 해석하고, 없으면 수신 시각을 사용합니다.
+        """
+        base = self._session_seconds()
+        update = self._update
+        count = 0
+        for event in events:
+            values = event.get("values") or {}
+            symbol = event.get("item")
+            price = values.get(FID_PRICE)
+            if not symbol or not price:
+                continue
+            hhmmss = values.get(FID_TRADE_TIME)
+            if hhmmss and len(hhmmss) == 6:
+                ts = base + int(hhmmss[:2]) * 3600 + int(hhmmss[2:4]) * 60 + int(hhmmss[4:])
+            else:
+                ts = local_epoch_seconds()
+            update(symbol, ts, abs(float(price)), abs(float(values.get(FID_TRADE_VOLUME) or 0)))
+            count += 1
+        self.stats["ticks"] += count
+        return self._emit()
+
+    def _session_seconds(self) -> float:
+        today = date.today()
+        if self._session_base is None or self._session_base[0] != today:
+            self._session_base = (today, local_epoch_seconds(datetime.combine(today, datetime.min.time())))
+        return self._session_base[1]
+
+    # ---- 봉 완성 ----
+
+    def _complete_base(self, slot: int):
+        base = self._base
+        start = base.start[slot]
+        o, h, l, c, v = base.open[slot], base.high[slot], base.low[slot], base.close[slot], base.volume[slot]
+        self._record(base, slot, start, o, h, l, c, v)
+        self._sealed[slot] = start
+        base.start[slot] = -1
+        for state in self._higher:
+            higher_start = start - start % state.seconds
+            if state.start[slot] >= 0 and state.start[slot] != higher_start:
+                self._complete(state, slot)
+            state.merge(slot, higher_start, o, h, l, c, v)
+
+    def _complete(self, state: _IntervalState, slot: int):
+        self._record(
+            state, slot, state.start[slot],
+            state.open[slot], state.high[slot], state.low[slot], state.close[slot], state.volume[slot],
+        )
+        state.start[slot] = -1
+
+    def _record(self, state: _IntervalState, slot: int, start: int, o, h, l, c, v):
+        state.ring[slot, state.count[slot] % state.depth] = (start, o, h, l, c, v)
+        state.count[slot] += 1
+        symbol = self._symbols[slot]
+        self._completed.append(Bar(symbol, state.name, start, o, h, l, c, v))
+        self._pending_rows.append((symbol, state.seconds, start, o, h, l, c, v))
+
+    def advance(self, ts: Optional[float] = None) -> List[Bar]:
+        """ts(기본: 현재 시각)까지 끝난 봉을 틱 없이도 완성 처리"""
+        ts = local_epoch_seconds() if ts is None else ts
+        base = self._base
+        for slot in range(len(self._symbols)):
+            if 0 <= base.start[slot] and base.start[slot] + base.seconds <= ts:
+                self._complete_base(slot)
+            for state in self._higher:
+                if 0 <= state.start[slot] and state.start[slot] + state.seconds <= ts:
+                    self._complete(state, slot)
+        return self._emit()
+
+    def close_all(self) -> List[Bar]:
+        """진행 중인 모든 봉을 강제로 완성 (장 마감 처리)"""
+        for slot in range(len(self._symbols)):
+            if self._base.start[slot] >= 0:
+                self._complete_base(slot)
+            for state in self._higher:
+                if state.start[slot] >= 0:
+                    self._complete(state, slot)
+        return self._emit()
+
+    def _emit(self) -> List[Bar]:
+        if not self._completed:
+            return []
+        bars, self._completed = self._completed, []
+        self.stats["bars"] += len(bars)
+        for callback, names in self._subscribers:
+            selected = bars if names is None else [bar for bar in bars if bar.interval in names]
+            if not selected:
+                continue
+            try:
+                callback(selected)
+            except Exception as e:
+                logger.error(f"봉 구독자 오류: {e}", exc_info=True)
+        return bars
+
+    # ---- 조회 ----
+
+    def history(self, symbol: str, interval: str, count: Optional[int] = None) -> np.ndarray:
+        """링 버퍼의 완성 봉 (오래된 순, shape=(n, 6), 열 순서는 BAR_FIELDS)"""
+        state = self._by_name[interval]
+        slot = self._slots.get(symbol)
+        if slot is None:
+            return np.empty((0, len(BAR_FIELDS)))
+        total = int(state.count[slot])
+        n = min(total, state.depth, count if count is not None else state.depth)
+        positions = np.arange(total - n, total) % state.depth
+        return state.ring[slot, positions]
+
+    def current(self, symbol: str, interval: str) -> Optional[Bar]:
+        """진행 중인 봉 (긴 주기는 진행 중인 기본 봉까지 합산)"""
+        slot = self._slots.get(symbol)
+        if slot is None:
+            return None
+        state, base = self._by_name[interval], self._base
+        parts = [
+            (s.start[slot], s.open[slot], s.high[slot], s.low[slot], s.close[slot], s.volume[slot])
+            for s in ((state, base) if state is not base else (base,))
+            if s.start[slot] >= 0
+        ]
+        if not parts:
+            return None
+        start = parts[0][0] - parts[0][0] % state.seconds
+        return Bar(
+            symbol, interval, start, parts[0][1],
+            max(p[2] for p in parts), min(p[3] for p in parts), parts[-1][4], sum(p[5] for p in parts),
+        )
+
+    # ---- 저장 ----
+
+    def flush(self) -> int:
+        """완성 봉을 stock_bars에 배치 UPSERT하고 저장 행 수 반환"""
+        rows, self._pending_rows = self._pending_rows, []
+        if not rows or not self.db_path:
+            return 0
+        try:
+            with get_pooled_connection(self.db_path) as conn:
+                conn.executemany(BARS_UPSERT_SQL, rows)
+        except Exception:
+            # 다음 flush에서 재시도
+            self._pending_rows[:0] = rows
+            raise
+        self.stats["flushed"] += len(rows)
+        return len(rows)
+
+    async def run_flusher(self, interval: Optional[float] = None):
+        """주기적으로 끝난 봉을 완성 처리하고 DB에 저장 (취소 시 남은 봉 저장)"""
+        interval = interval or self.flush_interval
+        try:
+            while True:
+                await asyncio.sleep(interval)
+                self.advance()
+                try:
+                    await asyncio.to_thread(self.flush)
+                except Exception as e:
+                    logger.error(f"봉 저장 실패: {e}")
+        finally:
+            await asyncio.to_thread(self.flush)
+
+
+def load_bars(
+    db_path: str,
+    symbol: str,
+    interval: str = "1m",
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+) -> np.ndarray:
+    """stock_bars에서 종목/주기 봉 조회 (shape=(n, 6), 열 순서는 BAR_FIELDS)"""
+    conditions = ["symbol = ?", "interval = ?"]
+    params: list = [symbol, interval_seconds(interval)]
+    if start is not None:
+        conditions.append("start >= ?")
+        params.append(int(local_epoch_seconds(start)))
+    if end is not None:
+        conditions.append("start <= ?")
+        params.append(int(local_epoch_seconds(end)))
+    rows = get_pooled_connection(db_path).execute(
+        f"SELECT {', '.join(BAR_FIELDS)} FROM {BARS_TABLE} WHERE {' AND '.join(conditions)} ORDER BY start",
+        params,
+    ).fetchall()
+    return np.array(rows, dtype=np.float64).reshape(-1, len(BAR_FIELDS))
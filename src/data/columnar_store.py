@@ -0,0 +1,334 @@
+"""
+메모리 맵 컬럼형 OHLCV 저장소
+
+`stock_ohlcv` 테이블을 필드별 .npy 파일로 내보내고 `np.load(mmap_mode='r')`로 엽니다.
+백테스트/스크리닝 시작 시 SQLite 조회와 pandas 파싱 없이 전체 시장을 즉시 열 수 있고,
+여러 프로세스가 같은 파일을 열면 OS 페이지 캐시를 공유하므로 워커별 복사본이 생기지 않습니다.
+
+파일 구성 (세대 디렉토리 단위로 원자적 교체):
+    <root>/CURRENT              현재 세대 디렉토리 이름
+    <root>/gen-<n>/meta.json    종목 목록, 행 수, 마지막 날짜
+    <root>/gen-<n>/day.npy      int32, 1970-01-01 기준 일수
+    <root>/gen-<n>/open.npy     int32 (high/low/close 동일)
+    <root>/gen-<n>/volume.npy   int64
+    <root>/gen-<n>/offsets.npy  int64, 종목 i의 행 구간 = [offsets[i], offsets[i+1])
+
+행은 (symbol, day) 순으로 정렬되어 있어 종목별 조회는 슬라이스, 기간 조회는 이진 탐색입니다.
+
+사용 예시:
+    store = ColumnarOHLCVStore.for_database(db_path)
+    store.export()                      # 최초 전체 내보내기
+    store.sync(since="2024-06-01")      # 이후 변경분만 재반영
+    data = store.open()
+    df = data.get_frame("005930", "2024-01-01", "2024-12-31")
+"""
+
+import os
+import json
+import shutil
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .connection_manager import get_pooled_connection
+from .ohlcv_schema import ohlcv_source
+from .panel_loader import _parse_dates
+
+logger = logging.getLogger(__name__)
+
+PRICE_FIELDS = ("open", "high", "low", "close")
+FIELDS = PRICE_FIELDS + ("volume",)
+FIELD_DTYPES = {"open": np.int32, "high": np.int32, "low": np.int32, "close": np.int32, "volume": np.int64}
+
+CURRENT_FILE = "CURRENT"
+META_FILE = "meta.json"
+DEFAULT_DIR_NAME = "columnar"
+
+_INT32_MAX = np.iinfo(np.int32).max
+
+
+def date_to_day(date: Union[str, datetime, np.datetime64]) -> int:
+    """날짜를 1970-01-01 기준 일수(int)로 변환"""
+    return int(np.datetime64(pd.Timestamp(date).date(), "D").astype(np.int64))
+
+
+def day_to_date(day: int) -> str:
+    """일수를 'YYYY-MM-DD' 문자열로 변환"""
+    return str(np.datetime64(int(day), "D"))
+
+
+class ColumnarOHLCV:
+    """열린 컬럼형 저장소의 읽기 전용 뷰 (배열은 메모리 맵)"""
+
+    def __init__(self, path: Path, meta: Dict, arrays: Dict[str, np.ndarray]):
+        self.path = path
+        self.meta = meta
+        self.symbols: List[str] = meta["symbols"]
+        self.day = arrays["day"]
+        self.offsets = arrays["offsets"]
+        self.columns = {field: arrays[field] for field in FIELDS}
+        self._symbol_pos = {s: i for i, s in enumerate(self.symbols)}
+
+    def __len__(self) -> int:
+        return len(self.day)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._symbol_pos
+
+    @property
+    def last_date(self) -> Optional[str]:
+        return self.meta.get("last_date")
+
+    def symbol_range(self, symbol: str, start: Optional[str] = None, end: Optional[str] = None) -> Tuple[int, int]:
+        """종목의 [start, end] 기간 행 구간 반환 (없으면 빈 구간)"""
+        pos = self._symbol_pos.get(symbol)
+        if pos is None:
+            return 0, 0
+        lo, hi = int(self.offsets[pos]), int(self.offsets[pos + 1])
+        days = self.day[lo:hi]
+        if start is not None:
+            lo += int(np.searchsorted(days, date_to_day(start), side="left"))
+        if end is not None:
+            hi = int(self.offsets[pos]) + int(np.searchsorted(days, date_to_day(end), side="right"))
+        return lo, max(lo, hi)
+
+    def get_arrays(
+        self,
+        symbol: str,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Dict[str, np.ndarray]:
+        """종목의 필드별 배열 뷰 반환 (복사 없음, 'day' 포함)"""
+        lo, hi = self.symbol_range(symbol, start, end)
+        result = {"day": self.day[lo:hi]}
+        for field in fields or FIELDS:
+            result[field] = self.columns[field][lo:hi]
+        return result
+
+    def get_frame(
+        self,
+        symbol: str,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> pd.DataFrame:
+        """종목 데이터를 load_panel과 같은 형태의 DataFrame으로 반환"""
+        fields = list(fields or FIELDS)
+        arrays = self.get_arrays(symbol, start, end, fields)
+        index = pd.DatetimeIndex(arrays["day"].astype("datetime64[D]"), name="date")
+        return pd.DataFrame({f: arrays[f].astype(np.float64) for f in fields}, index=index)
+
+    def load_frames(
+        self,
+        symbols: Optional[Sequence[str]] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Dict[str, pd.DataFrame]:
+        """다종목 DataFrame 딕셔너리 반환 (데이터가 없는 종목 제외)"""
+        frames = {}
+        for symbol in symbols if symbols is not None else self.symbols:
+            df = self.get_frame(symbol, start, end, fields)
+            if not df.empty:
+                frames[symbol] = df
+        return frames
+
+
+class ColumnarOHLCVStore:
+    """`stock_ohlcv` -> 컬럼형 파일 내보내기/동기화 관리자"""
+
+    def __init__(self, root: Union[str, Path], db_path: Optional[str] = None):
+        self.root = Path(root)
+        if db_path is None:
+            from .config import get_database_config
+
+            db_path = get_database_config().full_path
+        self.db_path = db_path
+
+    @classmethod
+    def for_database(cls, db_path: str) -> "ColumnarOHLCVStore":
+        """DB 파일과 같은 디렉토리의 columnar/ 저장소"""
+        root = Path(os.path.dirname(os.path.abspath(db_path))) / DEFAULT_DIR_NAME
+        return cls(root, db_path)
+
+    def exists(self) -> bool:
+        return (self.root / CURRENT_FILE).exists()
+
+    def _current_dir(self) -> Optional[Path]:
+        try:
+            name = (self.root / CURRENT_FILE).read_text(encoding="utf-8").strip()
+        except FileNotFoundError:
+            return None
+        return self.root / name
+
+    def open(self) -> ColumnarOHLCV:
+        """현재 세대를 메모리 맵으로 열기"""
+        gen_dir = self._current_dir()
+        if gen_dir is None:
+            raise FileNotFoundError(f"컬럼형 저장소가 없습니다: {self.root} (먼저 export() 실행)")
+        with open(gen_dir / META_FILE, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        arrays = {
+            name: np.load(gen_dir / f"{name}.npy", mmap_mode="r")
+            for name in ("day", "offsets") + FIELDS
+        }
+        return ColumnarOHLCV(gen_dir, meta, arrays)
+
+    def export(self) -> int:
+        """전체 테이블 내보내기. 저장한 행 수 반환"""
+        symbols, day, values = self._read_rows(since=None)
+        return self._write_generation(symbols, day, values)
+
+    def sync(self, since: Optional[str] = None) -> int:
+        """since(YYYY-MM-DD) 이후 행만 DB에서 다시 읽어 반영. 갱신한 행 수 반환
+
+        since를 생략하면 마지막으로 반영된 날짜부터 다시 읽습니다.
+        저장소가 없으면 전체 내보내기를 수행합니다.
+        """
+        if not self.exists():
+            return self.export()
+
+        current = self.open()
+        since = since or current.last_date
+        if since is None:
+            return self.export()
+        since_day = date_to_day(since)
+
+        new_symbols, new_day, new_values = self._read_rows(since=day_to_date(since_day))
+
+        # 기존 행 중 since 이전만 유지하고 새 행과 병합
+        old_symbol_idx = np.repeat(
+            np.arange(len(current.symbols), dtype=np.int64), np.diff(current.offsets)
+        )
+        keep = np.asarray(current.day) < since_day
+        merged_symbols = sorted(set(current.symbols) | set(new_symbols.tolist()))
+        lookup = np.asarray(merged_symbols, dtype=object)
+
+        old_idx = np.searchsorted(lookup, np.asarray(current.symbols, dtype=object))[old_symbol_idx[keep]]
+        new_idx = np.searchsorted(lookup, new_symbols)
+
+        symbol_idx = np.concatenate([old_idx, new_idx])
+        day = np.concatenate([np.asarray(current.day)[keep], new_day])
+        values = {
+            field: np.concatenate([np.asarray(current.columns[field])[keep], new_values[field]])
+            for field in FIELDS
+        }
+        del current  # 메모리 맵 해제 후 세대 교체
+
+        order = np.lexsort((day, symbol_idx))
+        symbol_idx = symbol_idx[order]
+        rows = self._write_generation(
+            lookup,
+            day[order],
+            {field: arr[order] for field, arr in values.items()},
+            symbol_idx=symbol_idx,
+        )
+        logger.info(f"컬럼형 저장소 동기화: {since} 이후 {len(new_day)}행 반영 (전체 {rows}행)")
+        return len(new_day)
+
+    def _read_rows(self, since: Optional[str]) -> Tuple[np.ndarray, np.ndarray, Dict[str, np.ndarray]]:
+        """(symbol, date) 순으로 행 조회 후 (행별 종목, day, 필드 배열) 반환"""
+        conn = get_pooled_connection(self.db_path)
+        ohlcv = ohlcv_source(conn)
+        query = (
+            f"SELECT symbol, {ohlcv.date_column}, open, high, low, close, volume FROM {ohlcv.table} "
+            "WHERE close IS NOT NULL"
+        )
+        conditions, params = ohlcv.range_condition(since, None)
+        for condition in conditions:
+            query += f" AND {condition}"
+        query += f" ORDER BY symbol, {ohlcv.date_column}"
+        rows = conn.execute(query, params).fetchall()
+
+        if not rows:
+            empty = {field: np.empty(0, dtype=FIELD_DTYPES[field]) for field in FIELDS}
+            return np.empty(0, dtype=object), np.empty(0, dtype=np.int32), empty
+
+        columns = list(zip(*rows))
+        symbols = np.asarray(columns[0], dtype=object)
+        day = _parse_dates(np.asarray(columns[1])).astype(np.int32)
+
+        values = {}
+        for field, raw in zip(FIELDS, columns[2:]):
+            arr = np.array(raw, dtype=np.float64)  # NULL -> NaN
+            arr = np.nan_to_num(arr, nan=0.0).astype(np.int64)
+            if field in PRICE_FIELDS and arr.size and arr.max() > _INT32_MAX:
+                raise ValueError(f"{field} 값이 int32 범위를 초과합니다: {arr.max()}")
+            values[field] = arr.astype(FIELD_DTYPES[field])
+        return symbols, day, values
+
+    def _write_generation(
+        self,
+        row_symbols: np.ndarray,
+        day: np.ndarray,
+        values: Dict[str, np.ndarray],
+        symbol_idx: Optional[np.ndarray] = None,
+    ) -> int:
+        """새 세대 디렉토리에 기록 후 CURRENT를 원자적으로 교체
+
+        symbol_idx가 없으면 row_symbols는 행별 종목(정렬됨), 있으면 종목 목록입니다.
+        """
+        if symbol_idx is None:
+            symbols, symbol_idx = np.unique(row_symbols, return_inverse=True)
+        else:
+            symbols = row_symbols
+        counts = np.bincount(symbol_idx, minlength=len(symbols)) if len(symbols) else np.zeros(0, np.int64)
+        offsets = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+
+        # 행이 없는 종목 제거 (sync 후 전체 삭제된 종목)
+        present = counts > 0
+        if not present.all():
+            symbols = np.asarray(symbols, dtype=object)[present]
+            offsets = np.concatenate(([0], np.cumsum(counts[present]))).astype(np.int64)
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        gen_name = f"gen-{datetime.now().strftime('%Y%m%d%H%M%S%f')}"
+        gen_dir = self.root / gen_name
+        gen_dir.mkdir()
+
+        np.save(gen_dir / "day.npy", np.ascontiguousarray(day, dtype=np.int32))
+        np.save(gen_dir / "offsets.npy", offsets)
+        for field in FIELDS:
+            np.save(gen_dir / f"{field}.npy", np.ascontiguousarray(values[field], dtype=FIELD_DTYPES[field]))
+
+        meta = {
+            "symbols": [str(s) for s in symbols],
+            "rows": int(len(day)),
+            "first_date": day_to_date(day.min()) if len(day) else None,
+            "last_date": day_to_date(day.max()) if len(day) else None,
+            "created_at": datetime.now().isoformat(),
+            "source": os.path.abspath(self.db_path),
+        }
+        with open(gen_dir / META_FILE, "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False)
+
+        tmp_current = self.root / f"{CURRENT_FILE}.tmp"
+        tmp_current.write_text(gen_name, encoding="utf-8")
+        os.replace(tmp_current, self.root / CURRENT_FILE)
+
+        self._remove_old_generations(keep=gen_name)
+        logger.debug(f"컬럼형 저장소 기록: {gen_dir} ({len(symbols)}개 종목, {len(day)}행)")
+        return int(len(day))
+
+    def _remove_old_generations(self, keep: str):
+        """이전 세대 삭제 (다른 프로세스가 연 메모리 맵은 POSIX에서 유지됨, Windows는 다음 기회에 삭제)"""
+        for path in self.root.glob("gen-*"):
+            if path.name != keep:
+                shutil.rmtree(path, ignore_errors=True)
+
+
+def open_columnar_store(db_path: Optional[str] = None) -> Optional[ColumnarOHLCV]:
+    """DB에 대응하는 컬럼형 저장소를 열기 (없으면 None)"""
+    if db_path is None:
+        from .config import get_database_config
+
+        db_path = get_database_config().full_path
+    store = ColumnarOHLCVStore.for_database(db_path)
+    if not store.exists():
+        return None
+    return store.open()
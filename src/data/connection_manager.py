@@ -0,0 +1,194 @@
+"""
+SQLite 연결 관리 모듈
+
+- 스레드별 연결 재사용 (스레드마다 DB 경로당 하나의 연결)
+- 연결 생성 시 PRAGMA 일괄 적용 (WAL, synchronous=NORMAL, cache/mmap, temp_store)
+- 연결 재사용으로 sqlite3 내장 prepared statement 캐시 활용
+
+WAL 모드에서는 읽기 연결이 쓰기 트랜잭션에 의해 차단되지 않으므로
+Streamlit 등 조회 화면이 업데이터의 대량 쓰기 중에도 대기하지 않습니다.
+
+사용 예시:
+    from src.data.connection_manager import get_pooled_connection
+
+    with get_pooled_connection(db_path) as conn:  # 종료 시 commit/rollback (연결은 유지)
+        conn.execute("INSERT ...", params)
+"""
+
+import os
+import sqlite3
+import logging
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Tuple, Union, Any
+
+logger = logging.getLogger(__name__)
+
+PathLike = Union[str, Path]
+
+
+@dataclass
+class ConnectionPragmas:
+    """연결 생성 시 적용할 PRAGMA 설정"""
+
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    cache_size_kb: int = 64 * 1024  # 64MB 페이지 캐시
+    mmap_size: int = 256 * 1024 * 1024  # 256MB 메모리 맵
+    temp_store: str = "MEMORY"
+    busy_timeout_ms: int = 30000
+
+
+class ConnectionManager:
+    """스레드 로컬 SQLite 연결 관리자
+
+    같은 스레드에서 같은 DB 경로를 요청하면 동일한 연결을 반환합니다.
+    반환된 연결은 `with conn:` 블록으로 트랜잭션을 관리하되 직접 close 하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        pragmas: ConnectionPragmas = None,
+        timeout: float = 30.0,
+        cached_statements: int = 256,
+    ):
+        self.pragmas = pragmas or ConnectionPragmas()
+        self.timeout = timeout
+        self.cached_statements = cached_statements
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # (스레드 ID, DB 경로) -> (스레드, 연결): 종료된 스레드의 연결 정리용
+        self._registry: Dict[Tuple[int, str], Tuple[threading.Thread, sqlite3.Connection]] = {}
+
+        self.stats = {
+            "connections_opened": 0,
+            "connections_reused": 0,
+            "connections_closed": 0,
+        }
+
+    @staticmethod
+    def normalize_path(db_path: PathLike) -> str:
+        """DB 경로를 연결 키로 사용할 수 있도록 정규화"""
+        path = str(db_path)
+        if path == ":memory:" or path.startswith("file:"):
+            return path
+        return os.path.abspath(path)
+
+    def get_connection(self, db_path: PathLike) -> sqlite3.Connection:
+        """현재 스레드의 연결 반환 (없으면 생성)"""
+        key = self.normalize_path(db_path)
+
+        connections = getattr(self._local, "connections", None)
+        if connections is None:
+            connections = self._local.connections = {}
+
+        conn = connections.get(key)
+        if conn is not None:
+            entry = self._registry.get((threading.get_ident(), key))
+            if entry is not None and entry[1] is conn:
+                self.stats["connections_reused"] += 1
+                return conn
+            # 다른 스레드의 close_all()로 닫힌 연결은 버리고 새로 생성
+            connections.pop(key)
+
+        conn = self._open_connection(key)
+        connections[key] = conn
+
+        with self._lock:
+            self._close_dead_thread_connections()
+            self._registry[(threading.get_ident(), key)] = (threading.current_thread(), conn)
+            self.stats["connections_opened"] += 1
+
+        return conn
+
+    def _open_connection(self, path: str) -> sqlite3.Connection:
+        """새 연결 생성 및 PRAGMA 적용"""
+        conn = sqlite3.connect(
+            path,
+            timeout=self.timeout,
+            check_same_thread=False,  # 정리(close_all) 목적. 실제 사용은 소유 스레드에서만
+            cached_statements=self.cached_statements,
+            uri=path.startswith("file:"),
+        )
+        self._apply_pragmas(conn)
+        logger.debug(f"SQLite 연결 생성: {path} (thread={threading.get_ident()})")
+        return conn
+
+    def _apply_pragmas(self, conn: sqlite3.Connection):
+        """연결 단위 PRAGMA 설정"""
+        p = self.pragmas
+        try:
+            conn.execute(f"PRAGMA busy_timeout = {int(p.busy_timeout_ms)}")
+            conn.execute(f"PRAGMA journal_mode = {p.journal_mode}")
+            conn.execute(f"PRAGMA synchronous = {p.synchronous}")
+            conn.execute(f"PRAGMA cache_size = {-int(p.cache_size_kb)}")
+            conn.execute(f"PRAGMA mmap_size = {int(p.mmap_size)}")
+            conn.execute(f"PRAGMA temp_store = {p.temp_store}")
+        except sqlite3.Error as e:
+            # 읽기 전용 DB 등에서는 일부 PRAGMA가 실패할 수 있음
+            logger.warning(f"PRAGMA 설정 실패: {e}")
+
+    def _close_dead_thread_connections(self):
+        """종료된 스레드가 남긴 연결 정리 (self._lock 보유 상태에서 호출)"""
+        dead_keys = [key for key, (thread, _) in self._registry.items() if not thread.is_alive()]
+        for key in dead_keys:
+            _, conn = self._registry.pop(key)
+            self._safe_close(conn)
+
+    def _safe_close(self, conn: sqlite3.Connection):
+        try:
+            conn.close()
+            self.stats["connections_closed"] += 1
+        except sqlite3.Error as e:
+            logger.debug(f"연결 종료 실패: {e}")
+
+    def close_thread_connections(self):
+        """현재 스레드의 모든 연결 종료"""
+        connections = getattr(self._local, "connections", None)
+        if not connections:
+            return
+
+        ident = threading.get_ident()
+        with self._lock:
+            for key, conn in connections.items():
+                self._registry.pop((ident, key), None)
+                self._safe_close(conn)
+        connections.clear()
+
+    def close_all(self, db_path: PathLike = None):
+        """모든 스레드의 연결 종료 (db_path 지정 시 해당 DB만)
+
+        DB 파일 교체(복원, 마이그레이션) 전이나 프로세스 종료 시 사용합니다.
+        다른 스레드는 다음 get_connection 호출 시 새 연결을 생성합니다.
+        """
+        target = self.normalize_path(db_path) if db_path is not None else None
+        with self._lock:
+            for key in list(self._registry.keys()):
+                if target is None or key[1] == target:
+                    _, conn = self._registry.pop(key)
+                    self._safe_close(conn)
+
+        # 현재 스레드의 로컬 캐시도 정리 (다른 스레드는 레지스트리 확인 후 재생성)
+        connections = getattr(self._local, "connections", None)
+        if connections:
+            for key in list(connections.keys()):
+                if target is None or key == target:
+                    connections.pop(key)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """연결 통계 반환"""
+        with self._lock:
+            stats = self.stats.copy()
+            stats["open_connections"] = len(self._registry)
+        return stats
+
+
+# 전역 인스턴스
+connection_manager = ConnectionManager()
+
+
+def get_pooled_connection(db_path: PathLike) -> sqlite3.Connection:
+    """전역 관리자에서 현재 스레드의 연결 반환"""
+    return connection_manager.get_connection(db_path)
@@ -0,0 +1,438 @@
+"""
+전 종목 OHLCV 일관성 감사 (벡터화)
+
+stock_ohlcv를 (symbol, date) 순서로 한 번만 스트리밍하며 청크 단위 NumPy 그룹 연산으로
+종목별 품질 지표를 계산하고 data_audit_summary 테이블에 저장합니다.
+종목마다 데이터프레임을 읽고 달력 날짜를 문자열로 비교하던 기존 검사를 대체합니다.
+
+검사 항목:
+- missing_days: 감사 기간의 거래일 중 적재되지 않은 날 (interior_missing_days: 첫~마지막 적재일 사이)
+- invalid_ohlc: 0 이하 가격 또는 고가/저가 범위를 벗어난 시가/종가 (고가 < 저가 포함)
+- negative_volume: 음수 거래량
+- zero_volume_days: 거래량 0 (거래정지 등, 경고)
+- stale_days: stale_run_days일 이상 종가가 변하지 않은 구간의 일수 (경고)
+- outlier_returns: 일간 종가 수익률 절대값이 outlier_return 초과 (경고)
+
+missing_days, invalid_ohlc, negative_volume은 오류(일관성 위반), 나머지는 경고로 분류합니다.
+
+사용 예시:
+    auditor = DataConsistencyAuditor("data/trading.db")
+    summary = auditor.audit("2024-01-01", "2024-12-31")          # 전 종목
+    touched = auditor.audit("2024-01-01", "2024-12-31", ["005930"])  # 갱신된 종목만 재검사
+    stats = auditor.summarize(summary)
+"""
+
+import logging
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .connection_manager import get_pooled_connection
+from .ohlcv_schema import ohlcv_source
+from .trading_calendar import observed_trading_day_numbers
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_TABLE = "data_audit_summary"
+MAX_INLINE_SYMBOLS = 500
+
+# 종목별 집계 컬럼 (요약 테이블 컬럼 순서)
+COUNT_COLUMNS = [
+    "rows",
+    "missing_days",
+    "interior_missing_days",
+    "invalid_ohlc",
+    "negative_volume",
+    "zero_volume_days",
+    "stale_days",
+    "max_stale_run",
+    "outlier_returns",
+]
+ERROR_COLUMNS = ["invalid_ohlc", "negative_volume"]
+WARNING_COLUMNS = ["zero_volume_days", "stale_days", "outlier_returns"]
+
+SUMMARY_COLUMNS = ["symbol", "start_date", "end_date", "first_date", "last_date"] + COUNT_COLUMNS + [
+    "is_consistent",
+    "audited_at",
+]
+
+
+@dataclass
+class AuditThresholds:
+    """경고 판정 기준"""
+
+    stale_run_days: int = 5  # 종가가 이 일수 이상 연속 동일하면 stale
+    outlier_return: float = 0.30  # KRX 일간 가격제한폭 (±30%)
+
+
+def market_reference_symbols(conn: sqlite3.Connection, start: str, end: str, limit: int = 3) -> List[str]:
+    """거래일 보정용 참조 종목 (시장 전체에서 적재 행이 가장 많은 종목)
+
+    저장된 감사 요약이 충분하면 그것을 쓰고, 없으면 기간 내 종목별 행 수를 직접 집계합니다.
+    요청 종목만으로 고르면 해당 종목의 누락일이 휴장일로 간주될 수 있으므로 항상 시장 전체에서 고릅니다.
+    """
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (SUMMARY_TABLE,)
+    ).fetchone()
+    if exists:
+        rows = conn.execute(
+            f"SELECT symbol FROM {SUMMARY_TABLE} WHERE start_date <= ? AND end_date >= ? "
+            f"ORDER BY rows DESC LIMIT ?",
+            (start, end, limit),
+        ).fetchall()
+        if len(rows) >= limit:
+            return [row[0] for row in rows]
+    ohlcv = ohlcv_source(conn)
+    rows = conn.execute(
+        f"SELECT symbol FROM {ohlcv.table} WHERE {ohlcv.date_column} BETWEEN ? AND ? "
+        f"GROUP BY symbol ORDER BY COUNT(*) DESC LIMIT ?",
+        (ohlcv.date_param(start), ohlcv.date_param(end), limit),
+    ).fetchall()
+    return [row[0] for row in rows]
+
+
+class DataConsistencyAuditor:
+    """전 종목 일관성 감사기"""
+
+    def __init__(
+        self,
+        db_path: str = "data/trading.db",
+        thresholds: Optional[AuditThresholds] = None,
+        chunk_rows: int = 200_000,
+    ):
+        """
+        Args:
+            db_path: stock_ohlcv가 있는 DB 경로
+            thresholds: 경고 판정 기준
+            chunk_rows: 스트리밍 시 한 번에 읽을 행 수 (메모리 상한)
+        """
+        self.db_path = db_path
+        self.thresholds = thresholds or AuditThresholds()
+        self.chunk_rows = chunk_rows
+        self._init_table()
+
+    def _init_table(self):
+        with get_pooled_connection(self.db_path) as conn:
+            conn.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {SUMMARY_TABLE} (
+                    symbol TEXT PRIMARY KEY,
+                    start_date TEXT NOT NULL,
+                    end_date TEXT NOT NULL,
+                    first_date TEXT,
+                    last_date TEXT,
+                    rows INTEGER NOT NULL,
+                    missing_days INTEGER NOT NULL,
+                    interior_missing_days INTEGER NOT NULL,
+                    invalid_ohlc INTEGER NOT NULL,
+                    negative_volume INTEGER NOT NULL,
+                    zero_volume_days INTEGER NOT NULL,
+                    stale_days INTEGER NOT NULL,
+                    max_stale_run INTEGER NOT NULL,
+                    outlier_returns INTEGER NOT NULL,
+                    is_consistent INTEGER NOT NULL,
+                    audited_at TEXT NOT NULL
+                )
+                """
+            )
+
+    def audit(
+        self,
+        start_date: str,
+        end_date: str,
+        symbols: Optional[List[str]] = None,
+        save: bool = True,
+    ) -> pd.DataFrame:
+        """기간 내 종목별 감사 결과 (인덱스=symbol, 컬럼=SUMMARY_COLUMNS)
+
+        Args:
+            start_date, end_date: YYYY-MM-DD 또는 YYYYMMDD
+            symbols: 감사할 종목 (None이면 기간 내 적재된 전 종목).
+                지정한 종목 중 적재 데이터가 없는 종목도 결과에 포함됩니다.
+            save: 결과를 요약 테이블에 저장할지 여부
+        """
+        start = pd.Timestamp(start_date).strftime("%Y-%m-%d")
+        end = pd.Timestamp(end_date).strftime("%Y-%m-%d")
+        conn = get_pooled_connection(self.db_path)
+
+        if symbols is None:
+            # 전 종목 감사는 스트림에서 관측한 날짜로 달력을 보정하므로 별도 조회가 필요 없음
+            trading_days = observed_trading_day_numbers(conn, start, end)
+        else:
+            symbols = list(dict.fromkeys(symbols))
+            trading_days = observed_trading_day_numbers(conn, start, end, market_reference_symbols(conn, start, end))
+
+        blocks = []
+        observed = []
+        for block in self._stream(conn, start, end, symbols):
+            blocks.append(self._audit_block(block, trading_days))
+            if symbols is None:
+                observed.append(np.unique(block["day"]))
+
+        if symbols is None and observed:
+            # 어느 종목에도 없는 달력상 거래일(임시 휴장일)은 마지막 관측일 이전이면 제외
+            observed_days = np.unique(np.concatenate(observed))
+            keep = (trading_days > observed_days[-1]) | np.isin(trading_days, observed_days, assume_unique=True)
+            trading_days = trading_days[keep]
+
+        summary = self._finalize(blocks, trading_days, start, end, symbols)
+        if save and not summary.empty:
+            self._save(conn, summary)
+        logger.info(
+            f"일관성 감사 완료: {len(summary)}개 종목, 거래일 {len(trading_days)}일, "
+            f"불일치 {int((~summary['is_consistent']).sum()) if not summary.empty else 0}개"
+        )
+        return summary
+
+    def _stream(self, conn: sqlite3.Connection, start: str, end: str, symbols: Optional[List[str]]):
+        """(symbol, date) 순서로 청크를 읽어 종목 경계에서 잘린 배열 묶음을 생성
+
+        청크 끝의 종목은 다음 청크와 합쳐서 내보내므로 한 종목이 두 블록에 나뉘지 않습니다.
+        """
+        ohlcv = ohlcv_source(conn)
+        conditions, params = ohlcv.range_condition(start, end)
+        symbol_condition = ""
+        if symbols is not None:
+            if not symbols:
+                return
+            # 대량 종목이면 조건 없이 전체를 읽고 _finalize에서 필터
+            if len(symbols) <= MAX_INLINE_SYMBOLS:
+                symbol_condition = f"AND symbol IN ({','.join('?' * len(symbols))})"
+                params.extend(symbols)
+
+        cursor = conn.execute(
+            # 날짜는 SQLite에서 정수 일수(1970-01-01 기준)로 변환하여 문자열 파싱 비용 제거
+            f"SELECT symbol, {ohlcv.day_expr()}, open, high, low, close, volume "
+            f"FROM {ohlcv.table} "
+            f"WHERE {' AND '.join(conditions)} {symbol_condition} ORDER BY symbol, {ohlcv.date_column}",
+            params,
+        )
+
+        carry: List[Tuple] = []
+        while True:
+            rows = cursor.fetchmany(self.chunk_rows)
+            if not rows:
+                break
+            rows = carry + rows if carry else rows
+            last_symbol = rows[-1][0]
+            cut = len(rows)
+            while cut > 0 and rows[cut - 1][0] == last_symbol:
+                cut -= 1
+            if cut == 0:
+                # 한 종목이 청크 전체를 차지 -> 다음 청크까지 이어서 읽음
+                carry = rows
+                continue
+            carry = rows[cut:]
+            yield self._to_arrays(rows[:cut])
+
+        if carry:
+            yield self._to_arrays(carry)
+
+    @staticmethod
+    def _to_arrays(rows: List[Tuple]) -> Dict[str, np.ndarray]:
+        # 2차원 object 배열 한 번 생성 후 열 단위 변환 (zip 전치보다 빠름)
+        table = np.array(rows, dtype=object)
+        arrays = {"symbol": table[:, 0], "day": table[:, 1].astype(np.int32)}
+        for i, col in enumerate(("open", "high", "low", "close", "volume"), start=2):
+            arrays[col] = table[:, i].astype(np.float64)
+        return arrays
+
+    def _audit_block(self, block: Dict[str, np.ndarray], trading_days: np.ndarray) -> Dict[str, np.ndarray]:
+        """종목 경계로 나뉜 블록의 종목별 지표 (NumPy 그룹 연산)"""
+        symbol, day = block["symbol"], block["day"]
+        open_, high, low, close, volume = (block[c] for c in ("open", "high", "low", "close", "volume"))
+        n = len(day)
+
+        starts = np.concatenate(([0], np.flatnonzero(symbol[1:] != symbol[:-1]) + 1))
+        group = np.repeat(np.arange(len(starts)), np.diff(np.append(starts, n)))
+        n_groups = len(starts)
+
+        def count(mask: np.ndarray, groups: np.ndarray = group) -> np.ndarray:
+            return np.bincount(groups[mask], minlength=n_groups)
+
+        invalid = (
+            (np.minimum(np.minimum(open_, high), np.minimum(low, close)) <= 0)
+            | (high < low)
+            | (open_ > high) | (open_ < low)
+            | (close > high) | (close < low)
+        )
+
+        # 이전 행과 같은 종목인 위치 (종목 경계의 비교 제외)
+        same_symbol = group[1:] == group[:-1]
+        prev_close = close[:-1]
+        unchanged = same_symbol & (close[1:] == prev_close)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            returns = np.where(prev_close > 0, close[1:] / prev_close - 1.0, 0.0)
+        outlier = same_symbol & (np.abs(returns) > self.thresholds.outlier_return)
+
+        # 동일 종가 연속 구간: unchanged가 True인 연속 run의 길이 + 1 = 구간 일수
+        edges = np.diff(np.concatenate(([0], unchanged.astype(np.int8), [0])))
+        run_starts = np.flatnonzero(edges == 1)
+        run_days = np.flatnonzero(edges == -1) - run_starts + 1
+        run_group = group[run_starts]
+        stale = run_days >= self.thresholds.stale_run_days
+        stale_days = np.bincount(run_group[stale], weights=run_days[stale], minlength=n_groups).astype(np.int64)
+        max_stale_run = np.zeros(n_groups, dtype=np.int64)
+        np.maximum.at(max_stale_run, run_group, run_days)
+
+        on_calendar = np.zeros(n, dtype=bool)
+        if len(trading_days):
+            pos = np.minimum(np.searchsorted(trading_days, day), len(trading_days) - 1)
+            on_calendar = trading_days[pos] == day
+
+        ends = np.append(starts[1:], n) - 1
+        return {
+            "symbol": symbol[starts],
+            "first_day": day[starts],
+            "last_day": day[ends],
+            "rows": np.diff(np.append(starts, n)),
+            "present_days": count(on_calendar),
+            "invalid_ohlc": count(invalid),
+            "negative_volume": count(volume < 0),
+            "zero_volume_days": count(volume == 0),
+            "stale_days": stale_days,
+            "max_stale_run": max_stale_run,
+            "outlier_returns": count(outlier, group[1:]),
+        }
+
+    def _finalize(
+        self,
+        blocks: List[Dict[str, np.ndarray]],
+        trading_days: np.ndarray,
+        start: str,
+        end: str,
+        symbols: Optional[List[str]],
+    ) -> pd.DataFrame:
+        """블록 결과를 합쳐 누락 일수와 일관성 판정을 계산"""
+        if blocks:
+            merged = {key: np.concatenate([b[key] for b in blocks]) for key in blocks[0]}
+        else:
+            merged = {
+                "symbol": np.empty(0, dtype=object),
+                "first_day": np.empty(0, dtype=np.int32),
+                "last_day": np.empty(0, dtype=np.int32),
+                **{key: np.empty(0, dtype=np.int64) for key in (
+                    "rows", "present_days", "invalid_ohlc", "negative_volume",
+                    "zero_volume_days", "stale_days", "max_stale_run", "outlier_returns",
+                )},
+            }
+
+        # 적재 행이 모두 거래일 배열에 포함되도록 보정했으므로 present_days는 보정 후에도 유효
+        present = merged.pop("present_days")
+        lo = np.searchsorted(trading_days, merged["first_day"], side="left")
+        hi = np.searchsorted(trading_days, merged["last_day"], side="right")
+        summary = pd.DataFrame({
+            "symbol": merged["symbol"],
+            "start_date": start,
+            "end_date": end,
+            "first_date": np.datetime_as_string(merged["first_day"].astype("datetime64[D]")),
+            "last_date": np.datetime_as_string(merged["last_day"].astype("datetime64[D]")),
+            "rows": merged["rows"],
+            "missing_days": np.maximum(len(trading_days) - present, 0),
+            "interior_missing_days": np.maximum(hi - lo - present, 0),
+            **{key: merged[key] for key in (
+                "invalid_ohlc", "negative_volume", "zero_volume_days",
+                "stale_days", "max_stale_run", "outlier_returns",
+            )},
+        }).set_index("symbol")
+
+        if symbols is not None:
+            absent = [s for s in symbols if s not in summary.index]
+            if absent:
+                empty = pd.DataFrame(
+                    {col: 0 for col in COUNT_COLUMNS}, index=pd.Index(absent, name="symbol")
+                )
+                empty["missing_days"] = len(trading_days)
+                empty["start_date"], empty["end_date"] = start, end
+                empty["first_date"] = empty["last_date"] = None
+                summary = pd.concat([summary, empty[summary.columns]])
+            summary = summary.loc[symbols]
+
+        errors = summary[["missing_days"] + ERROR_COLUMNS].sum(axis=1)
+        summary["is_consistent"] = (summary["rows"] > 0) & (errors == 0)
+        summary["audited_at"] = datetime.now().isoformat(timespec="seconds")
+        for col in COUNT_COLUMNS:
+            summary[col] = summary[col].astype(np.int64)
+        return summary
+
+    def _save(self, conn: sqlite3.Connection, summary: pd.DataFrame):
+        columns = SUMMARY_COLUMNS
+        frame = summary.reset_index()[columns].astype(object)
+        frame["is_consistent"] = frame["is_consistent"].astype(int)
+        frame = frame.where(frame.notna(), None)
+        placeholders = ",".join("?" * len(columns))
+        updates = ",".join(f"{c} = excluded.{c}" for c in columns[1:])
+        with conn:
+            conn.executemany(
+                f"INSERT INTO {SUMMARY_TABLE} ({','.join(columns)}) VALUES ({placeholders}) "
+                f"ON CONFLICT(symbol) DO UPDATE SET {updates}",
+                frame.itertuples(index=False, name=None),
+            )
+
+    def load_summary(self, symbols: Optional[List[str]] = None) -> pd.DataFrame:
+        """저장된 감사 결과 조회 (인덱스=symbol)"""
+        conn = get_pooled_connection(self.db_path)
+        query = f"SELECT {','.join(SUMMARY_COLUMNS)} FROM {SUMMARY_TABLE}"
+        params: List = []
+        if symbols is not None:
+            query += f" WHERE symbol IN ({','.join('?' * len(symbols))})"
+            params = list(symbols)
+        summary = pd.read_sql_query(query, conn, params=params).set_index("symbol")
+        summary["is_consistent"] = summary["is_consistent"].astype(bool)
+        return summary
+
+    @staticmethod
+    def describe_issues(row: pd.Series) -> Tuple[List[str], List[str]]:
+        """요약 행의 (오류, 경고) 설명 목록"""
+        errors = []
+        if row["rows"] == 0:
+            errors.append("기간 내 데이터 없음")
+        if row["invalid_ohlc"]:
+            errors.append(f"가격 범위 위반 {row['invalid_ohlc']}건 (0 이하 가격 또는 고가/저가 범위 이탈)")
+        if row["negative_volume"]:
+            errors.append(f"음수 거래량 {row['negative_volume']}건")
+
+        warnings = []
+        if row["zero_volume_days"]:
+            warnings.append(f"거래량 0 {row['zero_volume_days']}일")
+        if row["stale_days"]:
+            warnings.append(f"종가 무변동 구간 {row['stale_days']}일 (최장 {row['max_stale_run']}일)")
+        if row["outlier_returns"]:
+            warnings.append(f"이상 수익률 {row['outlier_returns']}건")
+        return errors, warnings
+
+    @classmethod
+    def summarize(cls, summary: pd.DataFrame) -> Dict:
+        """감사 결과를 증분 업데이트 통계/권장사항 형식으로 변환"""
+        missing = summary["missing_days"]
+        has_errors = summary[ERROR_COLUMNS].sum(axis=1) > 0
+        stats = {
+            "total_symbols": len(summary),
+            "symbols_with_missing_data": int((missing > 0).sum()),
+            "symbols_with_quality_issues": int(has_errors.sum()),
+            "symbols_with_warnings": int((summary[WARNING_COLUMNS].sum(axis=1) > 0).sum()),
+            "total_missing_days": int(missing.sum()),
+            "update_recommendations": [],
+        }
+
+        # 권장사항은 문제 있는 종목만 행 단위로 생성
+        for symbol, row in summary[(missing > 0) | has_errors].iterrows():
+            if row["missing_days"] > 0:
+                stats["update_recommendations"].append({
+                    "symbol": symbol,
+                    "action": "incremental_update",
+                    "missing_days": int(row["missing_days"]),
+                    "priority": "high" if row["missing_days"] > 10 else "medium",
+                })
+            if has_errors[symbol]:
+                stats["update_recommendations"].append({
+                    "symbol": symbol,
+                    "action": "data_quality_fix",
+                    "issues": cls.describe_issues(row)[0],
+                    "priority": "high",
+                })
+        return stats
@@ -0,0 +1,289 @@
+"""
+시장 데이터 제공자 인터페이스
+
+StockDataUpdater가 사용하는 pykrx 호출을 교체 가능한 인터페이스로 분리합니다.
+
+- PykrxDataSource: 실제 KRX 조회 (기본값)
+- RecordingDataSource: 다른 제공자를 감싸 응답을 디스크에 기록
+- ReplayDataSource: 기록된 응답을 모의 지연/오류율과 함께 재생 (오프라인 벤치마크, 회귀 테스트)
+
+기록 디렉토리 구성:
+    ohlcv_by_date/<ticker>.pkl        종목별 일봉 (여러 호출 결과 병합)
+    ohlcv/<YYYYMMDD>_<market>.pkl     일자별 전체 시장 시세
+    market_cap/<YYYYMMDD>_<market>.pkl
+    tickers/<YYYYMMDD>_<market>.json  티커 목록
+    ticker_names.json                 티커 -> 종목명
+
+사용 예시:
+    source = RecordingDataSource(PykrxDataSource(), "data/recordings")
+    StockDataUpdater(data_source=source).update_multiple_symbols_parallel(...)
+
+    replay = ReplayDataSource("data/recordings", latency=0.05, error_rate=0.01)
+    StockDataUpdater(db_path=tmp_db, data_source=replay)
+"""
+
+import json
+import time
+import random
+import logging
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+def _compact_date(date: str) -> str:
+    """YYYY-MM-DD/YYYYMMDD -> YYYYMMDD"""
+    return str(date).replace("-", "")
+
+
+class MarketDataSource(ABC):
+    """업데이터가 사용하는 시장 데이터 조회 인터페이스 (pykrx.stock 시그니처와 동일)"""
+
+    @abstractmethod
+    def get_market_ohlcv_by_date(self, fromdate: str, todate: str, ticker: str) -> pd.DataFrame:
+        """종목의 기간 일봉 (인덱스=날짜, 컬럼=시가/고가/저가/종가/거래량)"""
+
+    @abstractmethod
+    def get_market_ohlcv(self, date: str, market: str = "ALL") -> pd.DataFrame:
+        """특정일 전체 시장 시세 (인덱스=티커)"""
+
+    @abstractmethod
+    def get_market_cap(self, date: str, market: str = "ALL") -> pd.DataFrame:
+        """특정일 전체 시장 시가총액 (인덱스=티커)"""
+
+    @abstractmethod
+    def get_market_ticker_list(self, date: str, market: str = "ALL") -> List[str]:
+        """특정일 상장 티커 목록"""
+
+    @abstractmethod
+    def get_market_ticker_name(self, ticker: str) -> str:
+        """티커의 종목명"""
+
+    def get_market_ticker_and_name(self, date: str, market: str = "ALL") -> Optional[pd.Series]:
+        """티커 -> 종목명 일괄 조회 (미지원 제공자는 None)"""
+        return None
+
+
+class PykrxDataSource(MarketDataSource):
+    """pykrx를 통한 실제 KRX 조회"""
+
+    def __init__(self):
+        try:
+            from pykrx import stock
+        except ImportError as e:
+            raise ImportError("pykrx가 설치되지 않았습니다. 'pip install pykrx'로 설치해주세요.") from e
+
+        self._stock = stock
+
+    def get_market_ohlcv_by_date(self, fromdate, todate, ticker):
+        return self._stock.get_market_ohlcv_by_date(fromdate, todate, ticker)
+
+    def get_market_ohlcv(self, date, market="ALL"):
+        return self._stock.get_market_ohlcv(date, market=market)
+
+    def get_market_cap(self, date, market="ALL"):
+        return self._stock.get_market_cap(date, market=market)
+
+    def get_market_ticker_list(self, date, market="ALL"):
+        return self._stock.get_market_ticker_list(date, market=market)
+
+    def get_market_ticker_name(self, ticker):
+        return self._stock.get_market_ticker_name(ticker)
+
+    def get_market_ticker_and_name(self, date, market="ALL"):
+        # pykrx 내부의 전종목 시세 조회 (1회 호출). 지원하지 않는 버전이면 None
+        try:
+            from pykrx.website import krx as krx_website
+        except ImportError:
+            return None
+        return krx_website.get_market_ticker_and_name(date, market)
+
+
+class RecordingDataSource(MarketDataSource):
+    """다른 제공자의 응답을 기록 디렉토리에 저장하며 그대로 반환"""
+
+    def __init__(self, inner: MarketDataSource, record_dir: Union[str, Path]):
+        self.inner = inner
+        self.record_dir = Path(record_dir)
+        self._lock = threading.Lock()
+        for sub in ("ohlcv_by_date", "ohlcv", "market_cap", "tickers"):
+            (self.record_dir / sub).mkdir(parents=True, exist_ok=True)
+
+    def _save_frame(self, path: Path, df: pd.DataFrame):
+        tmp = path.with_suffix(".tmp")
+        df.to_pickle(tmp)
+        tmp.replace(path)
+
+    def get_market_ohlcv_by_date(self, fromdate, todate, ticker):
+        df = self.inner.get_market_ohlcv_by_date(fromdate, todate, ticker)
+        if df is not None and not df.empty:
+            path = self.record_dir / "ohlcv_by_date" / f"{ticker}.pkl"
+            with self._lock:
+                if path.exists():
+                    merged = pd.concat([pd.read_pickle(path), df])
+                    df_to_save = merged[~merged.index.duplicated(keep="last")].sort_index()
+                else:
+                    df_to_save = df
+                self._save_frame(path, df_to_save)
+        return df
+
+    def get_market_ohlcv(self, date, market="ALL"):
+        df = self.inner.get_market_ohlcv(date, market=market)
+        if df is not None:
+            self._save_frame(self.record_dir / "ohlcv" / f"{_compact_date(date)}_{market}.pkl", df)
+        return df
+
+    def get_market_cap(self, date, market="ALL"):
+        df = self.inner.get_market_cap(date, market=market)
+        if df is not None:
+            self._save_frame(self.record_dir / "market_cap" / f"{_compact_date(date)}_{market}.pkl", df)
+        return df
+
+    def get_market_ticker_list(self, date, market="ALL"):
+        tickers = list(self.inner.get_market_ticker_list(date, market=market))
+        path = self.record_dir / "tickers" / f"{_compact_date(date)}_{market}.json"
+        path.write_text(json.dumps(tickers), encoding="utf-8")
+        return tickers
+
+    def get_market_ticker_name(self, ticker):
+        name = self.inner.get_market_ticker_name(ticker)
+        self._record_names({ticker: name})
+        return name
+
+    def get_market_ticker_and_name(self, date, market="ALL"):
+        names = self.inner.get_market_ticker_and_name(date, market)
+        if names is not None and not names.empty:
+            self._record_names({str(t): str(n) for t, n in names.items()})
+        return names
+
+    def _record_names(self, names: Dict[str, str]):
+        path = self.record_dir / "ticker_names.json"
+        with self._lock:
+            existing = json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+            existing.update(names)
+            path.write_text(json.dumps(existing, ensure_ascii=False), encoding="utf-8")
+
+
+class SimulatedProviderError(ConnectionError):
+    """재생 제공자가 주입한 모의 오류"""
+
+
+class ReplayDataSource(MarketDataSource):
+    """기록된 응답 재생
+
+    종목별 일봉은 기록된 전체 구간에서 요청 기간만 잘라 반환하므로, 한 번 기록한 데이터로
+    전체/증분 업데이트를 모두 재현할 수 있습니다. 일자별 전체 시장 시세가 기록되어 있지 않으면
+    종목별 기록에서 해당 날짜 단면을 구성합니다.
+    """
+
+    def __init__(
+        self,
+        record_dir: Union[str, Path],
+        latency: float = 0.0,
+        latency_jitter: float = 0.0,
+        error_rate: float = 0.0,
+        seed: Optional[int] = None,
+    ):
+        """
+        Args:
+            record_dir: 기록 디렉토리
+            latency: 호출당 모의 지연 (초)
+            latency_jitter: 지연에 더할 균등분포 최대값 (초)
+            error_rate: 호출당 SimulatedProviderError 발생 확률 (0~1)
+            seed: 지연/오류 난수 시드
+        """
+        self.record_dir = Path(record_dir)
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self._random = random.Random(seed)
+        self._random_lock = threading.Lock()
+        self._frames: Dict[str, pd.DataFrame] = {}
+        self._frames_lock = threading.Lock()
+        self.stats = {"calls": 0, "errors": 0}
+
+    def _simulate(self, method: str):
+        """모의 지연 및 오류 주입"""
+        with self._random_lock:
+            self.stats["calls"] += 1
+            delay = self.latency + (self._random.uniform(0, self.latency_jitter) if self.latency_jitter else 0.0)
+            fail = self.error_rate > 0 and self._random.random() < self.error_rate
+            if fail:
+                self.stats["errors"] += 1
+        if delay > 0:
+            time.sleep(delay)
+        if fail:
+            raise SimulatedProviderError(f"모의 오류: {method}")
+
+    def _ticker_frame(self, ticker: str) -> pd.DataFrame:
+        with self._frames_lock:
+            df = self._frames.get(ticker)
+            if df is None:
+                path = self.record_dir / "ohlcv_by_date" / f"{ticker}.pkl"
+                df = pd.read_pickle(path) if path.exists() else pd.DataFrame()
+                self._frames[ticker] = df
+        return df
+
+    def _recorded_tickers(self) -> List[str]:
+        return sorted(p.stem for p in (self.record_dir / "ohlcv_by_date").glob("*.pkl"))
+
+    def _read_frame(self, sub: str, date: str, market: str) -> Optional[pd.DataFrame]:
+        path = self.record_dir / sub / f"{_compact_date(date)}_{market}.pkl"
+        return pd.read_pickle(path) if path.exists() else None
+
+    def get_market_ohlcv_by_date(self, fromdate, todate, ticker):
+        self._simulate("get_market_ohlcv_by_date")
+        df = self._ticker_frame(ticker)
+        if df.empty:
+            return df.copy()
+        return df.loc[pd.Timestamp(fromdate):pd.Timestamp(todate)].copy()
+
+    def get_market_ohlcv(self, date, market="ALL"):
+        self._simulate("get_market_ohlcv")
+        recorded = self._read_frame("ohlcv", date, market)
+        if recorded is not None:
+            return recorded
+
+        day = pd.Timestamp(date)
+        rows = {}
+        for ticker in self._recorded_tickers():
+            df = self._ticker_frame(ticker)
+            if day in df.index:
+                rows[ticker] = df.loc[day]
+        result = pd.DataFrame.from_dict(rows, orient="index")
+        result.index.name = "티커"
+        return result
+
+    def get_market_cap(self, date, market="ALL"):
+        self._simulate("get_market_cap")
+        recorded = self._read_frame("market_cap", date, market)
+        return recorded if recorded is not None else pd.DataFrame()
+
+    def get_market_ticker_list(self, date, market="ALL"):
+        self._simulate("get_market_ticker_list")
+        path = self.record_dir / "tickers" / f"{_compact_date(date)}_{market}.json"
+        if path.exists():
+            return json.loads(path.read_text(encoding="utf-8"))
+        return self._recorded_tickers()
+
+    def get_market_ticker_name(self, ticker):
+        self._simulate("get_market_ticker_name")
+        path = self.record_dir / "ticker_names.json"
+        names = json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+        return names.get(ticker, ticker)
+
+
+_default_source: Optional[MarketDataSource] = None
+
+
+def get_default_data_source() -> MarketDataSource:
+    """기본 제공자 (PykrxDataSource, 최초 호출 시 생성)"""
+    global _default_source
+    if _default_source is None:
+        _default_source = PykrxDataSource()
+    return _default_source
@@ -4,6 +4,7 @@ import logging
 from typing import Optional, Any
 import pandas as pd
 from src.utils.dataframe_utils import standardize_dataframe
+from src.data.connection_manager import get_pooled_connection
 
 DB_PATH = os.getenv("DB_PATH", "data/trading.db")
 
@@ -52,38 +53,49 @@ def init_db(conn: sqlite3.Connection) -> None:
 
 
 class DatabaseManager:
+    """
+    SQLite 접근 헬퍼
+
+    연결은 connection_manager의 스레드 로컬 연결(WAL 모드)을 재사용합니다.
+    """
+
     def __init__(self, db_path: str):
         self.db_path = db_path
 
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """현재 스레드의 공유 연결"""
+        return get_pooled_connection(self.db_path)
+
     def initialize_schema(self, schema_path: str):
         with open(schema_path, "r", encoding="utf-8") as f:
             schema_sql = f.read()
-        with sqlite3.connect(self.db_path) as conn:
+        with self.conn as conn:
             conn.executescript(schema_sql)
 
     def execute(self, query: str, params: Optional[tuple] = None):
-        with sqlite3.connect(self.db_path) as conn:
-            cur = conn.cursor()
-            cur.execute(query, params or ())
-            conn.commit()
+        with self.conn as conn:
+            conn.execute(query, params or ())
+
+    def executemany(self, query: str, seq_of_params) -> int:
+        """동일 쿼리를 단일 트랜잭션으로 일괄 실행하고 영향받은 행 수 반환"""
+        with self.conn as conn:
+            cur = conn.executemany(query, seq_of_params)
+            return cur.rowcount
 
     def fetchall(self, query: str, params: Optional[tuple] = None) -> list[Any]:
-        with sqlite3.connect(self.db_path) as conn:
-            cur = conn.cursor()
-            cur.execute(query, params or ())
-            return cur.fetchall()
+        return self.conn.execute(query, params or ()).fetchall()
 
     def fetchdf(self, query: str, params: Optional[tuple] = None):
-        with sqlite3.connect(self.db_path) as conn:
-            df = pd.read_sql_query(query, conn, params=params)
+        df = pd.read_sql_query(query, self.conn, params=params)
 
-            # symbol 컬럼이 없으면 추가 (쿼리에 symbol이 포함되어야 함)
-            if "symbol" not in df.columns and params and len(params) > 0:
-                # 쿼리의 첫 번째 파라미터가 symbol이라고 가정
-                df["symbol"] = params[0]
+        # symbol 컬럼이 없으면 추가 (쿼리에 symbol이 포함되어야 함)
+        if "symbol" not in df.columns and params and len(params) > 0:
+            # 쿼리의 첫 번째 파라미터가 symbol이라고 가정
+            df["symbol"] = params[0]
 
-            df = standardize_dataframe(df)
-            return df
+        df = standardize_dataframe(df)
+        return df
 
 
 if __name__ == "__main__":
@@ -0,0 +1,280 @@
+"""
+stock_ohlcv 압축 스키마 (WITHOUT ROWID + 정수 일수)
+
+기존 stock_ohlcv는 date를 'YYYY-MM-DD' 문자열로 저장하고, (symbol, date) 기본키 인덱스와
+별도의 rowid 테이블 B-tree를 함께 가집니다. 압축 스키마는
+
+- stock_ohlcv_days: day = 1970-01-01 기준 정수 일수, PRIMARY KEY (symbol, day) WITHOUT ROWID
+  (행이 기본키 B-tree에 바로 저장되어 중복 B-tree 없음)
+- idx_ohlcv_days_day_symbol: (day, symbol) 보조 인덱스 (특정일 단면 조회)
+- stock_ohlcv: 기존 컬럼 순서 그대로 date 문자열을 돌려주는 호환 뷰.
+  INSTEAD OF 트리거로 INSERT(OR REPLACE 의미)/UPDATE/DELETE도 지원
+
+로 구성됩니다. 범위 조회가 잦은 경로(패널 로더, 컬럼형 저장소, 일관성 감사, 거래일 인덱스,
+업데이터 쓰기)는 ohlcv_source()로 현재 스키마를 확인해 압축 테이블을 직접 읽고 씁니다.
+그 밖의 기존 쿼리는 뷰를 통해 결과가 그대로 유지됩니다 (날짜 조건은 인덱스를 타지 않음).
+
+사용 예시:
+    stats = migrate_to_compact("data/trading.db")
+    revert_to_legacy("data/trading.db")
+"""
+
+import os
+import time
+import logging
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from .connection_manager import get_pooled_connection
+
+logger = logging.getLogger(__name__)
+
+LEGACY_TABLE = "stock_ohlcv"
+COMPACT_TABLE = "stock_ohlcv_days"
+DAY_INDEX = "idx_ohlcv_days_day_symbol"
+
+# 'YYYY-MM-DD' -> 1970-01-01 기준 일수 / 역변환 (SQLite 식)
+DATE_TO_DAY_SQL = "CAST(julianday({}) - 2440587.5 AS INTEGER)"
+DAY_TO_DATE_SQL = "date({} * 86400, 'unixepoch')"
+
+# 이보다 긴 기간의 값 조회는 (day, symbol) 인덱스 대신 기본키 순서 전체 스캔
+# (보조 인덱스 경유 시 행마다 기본키 B-tree를 다시 탐색하므로 넓은 기간에서는 더 느림)
+INDEX_RANGE_DAYS = 31
+
+
+@dataclass(frozen=True)
+class OHLCVSource:
+    """현재 DB의 OHLCV 저장 형태
+
+    table: 범위 조회 대상 테이블, date_column: 날짜 컬럼 (date 문자열 또는 day 정수)
+    """
+
+    compact: bool
+
+    @property
+    def table(self) -> str:
+        return COMPACT_TABLE if self.compact else LEGACY_TABLE
+
+    @property
+    def date_column(self) -> str:
+        return "day" if self.compact else "date"
+
+    def day_expr(self, alias: str = "") -> str:
+        """정수 일수를 돌려주는 SELECT 식"""
+        prefix = f"{alias}." if alias else ""
+        return f"{prefix}day" if self.compact else DATE_TO_DAY_SQL.format(f"{prefix}date")
+
+    def date_param(self, value: Optional[str]):
+        """날짜 조건 바인딩 값 ('YYYY-MM-DD'/'YYYYMMDD' -> 압축 스키마면 일수)"""
+        if value is None or not self.compact:
+            return value
+        from .trading_calendar import to_day_number
+
+        return to_day_number(value)
+
+    def range_condition(
+        self, start: Optional[str], end: Optional[str], alias: str = ""
+    ) -> Tuple[List[str], List]:
+        """행 값을 읽는 기간 조건 (조건 목록, 바인딩 값)
+
+        압축 스키마에서 기간이 INDEX_RANGE_DAYS보다 길면 날짜 컬럼에 단항 +를 붙여
+        (day, symbol) 인덱스 사용을 막고 기본키 순서로 스캔합니다.
+        """
+        column = f"{alias}.{self.date_column}" if alias else self.date_column
+        if self.compact:
+            from .trading_calendar import to_day_number
+
+            first = to_day_number(start) if start else None
+            last = to_day_number(end) if end else to_day_number(datetime.now())
+            if first is None or last - first > INDEX_RANGE_DAYS:
+                column = f"+{column}"
+        conditions, params = [], []
+        if start:
+            conditions.append(f"{column} >= ?")
+            params.append(self.date_param(start))
+        if end:
+            conditions.append(f"{column} <= ?")
+            params.append(self.date_param(end))
+        return conditions, params
+
+
+def ohlcv_layout(conn: sqlite3.Connection) -> Optional[str]:
+    """'compact' (압축 테이블 + 호환 뷰), 'legacy' (기존 테이블), 없으면 None"""
+    rows = dict(conn.execute(
+        "SELECT name, type FROM sqlite_master WHERE name IN (?, ?)", (LEGACY_TABLE, COMPACT_TABLE)
+    ).fetchall())
+    if COMPACT_TABLE in rows:
+        return "compact"
+    if rows.get(LEGACY_TABLE) == "table":
+        return "legacy"
+    return None
+
+
+def ohlcv_source(conn: sqlite3.Connection) -> OHLCVSource:
+    """범위 조회/쓰기에 사용할 OHLCV 저장 형태"""
+    return OHLCVSource(compact=ohlcv_layout(conn) == "compact")
+
+
+def _legacy_columns(conn: sqlite3.Connection, table: str) -> List[Tuple[str, str]]:
+    """(컬럼명, 선언 타입) 목록 (테이블 정의 순서)"""
+    return [(row[1], row[2]) for row in conn.execute(f"PRAGMA table_info({table})")]
+
+
+def _compat_view_sql(columns: List[Tuple[str, str]]) -> List[str]:
+    """호환 뷰 및 INSTEAD OF 트리거 DDL"""
+    names = [name for name, _ in columns]
+    values = [name for name in names if name not in ("symbol", "date")]
+    select = ", ".join(
+        f"{DAY_TO_DATE_SQL.format('day')} AS date" if name == "date" else name for name in names
+    )
+    new_day = DATE_TO_DAY_SQL.format("NEW.date")
+    old_day = DATE_TO_DAY_SQL.format("OLD.date")
+    target = ", ".join(["symbol", "day"] + values)
+    new_values = ", ".join(["NEW.symbol", new_day] + [f"NEW.{v}" for v in values])
+    assignments = ", ".join(["symbol = NEW.symbol", f"day = {new_day}"] + [f"{v} = NEW.{v}" for v in values])
+    return [
+        f"CREATE VIEW {LEGACY_TABLE} AS SELECT {select} FROM {COMPACT_TABLE}",
+        f"CREATE TRIGGER {LEGACY_TABLE}_insert INSTEAD OF INSERT ON {LEGACY_TABLE} BEGIN "
+        f"INSERT OR REPLACE INTO {COMPACT_TABLE} ({target}) VALUES ({new_values}); END",
+        f"CREATE TRIGGER {LEGACY_TABLE}_update INSTEAD OF UPDATE ON {LEGACY_TABLE} BEGIN "
+        f"UPDATE {COMPACT_TABLE} SET {assignments} WHERE symbol = OLD.symbol AND day = {old_day}; END",
+        f"CREATE TRIGGER {LEGACY_TABLE}_delete INSTEAD OF DELETE ON {LEGACY_TABLE} BEGIN "
+        f"DELETE FROM {COMPACT_TABLE} WHERE symbol = OLD.symbol AND day = {old_day}; END",
+    ]
+
+
+def compact_upsert_sql(columns: List[str]) -> str:
+    """압축 테이블 UPSERT (date 문자열을 바인딩하면 SQLite에서 일수로 변환)"""
+    values = [c for c in columns if c not in ("symbol", "date")]
+    placeholders = ", ".join(["?", DATE_TO_DAY_SQL.format("?")] + ["?"] * len(values))
+    updates = ", ".join(f"{c} = excluded.{c}" for c in values)
+    return (
+        f"INSERT INTO {COMPACT_TABLE} (symbol, day, {', '.join(values)}) VALUES ({placeholders}) "
+        f"ON CONFLICT(symbol, day) DO UPDATE SET {updates}"
+    )
+
+
+def _file_size(db_path: str) -> int:
+    return sum(os.path.getsize(p) for p in (db_path, f"{db_path}-wal") if os.path.exists(p))
+
+
+def migrate_to_compact(db_path: str, keep_legacy: bool = False, vacuum: bool = True) -> Dict:
+    """기존 stock_ohlcv를 압축 스키마로 변환
+
+    단일 트랜잭션에서 (symbol, date) 순으로 복사하므로 기본키 B-tree에 순차 삽입되며,
+    실패 시 원래 테이블이 그대로 남습니다.
+
+    Args:
+        db_path: DB 경로
+        keep_legacy: 기존 테이블을 stock_ohlcv_legacy로 남김 (기본: 삭제)
+        vacuum: 변환 후 VACUUM으로 빈 페이지 반환
+
+    Returns:
+        {"rows", "size_before", "size_after", "seconds"}
+
+    Raises:
+        ValueError: 이미 변환되었거나 날짜 형식이 잘못된 행이 있는 경우
+    """
+    start = time.perf_counter()
+    conn = get_pooled_connection(db_path)
+    layout = ohlcv_layout(conn)
+    if layout != "legacy":
+        raise ValueError(f"변환할 {LEGACY_TABLE} 테이블이 없습니다 (현재: {layout})")
+
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    size_before = _file_size(db_path)
+    columns = _legacy_columns(conn, LEGACY_TABLE)
+    names = [name for name, _ in columns]
+    if "symbol" not in names or "date" not in names:
+        raise ValueError(f"{LEGACY_TABLE}에 symbol/date 컬럼이 없습니다")
+
+    invalid = conn.execute(
+        f"SELECT COUNT(*), MIN(date) FROM {LEGACY_TABLE} WHERE julianday(date) IS NULL"
+    ).fetchone()
+    if invalid[0]:
+        raise ValueError(f"날짜로 변환할 수 없는 행 {invalid[0]}개 (예: {invalid[1]!r})")
+
+    values = [(name, decl) for name, decl in columns if name not in ("symbol", "date")]
+    definition = ", ".join(
+        ["symbol TEXT NOT NULL", "day INTEGER NOT NULL"]
+        + [f"{name} {decl}".strip() for name, decl in values]
+        + ["PRIMARY KEY (symbol, day)"]
+    )
+    value_names = [name for name, _ in values]
+
+    with conn:
+        conn.execute("BEGIN")
+        conn.execute(f"CREATE TABLE {COMPACT_TABLE} ({definition}) WITHOUT ROWID")
+        conn.execute(
+            f"INSERT OR REPLACE INTO {COMPACT_TABLE} (symbol, day, {', '.join(value_names)}) "
+            f"SELECT symbol, {DATE_TO_DAY_SQL.format('date')}, {', '.join(value_names)} "
+            f"FROM {LEGACY_TABLE} ORDER BY symbol, date"
+        )
+        rows = conn.execute(f"SELECT COUNT(*) FROM {COMPACT_TABLE}").fetchone()[0]
+        # 보조 인덱스는 적재 후 한 번에 생성 (정렬 1회)
+        conn.execute(f"CREATE INDEX {DAY_INDEX} ON {COMPACT_TABLE} (day, symbol)")
+        if keep_legacy:
+            conn.execute(f"ALTER TABLE {LEGACY_TABLE} RENAME TO {LEGACY_TABLE}_legacy")
+        else:
+            conn.execute(f"DROP TABLE {LEGACY_TABLE}")
+        for sql in _compat_view_sql(columns):
+            conn.execute(sql)
+
+    if vacuum:
+        conn.execute("VACUUM")
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    from .trading_calendar import reset_trading_day_index
+
+    reset_trading_day_index(db_path)
+    stats = {
+        "rows": rows,
+        "size_before": size_before,
+        "size_after": _file_size(db_path),
+        "seconds": time.perf_counter() - start,
+    }
+    logger.info(
+        f"stock_ohlcv 압축 스키마 변환 완료: {rows:,}행, "
+        f"{stats['size_before'] / 1024 / 1024:.1f}MB -> {stats['size_after'] / 1024 / 1024:.1f}MB "
+        f"({stats['seconds']:.1f}초)"
+    )
+    return stats
+
+
+def revert_to_legacy(db_path: str, vacuum: bool = True) -> int:
+    """압축 스키마를 기존 stock_ohlcv 테이블로 되돌림. 복원한 행 수 반환"""
+    conn = get_pooled_connection(db_path)
+    if ohlcv_layout(conn) != "compact":
+        raise ValueError(f"{COMPACT_TABLE} 테이블이 없습니다")
+
+    view_columns = [row[1] for row in conn.execute(f"PRAGMA table_info({LEGACY_TABLE})")]
+    compact_columns = dict(_legacy_columns(conn, COMPACT_TABLE))
+    definition = ", ".join(
+        ["symbol TEXT NOT NULL" if name == "symbol" else "date TEXT NOT NULL" if name == "date"
+         else f"{name} {compact_columns.get(name, '')}".strip() for name in view_columns]
+        + ["PRIMARY KEY (symbol, date)"]
+    )
+    with conn:
+        conn.execute("BEGIN")
+        conn.execute(f"DROP VIEW IF EXISTS {LEGACY_TABLE}")
+        conn.execute(f"CREATE TABLE {LEGACY_TABLE} ({definition})")
+        select = ", ".join(
+            f"{DAY_TO_DATE_SQL.format('day')}" if name == "date" else name for name in view_columns
+        )
+        conn.execute(
+            f"INSERT INTO {LEGACY_TABLE} ({', '.join(view_columns)}) "
+            f"SELECT {select} FROM {COMPACT_TABLE} ORDER BY symbol, day"
+        )
+        rows = conn.execute(f"SELECT COUNT(*) FROM {LEGACY_TABLE}").fetchone()[0]
+        conn.execute(f"DROP TABLE {COMPACT_TABLE}")
+
+    if vacuum:
+        conn.execute("VACUUM")
+
+    from .trading_calendar import reset_trading_day_index
+
+    reset_trading_day_index(db_path)
+    logger.info(f"stock_ohlcv 기존 스키마 복원 완료: {rows:,}행")
+    return rows
@@ -0,0 +1,187 @@
+"""
+다종목 일괄 데이터 로더
+
+여러 종목의 OHLCV를 단일 범위 쿼리로 조회하고, (symbol, date) 정렬 결과를
+NumPy 그룹 경계로 분할하여 종목별 DataFrame 또는 정렬된 3차원 배열로 반환합니다.
+종목마다 StockDataManager/연결을 새로 만들 필요가 없습니다.
+
+사용 예시:
+    frames = load_panel(["005930", "000660"], "2023-01-01", "2024-12-31")
+    panel = load_panel(symbols, start, end, fields=["close", "volume"], as_array=True)
+    closes = panel.field("close")  # index=날짜, columns=종목
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from .connection_manager import get_pooled_connection
+from .ohlcv_schema import ohlcv_source
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FIELDS = ("open", "high", "low", "close", "volume")
+
+# SQLite 바인딩 변수 제한을 고려한 IN 절 최대 종목 수 (초과 시 임시 테이블 사용)
+MAX_INLINE_SYMBOLS = 500
+
+
+@dataclass
+class OHLCVPanel:
+    """날짜 x 종목으로 정렬된 OHLCV 패널
+
+    values 형태: (필드 수, 날짜 수, 종목 수). 데이터가 없는 칸은 NaN.
+    """
+
+    symbols: List[str]
+    dates: pd.DatetimeIndex
+    fields: List[str]
+    values: np.ndarray
+
+    def field(self, name: str) -> pd.DataFrame:
+        """단일 필드를 날짜 x 종목 DataFrame으로 반환"""
+        idx = self.fields.index(name)
+        return pd.DataFrame(self.values[idx], index=self.dates, columns=self.symbols)
+
+    def to_frames(self, dropna: bool = True) -> Dict[str, pd.DataFrame]:
+        """종목별 DataFrame 딕셔너리로 변환"""
+        frames = {}
+        for j, symbol in enumerate(self.symbols):
+            df = pd.DataFrame(self.values[:, :, j].T, index=self.dates, columns=self.fields)
+            frames[symbol] = df.dropna(how="all") if dropna else df
+        return frames
+
+
+def _parse_dates(raw_dates: np.ndarray) -> np.ndarray:
+    """'YYYY-MM-DD' 문자열 또는 정수 일수(압축 스키마) 배열을 datetime64[D]로 변환 (비표준 형식은 pandas로 대체)"""
+    if np.issubdtype(raw_dates.dtype, np.integer):
+        return raw_dates.astype("datetime64[D]")
+    try:
+        return raw_dates.astype("datetime64[D]")
+    except ValueError:
+        return pd.to_datetime(raw_dates, format="mixed").values.astype("datetime64[D]")
+
+
+def _fetch_rows(
+    db_path: str,
+    symbols: Optional[Sequence[str]],
+    start: Optional[str],
+    end: Optional[str],
+    fields: Sequence[str],
+) -> list:
+    """단일 범위 쿼리로 (symbol, date, fields...) 행 조회"""
+    conn = get_pooled_connection(db_path)
+    ohlcv = ohlcv_source(conn)
+    date_col = f"o.{ohlcv.date_column}"
+    select_cols = ", ".join(["o.symbol", date_col] + [f"o.{f}" for f in fields])
+
+    conditions, params = ohlcv.range_condition(start, end, alias="o")
+
+    source = f"{ohlcv.table} o"
+    if symbols is not None:
+        if len(symbols) <= MAX_INLINE_SYMBOLS:
+            placeholders = ",".join("?" * len(symbols))
+            conditions.insert(0, f"o.symbol IN ({placeholders})")
+            params = list(symbols) + params
+        else:
+            # 대량 종목은 임시 테이블 조인 (temp_store=MEMORY)
+            conn.execute("CREATE TEMP TABLE IF NOT EXISTS _panel_symbols (symbol TEXT PRIMARY KEY)")
+            with conn:
+                conn.execute("DELETE FROM _panel_symbols")
+                conn.executemany(
+                    "INSERT OR IGNORE INTO _panel_symbols (symbol) VALUES (?)",
+                    [(s,) for s in symbols],
+                )
+            source = f"_panel_symbols p JOIN {ohlcv.table} o ON o.symbol = p.symbol"
+
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    query = f"SELECT {select_cols} FROM {source} {where} ORDER BY o.symbol, {date_col}"
+    return conn.execute(query, params).fetchall()
+
+
+def load_panel(
+    symbols: Optional[Sequence[str]],
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    fields: Optional[Sequence[str]] = None,
+    db_path: Optional[str] = None,
+    as_array: bool = False,
+) -> Union[Dict[str, pd.DataFrame], OHLCVPanel]:
+    """
+    다종목 OHLCV 일괄 조회
+
+    Args:
+        symbols: 종목 코드 목록 (None이면 전체 종목)
+        start: 시작일 (YYYY-MM-DD, 포함)
+        end: 종료일 (YYYY-MM-DD, 포함)
+        fields: 조회 필드 (기본: open, high, low, close, volume)
+        db_path: DB 경로 (기본: 설정의 trading.db)
+        as_array: True면 정렬된 OHLCVPanel, False면 종목별 DataFrame 딕셔너리
+
+    Returns:
+        {symbol: DataFrame(index=date, columns=fields)} 또는 OHLCVPanel
+        데이터가 없는 종목은 딕셔너리에서 제외됩니다.
+    """
+    fields = list(fields or DEFAULT_FIELDS)
+    invalid = [f for f in fields if f not in DEFAULT_FIELDS and f != "amount"]
+    if invalid:
+        raise ValueError(f"지원하지 않는 필드: {invalid}")
+
+    if db_path is None:
+        from .config import get_database_config
+
+        db_path = get_database_config().full_path
+
+    rows = _fetch_rows(db_path, symbols, start, end, fields)
+
+    if not rows:
+        if as_array:
+            requested = list(symbols) if symbols is not None else []
+            return OHLCVPanel(
+                symbols=requested,
+                dates=pd.DatetimeIndex([], name="date"),
+                fields=fields,
+                values=np.empty((len(fields), 0, len(requested))),
+            )
+        return {}
+
+    columns = list(zip(*rows))
+    symbol_arr = np.asarray(columns[0], dtype=object)
+    date_arr = _parse_dates(np.asarray(columns[1]))
+    values = np.array(columns[2:], dtype=np.float64)  # (필드 수, 행 수), NULL -> NaN
+
+    # (symbol, date) 정렬 결과의 종목 경계
+    boundaries = np.flatnonzero(symbol_arr[1:] != symbol_arr[:-1]) + 1
+    starts = np.concatenate(([0], boundaries))
+    ends = np.concatenate((boundaries, [len(symbol_arr)]))
+    loaded_symbols = symbol_arr[starts].tolist()
+
+    if not as_array:
+        frames = {}
+        for symbol, s, e in zip(loaded_symbols, starts, ends):
+            index = pd.DatetimeIndex(date_arr[s:e], name="date")
+            frames[symbol] = pd.DataFrame(values[:, s:e].T, index=index, columns=fields)
+        logger.debug(f"패널 로드: {len(frames)}개 종목, {len(rows)}행")
+        return frames
+
+    # 정렬된 3차원 배열: 전체 날짜 축에 각 종목 값 배치
+    panel_symbols = list(symbols) if symbols is not None else loaded_symbols
+    symbol_pos = {s: j for j, s in enumerate(panel_symbols)}
+    unique_dates, date_idx = np.unique(date_arr, return_inverse=True)
+
+    counts = ends - starts
+    col_idx = np.repeat([symbol_pos[s] for s in loaded_symbols], counts)
+
+    panel_values = np.full((len(fields), len(unique_dates), len(panel_symbols)), np.nan)
+    panel_values[:, date_idx, col_idx] = values
+
+    logger.debug(f"패널 로드: {len(loaded_symbols)}개 종목 x {len(unique_dates)}일")
+    return OHLCVPanel(
+        symbols=panel_symbols,
+        dates=pd.DatetimeIndex(unique_dates, name="date"),
+        fields=fields,
+        values=panel_values,
+    )
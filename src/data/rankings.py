@@ -0,0 +1,232 @@
+"""
+일자별 단면 순위 테이블 (StockFilter 스크리닝용)
+
+거래일마다 전 종목의 N일 평균 거래량, N일 등락률과 시장별 순위를 stock_daily_rankings에
+미리 계산해 둡니다. 스크리닝은 (date, market, 순위) 인덱스 조회 한 번으로 끝나며,
+업데이터는 수집 후 새로 저장된 날짜 이후만 증분 갱신합니다.
+
+- 평균 거래량: 해당 종목의 최근 N 거래일 거래량 평균 (N/2일 이상 적재 시)
+- 등락률: N 거래일 전 종가 대비 종가 변화율 (%)
+- 순위: 기준일, 시장(stock_info.market)별 내림차순 1부터. 값이 없으면 NULL
+
+사용 예시:
+    builder = DailyRankingBuilder("data/trading.db")
+    builder.refresh()                      # 마지막 계산일 이후 증분
+    builder.refresh(since="2024-06-03")    # 백필 이후 재계산
+"""
+
+import logging
+import sqlite3
+from datetime import timedelta
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .connection_manager import get_pooled_connection
+from .panel_loader import load_panel
+
+logger = logging.getLogger(__name__)
+
+RANKING_TABLE = "stock_daily_rankings"
+
+VOLUME_WINDOWS = (1, 5, 20)
+RETURN_WINDOWS = (1, 5, 20)
+
+# 최장 창(20 거래일)을 채우기 위해 기준일 이전으로 더 읽을 달력 일수 (연휴 포함 여유)
+WARMUP_CALENDAR_DAYS = 45
+
+# 이 거래일 수 이상을 다시 쓰면 순위 인덱스를 삭제 후 재생성 (행마다 인덱스 6개 갱신보다 빠름)
+REBUILD_INDEX_DAYS = 60
+
+VALUE_COLUMNS = (
+    ["close"]
+    + [f"avg_volume_{n}" for n in VOLUME_WINDOWS]
+    + [f"change_rate_{n}" for n in RETURN_WINDOWS]
+)
+RANK_COLUMNS = [f"{col}_rank" for col in VALUE_COLUMNS[1:]]
+TABLE_COLUMNS = ["date", "symbol", "market"] + VALUE_COLUMNS + RANK_COLUMNS
+
+
+def _rank_index_sql() -> List[str]:
+    """시장별 순위 인덱스 DDL (순위 컬럼마다 하나)"""
+    return [
+        f"CREATE INDEX IF NOT EXISTS idx_rankings_{col} ON {RANKING_TABLE} (date, market, {col})"
+        for col in RANK_COLUMNS
+    ]
+
+
+def ranking_schema_sql() -> str:
+    """순위 테이블 및 시장별 순위 인덱스 DDL"""
+    columns = ",\n        ".join(
+        ["date TEXT NOT NULL", "symbol TEXT NOT NULL", "market TEXT"]
+        + [f"{col} REAL" for col in VALUE_COLUMNS]
+        + [f"{col} INTEGER" for col in RANK_COLUMNS]
+        + ["PRIMARY KEY (date, symbol)"]
+    )
+    indexes = "".join(f"{sql};\n" for sql in _rank_index_sql())
+    return f"CREATE TABLE IF NOT EXISTS {RANKING_TABLE} (\n        {columns}\n    );\n{indexes}"
+
+
+class DailyRankingBuilder:
+    """stock_ohlcv로부터 일자별 순위 테이블 계산"""
+
+    def __init__(self, db_path: str = "data/trading.db"):
+        self.db_path = db_path
+        with get_pooled_connection(self.db_path) as conn:
+            conn.executescript(ranking_schema_sql())
+
+    def last_date(self) -> Optional[str]:
+        """계산된 마지막 날짜 (YYYY-MM-DD)"""
+        row = get_pooled_connection(self.db_path).execute(f"SELECT MAX(date) FROM {RANKING_TABLE}").fetchone()
+        return row[0] if row else None
+
+    def refresh(self, since: Optional[str] = None, until: Optional[str] = None) -> int:
+        """since~until 거래일의 순위를 다시 계산
+
+        Args:
+            since: 재계산 시작일 (YYYY-MM-DD/YYYYMMDD, None이면 마지막 계산일 다음 날부터, 테이블이 비어 있으면 전체)
+            until: 재계산 종료일 (None이면 적재된 마지막 날짜)
+
+        Returns:
+            갱신한 거래일 수
+        """
+        if since is None:
+            last = self.last_date()
+            since = (pd.Timestamp(last) + timedelta(days=1)).strftime("%Y-%m-%d") if last else None
+        else:
+            since = pd.Timestamp(since).strftime("%Y-%m-%d")
+        until = pd.Timestamp(until).strftime("%Y-%m-%d") if until else None
+
+        load_start = (
+            (pd.Timestamp(since) - timedelta(days=WARMUP_CALENDAR_DAYS)).strftime("%Y-%m-%d") if since else None
+        )
+        panel = load_panel(None, load_start, until, fields=["close", "volume"], db_path=self.db_path, as_array=True)
+        target = np.flatnonzero(panel.dates >= pd.Timestamp(since)) if since else np.arange(len(panel.dates))
+        if len(target) == 0:
+            return 0
+
+        frame = self._compute(panel, target)
+        self._write(frame, panel.dates[target[0]], panel.dates[target[-1]])
+        logger.info(
+            f"순위 테이블 갱신: {panel.dates[target[0]].date()} ~ {panel.dates[target[-1]].date()} "
+            f"({len(target)}일, {len(frame)}행)"
+        )
+        return len(target)
+
+    def _compute(self, panel, target: np.ndarray) -> pd.DataFrame:
+        """패널(날짜 x 종목)에서 대상 날짜의 지표와 시장별 순위를 계산"""
+        close = panel.field("close")
+        close = close.where(close > 0)
+        volume = panel.field("volume")
+
+        metrics = {"close": close}
+        # 행 = 시장 거래일이므로 rolling/shift가 종목별 거래일 기준 창이 됨
+        for n in VOLUME_WINDOWS:
+            metrics[f"avg_volume_{n}"] = volume.rolling(n, min_periods=max(1, n // 2)).mean()
+        for n in RETURN_WINDOWS:
+            metrics[f"change_rate_{n}"] = (close / close.shift(n) - 1.0) * 100.0
+
+        # 기준일에 거래된 (종가 > 0) 종목만 순위 대상
+        traded = close.to_numpy()[target] > 0
+        date_idx, symbol_idx = np.nonzero(traded)
+        rows = target[date_idx]
+
+        frame = pd.DataFrame({
+            "date": np.datetime_as_string(panel.dates.values[rows].astype("datetime64[D]")),
+            "symbol": np.asarray(panel.symbols, dtype=object)[symbol_idx],
+        })
+        for name, values in metrics.items():
+            frame[name] = values.to_numpy()[rows, symbol_idx]
+
+        markets = dict(get_pooled_connection(self.db_path).execute("SELECT symbol, market FROM stock_info").fetchall())
+        frame["market"] = frame["symbol"].map(markets)
+
+        groups = frame.groupby(["date", "market"], dropna=False, sort=False)
+        for col in VALUE_COLUMNS[1:]:
+            frame[f"{col}_rank"] = groups[col].rank(ascending=False, method="first")
+        return frame[TABLE_COLUMNS]
+
+    def _write(self, frame: pd.DataFrame, first: pd.Timestamp, last: pd.Timestamp):
+        """대상 기간 행을 교체 (단일 트랜잭션, PK 순서로 삽입)"""
+        frame = frame.sort_values(["date", "symbol"], kind="stable")
+        columns = []
+        for col in TABLE_COLUMNS:
+            series = frame[col].astype("Int64") if col in RANK_COLUMNS else frame[col]
+            values = series.astype(object).to_numpy()
+            values[series.isna().to_numpy()] = None
+            columns.append(values)
+
+        rebuild = frame["date"].nunique() >= REBUILD_INDEX_DAYS
+        placeholders = ",".join("?" * len(TABLE_COLUMNS))
+        conn = get_pooled_connection(self.db_path)
+        with conn:
+            if rebuild:
+                for col in RANK_COLUMNS:
+                    conn.execute(f"DROP INDEX IF EXISTS idx_rankings_{col}")
+            conn.execute(
+                f"DELETE FROM {RANKING_TABLE} WHERE date BETWEEN ? AND ?",
+                (first.strftime("%Y-%m-%d"), last.strftime("%Y-%m-%d")),
+            )
+            conn.executemany(
+                f"INSERT INTO {RANKING_TABLE} ({','.join(TABLE_COLUMNS)}) VALUES ({placeholders})",
+                zip(*columns),
+            )
+            if rebuild:
+                for sql in _rank_index_sql():
+                    conn.execute(sql)
+
+
+def resolve_ranking_date(db_path: str, date: Optional[str] = None) -> Optional[str]:
+    """기준일 이전(포함) 가장 최근 순위 계산일 (YYYY-MM-DD). 테이블이 없거나 비어 있으면 None"""
+    conn = get_pooled_connection(db_path)
+    try:
+        if date is None:
+            row = conn.execute(f"SELECT MAX(date) FROM {RANKING_TABLE}").fetchone()
+        else:
+            row = conn.execute(
+                f"SELECT MAX(date) FROM {RANKING_TABLE} WHERE date <= ?", (pd.Timestamp(date).strftime("%Y-%m-%d"),)
+            ).fetchone()
+    except sqlite3.OperationalError:
+        return None
+    return row[0] if row else None
+
+
+def query_ranking_top(
+    db_path: str,
+    metric: str,
+    date: str,
+    market: str = "ALL",
+    top_n: int = 30,
+    ascending: bool = False,
+    where: Optional[str] = None,
+    params: Optional[List] = None,
+) -> List[str]:
+    """기준일 metric 상위(ascending=True면 하위) 종목
+
+    특정 시장은 (date, market, metric_rank) 인덱스를 순서대로 읽고,
+    ALL은 해당 날짜 행만 읽어 정렬합니다.
+    """
+    if metric not in VALUE_COLUMNS:
+        raise ValueError(f"지원하지 않는 순위 지표: {metric}")
+    conditions = ["date = ?", f"{metric} IS NOT NULL"]
+    query_params: List = [date]
+    if market != "ALL" and metric != "close":
+        conditions.append("market = ?")
+        query_params.append(market)
+        order = f"{metric}_rank {'DESC' if ascending else 'ASC'}"
+    else:
+        if market != "ALL":
+            conditions.append("market = ?")
+            query_params.append(market)
+        order = f"{metric} {'ASC' if ascending else 'DESC'}"
+    if where:
+        conditions.append(where)
+        query_params.extend(params or [])
+
+    query = (
+        f"SELECT symbol FROM {RANKING_TABLE} WHERE {' AND '.join(conditions)} "
+        f"ORDER BY {order} LIMIT ?"
+    )
+    query_params.append(top_n)
+    return [row[0] for row in get_pooled_connection(db_path).execute(query, query_params)]
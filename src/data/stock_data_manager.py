@@ -7,6 +7,7 @@ import os
 from src.data.database import DatabaseManager
 from src.data.updater import StockDataUpdater
 from src.data.indicators import TALibIndicators, TechnicalIndicators
+from src.data.panel_loader import load_panel
 
 from src.utils.constants import PROJECT_ROOT  # PROJECT_ROOT 임포트 추가
 
@@ -135,7 +136,7 @@ class StockDataManager:
         self.db.execute(
             "DELETE FROM technical_indicators WHERE symbol = ?", (stock_code,)
         )
-        with sqlite3.connect(self.db.db_path) as conn:
+        with self.db.conn as conn:
             df_indicators.dropna().to_sql(
                 "technical_indicators", conn, if_exists="append", index=False
             )
@@ -155,6 +156,12 @@ class StockDataManager:
             df.set_index('date', inplace=True)
         return df
 
+    def load_panel(self, symbols, start_date=None, end_date=None, fields=None, as_array=False):
+        """여러 종목의 기간 데이터를 단일 쿼리로 조회합니다. (panel_loader.load_panel 참고)"""
+        return load_panel(
+            symbols, start_date, end_date, fields=fields, db_path=self.db.db_path, as_array=as_array
+        )
+
     def get_all_symbols(self) -> list:
         """데이터베이스에 저장된 모든 고유 종목 코드를 반환합니다."""
         query = "SELECT DISTINCT symbol FROM stock_ohlcv ORDER BY symbol"
@@ -14,6 +14,8 @@ from functools import lru_cache
 import time
 from pathlib import Path
 from .database import DatabaseManager
+from .ohlcv_schema import DAY_TO_DATE_SQL, OHLCVSource, ohlcv_source
+from .rankings import RANKING_TABLE, RETURN_WINDOWS, VOLUME_WINDOWS, query_ranking_top
 
 # 프로젝트 루트 경로 설정
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
@@ -50,10 +52,16 @@ class StockFilter:
         cache_time = self.cache[cache_key].get('timestamp', 0)
         return (time.time() - cache_time) < self.cache_duration
 
+    def _ohlcv_source(self) -> OHLCVSource:
+        """OHLCV 조회 대상 (압축 스키마면 stock_ohlcv_days를 정수 day로 직접 조회)"""
+        return ohlcv_source(self.db_manager.conn)
+
     def _get_latest_trading_date(self) -> str:
         """최근 거래일 조회 (DatabaseManager 기반)"""
         try:
-            result = self.db_manager.fetchall("SELECT MAX(date) FROM stock_ohlcv")
+            ohlcv = self._ohlcv_source()
+            latest = DAY_TO_DATE_SQL.format("MAX(day)") if ohlcv.compact else "MAX(date)"
+            result = self.db_manager.fetchall(f"SELECT {latest} FROM {ohlcv.table}")
             
             if result and result[0] and result[0][0]:
                 # YYYY-MM-DD → YYYYMMDD 변환
@@ -89,46 +97,25 @@ class StockFilter:
         Args:
             top_n: 상위 N개 종목
             market: 시장 구분 ('KOSPI', 'KOSDAQ', 'ALL')
-            date: 기준일 (YYYYMMDD, None시 최근 거래일)
+            date: 기준일 (YYYYMMDD, None시 최근 저장일). stock_market_cap 시계열에서
+                기준일 이전 가장 최근 값을 사용하며, 시계열이 없으면 stock_info의 최신 스냅샷 사용
             min_cap: 최소 시가총액 (억원)
 
         Returns:
             종목 코드 리스트
         """
-        if date is None:
-            date = self._get_latest_trading_date()
-            
-        cache_key = self._get_cache_key(market, date, f"market_cap_{top_n}_{min_cap}")
+        cache_key = self._get_cache_key(market, date or "latest", f"market_cap_{top_n}_{min_cap}")
         if self._is_cache_valid(cache_key):
             return self.cache[cache_key]['data']
         
         try:
-            # 시장 조건 구성
-            where_conditions = ["market_cap IS NOT NULL"]
-            params: List[Union[str, int]] = []
-            
-            if market != "ALL":
-                where_conditions.append("market = ?")
-                params.append(market)
-            
-            # 최소 시가총액 조건 추가
-            if min_cap is not None:
-                min_cap_won = int(min_cap * 100_000_000)  # 억원을 원으로 변환
-                where_conditions.append("market_cap >= ?")
-                params.append(min_cap_won)
-            
-            where_clause = " AND ".join(where_conditions)
-            
-            query = f"""
-            SELECT symbol, market_cap 
-            FROM stock_info 
-            WHERE {where_clause}
-            ORDER BY market_cap DESC 
-            LIMIT ?
-            """
-            params.append(top_n)
-            
-            df = self.db_manager.fetchdf(query, tuple(params))
+            # 시가총액 시계열이 있으면 기준일 이전 가장 최근 스냅샷 사용 (미래 데이터 참조 없음)
+            if self._has_market_cap_history():
+                cap_date = self._get_market_cap_date(date)
+                df = (self._query_market_caps(cap_date, market, min_cap=min_cap, limit=top_n)
+                      if cap_date else pd.DataFrame())
+            else:
+                df = self._query_snapshot_market_caps(market, min_cap, top_n)
             result = df['symbol'].tolist() if not df.empty else []
             
             # 캐시 저장
@@ -143,6 +130,104 @@ class StockFilter:
             logger.error(f"시가총액 상위 종목 조회 실패: {e}")
             return []
 
+    def get_market_caps(
+        self,
+        date: Optional[str] = None,
+        symbols: Optional[List[str]] = None,
+        market: str = "ALL",
+    ) -> pd.DataFrame:
+        """
+        기준일 시점의 종목별 시가총액/상장주식수 (시가총액 가중, 과거 유니버스 선정용)
+
+        Args:
+            date: 기준일 (YYYYMMDD, None시 저장된 최근일). 해당일이 없으면 이전 가장 최근 저장일 사용
+            symbols: 조회 종목 (None시 전체)
+            market: 시장 구분 ('KOSPI', 'KOSDAQ', 'ALL')
+
+        Returns:
+            DataFrame (symbol, date, market_cap, shares), 시가총액 내림차순
+        """
+        cap_date = self._get_market_cap_date(date)
+        if cap_date is None:
+            return pd.DataFrame(columns=["symbol", "date", "market_cap", "shares"])
+        return self._query_market_caps(cap_date, market, symbols=symbols)
+
+    def _has_market_cap_history(self) -> bool:
+        """stock_market_cap 시계열 존재 여부 (테이블이 없는 DB 포함)"""
+        try:
+            return bool(self.db_manager.fetchall("SELECT 1 FROM stock_market_cap LIMIT 1"))
+        except Exception:
+            return False
+
+    def _get_market_cap_date(self, date: Optional[str]) -> Optional[str]:
+        """기준일 이전(포함) 가장 최근 시가총액 저장일 (YYYY-MM-DD, 없으면 None)"""
+        try:
+            if date is None:
+                result = self.db_manager.fetchall("SELECT MAX(date) FROM stock_market_cap")
+            else:
+                result = self.db_manager.fetchall(
+                    "SELECT MAX(date) FROM stock_market_cap WHERE date <= ?", (self._date_db_format(date),)
+                )
+        except Exception:
+            return None
+        return result[0][0] if result and result[0] else None
+
+    def _query_market_caps(
+        self,
+        cap_date: str,
+        market: str,
+        min_cap: Optional[float] = None,
+        symbols: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """stock_market_cap 단일 날짜 조회 (idx_market_cap_date_cap 순서대로 읽음)"""
+        query = "SELECT mc.symbol, mc.date, mc.market_cap, mc.shares FROM stock_market_cap mc"
+        where_conditions = ["mc.date = ?"]
+        params: List[Union[str, int]] = [cap_date]
+        
+        if market != "ALL":
+            query += " JOIN stock_info si ON si.symbol = mc.symbol"
+            where_conditions.append("si.market = ?")
+            params.append(market)
+        
+        # 최소 시가총액 조건 추가
+        if min_cap is not None:
+            where_conditions.append("mc.market_cap >= ?")
+            params.append(int(min_cap * 100_000_000))  # 억원을 원으로 변환
+        
+        if symbols is not None:
+            where_conditions.append(f"mc.symbol IN ({','.join('?' * len(symbols))})")
+            params.extend(symbols)
+        
+        query += f" WHERE {' AND '.join(where_conditions)} ORDER BY mc.market_cap DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        return self.db_manager.fetchdf(query, tuple(params))
+
+    def _query_snapshot_market_caps(self, market: str, min_cap: Optional[float], top_n: int) -> pd.DataFrame:
+        """stock_info.market_cap(최신 스냅샷) 기준 상위 종목 - 시계열이 없는 DB용"""
+        where_conditions = ["market_cap IS NOT NULL"]
+        params: List[Union[str, int]] = []
+        
+        if market != "ALL":
+            where_conditions.append("market = ?")
+            params.append(market)
+        
+        if min_cap is not None:
+            where_conditions.append("market_cap >= ?")
+            params.append(int(min_cap * 100_000_000))
+        
+        query = f"""
+        SELECT symbol, market_cap 
+        FROM stock_info 
+        WHERE {" AND ".join(where_conditions)}
+        ORDER BY market_cap DESC 
+        LIMIT ?
+        """
+        params.append(top_n)
+        return self.db_manager.fetchdf(query, tuple(params))
+
     def get_volume_top(
         self,
         top_n: int = 30,
@@ -174,31 +259,40 @@ class StockFilter:
         try:
             db_date = self._date_db_format(date)
             
+            # 순위 테이블에 계산된 기간이면 인덱스 조회 한 번으로 처리
+            if days_avg in VOLUME_WINDOWS and self._has_rankings(db_date):
+                metric = f"avg_volume_{days_avg}"
+                where, params = (f"{metric} >= ?", [min_volume]) if min_volume is not None else (None, None)
+                result = query_ranking_top(self.db_path, metric, db_date, market, top_n, where=where, params=params)
+                self.cache[cache_key] = {'data': result, 'timestamp': time.time()}
+                return result
+            
+            ohlcv = self._ohlcv_source()
             # 평균 거래량 계산 기간 설정
             if days_avg == 1:
                 # 단일 날짜 거래량
-                volume_query = """
+                volume_query = f"""
                 SELECT so.symbol, so.volume
-                FROM stock_ohlcv so
+                FROM {ohlcv.table} so
                 JOIN stock_info si ON so.symbol = si.symbol
-                WHERE so.date = ?
+                WHERE so.{ohlcv.date_column} = ?
                 """
-                params = [db_date]
+                params = [ohlcv.date_param(db_date)]
             else:
                 # 평균 거래량 계산
                 end_date_obj = datetime.strptime(date, '%Y%m%d')
                 start_date_obj = end_date_obj - timedelta(days=days_avg-1)
                 start_db_date = start_date_obj.strftime('%Y-%m-%d')
                 
-                volume_query = """
+                volume_query = f"""
                 SELECT so.symbol, AVG(so.volume) as volume
-                FROM stock_ohlcv so
+                FROM {ohlcv.table} so
                 JOIN stock_info si ON so.symbol = si.symbol
-                WHERE so.date BETWEEN ? AND ?
+                WHERE so.{ohlcv.date_column} BETWEEN ? AND ?
                 GROUP BY so.symbol
                 HAVING COUNT(*) >= ?
                 """
-                params = [start_db_date, db_date, max(1, days_avg // 2)]
+                params = [ohlcv.date_param(start_db_date), ohlcv.date_param(db_date), max(1, days_avg // 2)]
             
             # 시장 조건 추가
             if market != "ALL":
@@ -235,6 +329,7 @@ class StockFilter:
         date: Optional[str] = None,
         change_type: str = "rise",
         min_change: Optional[float] = None,
+        days: int = 1,
     ) -> List[str]:
         """
         등락률 상위 종목 조회 (DatabaseManager 기반)
@@ -245,6 +340,7 @@ class StockFilter:
             date: 기준일 (YYYYMMDD, None시 최근 거래일)
             change_type: 등락 구분 ('rise': 상승, 'fall': 하락, 'abs': 절대값)
             min_change: 최소 등락률 (%)
+            days: 등락률 계산 기간 (거래일, 1 이외는 순위 테이블 필요)
 
         Returns:
             종목 코드 리스트
@@ -252,32 +348,42 @@ class StockFilter:
         if date is None:
             date = self._get_latest_trading_date()
             
-        cache_key = self._get_cache_key(market, date, f"change_{change_type}_{top_n}_{min_change}")
+        cache_key = self._get_cache_key(market, date, f"change_{change_type}_{top_n}_{min_change}_{days}")
         if self._is_cache_valid(cache_key):
             return self.cache[cache_key]['data']
         
         try:
             db_date = self._date_db_format(date)
             
+            # 순위 테이블에 계산된 기간이면 인덱스 조회 한 번으로 처리
+            if days in RETURN_WINDOWS and self._has_rankings(db_date):
+                result = self._ranking_change_top(db_date, market, top_n, change_type, min_change, days)
+                self.cache[cache_key] = {'data': result, 'timestamp': time.time()}
+                return result
+            if days != 1:
+                logger.warning(f"{days}일 등락률은 순위 테이블이 필요합니다: {db_date}")
+                return []
+            
             # 전일 날짜 계산
             date_obj = datetime.strptime(date, '%Y%m%d')
             prev_date_obj = date_obj - timedelta(days=1)
             prev_db_date = prev_date_obj.strftime('%Y-%m-%d')
             
             # 등락률 계산 쿼리
-            change_query = """
+            ohlcv = self._ohlcv_source()
+            change_query = f"""
             SELECT 
                 today.symbol,
                 today.close as current_close,
                 prev.close as prev_close,
                 ((today.close - prev.close) * 100.0 / prev.close) as change_rate
-            FROM stock_ohlcv today
-            JOIN stock_ohlcv prev ON today.symbol = prev.symbol
+            FROM {ohlcv.table} today
+            JOIN {ohlcv.table} prev ON today.symbol = prev.symbol
             JOIN stock_info si ON today.symbol = si.symbol
-            WHERE today.date = ?
-            AND prev.date = ?
+            WHERE today.{ohlcv.date_column} = ?
+            AND prev.{ohlcv.date_column} = ?
             """
-            params = [db_date, prev_db_date]
+            params = [ohlcv.date_param(db_date), ohlcv.date_param(prev_db_date)]
             
             # 시장 조건 추가
             if market != "ALL":
@@ -324,6 +430,47 @@ class StockFilter:
             logger.error(f"등락률 상위 종목 조회 실패: {e}")
             return []
 
+    def _has_rankings(self, db_date: str) -> bool:
+        """기준일 순위 테이블 계산 여부 (테이블이 없는 DB 포함)"""
+        try:
+            return bool(self.db_manager.fetchall(f"SELECT 1 FROM {RANKING_TABLE} WHERE date = ? LIMIT 1", (db_date,)))
+        except Exception:
+            return False
+
+    def _ranking_change_top(
+        self,
+        db_date: str,
+        market: str,
+        top_n: int,
+        change_type: str,
+        min_change: Optional[float],
+        days: int,
+    ) -> List[str]:
+        """순위 테이블 기준 등락률 상위/하위/절대값 상위 종목"""
+        metric = f"change_rate_{days}"
+        threshold = min_change if min_change is not None else 0.0
+        if change_type == "rise":
+            op = ">=" if min_change is not None else ">"
+            return query_ranking_top(self.db_path, metric, db_date, market, top_n,
+                                     where=f"{metric} {op} ?", params=[threshold])
+        if change_type == "fall":
+            op = "<=" if min_change is not None else "<"
+            return query_ranking_top(self.db_path, metric, db_date, market, top_n, ascending=True,
+                                     where=f"{metric} {op} ?", params=[-threshold])
+
+        # abs: 해당 날짜 행만 읽어 절대값 정렬
+        query = f"SELECT symbol FROM {RANKING_TABLE} WHERE date = ? AND {metric} IS NOT NULL"
+        params: List[Union[str, float, int]] = [db_date]
+        if market != "ALL":
+            query += " AND market = ?"
+            params.append(market)
+        if min_change is not None:
+            query += f" AND ABS({metric}) >= ?"
+            params.append(min_change)
+        query += f" ORDER BY ABS({metric}) DESC LIMIT ?"
+        params.append(top_n)
+        return [row[0] for row in self.db_manager.fetchall(query, tuple(params))]
+
     def get_stock_info(
         self, symbols: List[str], date: Optional[str] = None
     ) -> pd.DataFrame:
@@ -350,6 +497,7 @@ class StockFilter:
             placeholders = ','.join(['?' for _ in symbols])
             
             # 종목 정보와 OHLCV 데이터 조인 쿼리
+            ohlcv = self._ohlcv_source()
             query = f"""
             SELECT 
                 si.symbol,
@@ -360,11 +508,11 @@ class StockFilter:
                 so.volume,
                 si.market_cap / 100000000.0 as market_cap_billion
             FROM stock_info si
-            LEFT JOIN stock_ohlcv so ON si.symbol = so.symbol AND so.date = ?
+            LEFT JOIN {ohlcv.table} so ON si.symbol = so.symbol AND so.{ohlcv.date_column} = ?
             WHERE si.symbol IN ({placeholders})
             """
             
-            params = [db_date] + symbols
+            params = [ohlcv.date_param(db_date)] + symbols
             df = self.db_manager.fetchdf(query, tuple(params))
             
             # 전일 대비 변화율 계산
@@ -374,11 +522,11 @@ class StockFilter:
                 
                 prev_query = f"""
                 SELECT symbol, close as prev_close
-                FROM stock_ohlcv
-                WHERE date = ? AND symbol IN ({placeholders})
+                FROM {ohlcv.table}
+                WHERE {ohlcv.date_column} = ? AND symbol IN ({placeholders})
                 """
                 
-                prev_params = [prev_db_date] + symbols
+                prev_params = [ohlcv.date_param(prev_db_date)] + symbols
                 prev_df = self.db_manager.fetchdf(prev_query, tuple(prev_params))
                 
                 # 전일 데이터와 병합하여 변화율 계산
@@ -0,0 +1,327 @@
+"""
+증분(스트리밍) 기술적 지표 계산 모듈
+
+새 봉이 들어올 때마다 O(1)로 지표를 갱신합니다. indicators.py의 배치 계산
+(TA-Lib / pandas)과 같은 값을 내도록 각 라이브러리의 시드/평활 방식을 그대로 따릅니다.
+
+- TA-Lib 호환: TalibSMA, TalibEMA, TalibMACD, TalibRSI, TalibBBands, TalibATR
+  (TA-Lib 바이너리는 CPU별 FMA 경로를 골라 쓰므로 마지막 자리 반올림 오차 수준까지 일치)
+- pandas 호환: RollingMean (rolling(n).mean()), EWMMean (ewm(span, adjust=True).mean())
+  (Kahan 보정 합 등 pandas 계산 순서를 따라 비트 단위로 일치)
+
+모든 클래스는 update(...)로 값을 하나 넣고 현재 지표 값을 돌려주며,
+아직 계산할 수 없는 구간(워밍업)에는 NaN을 돌려줍니다.
+
+사용 예시:
+    rsi = TalibRSI(14)
+    for close in closes:
+        value = rsi.update(close)
+"""
+
+import math
+from collections import deque
+from typing import Tuple
+
+NAN = float("nan")
+
+# TA-Lib의 TA_IS_ZERO / TA_IS_ZERO_OR_NEG 판정 기준
+_TA_EPSILON = 0.00000001
+
+
+def safe_divide(numerator: float, denominator: float) -> float:
+    """NumPy/pandas 나눗셈과 같은 결과 (0으로 나누면 inf 또는 NaN)"""
+    if denominator == 0:
+        if numerator != numerator or numerator == 0:
+            return NAN
+        return math.copysign(math.inf, numerator) * math.copysign(1.0, denominator)
+    return numerator / denominator
+
+
+class TalibSMA:
+    """talib.SMA와 같은 단순 이동평균 (누적합에 더하고 출력 후 가장 오래된 값을 뺌)"""
+
+    __slots__ = ("period", "_window", "_total")
+
+    def __init__(self, period: int):
+        self.period = period
+        self._window = deque()
+        self._total = 0.0
+
+    def update(self, value: float) -> float:
+        self._window.append(value)
+        self._total += value
+        if len(self._window) < self.period:
+            return NAN
+        result = self._total / self.period
+        self._total -= self._window.popleft()
+        return result
+
+
+class TalibEMA:
+    """
+    talib.EMA와 같은 지수 이동평균
+
+    처음 period개 값의 단순 평균으로 시작한 뒤 (x - prev) * k + prev로 갱신합니다.
+    skip은 시드 계산 전에 버릴 값 개수입니다 (MACD의 빠른 EMA 정렬용).
+    """
+
+    __slots__ = ("period", "k", "_skip", "_seed_total", "_seed_count", "value")
+
+    def __init__(self, period: int, skip: int = 0):
+        self.period = period
+        self.k = 2.0 / (period + 1)
+        self._skip = skip
+        self._seed_total = 0.0
+        self._seed_count = 0
+        self.value = NAN
+
+    def update(self, value: float) -> float:
+        if self._skip > 0:
+            self._skip -= 1
+            return NAN
+        if self._seed_count < self.period:
+            self._seed_total += value
+            self._seed_count += 1
+            if self._seed_count == self.period:
+                self.value = self._seed_total / self.period
+            return self.value
+        self.value = ((value - self.value) * self.k) + self.value
+        return self.value
+
+
+class TalibMACD:
+    """talib.MACD와 같은 (MACD, signal, hist). 세 값 모두 slow + signal - 2번째 봉부터 유효"""
+
+    __slots__ = ("_fast", "_slow", "_signal")
+
+    def __init__(self, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9):
+        if slow_period < fast_period:
+            fast_period, slow_period = slow_period, fast_period
+        self._slow = TalibEMA(slow_period)
+        self._fast = TalibEMA(fast_period, skip=slow_period - fast_period)
+        self._signal = TalibEMA(signal_period)
+
+    def update(self, value: float) -> Tuple[float, float, float]:
+        slow = self._slow.update(value)
+        fast = self._fast.update(value)
+        if slow != slow:
+            return NAN, NAN, NAN
+        macd = fast - slow
+        signal = self._signal.update(macd)
+        if signal != signal:
+            return NAN, NAN, NAN
+        return macd, signal, macd - signal
+
+
+class TalibRSI:
+    """talib.RSI와 같은 Wilder RSI (첫 period개 변화량 평균으로 시작)"""
+
+    __slots__ = ("period", "_prev", "_count", "_gain", "_loss")
+
+    def __init__(self, period: int = 14):
+        self.period = period
+        self._prev = None
+        self._count = 0
+        self._gain = 0.0
+        self._loss = 0.0
+
+    def update(self, value: float) -> float:
+        if self._prev is None:
+            self._prev = value
+            return NAN
+        diff = value - self._prev
+        self._prev = value
+        self._count += 1
+
+        if self._count <= self.period:
+            if diff < 0:
+                self._loss -= diff
+            else:
+                self._gain += diff
+            if self._count < self.period:
+                return NAN
+            self._loss /= self.period
+            self._gain /= self.period
+        else:
+            self._loss *= self.period - 1
+            self._gain *= self.period - 1
+            if diff < 0:
+                self._loss -= diff
+            else:
+                self._gain += diff
+            self._loss /= self.period
+            self._gain /= self.period
+
+        total = self._gain + self._loss
+        if -_TA_EPSILON < total < _TA_EPSILON:
+            return 0.0
+        return 100.0 * (self._gain / total)
+
+
+class TalibBBands:
+    """talib.BBANDS(SMA)와 같은 (upper, middle, lower)"""
+
+    __slots__ = ("period", "dev_up", "dev_down", "_window", "_total", "_total_sq")
+
+    def __init__(self, period: int = 20, dev_up: float = 2.0, dev_down: float = 2.0):
+        self.period = period
+        self.dev_up = dev_up
+        self.dev_down = dev_down
+        self._window = deque()
+        self._total = 0.0
+        self._total_sq = 0.0
+
+    def update(self, value: float) -> Tuple[float, float, float]:
+        self._window.append(value)
+        self._total += value
+        self._total_sq += value * value
+        if len(self._window) < self.period:
+            return NAN, NAN, NAN
+
+        middle = self._total / self.period
+        mean_sq = self._total_sq / self.period
+        oldest = self._window.popleft()
+        self._total -= oldest
+        self._total_sq -= oldest * oldest
+
+        mean_sq -= middle * middle
+        std = math.sqrt(mean_sq) if not mean_sq < _TA_EPSILON else 0.0
+        if self.dev_up == self.dev_down:
+            band = std * self.dev_up
+            return middle + band, middle, middle - band
+        return middle + std * self.dev_up, middle, middle - std * self.dev_down
+
+
+class TalibATR:
+    """talib.ATR와 같은 Wilder ATR (첫 period개 True Range 평균으로 시작)"""
+
+    __slots__ = ("period", "_prev_close", "_count", "_total", "value")
+
+    def __init__(self, period: int = 14):
+        self.period = period
+        self._prev_close = None
+        self._count = 0
+        self._total = 0.0
+        self.value = NAN
+
+    def update(self, high: float, low: float, close: float) -> float:
+        prev_close, self._prev_close = self._prev_close, close
+        if prev_close is None:
+            return NAN
+
+        true_range = high - low
+        gap = abs(prev_close - high)
+        if gap > true_range:
+            true_range = gap
+        gap = abs(prev_close - low)
+        if gap > true_range:
+            true_range = gap
+
+        self._count += 1
+        if self._count <= self.period:
+            self._total += true_range
+            if self._count == self.period:
+                self.value = self._total / self.period
+            return self.value
+
+        self.value *= self.period - 1
+        self.value += true_range
+        self.value /= self.period
+        return self.value
+
+
+class RollingMean:
+    """
+    pandas rolling(window).mean()과 같은 이동평균
+
+    pandas와 같이 Kahan 보정 합으로 더하고 빼며, 창 안에 NaN이 있으면 NaN입니다.
+    """
+
+    __slots__ = (
+        "window", "_values", "_nobs", "_sum", "_neg", "_comp_add", "_comp_remove",
+        "_same_count", "_prev",
+    )
+
+    def __init__(self, window: int):
+        self.window = window
+        self._values = deque()
+        self._nobs = 0
+        self._sum = 0.0
+        self._neg = 0
+        self._comp_add = 0.0
+        self._comp_remove = 0.0
+        self._same_count = 0
+        self._prev = None
+
+    def update(self, value: float) -> float:
+        if self._prev is None:
+            self._prev = value
+        if len(self._values) == self.window:
+            self._remove(self._values.popleft())
+        self._values.append(value)
+        self._add(value)
+
+        if self._nobs < self.window:
+            return NAN
+        result = self._sum / self._nobs
+        if self._same_count >= self._nobs:
+            result = self._prev
+        elif self._neg == 0 and result < 0:
+            result = 0.0
+        elif self._neg == self._nobs and result > 0:
+            result = 0.0
+        return result
+
+    def _add(self, value: float) -> None:
+        if value != value:
+            return
+        self._nobs += 1
+        y = value - self._comp_add
+        t = self._sum + y
+        self._comp_add = t - self._sum - y
+        self._sum = t
+        if math.copysign(1.0, value) < 0:
+            self._neg += 1
+        if value == self._prev:
+            self._same_count += 1
+        else:
+            self._same_count = 1
+        self._prev = value
+
+    def _remove(self, value: float) -> None:
+        if value != value:
+            return
+        self._nobs -= 1
+        y = -value - self._comp_remove
+        t = self._sum + y
+        self._comp_remove = t - self._sum - y
+        self._sum = t
+        if math.copysign(1.0, value) < 0:
+            self._neg -= 1
+
+
+class EWMMean:
+    """pandas ewm(span=span, adjust=True).mean()과 같은 지수 가중 평균"""
+
+    __slots__ = ("_decay", "_weight", "value")
+
+    def __init__(self, span: float):
+        com = (span - 1) / 2.0
+        alpha = 1.0 / (1.0 + com)
+        self._decay = 1.0 - alpha
+        self._weight = 1.0
+        self.value = NAN
+
+    def update(self, value: float) -> float:
+        if self.value != self.value:
+            # 첫 관측값 (NaN이 아닌 값이 나올 때까지 대기)
+            self.value = value
+            return value
+        if value != value:
+            self._weight *= self._decay
+            return self.value
+        self._weight *= self._decay
+        if self.value != value:
+            self.value = (self._weight * self.value + value) / (self._weight + 1.0)
+        self._weight += 1.0
+        return self.value
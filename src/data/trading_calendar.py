@@ -5,15 +5,197 @@
 
 import logging
 import sqlite3
-from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
+import threading
+from datetime import date as date_cls, datetime, timedelta
+from typing import Iterable, List, Optional, Dict, Any, Union
+import numpy as np
 import pandas as pd
 import os
 import time
 from .database import DatabaseManager
+from .connection_manager import get_pooled_connection
+from .ohlcv_schema import ohlcv_source
 
 logger = logging.getLogger(__name__)
 
+DateLike = Union[str, int, datetime, date_cls, pd.Timestamp]
+
+_EPOCH_ORDINAL = date_cls(1970, 1, 1).toordinal()
+
+# 달력 규칙(주말/휴일 제외)으로 채우는 구간: RULE_START ~ 오늘 + RULE_HORIZON_DAYS
+RULE_START = "19800101"
+RULE_HORIZON_DAYS = 366
+
+
+def to_day_number(value: DateLike) -> int:
+    """날짜(YYYYMMDD, YYYY-MM-DD, datetime, 일수)를 1970-01-01 기준 일수로 변환"""
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    if isinstance(value, str):
+        digits = value.replace("-", "")
+        return date_cls(int(digits[:4]), int(digits[4:6]), int(digits[6:8])).toordinal() - _EPOCH_ORDINAL
+    return value.toordinal() - _EPOCH_ORDINAL
+
+
+def to_day_numbers(values: Iterable[DateLike]) -> np.ndarray:
+    """날짜 목록을 int32 일수 배열로 변환 (벡터화)"""
+    values = np.asarray(list(values) if not isinstance(values, np.ndarray) else values)
+    if values.size == 0:
+        return np.empty(0, dtype=np.int32)
+    if np.issubdtype(values.dtype, np.integer):
+        return values.astype(np.int32)
+    if not np.issubdtype(values.dtype, np.datetime64):
+        values = pd.to_datetime(pd.Index(values)).values
+    return values.astype("datetime64[D]").astype(np.int32)
+
+
+def day_number_to_str(day: int, fmt: str = "%Y%m%d") -> str:
+    """일수를 날짜 문자열로 변환"""
+    return date_cls.fromordinal(int(day) + _EPOCH_ORDINAL).strftime(fmt)
+
+
+def rule_day_numbers(start: DateLike, end: DateLike, holidays: Iterable[DateLike] = ()) -> np.ndarray:
+    """start~end 중 주말/휴일이 아닌 날의 int32 일수 배열 (np.is_busday 벡터 연산)"""
+    first, last = to_day_number(start), to_day_number(end)
+    if last < first:
+        return np.empty(0, dtype=np.int32)
+    days = np.arange(first, last + 1, dtype=np.int32)
+    holiday_days = to_day_numbers(holidays).astype("datetime64[D]")
+    return days[np.is_busday(days.astype("datetime64[D]"), holidays=holiday_days)]
+
+
+class TradingDayIndex:
+    """메모리 거래일 인덱스
+
+    거래일을 정렬된 int32 일수(1970-01-01 기준) 배열과 비트맵(첫 거래일부터의 일별 bool)으로 보관합니다.
+
+    - is_trading_day: 비트맵 조회 O(1)
+    - next/previous/offset: 정렬 배열 이진 탐색 O(log n)
+    - range: searchsorted 2회 후 슬라이스 (반복문 없음)
+
+    적재 구간 [observed_first, observed_last]은 stock_ohlcv에 실제 적재된 날짜를 거래일로 보고
+    (임시 휴장일 반영), 그 밖은 달력 규칙(주말/휴일 제외)으로 채웁니다. observe()로 새로 적재된
+    날짜를 반영하면 DB를 다시 읽지 않고 배열과 비트맵만 재구성합니다.
+    """
+
+    def __init__(
+        self,
+        observed_days: Optional[Iterable[DateLike]] = None,
+        holidays: Iterable[DateLike] = (),
+        rule_start: DateLike = RULE_START,
+        rule_end: Optional[DateLike] = None,
+    ):
+        """
+        Args:
+            observed_days: 실제 적재된 거래일 (None이면 달력 규칙만 사용)
+            holidays: 달력 규칙에서 제외할 휴일
+            rule_start, rule_end: 달력 규칙 적용 범위 (기본: 1980-01-01 ~ 오늘 + 1년)
+        """
+        if rule_end is None:
+            rule_end = to_day_number(datetime.now()) + RULE_HORIZON_DAYS
+        self._rule_days = rule_day_numbers(rule_start, rule_end, holidays)
+        self._observed = np.unique(to_day_numbers(observed_days if observed_days is not None else []))
+        self._lock = threading.Lock()
+        self._rebuild()
+
+    def _rebuild(self):
+        observed = self._observed
+        rule = self._rule_days
+        if len(observed):
+            rule = rule[(rule < observed[0]) | (rule > observed[-1])]
+        days = np.union1d(rule, observed).astype(np.int32)
+        origin = int(days[0]) if len(days) else 0
+        bitmap = np.zeros(int(days[-1]) - origin + 1 if len(days) else 0, dtype=bool)
+        bitmap[days - origin] = True
+        # 읽기 스레드가 항상 일관된 (배열, 기준일, 비트맵) 묶음을 보도록 한 번에 교체
+        self._state = (days, origin, bitmap)
+
+    @property
+    def days(self) -> np.ndarray:
+        """정렬된 거래일 int32 일수 배열"""
+        return self._state[0]
+
+    @property
+    def observed_first(self) -> Optional[int]:
+        return int(self._observed[0]) if len(self._observed) else None
+
+    @property
+    def observed_last(self) -> Optional[int]:
+        return int(self._observed[-1]) if len(self._observed) else None
+
+    def __len__(self) -> int:
+        return len(self._state[0])
+
+    def is_trading_day(self, date: DateLike) -> bool:
+        """거래일 여부 (O(1))"""
+        _, origin, bitmap = self._state
+        offset = to_day_number(date) - origin
+        return 0 <= offset < len(bitmap) and bool(bitmap[offset])
+
+    def is_observed(self, date: DateLike) -> bool:
+        """stock_ohlcv에 적재된 거래일 여부 (O(1))"""
+        day = to_day_number(date)
+        first, last = self.observed_first, self.observed_last
+        return first is not None and first <= day <= last and self.is_trading_day(day)
+
+    def contains(self, days: Iterable[DateLike]) -> np.ndarray:
+        """날짜 배열의 거래일 여부 (벡터화)"""
+        _, origin, bitmap = self._state
+        offsets = to_day_numbers(days) - origin
+        valid = (offsets >= 0) & (offsets < len(bitmap))
+        result = np.zeros(len(offsets), dtype=bool)
+        result[valid] = bitmap[offsets[valid]]
+        return result
+
+    def offset(self, date: DateLike, sessions: int) -> Optional[int]:
+        """date로부터 sessions 거래일 뒤(음수면 앞)의 거래일 일수 (범위 밖이면 None)
+
+        date가 거래일이 아니면 직전/직후 거래일 사이에 있는 것으로 보고 셉니다.
+        (토요일 기준 +1은 월요일, -1은 금요일)
+        """
+        days = self._state[0]
+        day = to_day_number(date)
+        if sessions > 0:
+            position = int(np.searchsorted(days, day, side="right")) + sessions - 1
+        elif sessions < 0:
+            position = int(np.searchsorted(days, day, side="left")) + sessions
+        else:
+            return day if self.is_trading_day(day) else None
+        return int(days[position]) if 0 <= position < len(days) else None
+
+    def next(self, date: DateLike, sessions: int = 1) -> Optional[int]:
+        """date 이후 sessions번째 거래일"""
+        return self.offset(date, sessions)
+
+    def previous(self, date: DateLike, sessions: int = 1) -> Optional[int]:
+        """date 이전 sessions번째 거래일"""
+        return self.offset(date, -sessions)
+
+    def range(self, start: DateLike, end: DateLike) -> np.ndarray:
+        """start~end(포함) 거래일 int32 일수 배열"""
+        days = self._state[0]
+        lo = np.searchsorted(days, to_day_number(start), side="left")
+        hi = np.searchsorted(days, to_day_number(end), side="right")
+        return days[lo:hi]
+
+    def latest_observed(self, on_or_before: Optional[DateLike] = None) -> Optional[int]:
+        """on_or_before 이전(포함) 가장 최근 적재 거래일"""
+        observed = self._observed
+        if on_or_before is None:
+            return self.observed_last
+        position = int(np.searchsorted(observed, to_day_number(on_or_before), side="right")) - 1
+        return int(observed[position]) if position >= 0 else None
+
+    def observe(self, dates: Iterable[DateLike]) -> int:
+        """새로 적재된 날짜 반영. 추가된 거래일 수 반환"""
+        new_days = np.setdiff1d(to_day_numbers(dates), self._observed)
+        if len(new_days) == 0:
+            return 0
+        with self._lock:
+            self._observed = np.union1d(self._observed, new_days).astype(np.int32)
+            self._rebuild()
+        return len(new_days)
+
 
 class TradingCalendar:
     """한국 증권시장 거래일 관리 클래스"""
@@ -55,7 +237,7 @@ class TradingCalendar:
 
     def init_database(self):
         """거래일 캐시 데이터베이스 초기화"""
-        with sqlite3.connect(self.db_path) as conn:
+        with get_pooled_connection(self.db_path) as conn:
             conn.execute(
                 """
                     CREATE TABLE IF NOT EXISTS trading_days (
@@ -111,19 +293,18 @@ class TradingCalendar:
             logger.info(f"캐시된 거래일 사용: {cached_date}")
             return cached_date
 
-        # 2. 간단한 로직으로 후보 날짜 생성
-        for i in range(max_days_back):
-            candidate_date = (today - timedelta(days=i)).strftime("%Y%m%d")
-
-            # 주말/휴일 제외
-            if not self.is_trading_day_simple(candidate_date):
-                continue
-
-            # 3. pykrx API로 실제 거래일 확인
-            if self._verify_trading_day(candidate_date):
-                logger.info(f"거래일 확인 완료: {candidate_date}")
-                self._cache_trading_date(candidate_date)
-                return candidate_date
+        # 2. 메인 DB에 적재된 가장 최근 거래일 (메모리 인덱스 이진 탐색)
+        today_day = to_day_number(today)
+        try:
+            latest = self.day_index.latest_observed(today_day)
+        except Exception as e:
+            logger.debug(f"거래일 인덱스 조회 실패: {e}")
+            latest = None
+        if latest is not None and today_day - latest < max_days_back:
+            candidate_date = day_number_to_str(latest)
+            logger.info(f"거래일 확인 완료: {candidate_date}")
+            self._cache_trading_date(candidate_date)
+            return candidate_date
 
         # 4. 폴백: 캐시된 데이터 중 가장 최근 날짜
         fallback_date = self._get_fallback_trading_date()
@@ -139,7 +320,7 @@ class TradingCalendar:
     def _get_cached_trading_date(self) -> Optional[str]:
         """캐시된 거래일 조회"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with get_pooled_connection(self.db_path) as conn:
                 cursor = conn.execute(
                     """
                         SELECT date FROM trading_days 
@@ -163,21 +344,22 @@ class TradingCalendar:
         except:
             return False
 
-    def _verify_trading_day(self, date: str) -> bool:
-        """DatabaseManager를 사용하여 실제 거래일 확인"""
-        try:
-            # 메인 데이터베이스에서 해당 날짜의 OHLCV 데이터 존재 여부 확인
-            db_date = f"{date[:4]}-{date[4:6]}-{date[6:8]}"  # YYYYMMDD -> YYYY-MM-DD
-            result = self.main_db_manager.fetchall(
-                "SELECT COUNT(*) FROM stock_ohlcv WHERE date = ?", 
-                (db_date,)
-            )
-            is_trading = bool(result and result[0] and result[0][0] > 0)
+    @property
+    def day_index(self) -> "TradingDayIndex":
+        """메인 DB 적재일 기반 프로세스 공용 거래일 인덱스"""
+        return get_trading_day_index(self.main_db_path, self.holidays)
 
-            # 결과 캐시
-            self._cache_trading_day_result(date, is_trading)
-            return is_trading
+    @property
+    def rule_index(self) -> "TradingDayIndex":
+        """달력 규칙(주말/휴일 제외)만으로 만든 거래일 인덱스"""
+        if getattr(self, "_rule_index", None) is None:
+            self._rule_index = TradingDayIndex(holidays=self.holidays)
+        return self._rule_index
 
+    def _verify_trading_day(self, date: str) -> bool:
+        """메인 DB에 해당 날짜 OHLCV가 적재되었는지 확인 (메모리 인덱스 O(1) 조회)"""
+        try:
+            return self.day_index.is_observed(date)
         except Exception as e:
             logger.debug(f"거래일 확인 실패 ({date}): {e}")
             return False
@@ -185,7 +367,7 @@ class TradingCalendar:
     def _cache_trading_date(self, date: str):
         """거래일 캐시 저장"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with get_pooled_connection(self.db_path) as conn:
                 conn.execute(
                     """
                         INSERT OR REPLACE INTO trading_days (date, is_trading_day, market)
@@ -199,7 +381,7 @@ class TradingCalendar:
     def _cache_trading_day_result(self, date: str, is_trading: bool):
         """거래일 확인 결과 캐시"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with get_pooled_connection(self.db_path) as conn:
                 conn.execute(
                     """
                         INSERT OR REPLACE INTO trading_days (date, is_trading_day, market)
@@ -213,7 +395,7 @@ class TradingCalendar:
     def _get_fallback_trading_date(self) -> Optional[str]:
         """폴백 거래일 조회 (캐시된 데이터 중 가장 최근)"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with get_pooled_connection(self.db_path) as conn:
                 cursor = conn.execute(
                     """
                         SELECT date FROM trading_days 
@@ -228,38 +410,28 @@ class TradingCalendar:
             return None
 
     def get_trading_dates_range(self, start_date: str, end_date: str) -> List[str]:
-        """기간 내 거래일 목록 조회"""
-        trading_dates = []
-
-        start_dt = datetime.strptime(start_date, "%Y%m%d")
-        end_dt = datetime.strptime(end_date, "%Y%m%d")
-
-        current_dt = start_dt
-        while current_dt <= end_dt:
-            date_str = current_dt.strftime("%Y%m%d")
-            if self.is_trading_day_simple(date_str):
-                trading_dates.append(date_str)
-            current_dt += timedelta(days=1)
-
-        return trading_dates
+        """기간 내 거래일 목록 조회 (주말/휴일 제외, 벡터 연산)"""
+        days = rule_day_numbers(start_date, end_date, self.holidays)
+        return np.char.replace(np.datetime_as_string(days.astype("datetime64[D]")), "-", "").tolist()
 
     def get_previous_trading_date(self, date: str, days_back: int = 1) -> str:
         """이전 거래일 조회"""
-        current_date = datetime.strptime(date, "%Y%m%d")
-
-        for _ in range(days_back):
-            while True:
-                current_date -= timedelta(days=1)
-                date_str = current_date.strftime("%Y%m%d")
-                if self.is_trading_day_simple(date_str):
-                    break
-
-        return current_date.strftime("%Y%m%d")
+        previous = self.rule_index.previous(date, days_back)
+        if previous is None:
+            raise ValueError(f"거래일 인덱스 범위 밖의 날짜입니다: {date}")
+        return day_number_to_str(previous)
+
+    def get_next_trading_date(self, date: str, days_forward: int = 1) -> str:
+        """다음 거래일 조회"""
+        following = self.rule_index.next(date, days_forward)
+        if following is None:
+            raise ValueError(f"거래일 인덱스 범위 밖의 날짜입니다: {date}")
+        return day_number_to_str(following)
 
     def cache_market_data(self, date: str, market: str, data_type: str, symbols: List[str]):
         """시장 데이터 캐시 저장"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with get_pooled_connection(self.db_path) as conn:
                 conn.execute(
                     """
                         INSERT OR REPLACE INTO market_data_cache 
@@ -276,7 +448,7 @@ class TradingCalendar:
     ) -> Optional[List[str]]:
         """캐시된 시장 데이터 조회"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with get_pooled_connection(self.db_path) as conn:
                 cursor = conn.execute(
                     """
                         SELECT symbols FROM market_data_cache 
@@ -295,7 +467,7 @@ class TradingCalendar:
     def cleanup_old_cache(self, days_old: int = 30):
         """오래된 캐시 정리"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with get_pooled_connection(self.db_path) as conn:
                 conn.execute(
                     """
                         DELETE FROM trading_days 
@@ -322,3 +494,114 @@ class TradingCalendar:
 
 # 전역 인스턴스
 trading_calendar = TradingCalendar()
+
+# DB 경로별 프로세스 공용 거래일 인덱스
+_day_indexes: Dict[str, TradingDayIndex] = {}
+_day_index_lock = threading.Lock()
+
+
+def _load_observed_days(db_path: str) -> np.ndarray:
+    """stock_ohlcv에 적재된 날짜 (DB/테이블이 없으면 빈 배열)"""
+    if not os.path.exists(db_path):
+        return np.empty(0, dtype=np.int32)
+    conn = get_pooled_connection(db_path)
+    try:
+        ohlcv = ohlcv_source(conn)
+        rows = conn.execute(f"SELECT DISTINCT {ohlcv.date_column} FROM {ohlcv.table}").fetchall()
+    except sqlite3.OperationalError:
+        return np.empty(0, dtype=np.int32)
+    if ohlcv.compact:
+        return np.array([row[0] for row in rows], dtype=np.int32)
+    return to_day_numbers(np.array([row[0] for row in rows], dtype="datetime64[D]"))
+
+
+def get_trading_day_index(db_path: str = "data/trading.db", holidays: Optional[Iterable[DateLike]] = None) -> TradingDayIndex:
+    """DB 경로별 공용 거래일 인덱스 (최초 1회만 DB에서 적재일을 읽음)
+
+    Args:
+        db_path: stock_ohlcv가 있는 DB
+        holidays: 달력 규칙 휴일 (최초 생성 시에만 사용, 기본: 전역 trading_calendar 휴일)
+    """
+    key = os.path.abspath(db_path)
+    index = _day_indexes.get(key)
+    if index is None:
+        with _day_index_lock:
+            index = _day_indexes.get(key)
+            if index is None:
+                index = TradingDayIndex(
+                    _load_observed_days(db_path),
+                    holidays=trading_calendar.holidays if holidays is None else holidays,
+                )
+                _day_indexes[key] = index
+    return index
+
+
+def lookback_start_date(
+    sessions: int,
+    end: Optional[DateLike] = None,
+    db_path: str = "data/trading.db",
+    fmt: str = "%Y-%m-%d",
+) -> str:
+    """end(기본: 오늘)까지 최근 sessions 거래일 구간의 첫 거래일
+
+    달력일(sessions + 여유분)로 잡으면 주말/휴일만큼 봉 수가 모자라므로 거래일 인덱스로 셉니다.
+    """
+    end_day = to_day_number(end if end is not None else datetime.now())
+    index = get_trading_day_index(db_path)
+    # end가 거래일이면 end 자신이 sessions에 포함됨
+    back = sessions - 1 if index.is_trading_day(end_day) else sessions
+    start_day = index.previous(end_day, back) if back > 0 else end_day
+    if start_day is None:
+        start_day = int(index.days[0])
+    return day_number_to_str(start_day, fmt)
+
+
+def notify_ingested_dates(db_path: str, dates: Iterable[DateLike]) -> int:
+    """새로 적재된 날짜를 공용 인덱스에 반영 (아직 만들어지지 않았으면 무시)"""
+    index = _day_indexes.get(os.path.abspath(db_path))
+    return index.observe(dates) if index is not None else 0
+
+
+def reset_trading_day_index(db_path: Optional[str] = None):
+    """공용 인덱스 제거 (다음 조회 시 DB에서 다시 적재). None이면 전체"""
+    with _day_index_lock:
+        if db_path is None:
+            _day_indexes.clear()
+        else:
+            _day_indexes.pop(os.path.abspath(db_path), None)
+
+
+def observed_trading_day_numbers(
+    conn: sqlite3.Connection,
+    start_date: str,
+    end_date: str,
+    reference_symbols: Optional[List[str]] = None,
+) -> np.ndarray:
+    """기간 내 거래일을 정렬된 int32 일수(1970-01-01 기준) 배열로 반환
+
+    달력(주말/휴일)으로 거래일을 만든 뒤, 참조 종목들의 마지막 적재일까지는
+    참조 종목에 실제로 적재된 날짜만 거래일로 인정합니다 (달력에 없는 임시 휴장일 보정).
+
+    Args:
+        conn: stock_ohlcv가 있는 DB 연결
+        start_date, end_date: YYYY-MM-DD 또는 YYYYMMDD
+        reference_symbols: 적재 날짜를 참조할 종목 (None이면 달력만 사용)
+    """
+    start = pd.Timestamp(start_date)
+    end = pd.Timestamp(end_date)
+    days = rule_day_numbers(start, end, trading_calendar.holidays)
+    if len(days) == 0 or not reference_symbols:
+        return days
+
+    placeholders = ",".join("?" * len(reference_symbols))
+    ohlcv = ohlcv_source(conn)
+    observed = [row[0] for row in conn.execute(
+        f"SELECT DISTINCT {ohlcv.day_expr()} FROM {ohlcv.table} "
+        f"WHERE symbol IN ({placeholders}) AND {ohlcv.date_column} BETWEEN ? AND ?",
+        list(reference_symbols) + [ohlcv.date_param(start.strftime("%Y-%m-%d")), ohlcv.date_param(end.strftime("%Y-%m-%d"))],
+    )]
+    if observed:
+        observed_days = np.sort(np.array(observed, dtype=np.int32))
+        keep = (days > observed_days[-1]) | np.isin(days, observed_days, assume_unique=True)
+        days = days[keep]
+    return days
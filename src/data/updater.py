@@ -3,6 +3,7 @@ import sys
 import os
 import sqlite3
 import pandas as pd
+import numpy as np
 import yaml
 import logging
 from datetime import datetime, timedelta
@@ -12,19 +13,23 @@ import time
 from dataclasses import dataclass
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
+import queue
 import psutil
 import gc
 
-try:
-    from pykrx import stock
-except ImportError:
-    print("pykrx가 설치되지 않았습니다. 'pip install pykrx'로 설치해주세요.")
-    sys.exit(1)
-
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
+from src.data.backup import DatabaseBackupManager
+from src.data.connection_manager import get_pooled_connection
+from src.data.consistency_audit import DataConsistencyAuditor, market_reference_symbols
+from src.data.data_source import MarketDataSource, get_default_data_source
+from src.data.ohlcv_schema import compact_upsert_sql, ohlcv_source
+from src.data.rankings import DailyRankingBuilder
+from src.data.trading_calendar import notify_ingested_dates
+from src.utils.rate_limiter import get_rate_limiter
+
 os.makedirs(PROJECT_ROOT / "logs", exist_ok=True)
 logging.basicConfig(
     level=logging.INFO,
@@ -36,6 +41,51 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# (symbol, date) 기본키 기준 UPSERT - 기존 행은 가격/거래량만 갱신
+OHLCV_UPSERT_SQL = """
+    INSERT INTO stock_ohlcv (symbol, date, open, high, low, close, volume)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(symbol, date) DO UPDATE SET
+        open = excluded.open,
+        high = excluded.high,
+        low = excluded.low,
+        close = excluded.close,
+        volume = excluded.volume
+"""
+# 압축 스키마(stock_ohlcv_days, WITHOUT ROWID)용 UPSERT - 같은 행 튜플을 그대로 바인딩
+OHLCV_COMPACT_UPSERT_SQL = compact_upsert_sql(["symbol", "date", "open", "high", "low", "close", "volume"])
+
+# 일자별 시가총액 시계열. (date, market_cap DESC, symbol) 커버링 인덱스로
+# "기준일 시가총액 상위 N" 조회를 테이블 접근 없이 인덱스 순회만으로 처리
+MARKET_CAP_SCHEMA_SQL = """
+    CREATE TABLE IF NOT EXISTS stock_market_cap (
+        symbol TEXT NOT NULL,
+        date TEXT NOT NULL,
+        market_cap INTEGER NOT NULL,
+        shares INTEGER,
+        PRIMARY KEY (symbol, date)
+    );
+    CREATE INDEX IF NOT EXISTS idx_market_cap_date_cap
+        ON stock_market_cap (date, market_cap DESC, symbol);
+"""
+
+MARKET_CAP_UPSERT_SQL = """
+    INSERT INTO stock_market_cap (symbol, date, market_cap, shares)
+    VALUES (?, ?, ?, ?)
+    ON CONFLICT(symbol, date) DO UPDATE SET
+        market_cap = excluded.market_cap,
+        shares = excluded.shares
+"""
+
+OHLCV_COLUMN_MAPPING = {
+    "시가": "open",
+    "고가": "high",
+    "저가": "low",
+    "종가": "close",
+    "거래량": "volume",
+    "거래대금": "amount",
+}
+
 
 @dataclass
 class OptimizedDataUpdateConfig:
@@ -58,8 +108,16 @@ class OptimizedDataUpdateConfig:
     
     # API 최적화 설정
     api_delay: float = 0.3
+    requests_per_second: Optional[float] = None  # None이면 1 / api_delay (전체 워커 합산 속도)
+    rate_limit_burst: int = 3
     max_retries: int = 3
     retry_delay: float = 1.0
+    fetch_queue_size: int = 64  # 조회 결과 대기열 크기 (쓰기 지연 시 조회 스레드 대기)
+    
+    # DB 쓰기 설정
+    write_batch_size: int = 5000  # executemany 한 트랜잭션당 최대 행 수
+    sync_columnar_store: bool = True  # 컬럼형 저장소가 있으면 업데이트 후 변경분 동기화
+    refresh_rankings: bool = True  # 업데이트 후 저장된 날짜 이후의 일자별 순위 테이블 증분 갱신
     
     # 증분 업데이트 설정
     incremental_update: bool = True
@@ -85,101 +143,145 @@ class DataUpdateCacheManager:
             "full_updates": 0,
         }
     
-    def should_skip_symbol(self, symbol: str) -> bool:
-        """캐시 기반으로 종목 업데이트 건너뛸지 판단"""
-        if not self.config.enable_cache:
-            return False
-        
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute(
-                    """
-                    SELECT MAX(date) FROM stock_ohlcv WHERE symbol = ?
-                    """,
-                    (symbol,)
-                )
-                result = cursor.fetchone()
-                
-                if not result or not result[0]:
-                    return False
-                
-                last_date = datetime.strptime(result[0], "%Y-%m-%d")
-                days_diff = (datetime.now() - last_date).days
-                
-                # 강제 업데이트 기간 내라면 건너뛰지 않음
-                if days_diff <= self.config.force_update_days:
-                    return False
-                
-                # 캐시 만료 시간 확인
-                return days_diff * 24 < self.config.cache_expiry_hours
-                
-        except Exception as e:
-            logger.error(f"캐시 확인 실패 ({symbol}): {e}")
-            return False
-    
+    def plan_missing_ranges(
+        self, symbols: List[str], start_date: str, end_date: str
+    ) -> Dict[str, List[Tuple[str, str]]]:
+        """전체 종목의 누락 거래일 구간을 집합 연산으로 계산
+
+        1. 단일 GROUP BY 쿼리로 종목별 (MIN(date), MAX(date), COUNT(*)) 집계
+        2. 거래일을 정렬된 정수(1970-01-01 기준 일수) 배열로 만들어 이진 탐색으로
+           종목별 기대 행 수와 비교 → 앞/뒤 누락 구간은 바로 산출
+        3. 중간 누락이 있는 종목만 날짜를 조회하여 연속 누락 구간으로 묶음
+
+        거래일은 TradingCalendar 기준이며, DB의 마지막 적재일 이전 구간은
+        실제로 적재된 시장 날짜와 교집합하여 휴일 표에 없는 휴장일을 누락으로 보지 않습니다.
+
+        Returns:
+            {symbol: [(시작일, 종료일), ...]} (YYYY-MM-DD, 누락이 없으면 빈 리스트)
+        """
+        start = pd.Timestamp(start_date)
+        end = pd.Timestamp(end_date)
+        start_str, end_str = start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d")
+        conn = get_pooled_connection(self.db_path)
+
+        symbol_condition, symbol_params = self._symbol_filter(symbols)
+        ohlcv = ohlcv_source(conn)
+        summary = {
+            row[0]: row[1:]
+            for row in conn.execute(
+                f"SELECT symbol, MIN({ohlcv.day_expr()}), MAX({ohlcv.day_expr()}), COUNT(*) FROM {ohlcv.table} "
+                f"WHERE {ohlcv.date_column} BETWEEN ? AND ? {symbol_condition} GROUP BY symbol",
+                [ohlcv.date_param(start_str), ohlcv.date_param(end_str)] + symbol_params,
+            )
+        }
+
+        # 적재 행이 가장 많은 종목들의 날짜를 실제 시장 개장일 표본으로 사용
+        # (일부 종목만 집계한 경우 해당 종목의 누락일이 휴장일로 보이지 않도록 시장 전체에서 선택)
+        if symbol_condition:
+            reference_symbols = market_reference_symbols(conn, start_str, end_str)
+        else:
+            reference_symbols = sorted(summary, key=lambda sym: summary[sym][2], reverse=True)[:3]
+        trading_days = self._trading_day_numbers(conn, start, end, reference_symbols)
+        if len(trading_days) == 0:
+            return {symbol: [] for symbol in symbols}
+
+        plan: Dict[str, List[Tuple[int, int]]] = {}
+        interior: Dict[str, Tuple[int, int]] = {}
+        n_days = len(trading_days)
+        for symbol in symbols:
+            stats = summary.get(symbol)
+            if stats is None:
+                plan[symbol] = [(0, n_days - 1)]
+                continue
+
+            min_day, max_day, count = stats
+            lo = int(np.searchsorted(trading_days, min_day, side="left"))
+            hi = int(np.searchsorted(trading_days, max_day, side="right"))
+            ranges = []
+            if lo > 0:
+                ranges.append((0, lo - 1))
+            if hi < n_days:
+                ranges.append((hi, n_days - 1))
+            plan[symbol] = ranges
+            # 휴장일 행이 섞여 있으면 개수가 상쇄될 수 있으므로 불일치 시 모두 상세 확인
+            if count != hi - lo:
+                interior[symbol] = (lo, hi)
+
+        if interior:
+            self._add_interior_gaps(conn, interior, trading_days, start_str, end_str, plan)
+
+        day_strings = np.datetime_as_string(trading_days.astype("datetime64[D]")).tolist()
+        return {
+            symbol: [(day_strings[a], day_strings[b]) for a, b in sorted(ranges)]
+            for symbol, ranges in plan.items()
+        }
+
+    def _trading_day_numbers(
+        self,
+        conn: sqlite3.Connection,
+        start: pd.Timestamp,
+        end: pd.Timestamp,
+        reference_symbols: List[str],
+    ) -> np.ndarray:
+        """기간 내 거래일을 정렬된 int32 일수 배열로 반환 (참조 종목 적재일로 보정)"""
+        from .trading_calendar import observed_trading_day_numbers
+
+        return observed_trading_day_numbers(conn, start, end, reference_symbols)
+
+    @staticmethod
+    def _symbol_filter(symbols: List[str], max_inline: int = 500) -> Tuple[str, List[str]]:
+        """종목 IN 절 조건 (대량 종목이면 조건 없이 집계 후 파이썬에서 필터)"""
+        if len(symbols) > max_inline:
+            return "", []
+        placeholders = ",".join("?" * len(symbols))
+        return f"AND symbol IN ({placeholders})", list(symbols)
+
+    def _add_interior_gaps(
+        self,
+        conn: sqlite3.Connection,
+        interior: Dict[str, Tuple[int, int]],
+        trading_days: np.ndarray,
+        start_str: str,
+        end_str: str,
+        plan: Dict[str, List[Tuple[int, int]]],
+    ):
+        """중간 누락이 있는 종목만 날짜를 조회하여 연속 누락 구간을 plan에 추가"""
+        symbols = list(interior)
+        ohlcv = ohlcv_source(conn)
+        rows = []
+        for i in range(0, len(symbols), 500):
+            chunk = symbols[i:i + 500]
+            rows.extend(conn.execute(
+                f"SELECT symbol, {ohlcv.day_expr()} FROM {ohlcv.table} WHERE {ohlcv.date_column} BETWEEN ? AND ? "
+                f"AND symbol IN ({','.join('?' * len(chunk))}) ORDER BY symbol, {ohlcv.date_column}",
+                [ohlcv.date_param(start_str), ohlcv.date_param(end_str)] + chunk,
+            ).fetchall())
+        if not rows:
+            return
+
+        row_symbols = np.array([r[0] for r in rows], dtype=object)
+        row_days = np.array([r[1] for r in rows], dtype=np.int32)
+        boundaries = np.flatnonzero(row_symbols[1:] != row_symbols[:-1]) + 1
+        starts = np.concatenate(([0], boundaries))
+        ends = np.concatenate((boundaries, [len(rows)]))
+
+        for s, e in zip(starts, ends):
+            symbol = row_symbols[s]
+            lo, hi = interior[symbol]
+            present = np.isin(trading_days[lo:hi], row_days[s:e], assume_unique=True)
+            missing = np.flatnonzero(~present) + lo
+            if len(missing) == 0:
+                continue
+            # 연속된 거래일 위치를 하나의 구간으로 묶음
+            breaks = np.flatnonzero(np.diff(missing) != 1) + 1
+            run_starts = np.concatenate(([0], breaks))
+            run_ends = np.concatenate((breaks, [len(missing)])) - 1
+            plan[symbol].extend(zip(missing[run_starts].tolist(), missing[run_ends].tolist()))
+
     def get_missing_date_ranges(self, symbol: str, start_date: str, end_date: str) -> List[Tuple[str, str]]:
-        """누락된 날짜 범위 확인 - 개선된 버전"""
+        """단일 종목의 누락 거래일 구간 (plan_missing_ranges 참고)"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                # 기존 데이터 조회 (날짜 순으로 정렬)
-                df = pd.read_sql_query(
-                    """
-                    SELECT date FROM stock_ohlcv 
-                    WHERE symbol = ? AND date BETWEEN ? AND ? 
-                    ORDER BY date
-                    """,
-                    conn,
-                    params=[symbol, start_date, end_date]
-                )
-            
-            if df.empty:
-                logger.debug(f"종목 {symbol}: 기존 데이터 없음, 전체 범위 업데이트 필요")
-                return [(start_date, end_date)]
-            
-            # 날짜 범위 분석
-            existing_dates = set(df['date'].tolist())
-            start_dt = datetime.strptime(start_date, '%Y-%m-%d')
-            end_dt = datetime.strptime(end_date, '%Y-%m-%d')
-            
-            missing_ranges = []
-            current_start = start_dt
-            
-            # 날짜 범위를 순회하며 누락된 구간 찾기
-            for current_dt in pd.date_range(start_dt, end_dt):
-                current_date_str = current_dt.strftime('%Y-%m-%d')
-                
-                if current_date_str not in existing_dates:
-                    # 누락된 날짜 발견
-                    if current_start == current_dt:
-                        continue
-                    else:
-                        # 누락 구간의 시작점이 현재 날짜보다 이전이면 범위 추가
-                        if current_start < current_dt:
-                            missing_ranges.append((
-                                current_start.strftime('%Y-%m-%d'),
-                                (current_dt - timedelta(days=1)).strftime('%Y-%m-%d')
-                            ))
-                        current_start = current_dt
-                else:
-                    # 기존 데이터가 있으면 다음 누락 구간의 시작점으로 설정
-                    current_start = current_dt + timedelta(days=1)
-            
-            # 마지막 범위 처리 (끝까지 누락된 경우)
-            if current_start <= end_dt:
-                missing_ranges.append((
-                    current_start.strftime('%Y-%m-%d'),
-                    end_date
-                ))
-            
-            if missing_ranges:
-                logger.debug(f"종목 {symbol}: 누락된 범위 {len(missing_ranges)}개 발견")
-                for range_start, range_end in missing_ranges:
-                    logger.debug(f"  - {range_start} ~ {range_end}")
-            else:
-                logger.debug(f"종목 {symbol}: 모든 데이터가 존재함")
-            
-            return missing_ranges
-            
+            return self.plan_missing_ranges([symbol], start_date, end_date)[symbol]
         except Exception as e:
             logger.error(f"누락 날짜 범위 확인 실패 ({symbol}): {e}")
             return [(start_date, end_date)]
@@ -262,6 +364,18 @@ class DataUpdateBatchProcessor:
             "symbols_processed": len(batch),
         }
     
+    def record_pipeline_run(self, symbols: int, api_calls: int, write_batches: int, elapsed: float):
+        """조회/저장 파이프라인 실행 통계 반영"""
+        self.stats["total_batches"] += write_batches
+        self.stats["total_symbols"] += symbols
+        self.stats["total_time"] += elapsed
+        self.stats["api_calls"] += api_calls
+        if self.stats["total_time"] > 0:
+            self.stats["avg_symbols_per_second"] = self.stats["total_symbols"] / self.stats["total_time"]
+        logger.info(
+            f"파이프라인 처리 완료: {symbols}개 종목, API {api_calls}회, 쓰기 {write_batches}회, {elapsed:.2f}초"
+        )
+
     def _optimize_memory(self):
         """메모리 최적화"""
         gc.collect()
@@ -275,10 +389,22 @@ class StockDataUpdater:
     """주식 데이터를 수집, 저장 및 관리하는 클래스 (병렬 처리 지원)."""
 
     def __init__(self, db_path: Optional[str] = None, config_path: Optional[str] = None,
-                 optimization_config: Optional[OptimizedDataUpdateConfig] = None):
+                 optimization_config: Optional[OptimizedDataUpdateConfig] = None,
+                 data_source: Optional[MarketDataSource] = None):
         self.db_path = db_path or str(PROJECT_ROOT / "data" / "trading.db")
+        # 시장 데이터 제공자 (기본: pykrx, 벤치마크/테스트는 ReplayDataSource 등으로 교체)
+        self.data_source = data_source or get_default_data_source()
         self.config_path = config_path or str(PROJECT_ROOT / "config.yaml")
         self.config = self._load_config()
+        self._ticker_name_cache: Optional[Dict[str, str]] = None
+        self._range_plan: Optional[Dict[str, List[Tuple[str, str]]]] = None
+        
+        # 컬럼형 저장소 동기화용: 마지막 동기화 이후 저장된 가장 이른 날짜
+        self._columnar_lock = threading.Lock()
+        self._min_written_date: Optional[str] = None
+        # DB 쓰기와 write_stats 갱신 직렬화 (조회 스레드가 도는 동안에도 통계 일관성 유지)
+        self._write_lock = threading.Lock()
+        self.write_stats = {"rows": 0, "transactions": 0, "seconds": 0.0}
         
         # 최적화 설정 초기화
         self.optimization_config = optimization_config or OptimizedDataUpdateConfig()
@@ -287,6 +413,12 @@ class StockDataUpdater:
         self.cache_manager = DataUpdateCacheManager(self.db_path, self.optimization_config)
         self.batch_processor = DataUpdateBatchProcessor(self.optimization_config)
         
+        # pykrx 호출 공유 속도 제한 (프로세스 전역)
+        rps = self.optimization_config.requests_per_second
+        if not rps:
+            rps = 1.0 / self.optimization_config.api_delay if self.optimization_config.api_delay > 0 else 10.0
+        self.rate_limiter = get_rate_limiter("pykrx", rate=rps, burst=self.optimization_config.rate_limit_burst)
+        
         # 진행률 추적
         self.progress_lock = threading.Lock()
         self.progress_stats = {
@@ -298,6 +430,10 @@ class StockDataUpdater:
         }
         
         self._init_database()
+        # 전 종목 일관성 감사 (요약 테이블은 stock_ohlcv와 같은 DB에 저장)
+        self.auditor = DataConsistencyAuditor(self.db_path)
+        # 업데이트 전 롤백 지점 (DB 디렉토리의 backups/)
+        self.backup_manager = DatabaseBackupManager(self.db_path)
 
     def _load_config(self) -> Dict:
         """설정 파일(config.yaml)을 로드합니다."""
@@ -313,7 +449,9 @@ class StockDataUpdater:
         """통합 스키마를 사용하여 데이터베이스를 초기화합니다."""
         from .database import DatabaseManager
         
-        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        db_dir = os.path.dirname(self.db_path)
+        if db_dir:  # ":memory:" 등 디렉토리가 없는 경로 허용
+            os.makedirs(db_dir, exist_ok=True)
         
         # 통합 스키마 파일 경로
         schema_path = PROJECT_ROOT / "data" / "schema.sql"
@@ -325,39 +463,41 @@ class StockDataUpdater:
             logger.info("통합 스키마를 사용하여 데이터베이스 초기화 완료")
         else:
             # 스키마 파일이 없는 경우 최소한의 테이블만 생성
-            with sqlite3.connect(self.db_path) as conn:
+            with get_pooled_connection(self.db_path) as conn:
                 conn.execute("CREATE TABLE IF NOT EXISTS stock_info (symbol TEXT PRIMARY KEY, name TEXT NOT NULL, market TEXT, sector TEXT, industry TEXT, listing_date TEXT, market_cap INTEGER, updated_at TEXT)")
                 conn.execute("CREATE TABLE IF NOT EXISTS stock_ohlcv (symbol TEXT NOT NULL, date TEXT NOT NULL, open INTEGER, high INTEGER, low INTEGER, close INTEGER, volume INTEGER, PRIMARY KEY (symbol, date))")
                 conn.commit()
             logger.warning("스키마 파일을 찾을 수 없어 최소한의 테이블만 생성했습니다.")
 
+        with get_pooled_connection(self.db_path) as conn:
+            conn.executescript(MARKET_CAP_SCHEMA_SQL)
+
     def save_symbol_info(self, symbol_info: Dict):
         """단일 종목의 정보를 `stock_info` 테이블에 저장하거나 업데이트합니다."""
-        with sqlite3.connect(self.db_path) as conn:
+        with get_pooled_connection(self.db_path) as conn:
             conn.execute(
                 "INSERT OR REPLACE INTO stock_info (symbol, name, market, sector, updated_at) VALUES (?, ?, ?, ?, ?)",
                 (symbol_info['symbol'], symbol_info['name'], symbol_info['market'], symbol_info.get('sector', ''), datetime.now().isoformat()),
             )
 
     def update_all_symbol_info_with_krx(self, kospi_csv: str = "krx_sector_kospi.csv", kosdaq_csv: str = "krx_sector_kosdaq.csv") -> Optional[pd.DataFrame]:
-        """전체 상장 종목의 기본 정보를 최신 상태로 업데이트합니다."""
+        """전체 상장 종목의 기본 정보를 최신 상태로 업데이트합니다.
+
+        종목명은 시장 전체 일괄 조회로 가져오고, 내용이 바뀐 행만 단일 트랜잭션으로 저장합니다.
+        """
         logger.info("전체 종목 정보 업데이트 시작...")
         today = datetime.now().strftime("%Y%m%d")
-        all_tickers = stock.get_market_ticker_list(today, market="ALL")
-        kospi_tickers = set(stock.get_market_ticker_list(today, market="KOSPI"))
-        
-        pykrx_data = []
-        for ticker in all_tickers:
-            name = stock.get_market_ticker_name(ticker)
-            market = "KOSPI" if ticker in kospi_tickers else "KOSDAQ"
-            if market == "KOSPI":
-                market = "KOSPI"
-            elif market == "KOSDAQ":
-                market = "KOSDAQ"
-            else:
-                market = "UNKNOWN"
-            pykrx_data.append({"symbol": ticker, "name": name, "market": market})
-        df_pykrx = pd.DataFrame(pykrx_data)
+
+        # 1단계: 시장 단위 일괄 조회 (티커 -> 종목명, KOSPI 여부)
+        ticker_names = self._fetch_market_ticker_names(today, market="ALL")
+        kospi_tickers = set(self._call_api(self.data_source.get_market_ticker_list, today, market="KOSPI"))
+
+        symbols = list(ticker_names.keys())
+        df_pykrx = pd.DataFrame({
+            "symbol": symbols,
+            "name": [ticker_names[t] for t in symbols],
+            "market": ["KOSPI" if t in kospi_tickers else "KOSDAQ" for t in symbols],
+        })
 
         try:
             df_kospi_sector = pd.read_csv(PROJECT_ROOT / kospi_csv, dtype={"종목코드": str}, encoding="cp949")
@@ -372,80 +512,256 @@ class StockDataUpdater:
             df_merged = df_pykrx
             df_merged['sector'] = ''
 
-        with sqlite3.connect(self.db_path) as conn:
-            for _, row in df_merged.iterrows():
-                self.save_symbol_info({'symbol': row['symbol'], 'name': row['name'], 'market': row['market'], 'sector': row['sector']})
-        logger.info(f"총 {len(df_merged)}개 종목 정보 DB 저장 완료.")
+        # 2단계: 변경된 행만 일괄 저장
+        changed = self._save_symbol_info_bulk(df_merged)
+        logger.info(f"총 {len(df_merged)}개 종목 정보 확인, {changed}개 종목 DB 저장 완료.")
         return df_merged
 
-    def _save_ohlcv_data(self, df: pd.DataFrame, ticker: Optional[str] = None):
-        """OHLCV 데이터프레임을 DB에 저장합니다."""
+    def _fetch_market_ticker_names(self, date: str, market: str = "ALL") -> Dict[str, str]:
+        """시장 전체의 티커 -> 종목명 매핑 조회
+
+        pykrx 내부의 전종목 시세 조회(1회 호출)를 우선 사용하고,
+        지원하지 않는 버전에서는 로컬 캐시(stock_info)에 없는 티커만 개별 조회합니다.
+        """
+        name_cache = self._get_ticker_name_cache()
+
+        try:
+            names = self.rate_limiter.call(self.data_source.get_market_ticker_and_name, date, market)
+            if names is not None and not names.empty:
+                resolved = {str(t): str(n) for t, n in names.items()}
+                name_cache.update(resolved)
+                return resolved
+        except Exception as e:
+            logger.debug(f"일괄 종목명 조회 미지원, 개별 조회로 대체: {e}")
+
+        tickers = self._call_api(self.data_source.get_market_ticker_list, date, market=market)
+        resolved = {}
+        api_calls = 0
+        for ticker in tickers:
+            name = name_cache.get(ticker)
+            if not name:
+                name = self._call_api(self.data_source.get_market_ticker_name, ticker)
+                name_cache[ticker] = name
+                api_calls += 1
+            resolved[ticker] = name
+        logger.info(f"종목명 조회: {len(tickers)}개 중 {api_calls}개 API 호출 (나머지 캐시)")
+        return resolved
+
+    def _get_ticker_name_cache(self) -> Dict[str, str]:
+        """stock_info에 저장된 종목명으로 초기화되는 티커 -> 종목명 캐시"""
+        if self._ticker_name_cache is None:
+            conn = get_pooled_connection(self.db_path)
+            rows = conn.execute("SELECT symbol, name FROM stock_info WHERE name IS NOT NULL AND name != ''").fetchall()
+            self._ticker_name_cache = dict(rows)
+        return self._ticker_name_cache
+
+    def _save_symbol_info_bulk(self, df: pd.DataFrame) -> int:
+        """종목 정보를 단일 executemany 트랜잭션으로 저장 (내용이 바뀐 행만)
+
+        INSERT OR REPLACE와 달리 UPSERT로 갱신하므로 market_cap 등 다른 컬럼은 보존됩니다.
+        """
+        conn = get_pooled_connection(self.db_path)
+        existing = {
+            row[0]: (row[1], row[2], row[3] or "")
+            for row in conn.execute("SELECT symbol, name, market, sector FROM stock_info")
+        }
+
+        now = datetime.now().isoformat()
+        rows = [
+            (symbol, name, market, sector, now)
+            for symbol, name, market, sector in zip(
+                df["symbol"].tolist(), df["name"].tolist(), df["market"].tolist(), df["sector"].tolist()
+            )
+            if existing.get(symbol) != (name, market, sector)
+        ]
+        if not rows:
+            return 0
+
+        with conn:
+            conn.executemany(
+                """
+                INSERT INTO stock_info (symbol, name, market, sector, updated_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(symbol) DO UPDATE SET
+                    name = excluded.name,
+                    market = excluded.market,
+                    sector = excluded.sector,
+                    updated_at = excluded.updated_at
+                """,
+                rows,
+            )
+        return len(rows)
+
+    def _save_ohlcv_data(self, df: pd.DataFrame, ticker: Optional[str] = None, date: Optional[str] = None) -> int:
+        """OHLCV 데이터프레임을 DB에 UPSERT하고 저장 행 수를 반환합니다.
+
+        - 종목별 데이터(인덱스=날짜): ticker 지정
+        - 일자별 전체 시장 데이터(인덱스=티커): date(YYYYMMDD 또는 YYYY-MM-DD) 지정
+        """
         if df.empty:
-            return
-        
-        # 컬럼명 한글 -> 영어 변환
-        df.rename(columns={"시가": "open", "고가": "high", "저가": "low", "종가": "close", "거래량": "volume"}, inplace=True)
-        
-        # 인덱스가 날짜인지 종목코드인지 확인하여 적절히 처리
-        if hasattr(df.index, 'dtype') and pd.api.types.is_datetime64_any_dtype(df.index):
-            # 인덱스가 datetime인 경우
-            df['date'] = df.index.to_series().dt.strftime('%Y-%m-%d')
-        elif isinstance(df.index, pd.DatetimeIndex):
-            # DatetimeIndex인 경우
-            df['date'] = df.index.to_series().dt.strftime('%Y-%m-%d')
+            return 0
+
+        if isinstance(df.index, pd.DatetimeIndex):
+            if not ticker:
+                logger.error("OHLCV 데이터 저장 시 티커 정보가 없습니다.")
+                return 0
+            rows = self._build_ohlcv_rows(df, symbol=ticker)
         else:
-            # 인덱스가 종목코드인 경우 (일별 전체 시장 데이터)
-            df.reset_index(inplace=True)
-            
-            # 첫 번째 컬럼이 symbol 정보일 가능성이 높음
-            first_col = str(df.columns[0])
-            if first_col in ['ticker', '티커', 'symbol', 'index']:
-                # 첫 번째 컬럼 이름을 명시적으로 가져와서 변경
-                old_col = df.columns.tolist()[0]
-                df.rename(columns={old_col: 'symbol'}, inplace=True)
-            elif 'symbol' not in df.columns:
-                # 첫 번째 컬럼을 symbol로 사용
-                old_col = df.columns.tolist()[0]
-                df.rename(columns={old_col: 'symbol'}, inplace=True)
-            
-            # 날짜 정보가 없으므로 현재 날짜로 설정 (일별 데이터의 경우)
-            current_date = datetime.now().strftime('%Y-%m-%d')
-            df['date'] = current_date
-        
-        # 심볼 정보 추가 처리
-        if '티커' in df.columns and 'symbol' not in df.columns:
-             df.rename(columns={'티커': 'symbol'}, inplace=True)
-        elif ticker and 'symbol' not in df.columns:
-            df['symbol'] = ticker
-        elif 'symbol' not in df.columns:
-            logger.error("OHLCV 데이터 저장 시 티커 정보가 없습니다.")
-            return
-        
-        cols_to_save = ["symbol", "date", "open", "high", "low", "close", "volume"]
-        
-        # 필요한 컬럼이 모두 있는지 확인
-        missing_cols = [col for col in cols_to_save if col not in df.columns]
-        if missing_cols:
-            logger.error(f"필수 컬럼이 누락되었습니다: {missing_cols}")
-            return
-        
-        with sqlite3.connect(self.db_path) as conn:
-            df[cols_to_save].to_sql("stock_ohlcv", conn, if_exists='replace', index=False)
+            if not date:
+                logger.error("일자별 시장 데이터 저장 시 날짜 정보가 없습니다.")
+                return 0
+            rows = self._build_ohlcv_rows(df, date=pd.Timestamp(date).strftime("%Y-%m-%d"))
 
-    def update_daily_market_data(self, date_str: str):
-        """특정일의 전체 시장 OHLCV 데이터를 업데이트합니다."""
+        return self._bulk_upsert_ohlcv(rows)
+
+    def update_daily_market_data(self, date_str: str, symbols: Optional[List[str]] = None) -> int:
+        """특정일의 전체 시장 OHLCV 데이터를 한 번의 호출로 조회해 저장합니다.
+
+        Args:
+            date_str: 대상 날짜 (YYYYMMDD)
+            symbols: 저장할 종목 제한 (None이면 조회된 전체 종목)
+
+        Returns:
+            저장한 행 수 (휴장일이거나 실패 시 0)
+        """
         logger.info(f"일별 전체 시장 데이터 업데이트 시작: {date_str}")
         try:
-            df = stock.get_market_ohlcv(date_str, market="ALL")
-            self._save_ohlcv_data(df)
+            df = self._call_api(self.data_source.get_market_ohlcv, date_str, market="ALL")
+            saved = self._save_ohlcv_data(self._filter_market_day(df, symbols), date=date_str)
+            logger.info(f"일별 전체 시장 데이터 저장: {date_str} {saved}개 종목")
+            return saved
         except Exception as e:
             logger.error(f"일별 시장 데이터({date_str}) 업데이트 실패: {e}")
+            return 0
+
+    @staticmethod
+    def _filter_market_day(df: pd.DataFrame, symbols: Optional[List[str]] = None) -> pd.DataFrame:
+        """일자별 시장 데이터에서 거래되지 않은 행(종가 0, 휴장일 응답)과 대상 외 종목 제거"""
+        if df is None or df.empty:
+            return pd.DataFrame()
+        close_col = "종가" if "종가" in df.columns else "close"
+        mask = df[close_col].to_numpy(dtype=np.float64) > 0
+        if symbols is not None:
+            mask &= df.index.isin(symbols)
+        return df[mask]
+
+    def find_missing_trading_days(
+        self,
+        start_date: str,
+        end_date: str,
+        symbols: Optional[List[str]] = None,
+        min_coverage: float = 0.95,
+        inactive_after: int = 5,
+    ) -> List[str]:
+        """유니버스 전체 기준으로 데이터가 부족한 거래일 목록을 반환합니다.
+
+        날짜별 저장 종목 수를 한 번의 GROUP BY 쿼리로 집계하고, 그날 상장되어 있던 종목 수
+        대비 min_coverage 미만인 거래일을 누락일로 판단합니다. 종목별 적재 구간(첫~마지막 적재일)을
+        상장 기간으로 보되, 마지막 적재일이 DB 최신 적재일보다 inactive_after 거래일 이내면 아직
+        거래 중(최근 누락)으로, 첫 적재일이 DB 최초 적재일과 그만큼 가까우면 그 이전부터 상장된
+        것으로 봅니다. 따라서 상장폐지/장기 거래정지 종목의 과거 날짜가 매번 다시 조회되지 않습니다.
+
+        Args:
+            start_date, end_date: 조회 기간 (YYYYMMDD 또는 YYYY-MM-DD)
+            symbols: 유니버스 (None이면 적재된 전체 종목, 적재 데이터가 없으면 stock_info 종목 수)
+            min_coverage: 누락으로 보지 않을 최소 적재 비율
+            inactive_after: 이 거래일 수보다 오래 적재되지 않은 종목은 마지막 적재일 이후 제외
+
+        Returns:
+            누락 거래일 목록 (YYYYMMDD, 오름차순)
+        """
+        from .trading_calendar import rule_day_numbers, to_day_number, to_day_numbers, trading_calendar
+
+        start = pd.Timestamp(start_date)
+        end = pd.Timestamp(end_date)
+        candidates = trading_calendar.get_trading_dates_range(start.strftime("%Y%m%d"), end.strftime("%Y%m%d"))
+        if not candidates:
+            return []
+
+        conn = get_pooled_connection(self.db_path)
+        ohlcv = ohlcv_source(conn)
+        date_col = ohlcv.date_column
+        bounds = [ohlcv.date_param(start.strftime("%Y-%m-%d")), ohlcv.date_param(end.strftime("%Y-%m-%d"))]
+        symbol_params = list(symbols) if symbols is not None else []
+        symbol_filter = f"symbol IN ({','.join('?' * len(symbol_params))})" if symbols is not None else ""
+
+        counts = {
+            to_day_number(day): count for day, count in conn.execute(
+                f"SELECT {date_col}, COUNT(*) FROM {ohlcv.table} WHERE {date_col} BETWEEN ? AND ? "
+                f"{'AND ' + symbol_filter if symbol_filter else ''} GROUP BY {date_col}",
+                bounds + symbol_params,
+            ).fetchall()
+        }
+        spans = conn.execute(
+            f"SELECT MIN({date_col}), MAX({date_col}) FROM {ohlcv.table} "
+            f"{'WHERE ' + symbol_filter if symbol_filter else ''} GROUP BY symbol",
+            symbol_params,
+        ).fetchall()
+
+        days = np.array([to_day_number(day) for day in candidates], dtype=np.int64)
+        if spans:
+            firsts = to_day_numbers([row[0] for row in spans]).astype(np.int64)
+            lasts = to_day_numbers([row[1] for row in spans]).astype(np.int64)
+            # 적재 공백을 휴장으로 보지 않도록 달력 규칙(주말/휴일 제외) 거래일로 간격 계산
+            sessions = rule_day_numbers(int(firsts.min()), int(lasts.max()), trading_calendar.holidays)
+            first_pos = np.searchsorted(sessions, firsts)
+            last_pos = np.searchsorted(sessions, lasts)
+            # 최근까지 적재된 종목은 조회 기간 끝까지, 최초 적재 시점부터 있던 종목은 기간 처음부터 상장
+            lasts[last_pos.max() - last_pos <= inactive_after] = np.iinfo(np.int64).max
+            firsts[first_pos - first_pos.min() <= inactive_after] = np.iinfo(np.int64).min
+            listed = (
+                np.searchsorted(np.sort(firsts), days, side="right")
+                - np.searchsorted(np.sort(lasts), days, side="left")
+            )
+        else:
+            # 적재 데이터가 없으면 종목 정보(또는 지정 유니버스) 전체를 기준으로 사용
+            universe_size = len(symbols) if symbols is not None else conn.execute(
+                "SELECT COUNT(*) FROM stock_info"
+            ).fetchone()[0]
+            listed = np.full(len(days), universe_size)
+        required = np.maximum(1, np.ceil(listed * min_coverage))
+        loaded = np.array([counts.get(day, 0) for day in days.tolist()])
+
+        return [day for day, is_missing in zip(candidates, loaded < required) if is_missing]
+
+    def update_missing_trading_days(
+        self,
+        start_date: str,
+        end_date: str,
+        symbols: Optional[List[str]] = None,
+        min_coverage: float = 0.95,
+    ) -> Dict[str, int]:
+        """일자별(by-date) 수집 모드: 누락 거래일마다 전체 시장을 한 번에 조회해 저장합니다.
+
+        종목별 조회(거래일 1일 추가 시 종목 수만큼 호출) 대신 누락 거래일 수만큼만 호출합니다.
+
+        Returns:
+            {날짜(YYYYMMDD): 저장 행 수}
+        """
+        if symbols is None:
+            with get_pooled_connection(self.db_path) as conn:
+                universe = [row[0] for row in conn.execute("SELECT symbol FROM stock_info").fetchall()]
+            target_symbols = universe or None
+        else:
+            target_symbols = list(symbols)
+
+        missing_days = self.find_missing_trading_days(start_date, end_date, symbols, min_coverage)
+        logger.info(f"일자별 수집 모드: 누락 거래일 {len(missing_days)}일 ({start_date}~{end_date})")
+
+        results = {}
+        for day in missing_days:
+            results[day] = self.update_daily_market_data(day, symbols=target_symbols)
+
+        self.finalize_ingestion()
+        total_rows = sum(results.values())
+        logger.info(f"일자별 수집 완료: {len(missing_days)}회 호출, {total_rows}행 저장")
+        return results
 
     def update_specific_stock_data(self, ticker: str, start_date: str, end_date: str):
         """특정 종목의 지정된 기간 OHLCV 데이터를 업데이트합니다."""
         logger.info(f"종목({ticker}) 데이터 업데이트: {start_date}~{end_date}")
         try:
-            df = stock.get_market_ohlcv_by_date(start_date, end_date, ticker)
+            df = self._call_api(self.data_source.get_market_ohlcv_by_date, start_date, end_date, ticker)
             self._save_ohlcv_data_optimized(ticker, df)
         except Exception as e:
             logger.error(f"종목({ticker}) 데이터 업데이트 실패: {e}")
@@ -453,32 +769,88 @@ class StockDataUpdater:
     def update_all_historical_data(self, start_date: str, end_date: str):
         """전체 종목의 지정된 기간 OHLCV 데이터를 업데이트합니다."""
         logger.info(f"전체 종목 기간 데이터 업데이트 시작: {start_date}~{end_date}")
-        with sqlite3.connect(self.db_path) as conn:
+        with get_pooled_connection(self.db_path) as conn:
             tickers = pd.read_sql_query("SELECT symbol FROM stock_info", conn)['symbol'].tolist()
         
-        delay = self.config.get("data_collection", {}).get("api_delay", 0.2)
+        # 호출 간격은 공유 limiter가 조절
         for i, ticker in enumerate(tickers, 1):
             logger.info(f"  - ({i}/{len(tickers)}) {ticker} 데이터 수집 중...")
             self.update_specific_stock_data(ticker, start_date, end_date)
-            time.sleep(delay)
+        self.finalize_ingestion()
         logger.info("전체 종목 기간 데이터 업데이트 완료.")
 
-    def update_market_cap_data(self, date_str: Optional[str] = None):
-        """특정일의 전체 시장 시가총액 데이터를 업데이트합니다."""
-        date_str = date_str or datetime.now().strftime("%Y%m%d")
+    def update_market_cap_data(self, date_str: Optional[str] = None) -> int:
+        """특정일의 전체 시장 시가총액을 stock_market_cap 시계열에 저장합니다.
+
+        한 트랜잭션에서 executemany로 일괄 저장하며, 저장된 가장 최근 날짜 이상이면
+        stock_info.market_cap(최신 스냅샷)도 함께 갱신합니다.
+
+        Returns:
+            저장한 종목 수 (휴장일이거나 실패 시 0)
+        """
+        date_str = (date_str or datetime.now().strftime("%Y%m%d")).replace("-", "")
         logger.info(f"시가총액 데이터 업데이트 시작: {date_str}")
         try:
-            df = stock.get_market_cap(date_str, market="ALL")
-            df.reset_index(inplace=True)
-            df.rename(columns={'티커': 'symbol', '시가총액': 'market_cap'}, inplace=True)
-            
-            with sqlite3.connect(self.db_path) as conn:
-                for _, row in df.iterrows():
-                    conn.execute("UPDATE stock_info SET market_cap = ? WHERE symbol = ?", (row['market_cap'], row['symbol']))
-                conn.commit()
-            logger.info(f"총 {len(df)}개 종목 시가총액 정보 DB 업데이트 완료.")
+            df = self._call_api(self.data_source.get_market_cap, date_str, market="ALL")
+            rows = self._build_market_cap_rows(df, f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:]}")
+            if not rows:
+                logger.info(f"시가총액 데이터 없음 (휴장일 가능): {date_str}")
+                return 0
+
+            conn = get_pooled_connection(self.db_path)
+            with conn:
+                latest = conn.execute("SELECT MAX(date) FROM stock_market_cap").fetchone()[0]
+                conn.executemany(MARKET_CAP_UPSERT_SQL, rows)
+                if latest is None or rows[0][1] >= latest:
+                    conn.executemany(
+                        "UPDATE stock_info SET market_cap = ? WHERE symbol = ?",
+                        [(cap, symbol) for symbol, _, cap, _ in rows],
+                    )
+            logger.info(f"총 {len(rows)}개 종목 시가총액 정보 DB 업데이트 완료.")
+            return len(rows)
         except Exception as e:
             logger.error(f"시가총액 데이터({date_str}) 업데이트 실패: {e}")
+            return 0
+
+    @staticmethod
+    def _build_market_cap_rows(df: pd.DataFrame, date: str) -> List[Tuple]:
+        """pykrx get_market_cap 결과(인덱스=티커)를 (symbol, date, market_cap, shares) 튜플로 변환"""
+        if df is None or df.empty:
+            return []
+        cap_col = "시가총액" if "시가총액" in df.columns else "market_cap"
+        shares_col = "상장주식수" if "상장주식수" in df.columns else "shares"
+
+        caps = df[cap_col].to_numpy(dtype=np.float64)
+        valid = ~np.isnan(caps) & (caps > 0)
+        if shares_col in df.columns:
+            shares = df[shares_col].to_numpy(dtype=np.float64)[valid]
+            shares_list = [None if np.isnan(v) else int(v) for v in shares]
+        else:
+            shares_list = [None] * int(valid.sum())
+        symbols = df.index[valid].astype(str).tolist()
+        return list(zip(symbols, [date] * len(symbols), caps[valid].astype(np.int64).tolist(), shares_list))
+
+    def update_market_cap_history(self, start_date: str, end_date: str) -> Dict[str, int]:
+        """기간 내 시가총액이 저장되지 않은 거래일만 일자별로 조회해 저장합니다.
+
+        Returns:
+            {날짜(YYYYMMDD): 저장 종목 수}
+        """
+        from .trading_calendar import trading_calendar
+
+        start = pd.Timestamp(start_date)
+        end = pd.Timestamp(end_date)
+        candidates = trading_calendar.get_trading_dates_range(start.strftime("%Y%m%d"), end.strftime("%Y%m%d"))
+        existing = {
+            row[0].replace("-", "")
+            for row in get_pooled_connection(self.db_path).execute(
+                "SELECT DISTINCT date FROM stock_market_cap WHERE date BETWEEN ? AND ?",
+                (start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d")),
+            )
+        }
+        missing = [day for day in candidates if day not in existing]
+        logger.info(f"시가총액 이력 수집: 누락 거래일 {len(missing)}일 ({start_date}~{end_date})")
+        return {day: self.update_market_cap_data(day) for day in missing}
 
     # 새로운 병렬 처리 메서드들
     def update_multiple_symbols_parallel(
@@ -505,22 +877,21 @@ class StockDataUpdater:
             "start_time": start_time,
         })
         
-        # 캐시 기반 필터링
-        symbols_to_process = self._filter_symbols_by_cache(symbols, force_update)
+        # 누락 구간 일괄 계획 (누락이 없는 종목은 건너뜀)
+        symbols_to_process = self._plan_symbols(symbols, start_date, end_date, force_update)
         
         logger.info(
-            f"캐시 필터링 완료: {len(symbols_to_process)}개 처리 대상 "
+            f"누락 구간 계획 완료: {len(symbols_to_process)}개 처리 대상 "
             f"(건너뛴 종목: {len(symbols) - len(symbols_to_process)}개)"
         )
         
-        # 병렬 처리
+        # 조회(다중 스레드) -> 검증/저장(단일 writer) 파이프라인
         if symbols_to_process:
-            batches = self.batch_processor.create_optimized_batches(symbols_to_process)
-            parallel_results = self._process_batches_parallel(
-                batches, start_date, end_date, force_update
-            )
+            pipeline_results = self._run_fetch_pipeline(symbols_to_process, start_date, end_date, force_update)
         else:
-            parallel_results = {"results": {}, "batch_stats": []}
+            pipeline_results = {}
+        
+        self.finalize_ingestion()
         
         # 성능 분석
         total_time = time.time() - start_time
@@ -528,131 +899,174 @@ class StockDataUpdater:
         logger.info(f"최적화된 병렬 데이터 업데이트 완료: {total_time:.2f}초")
         
         return {
-            "results": parallel_results["results"],
+            "results": pipeline_results,
             "cache_stats": self.cache_manager.get_cache_stats(),
             "batch_stats": self.batch_processor.get_performance_stats(),
+            "rate_limiter": self.rate_limiter.get_stats(),
             "total_time": total_time,
         }
 
-    def _filter_symbols_by_cache(self, symbols: List[str], force_update: bool) -> List[str]:
-        """캐시 기반 종목 필터링"""
-        if force_update or not self.optimization_config.enable_cache:
+    def _plan_symbols(
+        self, symbols: List[str], start_date: Optional[str], end_date: Optional[str], force_update: bool
+    ) -> List[str]:
+        """누락 구간을 한 번에 계획하고 업데이트가 필요한 종목만 반환"""
+        self._range_plan = None
+        if force_update or not self.optimization_config.incremental_update or not (start_date and end_date):
             return symbols
 
-        symbols_to_process = []
-        for symbol in symbols:
-            if not self.cache_manager.should_skip_symbol(symbol):
-                symbols_to_process.append(symbol)
-            else:
-                with self.progress_lock:
-                    self.progress_stats["skipped_symbols"] += 1
+        try:
+            plan_start = time.time()
+            self._range_plan = self.cache_manager.plan_missing_ranges(symbols, start_date, end_date)
+            logger.debug(f"누락 구간 계획: {len(symbols)}개 종목, {time.time() - plan_start:.3f}초")
+        except Exception as e:
+            logger.error(f"누락 구간 계획 실패: {e}")
+            return symbols
 
+        symbols_to_process = [symbol for symbol in symbols if self._range_plan[symbol]]
+        skipped = len(symbols) - len(symbols_to_process)
+        with self.progress_lock:
+            self.progress_stats["skipped_symbols"] += skipped
+        self.cache_manager.cache_stats["skipped_symbols"] += skipped
         return symbols_to_process
 
-    def _process_batches_parallel(
-        self, batches: List[List[str]], start_date: Optional[str], end_date: Optional[str], force_update: bool
-    ) -> Dict[str, Any]:
-        """배치들을 병렬로 처리"""
-        all_results = {}
-        batch_stats = []
-
-        def process_single_batch(batch: List[str]) -> Dict[str, Any]:
-            """단일 배치 처리"""
-            return self.batch_processor.process_batch_with_monitoring(
-                batch,
-                self._update_batch_sequential,
-                start_date=start_date,
-                end_date=end_date,
-                force_update=force_update,
-            )
-
-        # 병렬 배치 처리
-        with ThreadPoolExecutor(max_workers=self.optimization_config.max_workers) as executor:
-            future_to_batch = {
-                executor.submit(process_single_batch, batch): i
-                for i, batch in enumerate(batches)
-            }
-
-            for future in as_completed(future_to_batch, timeout=self.optimization_config.timeout):
-                try:
-                    batch_result = future.result()
-                    all_results.update(batch_result["results"])
-                    batch_stats.append(batch_result)
-                except Exception as e:
-                    batch_idx = future_to_batch[future]
-                    logger.error(f"배치 {batch_idx} 처리 실패: {e}")
-
-        return {"results": all_results, "batch_stats": batch_stats}
-
-    def _update_batch_sequential(
-        self, batch: List[str], start_date: Optional[str] = None, end_date: Optional[str] = None, force_update: bool = False
+    def _call_api(self, func: Callable, *args, **kwargs):
+        """공유 속도 제한을 거쳐 데이터 API 호출 (실패 시 지수 대기 후 재시도)"""
+        retries = max(0, self.optimization_config.max_retries)
+        for attempt in range(retries + 1):
+            try:
+                return self.rate_limiter.call(func, *args, **kwargs)
+            except Exception as e:
+                if attempt >= retries:
+                    raise
+                delay = self.optimization_config.retry_delay * (2 ** attempt)
+                logger.warning(f"API 호출 실패 ({getattr(func, '__name__', func)}), {delay:.1f}초 후 재시도: {e}")
+                time.sleep(delay)
+
+    def _symbol_fetch_ranges(
+        self, symbol: str, start_date: Optional[str], end_date: Optional[str], force_update: bool
+    ) -> List[Tuple[str, str]]:
+        """종목별 조회 구간 (증분 모드면 누락 구간만)"""
+        if not (start_date and end_date):
+            return []
+        if self.optimization_config.incremental_update and not force_update:
+            plan = self._range_plan
+            if plan is not None and symbol in plan:
+                return plan[symbol]
+            return self.cache_manager.get_missing_date_ranges(symbol, start_date, end_date)
+        return [(start_date, end_date)]
+
+    def _run_fetch_pipeline(
+        self, symbols: List[str], start_date: Optional[str], end_date: Optional[str], force_update: bool
     ) -> Dict[str, bool]:
-        """배치를 순차적으로 업데이트"""
-        results = {}
-
-        for symbol in batch:
+        """조회/저장 분리 파이프라인
+
+        - 조회: max_workers개 스레드가 공유 limiter를 거쳐 pykrx 호출 (I/O 대기 중첩)
+        - 저장: 호출 스레드가 유일한 writer로 검증 후 행을 모아 write_batch_size 단위로 UPSERT
+        조회 결과 대기열은 크기가 제한되어 writer가 밀리면 조회 스레드가 대기합니다.
+        """
+        config = self.optimization_config
+        pipeline_start = time.time()
+        fetched: "queue.Queue" = queue.Queue(maxsize=max(1, config.fetch_queue_size))
+        api_calls = [0]
+        api_calls_lock = threading.Lock()
+        # writer가 예외로 빠져나가면 조회 스레드가 가득 찬 대기열에서 영원히 막히지 않도록 중단
+        cancelled = threading.Event()
+
+        def put(item):
+            while not cancelled.is_set():
+                try:
+                    fetched.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        def fetch(symbol: str):
+            if cancelled.is_set():
+                return
             try:
-                # API 호출 간격 준수
-                time.sleep(self.optimization_config.api_delay)
-
-                # 개별 종목 업데이트
-                success = self._update_single_symbol_optimized(symbol, start_date, end_date, force_update)
-                results[symbol] = success
-
-                # 진행률 업데이트
-                with self.progress_lock:
-                    if success:
-                        self.progress_stats["completed_symbols"] += 1
-                    else:
-                        self.progress_stats["failed_symbols"] += 1
+                ranges = self._symbol_fetch_ranges(symbol, start_date, end_date, force_update)
+                frames = []
+                for range_start, range_end in ranges:
+                    if cancelled.is_set():
+                        return
+                    frames.append(self._call_api(self.data_source.get_market_ohlcv_by_date, range_start, range_end, symbol))
+                    with api_calls_lock:
+                        api_calls[0] += 1
+                put((symbol, ranges, frames, None))
+            except Exception as e:
+                put((symbol, None, None, e))
 
-                    # 진행률 콜백 호출
-                    if self.optimization_config.progress_callback is not None:
-                        self._call_progress_callback()
+        results: Dict[str, bool] = {}
+        pending_rows: List[Tuple] = []
+        pending_symbols: List[str] = []
+        flushes = 0
 
+        def flush():
+            nonlocal flushes
+            if not pending_rows:
+                return
+            try:
+                self._bulk_upsert_ohlcv(pending_rows)
+                flushes += 1
             except Exception as e:
-                logger.error(f"종목 {symbol} 업데이트 실패: {e}")
-                results[symbol] = False
+                logger.error(f"DB 저장 실패 ({len(pending_symbols)}개 종목): {e}")
+                for symbol in pending_symbols:
+                    results[symbol] = False
+            pending_rows.clear()
+            pending_symbols.clear()
 
-                with self.progress_lock:
-                    self.progress_stats["failed_symbols"] += 1
+        with ThreadPoolExecutor(max_workers=max(1, config.max_workers)) as executor:
+            for symbol in symbols:
+                executor.submit(fetch, symbol)
 
+            try:
+                for _ in range(len(symbols)):
+                    symbol, ranges, frames, error = fetched.get()
+                    success = False
+                    if error is not None:
+                        logger.error(f"종목 {symbol} 조회 실패: {error}")
+                    else:
+                        # 모든 구간이 검증을 통과한 종목만 저장 대상에 추가
+                        success = True
+                        symbol_rows: List[Tuple] = []
+                        for (range_start, range_end), df in zip(ranges, frames):
+                            if df is None or df.empty:
+                                logger.warning(f"종목 {symbol}: 데이터 없음 ({range_start}~{range_end})")
+                                success = False
+                            elif not self._validate_data_quality(symbol, df):
+                                logger.error(f"종목 {symbol}: 데이터 품질 검증 실패")
+                                success = False
+                            else:
+                                symbol_rows.extend(self._build_ohlcv_rows(df, symbol=symbol))
+                        if success:
+                            pending_rows.extend(symbol_rows)
+                            pending_symbols.append(symbol)
+                            stat_key = "full_updates" if force_update or self._range_plan is None else "incremental_updates"
+                            self.cache_manager.cache_stats[stat_key] += 1
+
+                    results[symbol] = success
+                    if len(pending_rows) >= config.write_batch_size:
+                        flush()
+
+                    with self.progress_lock:
+                        self.progress_stats["completed_symbols" if success else "failed_symbols"] += 1
+                        if config.progress_callback is not None:
+                            self._call_progress_callback()
+
+                flush()
+            finally:
+                cancelled.set()
+                # 이미 put 대기 중인 조회 스레드가 빠져나가도록 대기열 비움
+                while True:
+                    try:
+                        fetched.get_nowait()
+                    except queue.Empty:
+                        break
+
+        elapsed = time.time() - pipeline_start
+        self.batch_processor.record_pipeline_run(len(symbols), api_calls[0], flushes, elapsed)
         return results
 
-    def _update_single_symbol_optimized(
-        self, symbol: str, start_date: Optional[str] = None, end_date: Optional[str] = None, force_update: bool = False
-    ) -> bool:
-        """최적화된 단일 종목 업데이트"""
-        try:
-            # 증분 업데이트 사용 여부 확인
-            if self.optimization_config.incremental_update and not force_update and start_date and end_date:
-                missing_ranges = self.cache_manager.get_missing_date_ranges(symbol, start_date, end_date)
-
-                if not missing_ranges:
-                    logger.debug(f"종목 {symbol}: 업데이트 불필요")
-                    return True
-
-                # 누락된 범위만 업데이트
-                for range_start, range_end in missing_ranges:
-                    if not self._fetch_and_save_data(symbol, range_start, range_end):
-                        return False
-
-                self.cache_manager.cache_stats["incremental_updates"] += 1
-            else:
-                # 전체 업데이트
-                if start_date and end_date and not self._fetch_and_save_data(symbol, start_date, end_date):
-                    return False
-
-                self.cache_manager.cache_stats["full_updates"] += 1
-
-            # 캐시 무효화
-            self.cache_manager.invalidate_cache(symbol)
-            return True
-
-        except Exception as e:
-            logger.error(f"종목 {symbol} 최적화 업데이트 실패: {e}")
-            return False
-
     def _validate_data_quality(self, symbol: str, df: pd.DataFrame) -> bool:
         """데이터 품질 검증"""
         if df.empty:
@@ -700,7 +1114,7 @@ class StockDataUpdater:
         """데이터 조회 및 저장 - 품질 검증 추가"""
         try:
             # pykrx로 데이터 조회
-            df = stock.get_market_ohlcv_by_date(start_date, end_date, symbol)
+            df = self._call_api(self.data_source.get_market_ohlcv_by_date, start_date, end_date, symbol)
 
             if df.empty:
                 logger.warning(f"종목 {symbol}: 데이터 없음 ({start_date}~{end_date})")
@@ -720,71 +1134,156 @@ class StockDataUpdater:
             return False
 
     def _save_ohlcv_data_optimized(self, symbol: str, df: pd.DataFrame):
-        """최적화된 OHLCV 데이터 저장 - 중복 처리 개선"""
+        """최적화된 OHLCV 데이터 저장 - executemany 기반 일괄 UPSERT"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                # 데이터 변환
-                df_to_save = df.copy()
-                df_to_save["symbol"] = symbol
-                df_to_save["date"] = pd.to_datetime(df_to_save.index).strftime("%Y-%m-%d")
-                df_to_save = df_to_save.reset_index(drop=True)
-
-                # 컬럼명 매핑 (pykrx -> DB)
-                column_mapping = {
-                    "시가": "open",
-                    "고가": "high",
-                    "저가": "low",
-                    "종가": "close",
-                    "거래량": "volume",
-                    "거래대금": "amount",
-                }
-                df_to_save = df_to_save.rename(columns=column_mapping)
-
-                # 필요한 컬럼만 선택
-                required_columns = ["symbol", "date", "open", "high", "low", "close", "volume"]
-                if "amount" in df_to_save.columns:
-                    required_columns.append("amount")
-
-                df_final = df_to_save[required_columns]
-                
-                # 중복 데이터 처리: UPSERT 방식 사용
-                for _, row in df_final.iterrows():
-                    # 기존 데이터 확인
-                    cursor = conn.execute(
-                        "SELECT COUNT(*) FROM stock_ohlcv WHERE symbol = ? AND date = ?",
-                        (row['symbol'], row['date'])
-                    )
-                    exists = cursor.fetchone()[0] > 0
-                    
-                    if exists:
-                        # 기존 데이터 업데이트
-                        conn.execute(
-                            """
-                            UPDATE stock_ohlcv 
-                            SET open = ?, high = ?, low = ?, close = ?, volume = ?
-                            WHERE symbol = ? AND date = ?
-                            """,
-                            (row['open'], row['high'], row['low'], row['close'], row['volume'],
-                             row['symbol'], row['date'])
-                        )
-                    else:
-                        # 새 데이터 삽입
-                        conn.execute(
-                            """
-                            INSERT INTO stock_ohlcv (symbol, date, open, high, low, close, volume)
-                            VALUES (?, ?, ?, ?, ?, ?, ?)
-                            """,
-                            (row['symbol'], row['date'], row['open'], row['high'], 
-                             row['low'], row['close'], row['volume'])
-                        )
-                
-                conn.commit()
-                logger.debug(f"종목 {symbol}: {len(df_final)}개 데이터 저장 완료 (중복 처리 포함)")
+            rows = self._build_ohlcv_rows(df, symbol=symbol)
+            saved = self._bulk_upsert_ohlcv(rows)
+            logger.debug(f"종목 {symbol}: {saved}개 데이터 저장 완료 (UPSERT)")
 
         except Exception as e:
             logger.error(f"DB 저장 실패 ({symbol}): {e}")
             raise
 
+    @staticmethod
+    def _build_ohlcv_rows(
+        df: pd.DataFrame, symbol: Optional[str] = None, date: Optional[str] = None
+    ) -> List[Tuple]:
+        """pykrx OHLCV 데이터프레임을 UPSERT용 튜플 리스트로 변환
+
+        - 종목별 조회(인덱스=날짜): symbol 지정
+        - 일자별 전체 시장 조회(인덱스=티커): date(YYYY-MM-DD) 지정
+        """
+        if df.empty:
+            return []
+
+        # 한글/영문 컬럼명 모두 허용 (데이터프레임 복사 없이 컬럼만 선택)
+        reverse_mapping = {v: k for k, v in OHLCV_COLUMN_MAPPING.items()}
+        source_columns = [
+            col if col in df.columns else reverse_mapping[col]
+            for col in ("open", "high", "low", "close", "volume")
+        ]
+
+        # 정수 컬럼은 그대로 쓰고, 실수 컬럼만 NaN 검사 (NaN 포함 행은 정수 변환 불가로 제외)
+        arrays = []
+        valid = np.ones(len(df), dtype=bool)
+        for col in source_columns:
+            array = df[col].to_numpy()
+            if array.dtype.kind not in "iu":
+                array = array.astype(np.float64)
+                valid &= ~np.isnan(array)
+            arrays.append(array)
+        index = df.index
+        if not valid.all():
+            arrays = [array[valid] for array in arrays]
+            index = index[valid]
+
+        # sqlite3는 numpy 정수를 바인딩하지 못하므로 tolist()로 파이썬 int 변환
+        columns = [array.astype(np.int64, copy=False).tolist() for array in arrays]
+        count = len(index)
+
+        if symbol is not None:
+            symbols = [symbol] * count
+        else:
+            symbols = index.astype(str).tolist()
+
+        if date is not None:
+            dates = [date] * count
+        else:
+            # strftime 대비 수 배 빠른 NumPy 날짜 문자열 변환 (DatetimeIndex는 재파싱하지 않음)
+            if not isinstance(index, pd.DatetimeIndex):
+                index = pd.to_datetime(index)
+            day_values = index.values.astype("datetime64[D]")
+            dates = np.datetime_as_string(day_values).tolist()
+
+        return list(zip(symbols, dates, *columns))
+
+    def _bulk_upsert_ohlcv(self, rows: List[Tuple]) -> int:
+        """OHLCV 튜플을 배치 단위 트랜잭션으로 UPSERT하고 저장 행 수 반환"""
+        if not rows:
+            return 0
+
+        batch_size = max(1, self.optimization_config.write_batch_size)
+        conn = get_pooled_connection(self.db_path)
+        upsert_sql = OHLCV_COMPACT_UPSERT_SQL if ohlcv_source(conn).compact else OHLCV_UPSERT_SQL
+        with self._write_lock:
+            write_start = time.perf_counter()
+            for i in range(0, len(rows), batch_size):
+                with conn:
+                    conn.executemany(upsert_sql, rows[i:i + batch_size])
+            write_time = time.perf_counter() - write_start
+            self.write_stats["rows"] += len(rows)
+            self.write_stats["transactions"] += (len(rows) + batch_size - 1) // batch_size
+            self.write_stats["seconds"] += write_time
+
+        written_dates = {row[1] for row in rows}
+        notify_ingested_dates(self.db_path, written_dates)
+        min_date = min(written_dates)
+        with self._columnar_lock:
+            if self._min_written_date is None or min_date < self._min_written_date:
+                self._min_written_date = min_date
+        return len(rows)
+
+    def export_columnar_store(self) -> int:
+        """stock_ohlcv 전체를 메모리 맵 컬럼형 저장소로 내보냅니다."""
+        from .columnar_store import ColumnarOHLCVStore
+
+        store = ColumnarOHLCVStore.for_database(self.db_path)
+        rows = store.export()
+        with self._columnar_lock:
+            self._min_written_date = None
+        logger.info(f"컬럼형 저장소 내보내기 완료: {store.root} ({rows}행)")
+        return rows
+
+    def finalize_ingestion(self) -> Dict[str, int]:
+        """수집 후처리: 이번 업데이트에서 저장된 가장 이른 날짜 이후만 파생 데이터에 반영합니다.
+
+        - 컬럼형 저장소 동기화 (내보낸 적이 있는 경우)
+        - 일자별 순위 테이블(stock_daily_rankings) 증분 갱신
+
+        Returns:
+            {"columnar_rows": 동기화 행 수, "ranking_days": 갱신 거래일 수}
+        """
+        with self._columnar_lock:
+            since, self._min_written_date = self._min_written_date, None
+        result = {"columnar_rows": 0, "ranking_days": 0}
+        if since is None:
+            return result
+
+        result["columnar_rows"] = self._sync_columnar_since(since)
+        if self.optimization_config.refresh_rankings:
+            try:
+                result["ranking_days"] = DailyRankingBuilder(self.db_path).refresh(since=since)
+            except Exception as e:
+                logger.error(f"순위 테이블 갱신 실패: {e}")
+        return result
+
+    def sync_columnar_store(self) -> int:
+        """이번 업데이트에서 저장된 날짜 이후만 컬럼형 저장소에 반영합니다.
+
+        저장소를 내보낸 적이 없거나 설정에서 비활성화된 경우 아무것도 하지 않습니다.
+        순위 테이블까지 갱신하려면 finalize_ingestion()을 사용하세요.
+        """
+        with self._columnar_lock:
+            since, self._min_written_date = self._min_written_date, None
+        if since is None:
+            return 0
+        return self._sync_columnar_since(since)
+
+    def _sync_columnar_since(self, since: str) -> int:
+        from .columnar_store import ColumnarOHLCVStore
+
+        if not self.optimization_config.sync_columnar_store:
+            return 0
+
+        store = ColumnarOHLCVStore.for_database(self.db_path)
+        if not store.exists():
+            return 0
+        try:
+            return store.sync(since=since)
+        except Exception as e:
+            logger.error(f"컬럼형 저장소 동기화 실패: {e}")
+            return 0
+
     def _call_progress_callback(self):
         """진행률 콜백 호출"""
         total = self.progress_stats["total_symbols"]
@@ -804,12 +1303,19 @@ class StockDataUpdater:
                 start_time=self.progress_stats["start_time"],
             )
 
+    def _write_stats_snapshot(self) -> Dict[str, Any]:
+        """쓰기 통계 사본 (갱신 중인 값을 읽지 않도록 쓰기 잠금 하에서 복사)"""
+        with self._write_lock:
+            return self.write_stats.copy()
+
     def get_optimization_stats(self) -> Dict[str, Any]:
         """최적화 통계 반환"""
         return {
             "cache_stats": self.cache_manager.get_cache_stats(),
             "batch_stats": self.batch_processor.get_performance_stats(),
             "progress_stats": self.progress_stats.copy(),
+            "write_stats": self._write_stats_snapshot(),
+            "rate_limiter": self.rate_limiter.get_stats(),
             "optimization_config": {
                 "max_workers": self.optimization_config.max_workers,
                 "enable_cache": self.optimization_config.enable_cache,
@@ -819,75 +1325,9 @@ class StockDataUpdater:
         }
 
     def check_data_consistency(self, symbol: str, start_date: str, end_date: str) -> Dict[str, Any]:
-        """데이터 일관성 검사"""
+        """단일 종목 데이터 일관성 검사 (DataConsistencyAuditor 결과를 기존 형식으로 반환)"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                # 기존 데이터 조회
-                df = pd.read_sql_query(
-                    """
-                    SELECT date, open, high, low, close, volume 
-                    FROM stock_ohlcv 
-                    WHERE symbol = ? AND date BETWEEN ? AND ? 
-                    ORDER BY date
-                    """,
-                    conn,
-                    params=[symbol, start_date, end_date]
-                )
-            
-            if df.empty:
-                return {
-                    "symbol": symbol,
-                    "total_days": 0,
-                    "missing_days": 0,
-                    "data_quality_issues": [],
-                    "is_consistent": False
-                }
-            
-            # 날짜 범위 계산
-            start_dt = datetime.strptime(start_date, '%Y-%m-%d')
-            end_dt = datetime.strptime(end_date, '%Y-%m-%d')
-            expected_days = (end_dt - start_dt).days + 1
-            actual_days = len(df)
-            
-            # 누락된 날짜 확인
-            existing_dates = set(df['date'].tolist())
-            all_dates = set()
-            for dt in pd.date_range(start_dt, end_dt):
-                all_dates.add(dt.strftime('%Y-%m-%d'))
-            
-            missing_dates = all_dates - existing_dates
-            
-            # 데이터 품질 이슈 확인
-            quality_issues = []
-            
-            # 가격 데이터 검증
-            if (df['high'] < df['low']).any():
-                quality_issues.append("고가가 저가보다 낮은 데이터 존재")
-            
-            if (df['open'] <= 0).any() or (df['close'] <= 0).any():
-                quality_issues.append("0 이하 가격 데이터 존재")
-            
-            if (df['volume'] < 0).any():
-                quality_issues.append("음수 거래량 존재")
-            
-            # 연속성 검증
-            df['date'] = pd.to_datetime(df['date'])
-            df_sorted = df.sort_values('date')
-            date_gaps = df_sorted['date'].diff().dt.days > 1
-            
-            if date_gaps.any():
-                quality_issues.append("날짜 간격이 1일을 초과하는 구간 존재")
-            
-            return {
-                "symbol": symbol,
-                "total_days": expected_days,
-                "actual_days": actual_days,
-                "missing_days": len(missing_dates),
-                "missing_dates": sorted(list(missing_dates)),
-                "data_quality_issues": quality_issues,
-                "is_consistent": len(missing_dates) == 0 and len(quality_issues) == 0
-            }
-            
+            row = self.auditor.audit(start_date, end_date, [symbol]).loc[symbol]
         except Exception as e:
             logger.error(f"데이터 일관성 검사 실패 ({symbol}): {e}")
             return {
@@ -896,44 +1336,24 @@ class StockDataUpdater:
                 "is_consistent": False
             }
 
-    def get_incremental_update_stats(self, symbols: List[str], start_date: str, end_date: str) -> Dict[str, Any]:
-        """증분 업데이트 통계 정보"""
-        stats = {
-            "total_symbols": len(symbols),
-            "symbols_with_missing_data": 0,
-            "symbols_with_quality_issues": 0,
-            "total_missing_days": 0,
-            "update_recommendations": []
+        errors, warnings = self.auditor.describe_issues(row)
+        result = {
+            "symbol": symbol,
+            "total_days": int(row["rows"] + row["missing_days"]),
+            "actual_days": int(row["rows"]),
+            "missing_days": int(row["missing_days"]),
+            "data_quality_issues": errors,
+            "warnings": warnings,
+            "is_consistent": bool(row["is_consistent"]),
         }
-        
-        for symbol in symbols:
-            consistency = self.check_data_consistency(symbol, start_date, end_date)
-            
-            if not consistency.get("is_consistent", False):
-                stats["symbols_with_missing_data"] += 1
-                stats["total_missing_days"] += consistency.get("missing_days", 0)
-                
-                if consistency.get("data_quality_issues"):
-                    stats["symbols_with_quality_issues"] += 1
-                
-                # 업데이트 권장사항 생성
-                if consistency.get("missing_days", 0) > 0:
-                    stats["update_recommendations"].append({
-                        "symbol": symbol,
-                        "action": "incremental_update",
-                        "missing_days": consistency.get("missing_days", 0),
-                        "priority": "high" if consistency.get("missing_days", 0) > 10 else "medium"
-                    })
-                
-                if consistency.get("data_quality_issues"):
-                    stats["update_recommendations"].append({
-                        "symbol": symbol,
-                        "action": "data_quality_fix",
-                        "issues": consistency.get("data_quality_issues", []),
-                        "priority": "high"
-                    })
-        
-        return stats
+        if row["missing_days"]:
+            result["missing_ranges"] = self.cache_manager.get_missing_date_ranges(symbol, start_date, end_date)
+        return result
+
+    def get_incremental_update_stats(self, symbols: List[str], start_date: str, end_date: str) -> Dict[str, Any]:
+        """증분 업데이트 통계 정보 (전 종목 1회 스트리밍 감사)"""
+        summary = self.auditor.audit(start_date, end_date, symbols)
+        return self.auditor.summarize(summary)
 
     def smart_incremental_update(
         self, 
@@ -948,7 +1368,8 @@ class StockDataUpdater:
         
         # 1단계: 데이터 일관성 분석
         logger.info("1단계: 데이터 일관성 분석 중...")
-        consistency_stats = self.get_incremental_update_stats(symbols, start_date, end_date)
+        initial_summary = self.auditor.audit(start_date, end_date, symbols)
+        consistency_stats = self.auditor.summarize(initial_summary)
         
         # 2단계: 업데이트 전략 결정
         logger.info("2단계: 업데이트 전략 결정 중...")
@@ -958,9 +1379,17 @@ class StockDataUpdater:
         logger.info("3단계: 우선순위별 업데이트 실행 중...")
         results = self._execute_update_plan(update_plan, start_date, end_date)
         
-        # 4단계: 결과 검증
-        logger.info("4단계: 결과 검증 중...")
-        final_stats = self.get_incremental_update_stats(symbols, start_date, end_date)
+        # 4단계: 결과 검증 (갱신 대상 종목만 재감사하여 초기 결과에 병합)
+        touched = list(dict.fromkeys(
+            item["symbol"]
+            for priority in ("high_priority", "medium_priority", "low_priority")
+            for item in update_plan[priority]
+        ))
+        logger.info(f"4단계: 결과 검증 중... ({len(touched)}개 종목 재검사)")
+        final_summary = initial_summary.copy()
+        if touched:
+            final_summary.loc[touched] = self.auditor.audit(start_date, end_date, touched)[final_summary.columns]
+        final_stats = self.auditor.summarize(final_summary)
         
         return {
             "initial_stats": consistency_stats,
@@ -1050,74 +1479,29 @@ class StockDataUpdater:
         return results
 
     def backup_before_update(self, symbols: List[str], backup_name: Optional[str] = None) -> str:
-        """업데이트 전 데이터 백업"""
-        if not backup_name:
-            backup_name = f"backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        
-        backup_path = PROJECT_ROOT / "data" / "backups" / f"{backup_name}.db"
-        backup_path.parent.mkdir(parents=True, exist_ok=True)
-        
+        """업데이트 전 롤백 지점(스냅샷) 생성
+
+        종목별 복사 대신 DB 전체를 copy-on-write 스냅샷(미지원 시 단계적 온라인 백업)으로 남기며,
+        symbols는 복원 시 범위를 지정하는 데 사용합니다.
+        """
         try:
-            with sqlite3.connect(self.db_path) as source_conn:
-                with sqlite3.connect(backup_path) as backup_conn:
-                    # 선택된 종목들의 데이터만 백업
-                    for symbol in symbols:
-                        # OHLCV 데이터 백업
-                        df_ohlcv = pd.read_sql_query(
-                            "SELECT * FROM stock_ohlcv WHERE symbol = ?",
-                            source_conn, params=[symbol]
-                        )
-                        if not df_ohlcv.empty:
-                            df_ohlcv.to_sql("stock_ohlcv", backup_conn, if_exists="append", index=False)
-                        
-                        # 종목 정보 백업
-                        df_info = pd.read_sql_query(
-                            "SELECT * FROM stock_info WHERE symbol = ?",
-                            source_conn, params=[symbol]
-                        )
-                        if not df_info.empty:
-                            df_info.to_sql("stock_info", backup_conn, if_exists="append", index=False)
-            
-            logger.info(f"백업 완료: {backup_path} ({len(symbols)}개 종목)")
-            return str(backup_path)
-            
+            backup_path = self.backup_manager.snapshot(backup_name)
+            logger.info(f"백업 완료: {backup_path} ({len(symbols)}개 종목 대상)")
+            return backup_path
         except Exception as e:
             logger.error(f"백업 실패: {e}")
             raise
 
     def restore_from_backup(self, backup_path: str, symbols: List[str]) -> bool:
-        """백업에서 데이터 복원"""
-        try:
-            with sqlite3.connect(backup_path) as backup_conn:
-                with sqlite3.connect(self.db_path) as target_conn:
-                    for symbol in symbols:
-                        # 기존 데이터 삭제
-                        target_conn.execute("DELETE FROM stock_ohlcv WHERE symbol = ?", (symbol,))
-                        target_conn.execute("DELETE FROM stock_info WHERE symbol = ?", (symbol,))
-                        
-                        # 백업 데이터 복원
-                        df_ohlcv = pd.read_sql_query(
-                            "SELECT * FROM stock_ohlcv WHERE symbol = ?",
-                            backup_conn, params=[symbol]
-                        )
-                        if not df_ohlcv.empty:
-                            df_ohlcv.to_sql("stock_ohlcv", target_conn, if_exists="append", index=False)
-                        
-                        df_info = pd.read_sql_query(
-                            "SELECT * FROM stock_info WHERE symbol = ?",
-                            backup_conn, params=[symbol]
-                        )
-                        if not df_info.empty:
-                            df_info.to_sql("stock_info", target_conn, if_exists="append", index=False)
-                    
-                    target_conn.commit()
-            
-            logger.info(f"복원 완료: {len(symbols)}개 종목")
-            return True
-            
-        except Exception as e:
-            logger.error(f"복원 실패: {e}")
-            return False
+        """백업에서 지정 종목 데이터 복원"""
+        from .columnar_store import ColumnarOHLCVStore
+
+        restored = self.backup_manager.restore(backup_path, symbols=symbols)
+        # 복원은 행 삭제를 포함하므로 증분 동기화 대신 컬럼형 저장소를 다시 내보냄
+        if restored and self.optimization_config.sync_columnar_store \
+                and ColumnarOHLCVStore.for_database(self.db_path).exists():
+            self.export_columnar_store()
+        return restored
 
     def safe_incremental_update(
         self,
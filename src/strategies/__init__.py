@@ -5,6 +5,7 @@ TA-Lib 기반 매매 전략 모듈
 - 볼린저 밴드 전략
 - RSI 전략
 - MACD 전략
+- 실시간 증분 신호 엔진
 """
 
 from .base_strategy import BaseStrategy
@@ -12,6 +13,7 @@ from .moving_average_strategy import MovingAverageStrategy
 from .bollinger_band_strategy import BollingerBandStrategy
 from .rsi_strategy import RSIStrategy
 from .macd_strategy import MACDStrategy
+from .live_engine import LiveSignalEngine
 
 __all__ = [
     "BaseStrategy",
@@ -19,4 +21,5 @@ __all__ = [
     "BollingerBandStrategy",
     "RSIStrategy",
     "MACDStrategy",
+    "LiveSignalEngine",
 ]
@@ -31,6 +31,12 @@ class TradeSignal:
     reason: str
     indicators: Dict[str, float]
     risk_level: str  # 'LOW', 'MEDIUM', 'HIGH'
+    # 주문 방식 (백테스트 장중 체결): 'MARKET'은 신호 봉 종가, 'LIMIT'/'STOP'은
+    # 다음 거래일부터 valid_days일 동안 limit_price/stop_price로 대기
+    order_type: str = "MARKET"
+    limit_price: Optional[float] = None
+    stop_price: Optional[float] = None
+    valid_days: Optional[int] = None  # None이면 BacktestConfig.order_valid_days
 
 
 @dataclass
@@ -262,6 +268,33 @@ class BaseStrategy(ABC):
         """
         pass
 
+    def evaluate_row(
+        self, row, timestamp, symbol: str = "", prev_row=None
+    ) -> List[TradeSignal]:
+        """
+        지표가 계산된 한 행만으로 매수/매도 신호 판정 (실시간 엔진용)
+
+        generate_signals와 같은 행 단위 판정 메서드(_buy_signal_at/_sell_signal_at)를
+        호출하므로 같은 지표 행에 대해 배치 경로와 동일한 신호를 돌려줍니다.
+
+        Args:
+            row: 지표 값 (pd.Series 또는 dict)
+            timestamp: 신호 시각
+            symbol: 종목코드
+            prev_row: 직전 행 (직전 값 비교가 필요한 전략용)
+
+        Returns:
+            매수 신호, 매도 신호 순서의 목록
+        """
+        signals = []
+        for judge in (getattr(self, "_buy_signal_at", None), getattr(self, "_sell_signal_at", None)):
+            if judge is None:
+                continue
+            signal = judge(row, timestamp, symbol)
+            if signal is not None:
+                signals.append(signal)
+        return signals
+
     def prepare_data(self, data: pd.DataFrame) -> pd.DataFrame:
         """데이터 전처리 및 검증"""
         if len(data) < self.config.min_data_length:
@@ -108,208 +108,222 @@ class BollingerBandStrategy(BaseStrategy):
 
         for i in range(len(df)):
             current_row = df.iloc[i]
-
-            # 데이터 부족 시 건너뛰기 (완화된 검증)
-            if pd.isna(current_row.get("BB_lower")) or pd.isna(current_row.get("close")):
-                continue
-
-            price = current_row["close"]
-            bb_position = current_row.get("BB_position", 0.5)
-            bb_width = current_row.get("BB_width", 0.05)
-            touching_lower = current_row.get("BB_touch_lower", False)
-            squeeze = current_row.get("BB_squeeze", False)
-
-            # 매수 조건들 (다양한 기회 제공)
-            buy_conditions = []
-            confidence = 0.0
-            reasons = []
-
-            # 조건 1: 하단 밴드 터치 후 반등
-            if touching_lower and bb_position > 0.1:
-                buy_conditions.append(True)
-                confidence += 40
-                reasons.append("하단 밴드 터치 후 반등")
-
-            # 조건 2: 스퀴즈 후 상승 돌파
-            elif squeeze and current_row.get("band_expanding", False) and price > current_row.get("BB_middle", price):
-                buy_conditions.append(True)
-                confidence += 35
-                reasons.append("스퀴즈 후 상승 돌파")
-
-            # 조건 3: 중간선 상승 돌파 (추세 추종)
-            elif (price > current_row.get("BB_middle", price) and 
-                  current_row.get("close", 0) > current_row.get("SMA_20", 0) and 
-                  bb_width > 0.03):
-                buy_conditions.append(True)
-                confidence += 30
-                reasons.append("중간선 상승 돌파")
-
-            # 조건 4: 밴드 중앙 근처에서 상승 추세
-            elif 0.3 <= bb_position <= 0.7 and price > current_row.get("close", price):
-                buy_conditions.append(True)
-                confidence += 25
-                reasons.append("밴드 중앙 상승 추세")
-
-            # 조건 5: 밴드 하단 근처에서 반등
-            elif bb_position < 0.3 and price > current_row.get("BB_lower", price):
-                buy_conditions.append(True)
-                confidence += 20
-                reasons.append("밴드 하단 근처 반등")
-
-            if not any(buy_conditions):
-                continue
-
-            # 추가 확인 조건들
-
-            # RSI 필터 (과매수 구간 제외)
-            if self.config.rsi_filter:
-                rsi = current_row.get("RSI", 50)
-                if rsi < self.config.rsi_overbought:
-                    confidence += 15
-                    reasons.append(f"RSI 적정 구간 ({rsi:.1f})")
-                elif rsi > 75:  # 과매수 시 신뢰도 감소
-                    confidence -= 10
-
-            # 거래량 확인
-            if self.config.volume_confirmation:
-                volume_ratio = current_row.get("volume_ratio", 1.0)
-                if volume_ratio >= self.config.volume_threshold:
-                    confidence += 20
-                    reasons.append(f"거래량 증가 ({volume_ratio:.1f}x)")
-
-            # 밴드 확장 확인 (변동성 증가)
-            if current_row.get("band_expanding", False):
-                confidence += 10
-                reasons.append("밴드 확장 (변동성 증가)")
-
-            # 신뢰도 임계점 확인 (완화)
-            if confidence >= 50:  # 60에서 50으로 완화
-                reason = "; ".join(reasons)
-
-                signal = TradeSignal(
-                    timestamp=current_row.name,
-                    symbol=symbol,  # 실제 심볼 할당
-                    signal_type="BUY",
-                    price=price,
-                    confidence=confidence,
-                    reason=reason,
-                    indicators={
-                        "BB_upper": current_row.get("BB_upper", price),
-                        "BB_middle": current_row.get("BB_middle", price),
-                        "BB_lower": current_row.get("BB_lower", price),
-                        "BB_position": bb_position,
-                        "BB_width": bb_width,
-                        "RSI": current_row.get("RSI", 50),
-                        "volume_ratio": current_row.get("volume_ratio", 1.0),
-                    },
-                    risk_level=self._assess_risk_level(current_row, confidence),
-                )
+            signal = self._buy_signal_at(current_row, current_row.name, symbol)
+            if signal is not None:
                 signals.append(signal)
 
         return signals
 
+    def _buy_signal_at(self, current_row, timestamp, symbol: str = "") -> Optional[TradeSignal]:
+        """지표가 계산된 한 행의 매수 신호 (없으면 None)"""
+        # 데이터 부족 시 건너뛰기 (완화된 검증)
+        if pd.isna(current_row.get("BB_lower")) or pd.isna(current_row.get("close")):
+            return None
+
+        price = current_row["close"]
+        bb_position = current_row.get("BB_position", 0.5)
+        bb_width = current_row.get("BB_width", 0.05)
+        touching_lower = current_row.get("BB_touch_lower", False)
+        squeeze = current_row.get("BB_squeeze", False)
+
+        # 매수 조건들 (다양한 기회 제공)
+        buy_conditions = []
+        confidence = 0.0
+        reasons = []
+
+        # 조건 1: 하단 밴드 터치 후 반등
+        if touching_lower and bb_position > 0.1:
+            buy_conditions.append(True)
+            confidence += 40
+            reasons.append("하단 밴드 터치 후 반등")
+
+        # 조건 2: 스퀴즈 후 상승 돌파
+        elif squeeze and current_row.get("band_expanding", False) and price > current_row.get("BB_middle", price):
+            buy_conditions.append(True)
+            confidence += 35
+            reasons.append("스퀴즈 후 상승 돌파")
+
+        # 조건 3: 중간선 상승 돌파 (추세 추종)
+        elif (price > current_row.get("BB_middle", price) and 
+              current_row.get("close", 0) > current_row.get("SMA_20", 0) and 
+              bb_width > 0.03):
+            buy_conditions.append(True)
+            confidence += 30
+            reasons.append("중간선 상승 돌파")
+
+        # 조건 4: 밴드 중앙 근처에서 상승 추세
+        elif 0.3 <= bb_position <= 0.7 and price > current_row.get("close", price):
+            buy_conditions.append(True)
+            confidence += 25
+            reasons.append("밴드 중앙 상승 추세")
+
+        # 조건 5: 밴드 하단 근처에서 반등
+        elif bb_position < 0.3 and price > current_row.get("BB_lower", price):
+            buy_conditions.append(True)
+            confidence += 20
+            reasons.append("밴드 하단 근처 반등")
+
+        if not any(buy_conditions):
+            return None
+
+        # 추가 확인 조건들
+
+        # RSI 필터 (과매수 구간 제외)
+        if self.config.rsi_filter:
+            rsi = current_row.get("RSI", 50)
+            if rsi < self.config.rsi_overbought:
+                confidence += 15
+                reasons.append(f"RSI 적정 구간 ({rsi:.1f})")
+            elif rsi > 75:  # 과매수 시 신뢰도 감소
+                confidence -= 10
+
+        # 거래량 확인
+        if self.config.volume_confirmation:
+            volume_ratio = current_row.get("volume_ratio", 1.0)
+            if volume_ratio >= self.config.volume_threshold:
+                confidence += 20
+                reasons.append(f"거래량 증가 ({volume_ratio:.1f}x)")
+
+        # 밴드 확장 확인 (변동성 증가)
+        if current_row.get("band_expanding", False):
+            confidence += 10
+            reasons.append("밴드 확장 (변동성 증가)")
+
+        # 신뢰도 임계점 확인 (완화)
+        if confidence >= 50:  # 60에서 50으로 완화
+            reason = "; ".join(reasons)
+
+            signal = TradeSignal(
+                timestamp=timestamp,
+                symbol=symbol,  # 실제 심볼 할당
+                signal_type="BUY",
+                price=price,
+                confidence=confidence,
+                reason=reason,
+                indicators={
+                    "BB_upper": current_row.get("BB_upper", price),
+                    "BB_middle": current_row.get("BB_middle", price),
+                    "BB_lower": current_row.get("BB_lower", price),
+                    "BB_position": bb_position,
+                    "BB_width": bb_width,
+                    "RSI": current_row.get("RSI", 50),
+                    "volume_ratio": current_row.get("volume_ratio", 1.0),
+                },
+                risk_level=self._assess_risk_level(current_row, confidence),
+            )
+            return signal
+
+        return None
+
     def _generate_sell_signals(self, df: pd.DataFrame, symbol: str) -> List[TradeSignal]:
         """매도 신호 생성"""
         signals = []
 
         for i in range(len(df)):
             current_row = df.iloc[i]
-
-            # 데이터 부족 시 건너뛰기
-            if pd.isna(current_row.get("BB_upper")) or pd.isna(
-                current_row.get("BB_position")
-            ):
-                continue
-
-            price = current_row["close"]
-            bb_position = current_row["BB_position"]
-            bb_width = current_row["BB_width"]
-            touching_upper = current_row.get("touching_upper", False)
-            breaking_upper = current_row.get("breaking_upper", False)
-
-            # 기본 매도 조건들
-            sell_conditions = []
-            confidence = 0.0
-            reasons = []
-
-            # 조건 1: 상단 밴드 터치/돌파 후 하락
-            if (touching_upper or breaking_upper) and bb_position > 0.8:
-                sell_conditions.append(True)
-                confidence += 40
-                reasons.append("상단 밴드 터치 후 하락")
-
-            # 조건 2: 중간선 하락 이탈 (추세 전환)
-            elif (
-                price < current_row["BB_middle"]
-                and current_row["close"] < current_row["SMA_20"]
-                and bb_width > 0.03
-            ):  # 충분한 변동성
-                sell_conditions.append(True)
-                confidence += 30
-                reasons.append("중간선 하락 이탈")
-
-            # 조건 3: 밴드 압축 시작 (변동성 감소)
-            elif (
-                current_row.get("band_contracting", False)
-                and bb_position > 0.7
-                and bb_width < 0.025
-            ):
-                sell_conditions.append(True)
-                confidence += 25
-                reasons.append("밴드 압축 시작")
-
-            if not any(sell_conditions):
-                continue
-
-            # 추가 확인 조건들
-
-            # RSI 필터 (과매도 구간 제외)
-            if self.config.rsi_filter:
-                rsi = current_row.get("RSI", 50)
-                if rsi > self.config.rsi_oversold:
-                    confidence += 15
-                    reasons.append(f"RSI 적정 구간 ({rsi:.1f})")
-                elif rsi < 25:  # 과매도 시 신뢰도 감소
-                    confidence -= 10
-
-            # 거래량 확인
-            if self.config.volume_confirmation:
-                volume_ratio = current_row.get("volume_ratio", 1.0)
-                if volume_ratio >= self.config.volume_threshold:
-                    confidence += 20
-                    reasons.append(f"거래량 증가 ({volume_ratio:.1f}x)")
-
-            # 밴드 위치 극단 확인
-            if bb_position > 0.9:
-                confidence += 15
-                reasons.append("밴드 상단 극단")
-
-            # 신뢰도 임계점 확인
-            if confidence >= 60:
-                reason = "; ".join(reasons)
-
-                signal = TradeSignal(
-                    timestamp=current_row.name,
-                    symbol=symbol,  # 실제 심볼 할당
-                    signal_type="SELL",
-                    price=price,
-                    confidence=confidence,
-                    reason=reason,
-                    indicators={
-                        "BB_upper": current_row["BB_upper"],
-                        "BB_middle": current_row["BB_middle"],
-                        "BB_lower": current_row["BB_lower"],
-                        "BB_position": bb_position,
-                        "BB_width": bb_width,
-                        "RSI": current_row.get("RSI", 50),
-                        "volume_ratio": current_row.get("volume_ratio", 1.0),
-                    },
-                    risk_level=self._assess_risk_level(current_row, confidence),
-                )
+            signal = self._sell_signal_at(current_row, current_row.name, symbol)
+            if signal is not None:
                 signals.append(signal)
 
         return signals
 
+    def _sell_signal_at(self, current_row, timestamp, symbol: str = "") -> Optional[TradeSignal]:
+        """지표가 계산된 한 행의 매도 신호 (없으면 None)"""
+        # 데이터 부족 시 건너뛰기
+        if pd.isna(current_row.get("BB_upper")) or pd.isna(
+            current_row.get("BB_position")
+        ):
+            return None
+
+        price = current_row["close"]
+        bb_position = current_row["BB_position"]
+        bb_width = current_row["BB_width"]
+        touching_upper = current_row.get("touching_upper", False)
+        breaking_upper = current_row.get("breaking_upper", False)
+
+        # 기본 매도 조건들
+        sell_conditions = []
+        confidence = 0.0
+        reasons = []
+
+        # 조건 1: 상단 밴드 터치/돌파 후 하락
+        if (touching_upper or breaking_upper) and bb_position > 0.8:
+            sell_conditions.append(True)
+            confidence += 40
+            reasons.append("상단 밴드 터치 후 하락")
+
+        # 조건 2: 중간선 하락 이탈 (추세 전환)
+        elif (
+            price < current_row["BB_middle"]
+            and current_row["close"] < current_row["SMA_20"]
+            and bb_width > 0.03
+        ):  # 충분한 변동성
+            sell_conditions.append(True)
+            confidence += 30
+            reasons.append("중간선 하락 이탈")
+
+        # 조건 3: 밴드 압축 시작 (변동성 감소)
+        elif (
+            current_row.get("band_contracting", False)
+            and bb_position > 0.7
+            and bb_width < 0.025
+        ):
+            sell_conditions.append(True)
+            confidence += 25
+            reasons.append("밴드 압축 시작")
+
+        if not any(sell_conditions):
+            return None
+
+        # 추가 확인 조건들
+
+        # RSI 필터 (과매도 구간 제외)
+        if self.config.rsi_filter:
+            rsi = current_row.get("RSI", 50)
+            if rsi > self.config.rsi_oversold:
+                confidence += 15
+                reasons.append(f"RSI 적정 구간 ({rsi:.1f})")
+            elif rsi < 25:  # 과매도 시 신뢰도 감소
+                confidence -= 10
+
+        # 거래량 확인
+        if self.config.volume_confirmation:
+            volume_ratio = current_row.get("volume_ratio", 1.0)
+            if volume_ratio >= self.config.volume_threshold:
+                confidence += 20
+                reasons.append(f"거래량 증가 ({volume_ratio:.1f}x)")
+
+        # 밴드 위치 극단 확인
+        if bb_position > 0.9:
+            confidence += 15
+            reasons.append("밴드 상단 극단")
+
+        # 신뢰도 임계점 확인
+        if confidence >= 60:
+            reason = "; ".join(reasons)
+
+            signal = TradeSignal(
+                timestamp=timestamp,
+                symbol=symbol,  # 실제 심볼 할당
+                signal_type="SELL",
+                price=price,
+                confidence=confidence,
+                reason=reason,
+                indicators={
+                    "BB_upper": current_row["BB_upper"],
+                    "BB_middle": current_row["BB_middle"],
+                    "BB_lower": current_row["BB_lower"],
+                    "BB_position": bb_position,
+                    "BB_width": bb_width,
+                    "RSI": current_row.get("RSI", 50),
+                    "volume_ratio": current_row.get("volume_ratio", 1.0),
+                },
+                risk_level=self._assess_risk_level(current_row, confidence),
+            )
+            return signal
+
+        return None
+
     def generate_signals(self, data: pd.DataFrame, symbol: str = None) -> list:
         """Bollinger Band 신호 생성: 데이터 컬럼 체크 및 예외 발생 시 빈 리스트 반환, 상세 로깅"""
         logger.debug(f"[BollingerBandStrategy] 입력 데이터 shape: {data.shape}, 컬럼: {list(data.columns)}")
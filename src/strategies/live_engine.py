@@ -0,0 +1,380 @@
+"""
+실시간 증분 신호 엔진
+
+generate_signals는 매번 전체 이력 DataFrame으로 지표를 다시 계산하므로 새 봉마다
+O(이력) 비용이 듭니다. LiveSignalEngine은 (종목, 전략)마다 증분 지표 상태를 유지하고
+새 봉이 들어오면 마지막 봉 한 행만 만들어 전략의 행 단위 판정(evaluate_row)에 넘깁니다.
+
+- 지표 행은 배치 경로(calculate_indicators)와 같은 컬럼 이름/계산 방식으로 구성
+  (배치에 없는 컬럼은 행에도 없어야 .get 기본값이 같게 적용됨)
+- 판정 로직은 배치와 같은 _buy_signal_at / _sell_signal_at / _signal_at 메서드를 공유
+- 신호는 콜백(on_signal(strategy_name, signal))과 큐((strategy_name, signal))로 전달
+- 같은 이력을 재생하면 generate_signals와 같은 신호 (TA-Lib 지표는 반올림 오차 범위까지 일치)
+
+사용 예시:
+    engine = LiveSignalEngine([RSIStrategy(), MACDStrategy()], on_signal=handle_signal)
+    engine.warm_up("005930", daily_history)          # 과거 일봉으로 상태만 채움
+    aggregator.subscribe(engine.on_bars, intervals=["1d"])
+"""
+
+import logging
+from collections import deque
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+from src.data.bar_aggregator import bar_start_to_datetime
+from src.data.indicators import SWING_TRADING_PARAMS
+from src.data.streaming_indicators import (
+    EWMMean,
+    NAN,
+    RollingMean,
+    TalibATR,
+    TalibBBands,
+    TalibMACD,
+    TalibRSI,
+    TalibSMA,
+    safe_divide,
+)
+
+from .base_strategy import BaseStrategy, TradeSignal
+from .bollinger_band_strategy import BollingerBandStrategy
+from .macd_strategy import MACDStrategy
+from .moving_average_strategy import MovingAverageStrategy
+from .rsi_strategy import RSIStrategy
+
+logger = logging.getLogger(__name__)
+
+SignalCallback = Callable[[str, TradeSignal], None]
+
+
+class _VolumeRatio:
+    """volume / volume.rolling(20).mean()"""
+
+    __slots__ = ("_sma",)
+
+    def __init__(self):
+        self._sma = RollingMean(20)
+
+    def update(self, volume: float) -> float:
+        return safe_divide(volume, self._sma.update(volume))
+
+
+class _RSIFeatures:
+    """RSIStrategy.calculate_indicators의 한 행"""
+
+    def __init__(self, strategy: RSIStrategy):
+        self._rsi = TalibRSI(SWING_TRADING_PARAMS["RSI"]["period"])
+        self._rsi_sma = RollingMean(5)
+        self._sma_20 = TalibSMA(SWING_TRADING_PARAMS["SMA"]["medium"])
+        self._volume_ratio = _VolumeRatio()
+        self._prev_rsi = NAN
+
+    def update(self, open_, high, low, close, volume) -> dict:
+        rsi = self._rsi.update(close)
+        prev_rsi, self._prev_rsi = self._prev_rsi, rsi
+        return {
+            "close": close,
+            "RSI": rsi,
+            "RSI_SMA": self._rsi_sma.update(rsi),
+            "RSI_rising": rsi > prev_rsi,
+            "RSI_falling": rsi < prev_rsi,
+            "SMA_20": self._sma_20.update(close),
+            "volume_ratio": self._volume_ratio.update(volume),
+        }
+
+
+class _MovingAverageFeatures:
+    """MovingAverageStrategy.calculate_indicators의 한 행"""
+
+    def __init__(self, strategy: MovingAverageStrategy):
+        config = strategy.config
+        self._triple = config.use_triple_ma
+        self._sma_fast = RollingMean(config.fast_period)
+        self._sma_slow = RollingMean(config.slow_period)
+        self._ema_fast = EWMMean(config.fast_period)
+        self._ema_slow = EWMMean(config.slow_period)
+        if self._triple:
+            self._sma_long = RollingMean(config.long_period)
+            self._ema_long = EWMMean(config.long_period)
+        self._atr = TalibATR(SWING_TRADING_PARAMS["ATR"]["period"])
+        self._volume_ratio = _VolumeRatio()
+        # 기울기 계산용 (현재 포함 6개 = shift(5))
+        self._fast_history = deque([NAN] * 6, maxlen=6)
+        self._slow_history = deque([NAN] * 6, maxlen=6)
+        self._prev = (NAN, NAN, NAN, NAN)
+
+    def update(self, open_, high, low, close, volume) -> dict:
+        sma_fast = self._sma_fast.update(close)
+        sma_slow = self._sma_slow.update(close)
+        ema_fast = self._ema_fast.update(close)
+        ema_slow = self._ema_slow.update(close)
+        prev_sma_fast, prev_sma_slow, prev_ema_fast, prev_ema_slow = self._prev
+        self._prev = (sma_fast, sma_slow, ema_fast, ema_slow)
+
+        self._fast_history.append(sma_fast)
+        self._slow_history.append(sma_slow)
+        fast_5, slow_5 = self._fast_history[0], self._slow_history[0]
+
+        row = {
+            "close": close,
+            "SMA_fast": sma_fast,
+            "SMA_slow": sma_slow,
+            "EMA_fast": ema_fast,
+            "EMA_slow": ema_slow,
+            "golden_cross": sma_fast > sma_slow and prev_sma_fast <= prev_sma_slow,
+            "dead_cross": sma_fast < sma_slow and prev_sma_fast >= prev_sma_slow,
+            "ema_golden_cross": ema_fast > ema_slow and prev_ema_fast <= prev_ema_slow,
+            "ema_dead_cross": ema_fast < ema_slow and prev_ema_fast >= prev_ema_slow,
+            "sma_fast_slope": safe_divide(sma_fast - fast_5, fast_5),
+            "sma_slow_slope": safe_divide(sma_slow - slow_5, slow_5),
+            "price_above_fast": close > sma_fast,
+            "price_above_slow": close > sma_slow,
+            "volume_ratio": self._volume_ratio.update(volume),
+            "ma_distance": safe_divide(sma_fast - sma_slow, sma_slow),
+            "atr_ratio": safe_divide(self._atr.update(high, low, close), close),
+        }
+        if self._triple:
+            sma_long = self._sma_long.update(close)
+            row["SMA_long"] = sma_long
+            row["EMA_long"] = self._ema_long.update(close)
+            row["bullish_alignment"] = sma_fast > sma_slow and sma_slow > sma_long
+            row["bearish_alignment"] = sma_fast < sma_slow and sma_slow < sma_long
+        else:
+            row["bullish_alignment"] = sma_fast > sma_slow
+            row["bearish_alignment"] = sma_fast < sma_slow
+        return row
+
+
+class _BollingerFeatures:
+    """BollingerBandStrategy.calculate_indicators의 한 행"""
+
+    def __init__(self, strategy: BollingerBandStrategy):
+        bb_params = SWING_TRADING_PARAMS["BB"]
+        self._bands = TalibBBands(bb_params["period"], bb_params["deviation"], bb_params["deviation"])
+        self._width_mean = RollingMean(20)
+        self._sma_20 = TalibSMA(SWING_TRADING_PARAMS["SMA"]["medium"])
+        self._rsi = TalibRSI(SWING_TRADING_PARAMS["RSI"]["period"])
+        self._volume_ratio = _VolumeRatio()
+
+    def update(self, open_, high, low, close, volume) -> dict:
+        upper, middle, lower = self._bands.update(close)
+        width = safe_divide(upper - lower, middle) * 100
+        return {
+            "close": close,
+            "BB_upper": upper,
+            "BB_middle": middle,
+            "BB_lower": lower,
+            "BB_width": width,
+            "BB_percent": safe_divide(close - lower, upper - lower),
+            "BB_squeeze": width < self._width_mean.update(width) * 0.8,
+            "BB_touch_upper": close >= upper * 0.98,
+            "BB_touch_lower": close <= lower * 1.02,
+            "SMA_20": self._sma_20.update(close),
+            "RSI": self._rsi.update(close),
+            "volume_ratio": self._volume_ratio.update(volume),
+        }
+
+
+class _MACDFeatures:
+    """MACDStrategy.generate_signals가 만드는 한 행"""
+
+    def __init__(self, strategy: MACDStrategy):
+        self._macd = TalibMACD(strategy.fast_period, strategy.slow_period, strategy.signal_period)
+        self._rsi = TalibRSI(SWING_TRADING_PARAMS["RSI"]["period"])
+        self._atr = TalibATR(SWING_TRADING_PARAMS["ATR"]["period"])
+        self._volume_ratio = _VolumeRatio()
+        self._prev = (NAN, NAN, NAN)
+
+    def update(self, open_, high, low, close, volume) -> dict:
+        macd, signal, hist = self._macd.update(close)
+        prev_macd, prev_signal, prev_hist = self._prev
+        self._prev = (macd, signal, hist)
+        return {
+            "close": close,
+            "MACD": macd,
+            "MACD_signal": signal,
+            "MACD_hist": hist,
+            "macd_cross_above": macd > signal and prev_macd <= prev_signal,
+            "macd_cross_below": macd < signal and prev_macd >= prev_signal,
+            "hist_change": hist - prev_hist,
+            "MACD_change": macd - prev_macd,
+            "RSI": self._rsi.update(close),
+            "volume_ratio": self._volume_ratio.update(volume),
+            "ATR": self._atr.update(high, low, close),
+        }
+
+
+# isinstance 검사 순서대로 매칭 (하위 클래스가 먼저)
+_FEATURE_BUILDERS = (
+    (MACDStrategy, _MACDFeatures),
+    (BollingerBandStrategy, _BollingerFeatures),
+    (RSIStrategy, _RSIFeatures),
+    (MovingAverageStrategy, _MovingAverageFeatures),
+)
+
+
+def _feature_builder(strategy: BaseStrategy):
+    for strategy_class, builder in _FEATURE_BUILDERS:
+        if isinstance(strategy, strategy_class):
+            return builder
+    raise ValueError(f"실시간 지표를 지원하지 않는 전략입니다: {type(strategy).__name__}")
+
+
+class _StrategyState:
+    """(종목, 전략)별 증분 지표와 직전 행"""
+
+    __slots__ = ("features", "prev_row")
+
+    def __init__(self, features):
+        self.features = features
+        self.prev_row = None
+
+
+class LiveSignalEngine:
+    """
+    스트리밍 봉 기반 실시간 신호 엔진
+
+    Args:
+        strategies: 평가할 전략 목록 (RSI/MACD/볼린저 밴드/이동평균)
+        on_signal: 신호 콜백 (strategy_name, signal)
+        queue: (strategy_name, signal)을 put_nowait로 넣을 큐 (queue.Queue 또는 asyncio.Queue)
+        interval: on_bars에서 받을 봉 주기 (TickBarAggregator 주기 문자열)
+    """
+
+    def __init__(
+        self,
+        strategies: Optional[Iterable[BaseStrategy]] = None,
+        on_signal: Optional[SignalCallback] = None,
+        queue=None,
+        interval: str = "1d",
+    ):
+        self.on_signal = on_signal
+        self.queue = queue
+        self.interval = interval
+        self._strategies: Dict[str, BaseStrategy] = {}
+        self._builders: Dict[str, type] = {}
+        self._states: Dict[str, Dict[str, _StrategyState]] = {}
+        self.stats = {"bars": 0, "signals": 0, "errors": 0, "dropped": 0}
+
+        for strategy in strategies or ():
+            self.add_strategy(strategy)
+
+    @property
+    def strategy_names(self) -> List[str]:
+        return list(self._strategies)
+
+    @property
+    def symbols(self) -> List[str]:
+        return list(self._states)
+
+    def add_strategy(self, strategy: BaseStrategy, name: Optional[str] = None) -> str:
+        """
+        전략 등록 (이미 상태가 있는 종목은 reset(symbol) 후 다시 warm_up 필요)
+
+        Returns:
+            신호에 붙는 전략 이름
+        """
+        name = name or strategy.name
+        if name in self._strategies:
+            raise ValueError(f"이미 등록된 전략 이름입니다: {name}")
+        self._builders[name] = _feature_builder(strategy)
+        self._strategies[name] = strategy
+        logger.info(f"실시간 신호 엔진 전략 등록: {name}")
+        return name
+
+    def reset(self, symbol: Optional[str] = None) -> None:
+        """종목(또는 전체) 지표 상태 초기화"""
+        if symbol is None:
+            self._states.clear()
+        else:
+            self._states.pop(symbol, None)
+
+    def on_bar(
+        self,
+        symbol: str,
+        timestamp,
+        open_: float,
+        high: float,
+        low: float,
+        close: float,
+        volume: float,
+        emit: bool = True,
+    ) -> List[Tuple[str, TradeSignal]]:
+        """
+        완성된 봉 하나를 모든 전략 상태에 반영하고 마지막 봉 신호를 판정
+
+        Args:
+            emit: False이면 상태만 갱신 (워밍업)
+
+        Returns:
+            (전략 이름, 신호) 목록
+        """
+        states = self._states.get(symbol)
+        if states is None:
+            states = self._states[symbol] = {}
+        self.stats["bars"] += 1
+
+        results = []
+        for name, strategy in self._strategies.items():
+            state = states.get(name)
+            if state is None:
+                state = states[name] = _StrategyState(self._builders[name](strategy))
+            row = state.features.update(open_, high, low, close, volume)
+
+            if emit:
+                try:
+                    signals = strategy.evaluate_row(row, timestamp, symbol, state.prev_row)
+                except Exception as e:
+                    self.stats["errors"] += 1
+                    logger.error(f"{symbol} {name} 실시간 신호 판정 실패: {e}")
+                    signals = []
+                results.extend((name, signal) for signal in signals)
+            state.prev_row = row
+
+        for name, signal in results:
+            self._emit(name, signal)
+        return results
+
+    def on_bars(self, bars) -> List[Tuple[str, TradeSignal]]:
+        """TickBarAggregator 구독 콜백 (설정한 주기의 봉만 처리)"""
+        results = []
+        for bar in bars:
+            if bar.interval != self.interval:
+                continue
+            results.extend(self.on_bar(
+                bar.symbol, bar_start_to_datetime(bar.start),
+                bar.open, bar.high, bar.low, bar.close, bar.volume,
+            ))
+        return results
+
+    def warm_up(self, symbol: str, history: pd.DataFrame) -> int:
+        """과거 OHLCV로 지표 상태만 채움 (신호 없음). 반영한 봉 수 반환"""
+        self._replay(symbol, history, emit=False)
+        return len(history)
+
+    def replay(self, symbol: str, history: pd.DataFrame) -> List[Tuple[str, TradeSignal]]:
+        """과거 OHLCV를 한 봉씩 재생하며 신호 판정 (인덱스가 신호 시각)"""
+        return self._replay(symbol, history, emit=True)
+
+    def _replay(self, symbol: str, history: pd.DataFrame, emit: bool) -> List[Tuple[str, TradeSignal]]:
+        columns = [history[col].astype(float).tolist() for col in ("open", "high", "low", "close", "volume")]
+        results = []
+        for timestamp, *ohlcv in zip(history.index, *columns):
+            results.extend(self.on_bar(symbol, timestamp, *ohlcv, emit=emit))
+        return results
+
+    def _emit(self, name: str, signal: TradeSignal) -> None:
+        self.stats["signals"] += 1
+        if self.on_signal is not None:
+            try:
+                self.on_signal(name, signal)
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.error(f"신호 콜백 실행 실패 ({name}): {e}")
+        if self.queue is not None:
+            try:
+                self.queue.put_nowait((name, signal))
+            except Exception as e:
+                self.stats["dropped"] += 1
+                logger.warning(f"신호 큐 적재 실패 ({name} {signal.symbol}): {e}")
@@ -9,7 +9,7 @@ import pandas as pd
 import numpy as np
 import talib
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import logging
 from dataclasses import dataclass
 
@@ -130,10 +130,15 @@ class MACDStrategy(BaseStrategy):
                 logger.error(f"[MACDStrategy] 필수 컬럼 누락: {col}")
                 return []
         try:
-            import talib
-            df = data.copy()
-            # talib.MACD 계산 및 컬럼명 통일
-            macd, macd_signal, macd_hist = talib.MACD(df['close'], fastperiod=12, slowperiod=26, signalperiod=9)
+            # 신뢰도/리스크 계산에 쓰는 RSI, ATR 등이 없으면 통합 지표부터 계산
+            df = data.copy() if "RSI" in data.columns else self.calculate_indicators(data)
+            # talib.MACD 계산 및 컬럼명 통일 (전략 설정 기간 사용)
+            macd, macd_signal, macd_hist = talib.MACD(
+                df['close'],
+                fastperiod=self.fast_period,
+                slowperiod=self.slow_period,
+                signalperiod=self.signal_period,
+            )
             df['MACD'] = macd
             df['MACD_signal'] = macd_signal
             df['MACD_hist'] = macd_hist
@@ -150,109 +155,9 @@ class MACDStrategy(BaseStrategy):
                     continue
 
                 current_row = df.iloc[i]
-                prev_row = df.iloc[i - 1]
-
-                # 필수 값 확인
-                if pd.isna(current_row["MACD"]) or pd.isna(current_row["MACD_signal"]):
-                    continue
-
-                signal = None
-                reason = ""
-                confidence = 0.5
-
-                # 매수 신호 조건들
-                buy_conditions = []
-
-                # 1. MACD 골든크로스
-                if "macd_cross_above" in current_row and current_row["macd_cross_above"]:
-                    buy_conditions.append("MACD 골든크로스")
-
-                # 2. MACD 히스토그램 상승 전환
-                if (
-                    "MACD_hist" in current_row and "hist_change" in current_row and
-                    current_row["MACD_hist"] > self.histogram_threshold
-                    and prev_row["MACD_hist"] <= self.histogram_threshold
-                    and current_row["hist_change"] > 0
-                ):
-                    buy_conditions.append("히스토그램 상승 전환")
-
-                # 3. MACD 라인이 0선 위에서 상승
-                if (
-                    "MACD" in current_row and "MACD_change" in current_row and "MACD_signal" in current_row and
-                    current_row["MACD"] > 0
-                    and current_row["MACD_change"] > 0
-                    and current_row["MACD"] > current_row["MACD_signal"]
-                ):
-                    buy_conditions.append("0선 위 MACD 상승")
-
-                # 매도 신호 조건들
-                sell_conditions = []
-
-                # 1. MACD 데드크로스
-                if "macd_cross_below" in current_row and current_row["macd_cross_below"]:
-                    sell_conditions.append("MACD 데드크로스")
-
-                # 2. MACD 히스토그램 하락 전환
-                if (
-                    "MACD_hist" in current_row and "hist_change" in current_row and
-                    current_row["MACD_hist"] < -self.histogram_threshold
-                    and prev_row["MACD_hist"] >= -self.histogram_threshold
-                    and current_row["hist_change"] < 0
-                ):
-                    sell_conditions.append("히스토그램 하락 전환")
-
-                # 3. MACD 라인이 0선 아래에서 하락
-                if (
-                    "MACD" in current_row and "MACD_change" in current_row and "MACD_signal" in current_row and
-                    current_row["MACD"] < 0
-                    and current_row["MACD_change"] < 0
-                    and current_row["MACD"] < current_row["MACD_signal"]
-                ):
-                    sell_conditions.append("0선 아래 MACD 하락")
-
-                # 신호 결정
-                if buy_conditions:
-                    signal_type = "BUY"
-                    reason = " + ".join(buy_conditions)
-
-                    # 추가 필터 적용
-                    if self._apply_buy_filters(current_row):
-                        confidence = self._calculate_buy_confidence(current_row)
-                    else:
-                        continue  # 필터 통과 실패
-
-                elif sell_conditions:
-                    signal_type = "SELL"
-                    reason = " + ".join(sell_conditions)
-
-                    # 추가 필터 적용
-                    if self._apply_sell_filters(current_row):
-                        confidence = self._calculate_sell_confidence(current_row)
-                    else:
-                        continue  # 필터 통과 실패
-
-                else:
-                    continue  # 신호 없음
-
-                # TradeSignal 생성
-                signal = TradeSignal(
-                    timestamp=current_row.name,  # 인덱스에서 날짜 가져오기
-                    symbol=symbol,
-                    signal_type=signal_type,
-                    price=current_row["close"],
-                    confidence=confidence,
-                    reason=reason,
-                    indicators={
-                        "MACD": current_row.get("MACD", np.nan),
-                        "MACD_signal": current_row.get("MACD_signal", np.nan),
-                        "MACD_hist": current_row.get("MACD_hist", np.nan),
-                        "RSI": current_row.get("RSI", np.nan),
-                        "volume_ratio": current_row.get("volume_ratio", 1.0),
-                    },
-                    risk_level=self._assess_risk_level(current_row, confidence),
-                )
-
-                signals.append(signal)
+                signal = self._signal_at(current_row, df.iloc[i - 1], current_row.name, symbol)
+                if signal is not None:
+                    signals.append(signal)
 
             logger.debug(f"[MACDStrategy] 생성된 신호 수: {len(signals)}")
             return signals
@@ -260,6 +165,117 @@ class MACDStrategy(BaseStrategy):
             logger.error(f"[MACDStrategy] 신호 생성 중 예외 발생: {e}")
             return []
 
+    def evaluate_row(self, row, timestamp, symbol: str = "", prev_row=None) -> List[TradeSignal]:
+        """한 행 신호 판정 (히스토그램 전환 비교에 직전 행 필요)"""
+        if prev_row is None:
+            return []
+        signal = self._signal_at(row, prev_row, timestamp, symbol)
+        return [signal] if signal is not None else []
+
+    def _signal_at(self, current_row, prev_row, timestamp, symbol: str = "") -> Optional[TradeSignal]:
+        """지표가 계산된 한 행(과 직전 행)의 매수/매도 신호 (없으면 None)"""
+        # 필수 값 확인
+        if pd.isna(current_row["MACD"]) or pd.isna(current_row["MACD_signal"]):
+            return None
+
+        signal = None
+        reason = ""
+        confidence = 0.5
+
+        # 매수 신호 조건들
+        buy_conditions = []
+
+        # 1. MACD 골든크로스
+        if "macd_cross_above" in current_row and current_row["macd_cross_above"]:
+            buy_conditions.append("MACD 골든크로스")
+
+        # 2. MACD 히스토그램 상승 전환
+        if (
+            "MACD_hist" in current_row and "hist_change" in current_row and
+            current_row["MACD_hist"] > self.histogram_threshold
+            and prev_row["MACD_hist"] <= self.histogram_threshold
+            and current_row["hist_change"] > 0
+        ):
+            buy_conditions.append("히스토그램 상승 전환")
+
+        # 3. MACD 라인이 0선 위에서 상승
+        if (
+            "MACD" in current_row and "MACD_change" in current_row and "MACD_signal" in current_row and
+            current_row["MACD"] > 0
+            and current_row["MACD_change"] > 0
+            and current_row["MACD"] > current_row["MACD_signal"]
+        ):
+            buy_conditions.append("0선 위 MACD 상승")
+
+        # 매도 신호 조건들
+        sell_conditions = []
+
+        # 1. MACD 데드크로스
+        if "macd_cross_below" in current_row and current_row["macd_cross_below"]:
+            sell_conditions.append("MACD 데드크로스")
+
+        # 2. MACD 히스토그램 하락 전환
+        if (
+            "MACD_hist" in current_row and "hist_change" in current_row and
+            current_row["MACD_hist"] < -self.histogram_threshold
+            and prev_row["MACD_hist"] >= -self.histogram_threshold
+            and current_row["hist_change"] < 0
+        ):
+            sell_conditions.append("히스토그램 하락 전환")
+
+        # 3. MACD 라인이 0선 아래에서 하락
+        if (
+            "MACD" in current_row and "MACD_change" in current_row and "MACD_signal" in current_row and
+            current_row["MACD"] < 0
+            and current_row["MACD_change"] < 0
+            and current_row["MACD"] < current_row["MACD_signal"]
+        ):
+            sell_conditions.append("0선 아래 MACD 하락")
+
+        # 신호 결정
+        if buy_conditions:
+            signal_type = "BUY"
+            reason = " + ".join(buy_conditions)
+
+            # 추가 필터 적용
+            if self._apply_buy_filters(current_row):
+                confidence = self._calculate_buy_confidence(current_row)
+            else:
+                return None  # 필터 통과 실패
+
+        elif sell_conditions:
+            signal_type = "SELL"
+            reason = " + ".join(sell_conditions)
+
+            # 추가 필터 적용
+            if self._apply_sell_filters(current_row):
+                confidence = self._calculate_sell_confidence(current_row)
+            else:
+                return None  # 필터 통과 실패
+
+        else:
+            return None  # 신호 없음
+
+        # TradeSignal 생성
+        signal = TradeSignal(
+            timestamp=timestamp,
+            symbol=symbol,
+            signal_type=signal_type,
+            price=current_row["close"],
+            confidence=confidence,
+            reason=reason,
+            indicators={
+                "MACD": current_row.get("MACD", np.nan),
+                "MACD_signal": current_row.get("MACD_signal", np.nan),
+                "MACD_hist": current_row.get("MACD_hist", np.nan),
+                "RSI": current_row.get("RSI", np.nan),
+                "volume_ratio": current_row.get("volume_ratio", 1.0),
+            },
+            risk_level=self._assess_risk_level(current_row, confidence),
+        )
+
+        return signal
+
     def _apply_buy_filters(self, row: pd.Series) -> bool:
         """매수 신호 추가 필터 (완화된 버전)"""
         filters_passed = []
@@ -171,84 +171,91 @@ class MovingAverageStrategy(BaseStrategy):
 
         for i in range(len(df)):
             current_row = df.iloc[i]
+            signal = self._buy_signal_at(current_row, current_row.name)
+            if signal is not None:
+                signals.append(signal)
 
-            # 데이터 부족 시 건너뛰기
-            if pd.isna(current_row.get("SMA_fast")) or pd.isna(current_row.get("SMA_slow")):
-                continue
-
-            # 기본 매수 조건들
-            golden_cross = current_row.get("golden_cross", False)
-            ema_golden_cross = current_row.get("ema_golden_cross", False)
-            bullish_alignment = current_row.get("bullish_alignment", False)
-            price_above_fast = current_row.get("price_above_fast", False)
-
-            # 주요 매수 신호 조건
-            if not (golden_cross or ema_golden_cross or (bullish_alignment and price_above_fast)):
-                continue
-
-            # 신뢰도 계산
-            confidence = 40.0
-            reasons = []
-
-            # 신호 타입별 가중치
-            if golden_cross:
-                confidence += 25
-                reasons.append("SMA 골든크로스")
-            if ema_golden_cross:
-                confidence += 20
-                reasons.append("EMA 골든크로스")
-            if bullish_alignment:
-                confidence += 15
-                reasons.append("상승 정렬")
-            if price_above_fast:
-                confidence += 10
-                reasons.append("주가 > 단기MA")
+        return signals
+
+    def _buy_signal_at(self, current_row, timestamp, symbol: str = "") -> Optional[TradeSignal]:
+        """지표가 계산된 한 행의 매수 신호 (없으면 None)"""
+        # 데이터 부족 시 건너뛰기
+        if pd.isna(current_row.get("SMA_fast")) or pd.isna(current_row.get("SMA_slow")):
+            return None
+
+        # 기본 매수 조건들
+        golden_cross = current_row.get("golden_cross", False)
+        ema_golden_cross = current_row.get("ema_golden_cross", False)
+        bullish_alignment = current_row.get("bullish_alignment", False)
+        price_above_fast = current_row.get("price_above_fast", False)
+
+        # 주요 매수 신호 조건
+        if not (golden_cross or ema_golden_cross or (bullish_alignment and price_above_fast)):
+            return None
+
+        # 신뢰도 계산
+        confidence = 40.0
+        reasons = []
+
+        # 신호 타입별 가중치
+        if golden_cross:
+            confidence += 25
+            reasons.append("SMA 골든크로스")
+        if ema_golden_cross:
+            confidence += 20
+            reasons.append("EMA 골든크로스")
+        if bullish_alignment:
+            confidence += 15
+            reasons.append("상승 정렬")
+        if price_above_fast:
+            confidence += 10
+            reasons.append("주가 > 단기MA")
+
+        # 추가 확인 조건들
+        sma_fast_slope = current_row.get("sma_fast_slope", 0)
+        volume_ratio = current_row.get("volume_ratio", 1.0)
+        atr_ratio = current_row.get("atr_ratio", 0.02)
 
-            # 추가 확인 조건들
-            sma_fast_slope = current_row.get("sma_fast_slope", 0)
-            volume_ratio = current_row.get("volume_ratio", 1.0)
-            atr_ratio = current_row.get("atr_ratio", 0.02)
+        # 기울기 확인
+        if sma_fast_slope and sma_fast_slope > self.config.slope_threshold:
+            confidence += 10
+            reasons.append("상승 추세")
 
-            # 기울기 확인
-            if sma_fast_slope and sma_fast_slope > self.config.slope_threshold:
+        # 거래량 확인
+        if self.config.volume_confirmation and volume_ratio:
+            if volume_ratio >= self.config.volume_threshold:
+                confidence += 15
+                reasons.append(f"거래량 증가 ({volume_ratio:.1f}x)")
+
+        # ATR 필터
+        if self.config.atr_filter and atr_ratio:
+            if atr_ratio >= self.config.min_atr_ratio:
                 confidence += 10
-                reasons.append("상승 추세")
-
-            # 거래량 확인
-            if self.config.volume_confirmation and volume_ratio:
-                if volume_ratio >= self.config.volume_threshold:
-                    confidence += 15
-                    reasons.append(f"거래량 증가 ({volume_ratio:.1f}x)")
-
-            # ATR 필터
-            if self.config.atr_filter and atr_ratio:
-                if atr_ratio >= self.config.min_atr_ratio:
-                    confidence += 10
-                    reasons.append("충분한 변동성")
-
-            # 신뢰도 임계점 확인
-            if confidence >= 60:
-                reason = "; ".join(reasons)
-                price = current_row["close"]
-
-                signal = TradeSignal(
-                    timestamp=current_row.name,
-                    symbol="",  # run_strategy에서 설정
-                    signal_type="BUY",
-                    price=price,
-                    confidence=confidence,
-                    reason=reason,
-                    indicators={
-                        "SMA_fast": current_row["SMA_fast"],
-                        "SMA_slow": current_row["SMA_slow"],
-                        "ma_distance": current_row.get("ma_distance", 0),
-                        "volume_ratio": volume_ratio,
-                    },
-                    risk_level=self._assess_risk_level(current_row, confidence),
-                )
-                signals.append(signal)
+                reasons.append("충분한 변동성")
+
+        # 신뢰도 임계점 확인
+        if confidence >= 60:
+            reason = "; ".join(reasons)
+            price = current_row["close"]
+
+            signal = TradeSignal(
+                timestamp=timestamp,
+                symbol=symbol,
+                signal_type="BUY",
+                price=price,
+                confidence=confidence,
+                reason=reason,
+                indicators={
+                    "SMA_fast": current_row["SMA_fast"],
+                    "SMA_slow": current_row["SMA_slow"],
+                    "ma_distance": current_row.get("ma_distance", 0),
+                    "volume_ratio": volume_ratio,
+                },
+                risk_level=self._assess_risk_level(current_row, confidence),
+            )
+            return signal
 
-        return signals
+        return None
 
     def _generate_sell_signals(self, df: pd.DataFrame) -> List[TradeSignal]:
         """매도 신호 생성"""
@@ -256,78 +263,85 @@ class MovingAverageStrategy(BaseStrategy):
 
         for i in range(len(df)):
             current_row = df.iloc[i]
-
-            # 데이터 부족 시 건너뛰기
-            if pd.isna(current_row.get("SMA_fast")) or pd.isna(current_row.get("SMA_slow")):
-                continue
-
-            # 기본 매도 조건들
-            dead_cross = current_row.get("dead_cross", False)
-            ema_dead_cross = current_row.get("ema_dead_cross", False)
-            bearish_alignment = current_row.get("bearish_alignment", False)
-            price_below_fast = not current_row.get("price_above_fast", True)
-
-            # 주요 매도 신호 조건
-            if not (dead_cross or ema_dead_cross or (bearish_alignment and price_below_fast)):
-                continue
-
-            # 신뢰도 계산
-            confidence = 40.0
-            reasons = []
-
-            # 신호 타입별 가중치
-            if dead_cross:
-                confidence += 25
-                reasons.append("SMA 데드크로스")
-            if ema_dead_cross:
-                confidence += 20
-                reasons.append("EMA 데드크로스")
-            if bearish_alignment:
-                confidence += 15
-                reasons.append("하락 정렬")
-            if price_below_fast:
-                confidence += 10
-                reasons.append("주가 < 단기MA")
-
-            # 추가 확인 조건들
-            sma_fast_slope = current_row.get("sma_fast_slope", 0)
-            volume_ratio = current_row.get("volume_ratio", 1.0)
-
-            # 기울기 확인 (하락 추세)
-            if sma_fast_slope and sma_fast_slope < -self.config.slope_threshold:
-                confidence += 10
-                reasons.append("하락 추세")
-
-            # 거래량 확인
-            if self.config.volume_confirmation and volume_ratio:
-                if volume_ratio >= self.config.volume_threshold:
-                    confidence += 15
-                    reasons.append(f"거래량 증가 ({volume_ratio:.1f}x)")
-
-            # 신뢰도 임계점 확인
-            if confidence >= 60:
-                reason = "; ".join(reasons)
-                price = current_row["close"]
-
-                signal = TradeSignal(
-                    timestamp=current_row.name,
-                    symbol="",
-                    signal_type="SELL",
-                    price=price,
-                    confidence=confidence,
-                    reason=reason,
-                    indicators={
-                        "SMA_fast": current_row["SMA_fast"],
-                        "SMA_slow": current_row["SMA_slow"],
-                        "ma_distance": current_row.get("ma_distance", 0),
-                        "volume_ratio": volume_ratio,
-                    },
-                    risk_level=self._assess_risk_level(current_row, confidence),
-                )
+            signal = self._sell_signal_at(current_row, current_row.name)
+            if signal is not None:
                 signals.append(signal)
 
         return signals
 
+    def _sell_signal_at(self, current_row, timestamp, symbol: str = "") -> Optional[TradeSignal]:
+        """지표가 계산된 한 행의 매도 신호 (없으면 None)"""
+        # 데이터 부족 시 건너뛰기
+        if pd.isna(current_row.get("SMA_fast")) or pd.isna(current_row.get("SMA_slow")):
+            return None
+
+        # 기본 매도 조건들
+        dead_cross = current_row.get("dead_cross", False)
+        ema_dead_cross = current_row.get("ema_dead_cross", False)
+        bearish_alignment = current_row.get("bearish_alignment", False)
+        price_below_fast = not current_row.get("price_above_fast", True)
+
+        # 주요 매도 신호 조건
+        if not (dead_cross or ema_dead_cross or (bearish_alignment and price_below_fast)):
+            return None
+
+        # 신뢰도 계산
+        confidence = 40.0
+        reasons = []
+
+        # 신호 타입별 가중치
+        if dead_cross:
+            confidence += 25
+            reasons.append("SMA 데드크로스")
+        if ema_dead_cross:
+            confidence += 20
+            reasons.append("EMA 데드크로스")
+        if bearish_alignment:
+            confidence += 15
+            reasons.append("하락 정렬")
+        if price_below_fast:
+            confidence += 10
+            reasons.append("주가 < 단기MA")
+
+        # 추가 확인 조건들
+        sma_fast_slope = current_row.get("sma_fast_slope", 0)
+        volume_ratio = current_row.get("volume_ratio", 1.0)
+
+        # 기울기 확인 (하락 추세)
+        if sma_fast_slope and sma_fast_slope < -self.config.slope_threshold:
+            confidence += 10
+            reasons.append("하락 추세")
+
+        # 거래량 확인
+        if self.config.volume_confirmation and volume_ratio:
+            if volume_ratio >= self.config.volume_threshold:
+                confidence += 15
+                reasons.append(f"거래량 증가 ({volume_ratio:.1f}x)")
+
+        # 신뢰도 임계점 확인
+        if confidence >= 60:
+            reason = "; ".join(reasons)
+            price = current_row["close"]
+
+            signal = TradeSignal(
+                timestamp=timestamp,
+                symbol=symbol,
+                signal_type="SELL",
+                price=price,
+                confidence=confidence,
+                reason=reason,
+                indicators={
+                    "SMA_fast": current_row["SMA_fast"],
+                    "SMA_slow": current_row["SMA_slow"],
+                    "ma_distance": current_row.get("ma_distance", 0),
+                    "volume_ratio": volume_ratio,
+                },
+                risk_level=self._assess_risk_level(current_row, confidence),
+            )
+            return signal
+
+        return None
+
     def generate_signals(self, data: pd.DataFrame, symbol: str) -> List[TradeSignal]:
         """매매 신호 생성"""
         df = self.calculate_indicators(data)
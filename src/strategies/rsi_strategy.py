@@ -109,95 +109,102 @@ class RSIStrategy(BaseStrategy):
 
         for i in range(len(df)):
             current_row = df.iloc[i]
+            signal = self._buy_signal_at(current_row, current_row.name)
+            if signal is not None:
+                signals.append(signal)
+
+        return signals
+
+    def _buy_signal_at(self, current_row, timestamp, symbol: str = "") -> Optional[TradeSignal]:
+        """지표가 계산된 한 행의 매수 신호 (없으면 None)"""
+        # 데이터 부족 시 건너뛰기 (최소 요구사항 완화)
+        if pd.isna(current_row.get("RSI")) or pd.isna(current_row.get("SMA_20")):
+            return None
+
+        rsi = current_row["RSI"]
+        price = current_row["close"]
+        sma_20 = current_row["SMA_20"]
+        sma_50 = current_row.get("SMA_50", sma_20)
+        volume_ratio = current_row.get("volume_ratio", 1.0)
 
-            # 데이터 부족 시 건너뛰기 (최소 요구사항 완화)
-            if pd.isna(current_row.get("RSI")) or pd.isna(current_row.get("SMA_20")):
-                continue
-
-            rsi = current_row["RSI"]
-            price = current_row["close"]
-            sma_20 = current_row["SMA_20"]
-            sma_50 = current_row.get("SMA_50", sma_20)
-            volume_ratio = current_row.get("volume_ratio", 1.0)
-
-            # 매수 조건들 (다양한 기회 제공)
-            buy_conditions = []
-            confidence = 0.0
-            reasons = []
-
-            # 조건 1: RSI 과매도 구간에서 반등
-            if rsi <= self.config.rsi_oversold and current_row.get("RSI_rising", False):
-                buy_conditions.append(True)
-                confidence += 40
-                reasons.append(f"RSI 과매도 반등 (RSI: {rsi:.1f})")
-
-            # 조건 2: RSI 중간 구간에서 상승 추세
-            elif 30 <= rsi <= 50 and current_row.get("RSI_rising", False):
-                buy_conditions.append(True)
-                confidence += 30
-                reasons.append(f"RSI 중간 구간 상승 (RSI: {rsi:.1f})")
-
-            # 조건 3: RSI가 50을 상향 돌파
-            elif rsi > 50 and current_row.get("RSI", 0) > 50:
-                buy_conditions.append(True)
-                confidence += 25
-                reasons.append(f"RSI 50 상향 돌파 (RSI: {rsi:.1f})")
-
-            # 조건 4: 가격이 이동평균선 위에서 RSI 상승
-            elif price > sma_20 and current_row.get("RSI_rising", False):
-                buy_conditions.append(True)
-                confidence += 20
-                reasons.append("주가 > SMA20 + RSI 상승")
-
-            if not any(buy_conditions):
-                continue
-
-            # 추가 확인 조건들
-
-            # 가격 위치 필터 (선택적)
-            if self.config.volume_filter:
-                if price > sma_20:
-                    confidence += 15
-                    reasons.append("주가 > SMA20")
-                elif price > sma_50:
-                    confidence += 10
-                    reasons.append("주가 > SMA50")
-
-            # 거래량 확인
-            if volume_ratio >= self.config.volume_threshold:
-                confidence += 20
-                reasons.append(f"거래량 증가 ({volume_ratio:.1f}x)")
-
-            # RSI 추가 조건
-            if rsi < 25:  # 매우 과매도
+        # 매수 조건들 (다양한 기회 제공)
+        buy_conditions = []
+        confidence = 0.0
+        reasons = []
+
+        # 조건 1: RSI 과매도 구간에서 반등
+        if rsi <= self.config.rsi_oversold and current_row.get("RSI_rising", False):
+            buy_conditions.append(True)
+            confidence += 40
+            reasons.append(f"RSI 과매도 반등 (RSI: {rsi:.1f})")
+
+        # 조건 2: RSI 중간 구간에서 상승 추세
+        elif 30 <= rsi <= 50 and current_row.get("RSI_rising", False):
+            buy_conditions.append(True)
+            confidence += 30
+            reasons.append(f"RSI 중간 구간 상승 (RSI: {rsi:.1f})")
+
+        # 조건 3: RSI가 50을 상향 돌파
+        elif rsi > 50 and current_row.get("RSI", 0) > 50:
+            buy_conditions.append(True)
+            confidence += 25
+            reasons.append(f"RSI 50 상향 돌파 (RSI: {rsi:.1f})")
+
+        # 조건 4: 가격이 이동평균선 위에서 RSI 상승
+        elif price > sma_20 and current_row.get("RSI_rising", False):
+            buy_conditions.append(True)
+            confidence += 20
+            reasons.append("주가 > SMA20 + RSI 상승")
+
+        if not any(buy_conditions):
+            return None
+
+        # 추가 확인 조건들
+
+        # 가격 위치 필터 (선택적)
+        if self.config.volume_filter:
+            if price > sma_20:
                 confidence += 15
-                reasons.append("매우 과매도 구간")
-            elif rsi < 35:  # 과매도
+                reasons.append("주가 > SMA20")
+            elif price > sma_50:
                 confidence += 10
-                reasons.append("과매도 구간")
-
-            # 신뢰도 임계점 확인 (완화)
-            if confidence >= 50:  # 60에서 50으로 완화
-                reason = "; ".join(reasons)
-
-                signal = TradeSignal(
-                    timestamp=current_row.name,
-                    symbol="",  # run_strategy에서 설정됨
-                    signal_type="BUY",
-                    price=price,
-                    confidence=confidence,
-                    reason=reason,
-                    indicators={
-                        "RSI": rsi,
-                        "RSI_SMA": current_row.get("RSI_SMA", rsi),
-                        "SMA_20": sma_20,
-                        "volume_ratio": volume_ratio,
-                    },
-                    risk_level=self._assess_risk_level(current_row, confidence),
-                )
-                signals.append(signal)
+                reasons.append("주가 > SMA50")
+
+        # 거래량 확인
+        if volume_ratio >= self.config.volume_threshold:
+            confidence += 20
+            reasons.append(f"거래량 증가 ({volume_ratio:.1f}x)")
+
+        # RSI 추가 조건
+        if rsi < 25:  # 매우 과매도
+            confidence += 15
+            reasons.append("매우 과매도 구간")
+        elif rsi < 35:  # 과매도
+            confidence += 10
+            reasons.append("과매도 구간")
+
+        # 신뢰도 임계점 확인 (완화)
+        if confidence >= 50:  # 60에서 50으로 완화
+            reason = "; ".join(reasons)
+
+            signal = TradeSignal(
+                timestamp=timestamp,
+                symbol=symbol,
+                signal_type="BUY",
+                price=price,
+                confidence=confidence,
+                reason=reason,
+                indicators={
+                    "RSI": rsi,
+                    "RSI_SMA": current_row.get("RSI_SMA", rsi),
+                    "SMA_20": sma_20,
+                    "volume_ratio": volume_ratio,
+                },
+                risk_level=self._assess_risk_level(current_row, confidence),
+            )
+            return signal
 
-        return signals
+        return None
 
     def _generate_sell_signals(self, df: pd.DataFrame) -> List[TradeSignal]:
         """매도 신호 생성"""
@@ -205,57 +212,64 @@ class RSIStrategy(BaseStrategy):
 
         for i in range(len(df)):
             current_row = df.iloc[i]
+            signal = self._sell_signal_at(current_row, current_row.name)
+            if signal is not None:
+                signals.append(signal)
 
-            # 데이터 부족 시 건너뛰기
-            if pd.isna(current_row.get("RSI")):
-                continue
-
-            rsi = current_row["RSI"]
-            price = current_row["close"]
-            volume_ratio = current_row.get("volume_ratio", 1.0)
-
-            # 기본 매도 조건: RSI 과매수 구간에서 하락
-            overbought_decline = rsi >= self.config.rsi_overbought and current_row.get(
-                "RSI_falling", False
-            )
+        return signals
 
-            if not overbought_decline:
-                continue
+    def _sell_signal_at(self, current_row, timestamp, symbol: str = "") -> Optional[TradeSignal]:
+        """지표가 계산된 한 행의 매도 신호 (없으면 None)"""
+        # 데이터 부족 시 건너뛰기
+        if pd.isna(current_row.get("RSI")):
+            return None
 
-            # 신뢰도 계산
-            confidence = 50.0
-            reasons = [f"RSI 과매수 하락 (RSI: {rsi:.1f})"]
+        rsi = current_row["RSI"]
+        price = current_row["close"]
+        volume_ratio = current_row.get("volume_ratio", 1.0)
 
-            # RSI 극값 조건
-            if rsi > 75:  # 매우 과매수
-                confidence += 15
-                reasons.append("매우 과매수 구간")
+        # 기본 매도 조건: RSI 과매수 구간에서 하락
+        overbought_decline = rsi >= self.config.rsi_overbought and current_row.get(
+            "RSI_falling", False
+        )
 
-            # 거래량 확인
-            if volume_ratio >= self.config.volume_threshold:
-                confidence += 15
-                reasons.append(f"거래량 증가 ({volume_ratio:.1f}x)")
-
-            # 신뢰도 임계점 확인
-            if confidence >= 60:
-                reason = "; ".join(reasons)
-
-                signal = TradeSignal(
-                    timestamp=current_row.name,
-                    symbol="",
-                    signal_type="SELL",
-                    price=price,
-                    confidence=confidence,
-                    reason=reason,
-                    indicators={
-                        "RSI": rsi,
-                        "volume_ratio": volume_ratio,
-                    },
-                    risk_level=self._assess_risk_level(current_row, confidence),
-                )
-                signals.append(signal)
+        if not overbought_decline:
+            return None
+
+        # 신뢰도 계산
+        confidence = 50.0
+        reasons = [f"RSI 과매수 하락 (RSI: {rsi:.1f})"]
+
+        # RSI 극값 조건
+        if rsi > 75:  # 매우 과매수
+            confidence += 15
+            reasons.append("매우 과매수 구간")
+
+        # 거래량 확인
+        if volume_ratio >= self.config.volume_threshold:
+            confidence += 15
+            reasons.append(f"거래량 증가 ({volume_ratio:.1f}x)")
+
+        # 신뢰도 임계점 확인
+        if confidence >= 60:
+            reason = "; ".join(reasons)
+
+            signal = TradeSignal(
+                timestamp=timestamp,
+                symbol=symbol,
+                signal_type="SELL",
+                price=price,
+                confidence=confidence,
+                reason=reason,
+                indicators={
+                    "RSI": rsi,
+                    "volume_ratio": volume_ratio,
+                },
+                risk_level=self._assess_risk_level(current_row, confidence),
+            )
+            return signal
 
-        return signals
+        return None
 
     def generate_signals(self, data: pd.DataFrame, symbol: str) -> List[TradeSignal]:
         """매매 신호 생성"""
@@ -3,28 +3,36 @@
 - 주문 관리
 - 포트폴리오 관리
 - 위험 관리
+- 공분산 기반 위험 엔진 (EWMA 공분산, VaR/CVaR)
 - 백테스팅 엔진
 - 병렬 처리
 - 캐싱 시스템
 - 배치 최적화
+- 모의투자 시뮬레이터 (시장 재생 서버, 가상 체결)
 """
 
 from .order_manager import OrderManager
-from .portfolio import Portfolio
+from .portfolio import ArrayPortfolio, Portfolio
 from .risk_manager import RiskManager
+from .risk_engine import RiskEngine
 from .backtest import BacktestEngine
 from .parallel_backtest import ParallelBacktestEngine
 from .cache_manager import BacktestCacheManager
 from .batch_optimizer import BatchProcessor
 from .optimized_backtest import OptimizedBacktestEngine
+from .paper_trading import MarketReplayServer, PaperTradingSession
 
 __all__ = [
     "OrderManager",
     "Portfolio",
+    "ArrayPortfolio",
     "RiskManager",
+    "RiskEngine",
     "BacktestEngine",
     "ParallelBacktestEngine",
     "BacktestCacheManager",
     "BatchProcessor",
     "OptimizedBacktestEngine",
+    "MarketReplayServer",
+    "PaperTradingSession",
 ]
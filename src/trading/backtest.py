@@ -3,6 +3,14 @@
 
 TA-Lib 기반 매매 전략의 과거 성과를 검증하고 분석하는 백테스팅 시스템입니다.
 100만원 규모 포트폴리오에 최적화되어 있습니다.
+
+시장가 신호는 신호 봉 종가에 체결합니다. order_type이 'LIMIT'/'STOP'인 신호는
+다음 거래일부터 대기 주문이 되어, 매일 전체 대기 주문을 당일 시가/고가/저가 범위와
+한 번에(NumPy 벡터 연산) 대조해 체결합니다. 갭으로 지정가/스탑가를 넘어 시작하면
+시가에 체결하고, 종목별 당일 거래량의 max_volume_participation 비율까지만 부분 체결합니다.
+
+max_portfolio_var를 지정하면 매일 종가로 EWMA 공분산(RiskEngine)을 갱신하고, 매수 수량을
+보유 종목과의 상관을 반영한 포트폴리오 VaR 한도 안으로 줄입니다.
 """
 
 import pandas as pd
@@ -13,8 +21,111 @@ import logging
 from dataclasses import dataclass, field
 import copy
 
+from .risk_engine import EWMACovariance, RiskEngine, RiskEngineConfig
+
 logger = logging.getLogger(__name__)
 
+ORDER_MARKET = "MARKET"
+ORDER_LIMIT = "LIMIT"
+ORDER_STOP = "STOP"
+OHLCV_COLUMNS = ("open", "high", "low", "close", "volume")
+
+
+def match_intraday_orders(
+    is_buy: np.ndarray,
+    is_stop: np.ndarray,
+    price: np.ndarray,
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    대기 주문들을 당일 OHLC 범위와 대조 (주문별 배열, 벡터 연산)
+
+    - 매수 지정가 / 매도 스탑: 시가 <= 가격이면 시가(갭 하락), 저가 <= 가격이면 가격
+    - 매도 지정가 / 매수 스탑: 시가 >= 가격이면 시가(갭 상승), 고가 >= 가격이면 가격
+    - 시세가 없는 날(NaN)은 체결되지 않음
+
+    Returns:
+        (체결 여부, 체결가)
+    """
+    falling = is_buy != is_stop  # 가격이 내려와야 체결되는 주문
+    gap = np.where(falling, open_ <= price, open_ >= price)
+    touched = np.where(falling, low <= price, high >= price)
+    return gap | touched, np.where(gap, open_, price)
+
+
+def allocate_by_group(groups: np.ndarray, desired: np.ndarray, capacity: np.ndarray) -> np.ndarray:
+    """
+    그룹(종목)별 용량을 배열 순서대로 주문에 배분
+
+    Args:
+        groups: 주문별 그룹 번호
+        desired: 주문별 요청 수량
+        capacity: 주문별 소속 그룹의 용량 (같은 그룹은 같은 값)
+
+    Returns:
+        주문별 배분 수량
+    """
+    order = np.argsort(groups, kind="stable")
+    sorted_groups = groups[order]
+    wanted = desired[order]
+    cumulative = np.cumsum(wanted)
+    starts = np.ones(len(order), dtype=bool)
+    starts[1:] = sorted_groups[1:] != sorted_groups[:-1]
+    # 그룹 시작 전까지의 누적 수량을 빼서 그룹 내 앞선 주문 수량을 구함
+    group_base = np.maximum.accumulate(np.where(starts, cumulative - wanted, 0.0))
+    before = cumulative - wanted - group_base
+    allocated = np.empty_like(wanted)
+    allocated[order] = np.clip(capacity[order] - before, 0.0, wanted)
+    return allocated
+
+
+class _WorkingOrders:
+    """대기 중인 지정가/스탑 주문 (열 단위 NumPy 배열)"""
+
+    def __init__(self):
+        self.slot = np.empty(0, dtype=np.int64)
+        self.is_buy = np.empty(0, dtype=bool)
+        self.is_stop = np.empty(0, dtype=bool)
+        self.price = np.empty(0)
+        self.remaining = np.empty(0)
+        self.filled = np.empty(0)
+        self.expires = np.empty(0, dtype=np.int64)  # 마지막 유효 거래일 인덱스
+        self.signals: List[Any] = []
+        self._staged: List[Tuple] = []
+
+    def __len__(self) -> int:
+        return len(self.signals) + len(self._staged)
+
+    def add(self, slot: int, is_buy: bool, is_stop: bool, price: float, quantity: float, expires: int, signal):
+        self._staged.append((slot, is_buy, is_stop, price, quantity, expires, signal))
+
+    def has(self, slot: int, is_buy: bool) -> bool:
+        self.flush()
+        return bool(np.any((self.slot == slot) & (self.is_buy == is_buy)))
+
+    def flush(self):
+        """add()로 쌓인 주문을 배열에 합침"""
+        if not self._staged:
+            return
+        slot, is_buy, is_stop, price, quantity, expires, signals = zip(*self._staged)
+        self._staged = []
+        self.slot = np.concatenate([self.slot, np.asarray(slot, dtype=np.int64)])
+        self.is_buy = np.concatenate([self.is_buy, np.asarray(is_buy, dtype=bool)])
+        self.is_stop = np.concatenate([self.is_stop, np.asarray(is_stop, dtype=bool)])
+        self.price = np.concatenate([self.price, np.asarray(price, dtype=float)])
+        self.remaining = np.concatenate([self.remaining, np.asarray(quantity, dtype=float)])
+        self.filled = np.concatenate([self.filled, np.zeros(len(signals))])
+        self.expires = np.concatenate([self.expires, np.asarray(expires, dtype=np.int64)])
+        self.signals.extend(signals)
+
+    def keep(self, mask: np.ndarray):
+        """mask가 True인 주문만 남김"""
+        for name in ("slot", "is_buy", "is_stop", "price", "remaining", "filled", "expires"):
+            setattr(self, name, getattr(self, name)[mask])
+        self.signals = [signal for signal, kept in zip(self.signals, mask.tolist()) if kept]
+
 
 @dataclass
 class Trade:
@@ -96,6 +207,12 @@ class BacktestConfig:
     enable_stop_loss: bool = True
     enable_take_profit: bool = True
     rebalance_frequency: str = "daily"  # 'daily', 'weekly', 'monthly'
+    order_valid_days: int = 1  # 지정가/스탑 주문 유효 거래일 수 (신호 다음 날부터)
+    max_volume_participation: float = 0.1  # 종목별 당일 거래량 대비 최대 체결 비율 (0이면 제한 없음)
+    gap_exit_at_open: bool = False  # 갭으로 손절/익절가를 넘어 시작하면 시가에 청산 (False: 손절/익절가에 청산)
+    max_portfolio_var: float = 0.0  # 포트폴리오 가치 대비 1일 VaR 한도 (0이면 사용 안 함)
+    var_confidence: float = 0.95  # VaR 신뢰수준
+    covariance_decay: float = 0.94  # EWMA 공분산 감쇠 계수
 
 
 class BacktestEngine:
@@ -118,6 +235,14 @@ class BacktestEngine:
         self.daily_returns: List[float] = []
         self.current_date: Optional[datetime] = None
         self._processed_signals = set()  # 신호 처리 기록 초기화
+        self._working_orders = _WorkingOrders()
+        self._symbol_slots: Dict[str, int] = {}
+        self._symbols: List[str] = []
+        self._ohlcv = np.empty((len(OHLCV_COLUMNS), 0, 0))  # (필드, 거래일, 종목)
+        self._day_index = 0
+        self.order_stats = {"placed": 0, "filled": 0, "partial": 0, "expired": 0, "rejected": 0}
+        self.risk_engine: Optional[RiskEngine] = None
+        self.risk_stats = {"checks": 0, "capped": 0, "blocked": 0}
 
     def run_backtest(
         self,
@@ -191,15 +316,32 @@ class BacktestEngine:
             logger.error("날짜 범위에 해당하는 데이터가 없습니다.")
             return self._empty_results()
 
+        # 장중 체결용 (거래일 x 종목) OHLCV 행렬
+        self._prepare_market_matrix(data, sorted_dates)
+        if self.config.max_portfolio_var > 0:
+            risk_config = RiskEngineConfig(
+                decay=self.config.covariance_decay,
+                confidence=self.config.var_confidence,
+                max_portfolio_var=self.config.max_portfolio_var,
+            )
+            self.risk_engine = RiskEngine(risk_config, EWMACovariance(self._symbols, decay=risk_config.decay))
+
         # 백테스팅 실행
-        for date in sorted_dates:
+        for day, date in enumerate(sorted_dates):
             self.current_date = pd.to_datetime(date, format="mixed", errors="coerce")
+            self._day_index = day
+            self._match_working_orders(day)
+            if self.risk_engine is not None:
+                # 종가 신호부터 당일 수익률까지 반영된 공분산 사용
+                self.risk_engine.update(self._ohlcv[3, day], self.current_date)
             self._process_daily_signals(strategy, data, date, all_signals)
             self._update_positions(data, date)
             self._record_equity()
 
-        # 미청산 포지션 정리
+        # 미청산 포지션 정리 (남은 대기 주문은 만료 처리)
         if sorted_dates:
+            self.order_stats["expired"] += len(self._working_orders)
+            self._working_orders = _WorkingOrders()
             self._close_all_positions(data, sorted_dates[-1])
 
         # 결과 분석
@@ -276,6 +418,11 @@ class BacktestEngine:
         symbol = signal.symbol
         current_price = market_data["close"]
 
+        order_type = getattr(signal, "order_type", ORDER_MARKET) or ORDER_MARKET
+        if order_type != ORDER_MARKET:
+            self._place_working_order(signal, order_type, market_data)
+            return
+
         if signal.signal_type == "BUY":
             self._process_buy_signal(signal, current_price, market_data)
         elif signal.signal_type == "SELL":
@@ -300,6 +447,8 @@ class BacktestEngine:
             current_price, signal, market_data
         )
 
+        position_size = self._apply_risk_limit(symbol, position_size, current_price)
+
         if position_size <= 0:
             logger.info(f"{symbol}: 포지션 크기 0 이하({position_size}), 매수 신호 무시 (신호: {signal})")
             return
@@ -364,16 +513,174 @@ class BacktestEngine:
         self._close_position(symbol, current_price, signal.reason)
         logger.info(f"매도 실행: {symbol} {position.quantity:.2f}주 @ {current_price:,.0f}원 (신호: {signal})")
 
-    def _close_position(self, symbol: str, exit_price: float, exit_reason: str):
-        """포지션 청산"""
+    # ---- 지정가/스탑 주문 (장중 체결) ----
+
+    def _prepare_market_matrix(self, data: Dict[str, pd.DataFrame], sorted_dates: List):
+        """종목별 OHLCV를 (필드, 거래일, 종목) 행렬로 정렬 (시세 없는 날은 NaN)"""
+        self._symbols = list(data)
+        self._symbol_slots = {symbol: slot for slot, symbol in enumerate(self._symbols)}
+        dates = pd.Index(sorted_dates)
+        ohlcv = np.full((len(OHLCV_COLUMNS), len(dates), len(self._symbols)), np.nan)
+
+        for slot, df in enumerate(data.values()):
+            if "date" in df.columns:
+                keys = pd.to_datetime(df["date"], format="mixed", errors="coerce").dt.date
+            else:
+                keys = pd.to_datetime(df.index, format="mixed", errors="coerce").date
+            close = df["close"].to_numpy(dtype=float)
+            columns = {
+                "open": df["open"].to_numpy(dtype=float) if "open" in df.columns else close,
+                "high": df["high"].to_numpy(dtype=float) if "high" in df.columns else close,
+                "low": df["low"].to_numpy(dtype=float) if "low" in df.columns else close,
+                "close": close,
+                # 거래량이 없으면 참여율 제한 없음
+                "volume": df["volume"].to_numpy(dtype=float) if "volume" in df.columns else np.full(len(df), np.inf),
+            }
+            frame = pd.DataFrame(columns, index=pd.Index(keys))
+            frame = frame[~frame.index.duplicated(keep="last")]
+            ohlcv[:, :, slot] = frame.reindex(dates).to_numpy().T
+
+        self._ohlcv = ohlcv
+
+    def _place_working_order(self, signal, order_type: str, market_data: pd.Series):
+        """지정가/스탑 신호를 다음 거래일부터 유효한 대기 주문으로 등록"""
+        symbol = signal.symbol
+        if signal.signal_type not in ("BUY", "SELL"):
+            return
+        is_buy = signal.signal_type == "BUY"
+        is_stop = order_type == ORDER_STOP
+        price = signal.stop_price if is_stop else signal.limit_price
+        slot = self._symbol_slots.get(symbol)
+        if order_type not in (ORDER_LIMIT, ORDER_STOP) or price is None or not price > 0 or slot is None:
+            self.order_stats["rejected"] += 1
+            logger.info(f"{symbol}: 잘못된 {order_type} 주문 신호 무시 (가격: {price}, 신호: {signal})")
+            return
+
+        orders = self._working_orders
+        if is_buy:
+            if symbol in self.positions or orders.has(slot, True):
+                logger.info(f"{symbol}: 포지션 또는 대기 매수 주문 보유 중, {order_type} 매수 신호 무시")
+                return
+            pending_slots = set(orders.slot[orders.is_buy].tolist())
+            held_slots = {self._symbol_slots.get(held) for held in self.positions}
+            if len(self.positions) + len(pending_slots - held_slots) >= self.config.max_positions:
+                logger.info(f"{symbol}: 최대 포지션 수 초과({self.config.max_positions}), {order_type} 매수 신호 무시")
+                return
+            quantity = float(np.floor(self._calculate_position_size(price, signal, market_data)))
+        else:
+            position = self.positions.get(symbol)
+            if position is None or orders.has(slot, False):
+                logger.info(f"{symbol}: 보유 포지션 없음 또는 대기 매도 주문 존재, {order_type} 매도 신호 무시")
+                return
+            quantity = position.quantity
+
+        if not quantity > 0:
+            logger.info(f"{symbol}: 주문 수량 0, {order_type} 신호 무시 (신호: {signal})")
+            return
+
+        valid_days = max(1, int(getattr(signal, "valid_days", None) or self.config.order_valid_days))
+        orders.add(slot, is_buy, is_stop, float(price), quantity, self._day_index + valid_days, signal)
+        self.order_stats["placed"] += 1
+        logger.info(
+            f"{order_type} 주문 접수: {symbol} {signal.signal_type} {quantity:.2f}주 @ {price:,.0f}원 ({valid_days}거래일)"
+        )
+
+    def _match_working_orders(self, day: int):
+        """대기 주문 전체를 당일 OHLC 범위와 한 번에 대조해 체결"""
+        orders = self._working_orders
+        if not len(orders):
+            return
+        orders.flush()
+
+        slots = orders.slot
+        open_, high, low, _, volume = self._ohlcv[:, day, slots]
+        hit, fill_price = match_intraday_orders(orders.is_buy, orders.is_stop, orders.price, open_, high, low)
+        quantity = np.where(hit, orders.remaining, 0.0)
+        participation = self.config.max_volume_participation
+        if participation > 0:
+            capacity = np.floor(np.nan_to_num(volume, nan=0.0) * participation)
+            quantity = allocate_by_group(slots, quantity, capacity)
+
+        executed = np.zeros(len(slots))
+        rejected = np.zeros(len(slots), dtype=bool)
+        for i in np.flatnonzero(quantity > 0).tolist():
+            signal = orders.signals[i]
+            if orders.is_buy[i]:
+                executed[i] = self._fill_working_buy(signal, quantity[i], fill_price[i])
+            else:
+                executed[i] = self._fill_working_sell(signal, quantity[i], fill_price[i])
+            rejected[i] = executed[i] <= 0
+
+        orders.remaining -= executed
+        orders.filled += executed
+        completed = orders.remaining <= 1e-9
+        expired = ~completed & ~rejected & (orders.expires <= day)
+        self.order_stats["filled"] += int(np.count_nonzero(completed))
+        self.order_stats["partial"] += int(np.count_nonzero((executed > 0) & ~completed))
+        self.order_stats["expired"] += int(np.count_nonzero(expired))
+        self.order_stats["rejected"] += int(np.count_nonzero(rejected))
+        orders.keep(~(completed | expired | rejected))
+
+    def _fill_working_buy(self, signal, quantity: float, price: float) -> float:
+        """대기 매수 주문 체결 (현금 한도 내 정수 주식), 체결 수량 반환"""
+        symbol = signal.symbol
+        cost_rate = 1 + self.config.commission_rate + self.config.slippage_rate
+        quantity = float(np.floor(min(quantity, self.cash / (price * cost_rate))))
+        quantity = float(np.floor(self._apply_risk_limit(symbol, quantity, price)))
+        position = self.positions.get(symbol)
+        if quantity < 1 or (position is None and len(self.positions) >= self.config.max_positions):
+            logger.info(f"{symbol}: 자금/포지션 한도로 대기 매수 주문 체결 불가 (신호: {signal})")
+            return 0.0
+
+        trade_value = quantity * price
+        self.cash -= trade_value * cost_rate
+        if position is None:
+            position = Position(
+                symbol=symbol,
+                quantity=quantity,
+                entry_price=price,
+                entry_date=self.current_date,
+                stop_loss=0.0,
+                take_profit=0.0,
+                entry_reason=signal.reason,
+                position_type="LONG",
+            )
+            self.positions[symbol] = position
+        else:
+            # 부분 체결 누적 - 평균 단가
+            total = position.quantity + quantity
+            position.entry_price = (position.entry_price * position.quantity + trade_value) / total
+            position.quantity = total
+        position.stop_loss = position.entry_price * (1 - self.config.risk_per_trade)
+        position.take_profit = position.entry_price * (1 + self.config.risk_per_trade * 2)
+
+        logger.info(f"대기 매수 체결: {symbol} {quantity:.0f}주 @ {price:,.0f}원 (신호: {signal})")
+        return quantity
+
+    def _fill_working_sell(self, signal, quantity: float, price: float) -> float:
+        """대기 매도 주문 체결 (보유 수량 한도), 체결 수량 반환"""
+        symbol = signal.symbol
+        position = self.positions.get(symbol)
+        if position is None:
+            logger.info(f"{symbol}: 보유 포지션 없음, 대기 매도 주문 체결 불가 (신호: {signal})")
+            return 0.0
+        quantity = min(quantity, position.quantity)
+        self._close_position(symbol, price, signal.reason, quantity)
+        logger.info(f"대기 매도 체결: {symbol} {quantity:.2f}주 @ {price:,.0f}원 (신호: {signal})")
+        return quantity
+
+    def _close_position(self, symbol: str, exit_price: float, exit_reason: str, quantity: Optional[float] = None):
+        """포지션 청산 (quantity가 있으면 해당 수량만 부분 청산)"""
         if symbol not in self.positions:
             logger.debug(f"{symbol}: 청산 시도했으나 포지션 없음 (exit_price: {exit_price}, reason: {exit_reason})")
             return
 
         position = self.positions[symbol]
+        if quantity is None or quantity >= position.quantity:
+            quantity = position.quantity
 
         # 거래 기록 생성
-        trade_value = position.quantity * exit_price
+        trade_value = quantity * exit_price
         commission = trade_value * self.config.commission_rate
         slippage = trade_value * self.config.slippage_rate
         net_proceeds = trade_value - commission - slippage
@@ -385,7 +692,7 @@ class BacktestEngine:
             trade_type=position.position_type,
             entry_price=position.entry_price,
             exit_price=exit_price,
-            quantity=position.quantity,
+            quantity=quantity,
             entry_reason=position.entry_reason,
             exit_reason=exit_reason,
             commission=commission * 2,  # 매수/매도 수수료
@@ -394,12 +701,41 @@ class BacktestEngine:
 
         self.trades.append(trade)
         self.cash += net_proceeds
-        del self.positions[symbol]
+        if quantity >= position.quantity:
+            del self.positions[symbol]
+        else:
+            position.quantity -= quantity
 
         logger.debug(
-            f"매도 실행: {symbol} {position.quantity:.2f}주 @ {exit_price:,.0f}원, 수익률: {trade.return_pct:.2%}"
+            f"매도 실행: {symbol} {quantity:.2f}주 @ {exit_price:,.0f}원, 수익률: {trade.return_pct:.2%}"
         )
 
+    def _apply_risk_limit(self, symbol: str, quantity: float, price: float) -> float:
+        """포트폴리오 VaR 한도를 넘지 않도록 매수 수량 축소 (RiskEngine이 없으면 그대로)"""
+        if self.risk_engine is None or quantity <= 0:
+            return quantity
+
+        closes = self._ohlcv[3, self._day_index]
+        exposures = {}
+        for held, position in self.positions.items():
+            slot = self._symbol_slots.get(held)
+            close = closes[slot] if slot is not None else np.nan
+            exposures[held] = position.quantity * (close if np.isfinite(close) else position.entry_price)
+
+        self.risk_stats["checks"] += 1
+        limit = self.risk_engine.max_position_value(symbol, exposures, self.get_portfolio_value())
+        if quantity * price <= limit:
+            return quantity
+
+        capped = limit / price
+        if capped < 1:
+            self.risk_stats["blocked"] += 1
+            logger.info(f"{symbol}: VaR 한도로 매수 불가 (추가 가능 {limit:,.0f}원)")
+            return 0.0
+        self.risk_stats["capped"] += 1
+        logger.info(f"{symbol}: VaR 한도로 매수 수량 축소 {quantity:.2f}주 -> {capped:.2f}주")
+        return capped
+
     def _calculate_position_size(
         self, price: float, signal, market_data: pd.Series
     ) -> float:
@@ -458,14 +794,19 @@ class BacktestEngine:
             current_price = day_data.iloc[-1]["close"]
             high_price = day_data.iloc[-1]["high"]
             low_price = day_data.iloc[-1]["low"]
+            open_price = day_data.iloc[-1].get("open", current_price)
+            # gap_exit_at_open이면 장 시작 전부터 보유한 포지션은 갭으로 손절/익절가를 넘어 시작할 때 시가에 청산
+            held_at_open = self.config.gap_exit_at_open and position.entry_date < self.current_date
 
             # 손절 체크
             if self.config.enable_stop_loss and low_price <= position.stop_loss:
-                positions_to_close.append((symbol, position.stop_loss, "손절"))
+                exit_price = min(open_price, position.stop_loss) if held_at_open else position.stop_loss
+                positions_to_close.append((symbol, exit_price, "손절"))
 
             # 익절 체크
             elif self.config.enable_take_profit and high_price >= position.take_profit:
-                positions_to_close.append((symbol, position.take_profit, "익절"))
+                exit_price = max(open_price, position.take_profit) if held_at_open else position.take_profit
+                positions_to_close.append((symbol, exit_price, "익절"))
 
         # 포지션 청산
         for symbol, exit_price, reason in positions_to_close:
@@ -576,6 +917,8 @@ class BacktestEngine:
                 max([trade.holding_days for trade in self.trades]) if self.trades else 0
             ),
             "total_commission": sum([trade.commission for trade in self.trades]),
+            "order_stats": dict(self.order_stats),
+            "risk_stats": dict(self.risk_stats),
             # 자산 곡선
             "equity_curve": pd.DataFrame(self.equity_curve),
             "daily_returns": pd.Series(self.daily_returns),
@@ -622,6 +965,8 @@ class BacktestEngine:
             "avg_holding_days": 0,
             "max_holding_days": 0,
             "total_commission": 0,
+            "order_stats": dict(self.order_stats),
+            "risk_stats": dict(self.risk_stats),
             "equity_curve": empty_equity_curve,
             "daily_returns": pd.Series(),
             "trades": pd.DataFrame(),
@@ -18,6 +18,8 @@ from dataclasses import dataclass
 import threading
 from contextlib import contextmanager
 
+from src.data.connection_manager import get_pooled_connection
+
 logger = logging.getLogger(__name__)
 
 
@@ -68,7 +70,7 @@ class BacktestCacheManager:
     def _init_database(self):
         """데이터베이스 초기화"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with get_pooled_connection(self.db_path) as conn:
                 cursor = conn.cursor()
 
                 # 캐시 테이블 생성
@@ -187,7 +189,7 @@ class BacktestCacheManager:
                         return self.memory_cache[cache_key]
 
             # 데이터베이스 캐시 확인
-            with sqlite3.connect(self.db_path) as conn:
+            with get_pooled_connection(self.db_path) as conn:
                 cursor = conn.cursor()
 
                 # 캐시 조회
@@ -274,7 +276,7 @@ class BacktestCacheManager:
             data_size = len(results_json.encode())
 
             # 데이터베이스에 저장
-            with sqlite3.connect(self.db_path) as conn:
+            with get_pooled_connection(self.db_path) as conn:
                 cursor = conn.cursor()
 
                 cursor.execute(
@@ -341,7 +343,7 @@ class BacktestCacheManager:
     def cleanup_cache(self):
         """캐시 정리"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with get_pooled_connection(self.db_path) as conn:
                 cursor = conn.cursor()
 
                 # 만료된 캐시 삭제
@@ -391,7 +393,7 @@ class BacktestCacheManager:
     def get_cache_stats(self) -> Dict[str, Any]:
         """캐시 통계 조회"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with get_pooled_connection(self.db_path) as conn:
                 cursor = conn.cursor()
 
                 # 데이터베이스 통계
@@ -444,7 +446,7 @@ class BacktestCacheManager:
     def clear_cache(self, strategy_name: str = None, symbol: str = None):
         """캐시 삭제"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with get_pooled_connection(self.db_path) as conn:
                 cursor = conn.cursor()
 
                 if strategy_name and symbol:
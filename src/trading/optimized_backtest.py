@@ -11,7 +11,7 @@ import pandas as pd
 import numpy as np
 from dataclasses import dataclass
 import sys
-from datetime import datetime, timedelta
+from datetime import datetime
 
 # 프로젝트 루트 설정
 PROJECT_ROOT = Path(__file__).parent.parent.parent
@@ -39,6 +39,7 @@ from src.trading.batch_optimizer import (
     create_optimized_batch_processor,
 )
 from src.data.updater import StockDataUpdater
+from src.data.trading_calendar import lookback_start_date
 from src.strategies.base_strategy import BaseStrategy
 
 logger = logging.getLogger(__name__)
@@ -237,33 +238,42 @@ def _collect_data_optimized(
     # update_symbol은 내부적으로 데이터베이스에 저장하므로 별도의 저장 로직 불필요
     # 여기서는 force_update=False로 설정하여 이미 최신 데이터가 있으면 건너뛰도록 함
 
+    # 최근 days 거래일 구간 (달력일로 잡으면 주말/휴일만큼 봉 수가 모자람)
+    start_date = lookback_start_date(days, db_path=self.data_updater.db_path)
+
     # 데이터 수집 및 저장
     results = self.data_updater.update_multiple_symbols_parallel(
         symbols=symbols,
-        start_date=(datetime.now() - timedelta(days=days + 30)).strftime(
-            "%Y%m%d"
-        ),  # 백테스팅 기간 + 여유분
+        start_date=start_date.replace("-", ""),
         end_date=datetime.now().strftime("%Y%m%d"),
         force_update=False,  # 이미 최신 데이터가 있으면 업데이트하지 않음
         max_workers=self.config.max_workers or 5,  # 병렬 워커 수
     )
 
-    # 데이터베이스에서 수집된 데이터 로드
+    # 컬럼형 저장소(메모리 맵)가 있으면 우선 사용, 없으면 단일 쿼리로 일괄 로드
+    from src.data.columnar_store import open_columnar_store
+    from src.data.panel_loader import load_panel
+
+    # 캐시로 건너뛴 종목은 결과에 없으므로 실패로 보고된 종목만 제외
+    update_results = results.get("results", {})
+    failed_symbols = {symbol for symbol, success in update_results.items() if not success}
+    for symbol in failed_symbols:
+        logger.warning(f"{symbol} 데이터 수집 실패")
+    updated_symbols = [symbol for symbol in symbols if symbol not in failed_symbols]
+
+    columnar = open_columnar_store(self.data_updater.db_path)
+    if columnar is not None:
+        panel = columnar.load_frames(updated_symbols, start=start_date)
+    else:
+        panel = load_panel(updated_symbols, start=start_date, db_path=self.data_updater.db_path)
+
     symbols_data = {}
-    for symbol, success in results.items():
-        if success:
-            # StockDataManager를 사용하여 데이터베이스에서 데이터 로드
-            # StockDataManager는 db_path를 필요로 함
-            from src.data.stock_data_manager import StockDataManager
-
-            dm = StockDataManager(db_path=self.data_updater.db_path)
-            df = dm.get_latest_data(symbol, days=days)
-            if not df.empty:
-                symbols_data[symbol] = df
-            else:
-                logger.warning(f"데이터베이스에서 {symbol} 데이터 로드 실패")
+    for symbol in updated_symbols:
+        df = panel.get(symbol)
+        if df is not None and not df.empty:
+            symbols_data[symbol] = df.tail(days)
         else:
-            logger.warning(f"{symbol} 데이터 수집 실패")
+            logger.warning(f"데이터베이스에서 {symbol} 데이터 로드 실패")
 
     return symbols_data
 
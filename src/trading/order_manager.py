@@ -5,10 +5,13 @@
 - 주문 상태 관리
 - 주문 이력 추적
 - 슬리피지 및 수수료 적용
+- 종목/상태별 인덱스와 종목·매매구분별 가격순 지정가 대기열
 """
 
+import bisect
+import itertools
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 from enum import Enum
 from dataclasses import dataclass
@@ -37,6 +40,10 @@ class OrderStatus(Enum):
     REJECTED = "REJECTED"  # 거부
 
 
+# 주문 일련번호 (프로세스 내 단조 증가, 같은 초에 생성된 주문도 ID가 겹치지 않음)
+_order_sequence = itertools.count(1)
+
+
 @dataclass
 class Order:
     """주문 정보"""
@@ -53,228 +60,327 @@ class Order:
     filled_price: Optional[float] = None
     filled_quantity: int = 0
     commission: float = 0.0
-
-
-def __post_init__(self):
-    if self.created_at is None:
-        self.created_at = datetime.now()
-    if self.order_id is None:
-        self.order_id = f"{self.symbol}_{self.side.value}_{self.created_at.strftime('%Y%m%d_%H%M%S')}"
+    sequence: int = 0  # 생성 순서 (지정가 대기열의 시간 우선순위)
+
+    def __post_init__(self):
+        if self.created_at is None:
+            self.created_at = datetime.now()
+        if not self.sequence:
+            self.sequence = next(_order_sequence)
+        if self.order_id is None:
+            self.order_id = (
+                f"{self.symbol}_{self.side.value}_{self.created_at.strftime('%Y%m%d_%H%M%S')}_{self.sequence}"
+            )
 
 
 class OrderManager:
-    """주문 관리 클래스"""
-
-
-def __init__(self, commission_rate: float = 0.00015, slippage_rate: float = 0.001):
     """
-    주문 관리자 초기화
+    주문 관리 클래스
 
-    Args:
-        commission_rate: 수수료율 (기본: 0.015%)
-        slippage_rate: 슬리피지율 (기본: 0.1%)
+    orders(활성 주문)와 order_history(완료 이력) 각각에 상태별, (종목, 상태)별 인덱스를
+    유지해 대기/체결 주문 조회가 전체 주문을 훑지 않습니다. 활성 인덱스는
+    clear_completed_orders()로 정리되고, 이력 인덱스는 reset()에서만 비워집니다. 대기 중인 지정가 주문은
+    (종목, 매매구분)마다 가격-시간 우선순위로 정렬된 대기열에 두어, 새 가격에 대해
+    체결 가능한 주문만 확인합니다 (match_limit_orders).
     """
-    self.commission_rate = commission_rate
-    self.slippage_rate = slippage_rate
-
-    # 주문 관리
-    self.orders: Dict[str, Order] = {}
-    self.order_history: List[Order] = []
-
-    # 로깅
-    self.logger = logging.getLogger(self.__class__.__name__)
-
-
-def create_market_order(self, symbol: str, side: OrderSide, quantity: int) -> Order:
-    """시장가 주문 생성"""
-    order = Order(
-        symbol=symbol, side=side, order_type=OrderType.MARKET, quantity=quantity
-    )
-
-    self.orders[order.order_id] = order
-    self.logger.info(
-        f"시장가 주문 생성: {order.order_id} - {symbol} {side.value} {quantity}주"
-    )
-    return order
-
-
-def create_limit_order(
-    self, symbol: str, side: OrderSide, quantity: int, price: float
-) -> Order:
-    """지정가 주문 생성"""
-    order = Order(
-        symbol=symbol,
-        side=side,
-        order_type=OrderType.LIMIT,
-        quantity=quantity,
-        price=price,
-    )
-
-    self.orders[order.order_id] = order
-    self.logger.info(
-        f"지정가 주문 생성: {order.order_id} - {symbol} {side.value} {quantity}주 @ {price:,.0f}원"
-    )
-    return order
-
-
-def execute_order(
-    self, order_id: str, market_price: float, available_quantity: int = None
-) -> bool:
-    """주문 체결 처리"""
-    if order_id not in self.orders:
-        self.logger.error(f"주문 ID를 찾을 수 없음: {order_id}")
-        return False
-
-    order = self.orders[order_id]
-
-    if order.status != OrderStatus.PENDING:
-        self.logger.warning(
-            f"이미 처리된 주문: {order_id} (상태: {order.status.value})"
+
+    def __init__(self, commission_rate: float = 0.00015, slippage_rate: float = 0.001):
+        """
+        주문 관리자 초기화
+
+        Args:
+            commission_rate: 수수료율 (기본: 0.015%)
+            slippage_rate: 슬리피지율 (기본: 0.1%)
+        """
+        self.commission_rate = commission_rate
+        self.slippage_rate = slippage_rate
+
+        # 주문 관리
+        self.orders: Dict[str, Order] = {}
+        self.order_history: List[Order] = []
+
+        # 인덱스 (삽입 순서 유지 dict: 주문 ID -> 주문)
+        self._by_status: Dict[OrderStatus, Dict[str, Order]] = {status: {} for status in OrderStatus}
+        self._by_symbol_status: Dict[Tuple[str, OrderStatus], Dict[str, Order]] = {}
+        # 이력 인덱스 (order_history와 같은 순서, 완료 주문 정리 후에도 유지)
+        self._history_by_status: Dict[OrderStatus, List[Order]] = {status: [] for status in OrderStatus}
+        self._history_by_symbol_status: Dict[Tuple[str, OrderStatus], List[Order]] = {}
+        # (종목, 매매구분) -> [(정렬 키, 일련번호, 주문 ID)], 체결 가능성이 높은 순
+        # 매수는 -가격(높은 가격 우선), 매도는 가격(낮은 가격 우선)
+        self._limit_queues: Dict[Tuple[str, OrderSide], List[Tuple[float, int, str]]] = {}
+
+        # 로깅
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    # ---- 인덱스 관리 ----
+
+    @staticmethod
+    def _limit_key(side: OrderSide, price: float) -> float:
+        return -price if side == OrderSide.BUY else price
+
+    def _register(self, order: Order):
+        """새 주문을 활성 목록과 인덱스에 등록"""
+        self.orders[order.order_id] = order
+        self._index(order)
+        if order.order_type == OrderType.LIMIT and order.status == OrderStatus.PENDING:
+            queue = self._limit_queues.setdefault((order.symbol, order.side), [])
+            bisect.insort(queue, (self._limit_key(order.side, order.price), order.sequence, order.order_id))
+
+    def _index(self, order: Order):
+        self._by_status[order.status][order.order_id] = order
+        key = (order.symbol, order.status)
+        bucket = self._by_symbol_status.get(key)
+        if bucket is None:
+            bucket = self._by_symbol_status[key] = {}
+        bucket[order.order_id] = order
+
+    def _set_status(self, order: Order, status: OrderStatus):
+        """주문 상태 변경 (인덱스 이동, 대기 지정가 주문은 대기열에서 제거)"""
+        previous = order.status
+        if previous == status:
+            return
+        self._by_status[previous].pop(order.order_id, None)
+        bucket = self._by_symbol_status.get((order.symbol, previous))
+        if bucket is not None:
+            bucket.pop(order.order_id, None)
+            if not bucket:
+                del self._by_symbol_status[(order.symbol, previous)]
+        if previous == OrderStatus.PENDING and order.order_type == OrderType.LIMIT:
+            self._dequeue_limit(order)
+        order.status = status
+        self._index(order)
+
+    def _record_history(self, order: Order):
+        """완료된 주문을 이력과 이력 인덱스에 추가"""
+        self.order_history.append(order)
+        self._history_by_status[order.status].append(order)
+        self._history_by_symbol_status.setdefault((order.symbol, order.status), []).append(order)
+
+    def _dequeue_limit(self, order: Order):
+        queue = self._limit_queues.get((order.symbol, order.side))
+        if not queue:
+            return
+        entry = (self._limit_key(order.side, order.price), order.sequence, order.order_id)
+        i = bisect.bisect_left(queue, entry)
+        if i < len(queue) and queue[i] == entry:
+            del queue[i]
+        if not queue:
+            del self._limit_queues[(order.symbol, order.side)]
+
+    def _orders_with(self, status: OrderStatus, symbol: str = None) -> List[Order]:
+        if symbol:
+            return list(self._by_symbol_status.get((symbol, status), {}).values())
+        return list(self._by_status[status].values())
+
+    # ---- 주문 생성 ----
+
+    def create_market_order(self, symbol: str, side: OrderSide, quantity: int) -> Order:
+        """시장가 주문 생성"""
+        order = Order(
+            symbol=symbol, side=side, order_type=OrderType.MARKET, quantity=quantity
         )
-        return False
 
-    # 체결 가능 여부 확인
-    if order.order_type == OrderType.LIMIT:
-        if order.side == OrderSide.BUY and market_price > order.price:
-            self.logger.info(
-                f"지정가 매수 주문 미체결: 시장가 {market_price:,.0f} > 주문가 {order.price:,.0f}"
-            )
+        self._register(order)
+        self.logger.info(
+            f"시장가 주문 생성: {order.order_id} - {symbol} {side.value} {quantity}주"
+        )
+        return order
+
+    def create_limit_order(
+        self, symbol: str, side: OrderSide, quantity: int, price: float
+    ) -> Order:
+        """지정가 주문 생성"""
+        order = Order(
+            symbol=symbol,
+            side=side,
+            order_type=OrderType.LIMIT,
+            quantity=quantity,
+            price=price,
+        )
+
+        self._register(order)
+        self.logger.info(
+            f"지정가 주문 생성: {order.order_id} - {symbol} {side.value} {quantity}주 @ {price:,.0f}원"
+        )
+        return order
+
+    def execute_order(
+        self, order_id: str, market_price: float, available_quantity: int = None
+    ) -> bool:
+        """주문 체결 처리"""
+        if order_id not in self.orders:
+            self.logger.error(f"주문 ID를 찾을 수 없음: {order_id}")
             return False
-        elif order.side == OrderSide.SELL and market_price < order.price:
-            self.logger.info(
-                f"지정가 매도 주문 미체결: 시장가 {market_price:,.0f} < 주문가 {order.price:,.0f}"
+
+        order = self.orders[order_id]
+
+        if order.status != OrderStatus.PENDING:
+            self.logger.warning(
+                f"이미 처리된 주문: {order_id} (상태: {order.status.value})"
             )
             return False
 
-    # 체결 가격 계산 (슬리피지 적용)
-    if order.side == OrderSide.BUY:
-        filled_price = market_price * (1 + self.slippage_rate)  # 매수시 불리하게
-    else:
-        filled_price = market_price * (1 - self.slippage_rate)  # 매도시 불리하게
-
-    # 지정가 주문의 경우 지정가보다 유리하게 체결되지 않음
-    if order.order_type == OrderType.LIMIT:
+        # 체결 가능 여부 확인
+        if order.order_type == OrderType.LIMIT:
+            if order.side == OrderSide.BUY and market_price > order.price:
+                self.logger.info(
+                    f"지정가 매수 주문 미체결: 시장가 {market_price:,.0f} > 주문가 {order.price:,.0f}"
+                )
+                return False
+            elif order.side == OrderSide.SELL and market_price < order.price:
+                self.logger.info(
+                    f"지정가 매도 주문 미체결: 시장가 {market_price:,.0f} < 주문가 {order.price:,.0f}"
+                )
+                return False
+
+        # 체결 가격 계산 (슬리피지 적용)
         if order.side == OrderSide.BUY:
-            filled_price = min(filled_price, order.price)
+            filled_price = market_price * (1 + self.slippage_rate)  # 매수시 불리하게
         else:
-            filled_price = max(filled_price, order.price)
-
-    # 체결 수량 결정
-    filled_quantity = order.quantity
-    if available_quantity is not None and available_quantity < order.quantity:
-        filled_quantity = available_quantity
-
-    if filled_quantity <= 0:
-        order.status = OrderStatus.REJECTED
-        self.logger.warning(f"주문 거부: {order_id} - 체결 가능 수량 부족")
-        return False
-
-    # 수수료 계산
-    gross_amount = filled_quantity * filled_price
-    commission = gross_amount * self.commission_rate
-
-    # 주문 상태 업데이트
-    order.status = OrderStatus.FILLED
-    order.filled_at = datetime.now()
-    order.filled_price = filled_price
-    order.filled_quantity = filled_quantity
-    order.commission = commission
-
-    # 이력에 추가
-    self.order_history.append(order)
-
-    self.logger.info(
-        f"주문 체결: {order_id} - {filled_quantity}주 @ {filled_price:,.0f}원 (수수료: {commission:,.0f}원)"
-    )
-    return True
+            filled_price = market_price * (1 - self.slippage_rate)  # 매도시 불리하게
+
+        # 지정가 주문의 경우 지정가보다 유리하게 체결되지 않음
+        if order.order_type == OrderType.LIMIT:
+            if order.side == OrderSide.BUY:
+                filled_price = min(filled_price, order.price)
+            else:
+                filled_price = max(filled_price, order.price)
+
+        # 체결 수량 결정
+        filled_quantity = order.quantity
+        if available_quantity is not None and available_quantity < order.quantity:
+            filled_quantity = available_quantity
+
+        if filled_quantity <= 0:
+            self._set_status(order, OrderStatus.REJECTED)
+            self.logger.warning(f"주문 거부: {order_id} - 체결 가능 수량 부족")
+            return False
 
+        # 수수료 계산
+        gross_amount = filled_quantity * filled_price
+        commission = gross_amount * self.commission_rate
 
-def cancel_order(self, order_id: str) -> bool:
-    """주문 취소"""
-    if order_id not in self.orders:
-        self.logger.error(f"주문 ID를 찾을 수 없음: {order_id}")
-        return False
+        # 주문 상태 업데이트
+        self._set_status(order, OrderStatus.FILLED)
+        order.filled_at = datetime.now()
+        order.filled_price = filled_price
+        order.filled_quantity = filled_quantity
+        order.commission = commission
 
-    order = self.orders[order_id]
+        # 이력에 추가
+        self._record_history(order)
 
-    if order.status != OrderStatus.PENDING:
-        self.logger.warning(
-            f"취소할 수 없는 주문: {order_id} (상태: {order.status.value})"
+        self.logger.info(
+            f"주문 체결: {order_id} - {filled_quantity}주 @ {filled_price:,.0f}원 (수수료: {commission:,.0f}원)"
         )
-        return False
-
-    order.status = OrderStatus.CANCELLED
-    self.order_history.append(order)
-
-    self.logger.info(f"주문 취소: {order_id}")
-    return True
-
-
-def get_order(self, order_id: str) -> Optional[Order]:
-    """주문 정보 조회"""
-    return self.orders.get(order_id)
-
-
-def get_pending_orders(self, symbol: str = None) -> List[Order]:
-    """대기 중인 주문 목록"""
-    pending_orders = [
-        order for order in self.orders.values() if order.status == OrderStatus.PENDING
-    ]
-
-    if symbol:
-        pending_orders = [order for order in pending_orders if order.symbol == symbol]
-
-    return pending_orders
-
+        return True
 
-def get_filled_orders(self, symbol: str = None) -> List[Order]:
-    """체결된 주문 목록"""
-    filled_orders = [
-        order for order in self.order_history if order.status == OrderStatus.FILLED
-    ]
-
-    if symbol:
-        filled_orders = [order for order in filled_orders if order.symbol == symbol]
-
-    return filled_orders
-
-
-def get_order_summary(self) -> Dict[str, int]:
-    """주문 현황 요약"""
-    summary = {
-        "total": len(self.orders),
-        "pending": len(
-            [o for o in self.orders.values() if o.status == OrderStatus.PENDING]
-        ),
-        "filled": len(
-            [o for o in self.order_history if o.status == OrderStatus.FILLED]
-        ),
-        "cancelled": len(
-            [o for o in self.order_history if o.status == OrderStatus.CANCELLED]
-        ),
-        "rejected": len(
-            [o for o in self.order_history if o.status == OrderStatus.REJECTED]
-        ),
-    }
-    return summary
-
-
-def clear_completed_orders(self):
-    """완료된 주문들을 활성 주문 목록에서 제거"""
-    completed_orders = [
-        order_id
-        for order_id, order in self.orders.items()
-        if order.status != OrderStatus.PENDING
-    ]
-
-    for order_id in completed_orders:
-        del self.orders[order_id]
+    def cancel_order(self, order_id: str) -> bool:
+        """주문 취소"""
+        if order_id not in self.orders:
+            self.logger.error(f"주문 ID를 찾을 수 없음: {order_id}")
+            return False
 
-    self.logger.info(f"완료된 주문 {len(completed_orders)}개 정리")
+        order = self.orders[order_id]
 
+        if order.status != OrderStatus.PENDING:
+            self.logger.warning(
+                f"취소할 수 없는 주문: {order_id} (상태: {order.status.value})"
+            )
+            return False
 
-def reset(self):
-    """주문 관리자 초기화"""
-    self.orders.clear()
-    self.order_history.clear()
-    self.logger.info("주문 관리자 초기화 완료")
+        self._set_status(order, OrderStatus.CANCELLED)
+        self._record_history(order)
+
+        self.logger.info(f"주문 취소: {order_id}")
+        return True
+
+    def match_limit_orders(
+        self, symbol: str, market_price: float, available_quantity: int = None
+    ) -> List[Order]:
+        """
+        새 시장가로 체결 가능한 대기 지정가 주문만 골라 가격-시간 우선순위로 체결
+
+        매수는 지정가 >= 시장가, 매도는 지정가 <= 시장가인 주문이 대상이며, 정렬된
+        대기열 앞부분만 확인합니다. available_quantity가 있으면 매수/매도 각각
+        그 수량 안에서 순서대로 배분합니다.
+
+        Returns:
+            체결된 주문 목록
+        """
+        filled = []
+        for side in (OrderSide.BUY, OrderSide.SELL):
+            queue = self._limit_queues.get((symbol, side))
+            if not queue:
+                continue
+            end = bisect.bisect_right(queue, (self._limit_key(side, market_price), float("inf")))
+            remaining = available_quantity
+            for _, _, order_id in queue[:end]:
+                if remaining is not None and remaining <= 0:
+                    break
+                if self.execute_order(order_id, market_price, remaining):
+                    order = self.orders[order_id]
+                    filled.append(order)
+                    if remaining is not None:
+                        remaining -= order.filled_quantity
+        return filled
+
+    def get_pending_limit_orders(self, symbol: str, side: OrderSide) -> List[Order]:
+        """대기 중인 지정가 주문 (체결 우선순위 순)"""
+        return [self.orders[order_id] for *_, order_id in self._limit_queues.get((symbol, side), [])]
+
+    def get_order(self, order_id: str) -> Optional[Order]:
+        """주문 정보 조회"""
+        return self.orders.get(order_id)
+
+    def get_pending_orders(self, symbol: str = None) -> List[Order]:
+        """대기 중인 주문 목록"""
+        return self._orders_with(OrderStatus.PENDING, symbol)
+
+    def get_filled_orders(self, symbol: str = None) -> List[Order]:
+        """체결된 주문 목록 (이력 기준, 완료 주문 정리 후에도 유지)"""
+        if symbol:
+            return list(self._history_by_symbol_status.get((symbol, OrderStatus.FILLED), []))
+        return list(self._history_by_status[OrderStatus.FILLED])
+
+    def get_order_summary(self) -> Dict[str, int]:
+        """주문 현황 요약 (대기는 활성 주문, 체결/취소/거부는 이력 기준)"""
+        history = self._history_by_status
+        summary = {
+            "total": len(self.orders),
+            "pending": len(self._by_status[OrderStatus.PENDING]),
+            "filled": len(history[OrderStatus.FILLED]),
+            "cancelled": len(history[OrderStatus.CANCELLED]),
+            "rejected": len(history[OrderStatus.REJECTED]),
+        }
+        return summary
+
+    def clear_completed_orders(self):
+        """완료된 주문들을 활성 주문 목록과 활성 인덱스에서 제거 (이력은 유지)"""
+        removed = 0
+        for status, bucket in self._by_status.items():
+            if status == OrderStatus.PENDING:
+                continue
+            for order_id in bucket:
+                del self.orders[order_id]
+            removed += len(bucket)
+            bucket.clear()
+
+        completed_keys = [key for key in self._by_symbol_status if key[1] != OrderStatus.PENDING]
+        for key in completed_keys:
+            del self._by_symbol_status[key]
+
+        self.logger.info(f"완료된 주문 {removed}개 정리")
+
+    def reset(self):
+        """주문 관리자 초기화"""
+        self.orders.clear()
+        self.order_history.clear()
+        for bucket in self._by_status.values():
+            bucket.clear()
+        self._by_symbol_status.clear()
+        for history in self._history_by_status.values():
+            history.clear()
+        self._history_by_symbol_status.clear()
+        self._limit_queues.clear()
+        self.logger.info("주문 관리자 초기화 완료")
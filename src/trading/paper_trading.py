@@ -0,0 +1,767 @@
+"""
+모의투자(페이퍼 트레이딩) 시뮬레이터
+
+브로커 연결 없이 실시간 매매 경로 전체(시세 수신 -> 봉 집계 -> 신호 -> 주문 관리 ->
+포트폴리오)를 부하 시험하기 위한 로컬 시장 재생 서버와 가상 체결 브로커입니다.
+
+- MarketReplayServer: 기록된/합성 체결 틱을 WebSocketClient와 같은 프로토콜
+  (구독 메시지, REAL/0B 체결 프레임)로 1~1000배속 재생하고, 같은 연결로 받은
+  주문(trnm=ORDER)을 SimulatedBroker로 체결해 REAL/00(주문체결) 이벤트로 응답
+- PaperTradingSession: WebSocketClient -> TickBarAggregator -> LiveSignalEngine
+  -> OrderManager -> Portfolio를 연결하고 단계별 지연을 LatencyHistogram으로 기록
+  (feed: 서버 송신 -> 틱 핸들러, bar: 틱 수신 -> 봉 완성, signal: 틱 수신 -> 신호,
+  order_ack: 주문 전송 -> 체결 응답, tick_to_ack: 서버 송신 -> 체결 응답)
+- 재생 시각은 거래소 현지 epoch 초이며 체결시간(20)은 HHMMSS로만 전달되므로
+  한 번에 한 거래일만 재생합니다 (봉 날짜는 수신 측의 당일 날짜)
+
+기록 틱 파일(CSV)은 ts(현지 epoch 초) 또는 timestamp(일시 문자열), symbol, price,
+volume 컬럼을 사용합니다.
+
+사용 예시:
+    ticks = synthetic_ticks(["005930", "000660"], minutes=390)
+    async with MarketReplayServer(ticks, speed=1000) as server:
+        session = PaperTradingSession(server.url, [RSIStrategy()])
+        report = await session.run(["005930", "000660"])
+    print(format_latency_report(session.latency))
+"""
+
+import asyncio
+import bisect
+import json
+import logging
+import math
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Set
+
+import numpy as np
+import pandas as pd
+import websockets
+
+from src.api.auth import TokenCache
+from src.api.stream_pipeline import PipelineConfig
+from src.api.websocket_client import ReconnectPolicy, WebSocketClient
+from src.data.bar_aggregator import (
+    FID_PRICE,
+    FID_TRADE_TIME,
+    FID_TRADE_VOLUME,
+    Bar,
+    TickBarAggregator,
+    bar_start_to_datetime,
+    local_epoch_seconds,
+)
+from src.strategies.base_strategy import BaseStrategy, TradeSignal
+from src.strategies.live_engine import LiveSignalEngine
+
+from .order_manager import OrderManager, OrderSide, OrderStatus
+from .portfolio import Portfolio
+
+logger = logging.getLogger(__name__)
+
+MIN_SPEED = 1.0
+MAX_SPEED = 1000.0
+
+TRADE_TR_TYPE = "0B"  # 주식체결
+FILL_TR_TYPE = "00"  # 주문체결
+ORDER_TRNM = "ORDER"
+REPLAY_END_TRNM = "REPLAY_END"
+PAPER_TOKEN = "paper-trading"
+
+# 주문체결(00) FID
+FID_ORDER_ID = "9203"
+FID_SYMBOL = "9001"
+FID_ORDER_STATUS = "913"
+FID_ORDER_SIDE = "905"
+FID_FILL_PRICE = "910"
+FID_FILL_QUANTITY = "911"
+FID_FILL_TIME = "908"
+STATUS_FILLED = "체결"
+STATUS_REJECTED = "거부"
+
+NAN = float("nan")
+
+LATENCY_STAGES = ("feed", "bar", "signal", "order_ack", "tick_to_ack")
+
+
+class ReplayTick(NamedTuple):
+    """재생할 체결 틱"""
+
+    ts: float  # 거래소 현지 epoch 초
+    symbol: str
+    price: float
+    volume: float
+
+
+def _hhmmss(ts: float) -> str:
+    seconds = int(ts) % 86400
+    return f"{seconds // 3600:02d}{seconds // 60 % 60:02d}{seconds % 60:02d}"
+
+
+# ---- 틱 소스 ----
+
+
+def load_recorded_ticks(path: str) -> List[ReplayTick]:
+    """기록된 체결 틱 CSV 로드 (시각순 정렬)"""
+    frame = pd.read_csv(path, dtype={"symbol": str})
+    if "ts" in frame.columns:
+        timestamps = frame["ts"].astype(float)
+    elif "timestamp" in frame.columns:
+        timestamps = pd.Series(
+            [local_epoch_seconds(moment) for moment in pd.to_datetime(frame["timestamp"]).dt.to_pydatetime()],
+            index=frame.index,
+        )
+    else:
+        raise ValueError(f"시각 컬럼(ts 또는 timestamp)이 없습니다: {path}")
+    frame = frame.assign(ts=timestamps).sort_values("ts", kind="stable")
+    ticks = [
+        ReplayTick(ts, symbol, price, volume)
+        for ts, symbol, price, volume in zip(
+            frame["ts"].tolist(),
+            frame["symbol"].tolist(),
+            frame["price"].astype(float).tolist(),
+            frame["volume"].astype(float).tolist(),
+        )
+    ]
+    logger.info(f"기록 틱 {len(ticks):,}건 로드: {path}")
+    return ticks
+
+
+def save_ticks(ticks: Iterable[ReplayTick], path: str) -> None:
+    """체결 틱을 load_recorded_ticks 형식의 CSV로 저장"""
+    pd.DataFrame(list(ticks), columns=list(ReplayTick._fields)).to_csv(path, index=False)
+
+
+def synthetic_ticks(
+    symbols: Sequence[str],
+    minutes: int = 390,
+    ticks_per_second: float = 20.0,
+    session_start: str = "09:00:00",
+    base_price: float = 50_000.0,
+    volatility: float = 0.002,
+    seed: int = 0,
+) -> List[ReplayTick]:
+    """
+    종목별 로그 정규 랜덤워크 합성 틱 (당일 session_start부터 minutes분, 초 단위 시각)
+
+    Args:
+        ticks_per_second: 전 종목 합산 초당 틱 수
+        volatility: 틱당 로그 수익률 표준편차
+    """
+    rng = np.random.default_rng(seed)
+    count = int(minutes * 60 * ticks_per_second)
+    start = local_epoch_seconds(datetime.combine(datetime.now().date(), datetime.strptime(session_start, "%H:%M:%S").time()))
+    offsets = np.sort(rng.integers(0, minutes * 60, count))
+    symbol_idx = rng.integers(0, len(symbols), count)
+    returns = rng.normal(0.0, volatility, count)
+
+    prices = np.empty(count)
+    for idx in range(len(symbols)):
+        mask = symbol_idx == idx
+        level = base_price * (0.5 + rng.random())
+        prices[mask] = np.round(level * np.exp(np.cumsum(returns[mask])))
+    volumes = rng.integers(1, 500, count)
+
+    return [
+        ReplayTick(start + offset, symbols[idx], price, volume)
+        for offset, idx, price, volume in zip(offsets.tolist(), symbol_idx.tolist(), prices.tolist(), volumes.tolist())
+    ]
+
+
+# ---- 지연 히스토그램 ----
+
+
+class LatencyHistogram:
+    """로그 간격 지연 히스토그램 (구간 경계 기준 백분위 추정)"""
+
+    def __init__(
+        self,
+        name: str,
+        min_seconds: float = 1e-6,
+        max_seconds: float = 100.0,
+        bins_per_decade: int = 10,
+    ):
+        """
+        Args:
+            name: 단계 이름
+            min_seconds, max_seconds: 구간 범위 (벗어난 값은 양 끝 구간에 집계)
+            bins_per_decade: 10배 구간당 칸 수
+        """
+        self.name = name
+        decades = math.log10(max_seconds / min_seconds)
+        bins = int(round(decades * bins_per_decade))
+        self.edges: List[float] = (min_seconds * 10 ** (np.arange(bins + 1) / bins_per_decade)).tolist()
+        self.counts = [0] * (bins + 2)  # [min 미만, 구간들..., max 이상]
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        seconds = max(seconds, 0.0)
+        self.counts[bisect.bisect_right(self.edges, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, pct: float) -> float:
+        """pct(0~100) 백분위 지연 (해당 구간 상한, 관측 최대값 이하로 제한)"""
+        if not self.count:
+            return NAN
+        rank = max(1, math.ceil(self.count * pct / 100.0))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                upper = self.edges[index] if index < len(self.edges) else self.max
+                return min(max(upper, self.min), self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else NAN
+
+    def summary(self) -> Dict[str, float]:
+        """건수와 평균/백분위/최대 지연 (밀리초)"""
+        return {
+            "count": self.count,
+            "mean_ms": self.mean * 1000,
+            "p50_ms": self.percentile(50) * 1000,
+            "p90_ms": self.percentile(90) * 1000,
+            "p99_ms": self.percentile(99) * 1000,
+            "max_ms": self.max * 1000 if self.count else NAN,
+        }
+
+    def format(self, width: int = 40) -> str:
+        """관측값이 있는 구간만 막대그래프 텍스트로 출력"""
+        stats = self.summary()
+        lines = [
+            f"[{self.name}] n={self.count:,} mean={stats['mean_ms']:.3f}ms "
+            f"p50={stats['p50_ms']:.3f}ms p90={stats['p90_ms']:.3f}ms "
+            f"p99={stats['p99_ms']:.3f}ms max={stats['max_ms']:.3f}ms"
+        ]
+        if not self.count:
+            return lines[0]
+        peak = max(self.counts)
+        bounds = [0.0] + self.edges + [math.inf]
+        for index, count in enumerate(self.counts):
+            if not count:
+                continue
+            low, high = bounds[index] * 1000, bounds[index + 1] * 1000
+            bar = "#" * max(1, round(width * count / peak))
+            lines.append(f"  {low:>10.3f} ~ {high:>10.3f}ms | {bar} {count:,}")
+        return "\n".join(lines)
+
+
+def format_latency_report(histograms: Dict[str, LatencyHistogram]) -> str:
+    """단계별 지연 히스토그램 보고서"""
+    return "\n\n".join(histogram.format() for histogram in histograms.values())
+
+
+# ---- 가상 브로커 / 재생 서버 ----
+
+
+class SimulatedBroker:
+    """
+    가상 체결 브로커
+
+    시장가 주문은 해당 종목의 최근 재생 체결가로 즉시 전량 체결하고, 지정가 주문은
+    재생 가격이 지정가에 도달하는 틱에서 지정가로 체결합니다. 체결가가 없는 종목이나
+    수량이 잘못된 주문은 거부합니다.
+    """
+
+    def __init__(self, fill_latency: float = 0.0):
+        """
+        Args:
+            fill_latency: 체결 응답 전 대기 시간 (초, 거래소 왕복 지연 모의)
+        """
+        self.fill_latency = fill_latency
+        self.last_prices: Dict[str, float] = {}
+        self.last_ts = 0.0
+        self._resting: Dict[str, List[Dict[str, Any]]] = {}
+        self.stats = {"orders": 0, "filled": 0, "rejected": 0}
+
+    def on_tick(self, symbol: str, price: float, ts: float) -> List[Dict[str, Any]]:
+        """재생 틱 반영, 이 가격으로 체결된 지정가 주문 체결 이벤트 반환"""
+        self.last_prices[symbol] = price
+        self.last_ts = ts
+        resting = self._resting.get(symbol)
+        if not resting:
+            return []
+        fills, remaining = [], []
+        for order in resting:
+            buy = order["side"] == OrderSide.BUY.value
+            if (buy and price <= order["price"]) or (not buy and price >= order["price"]):
+                fills.append(self._fill_event(order, order["price"], STATUS_FILLED))
+            else:
+                remaining.append(order)
+        self._resting[symbol] = remaining
+        return fills
+
+    def submit(self, order: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """주문 접수 (즉시 체결/거부 이벤트 반환, 미체결 지정가는 대기)"""
+        self.stats["orders"] += 1
+        symbol = order.get("symbol")
+        price = self.last_prices.get(symbol)
+        try:
+            valid = int(order.get("quantity") or 0) > 0 and order.get("side") in (
+                OrderSide.BUY.value,
+                OrderSide.SELL.value,
+            )
+        except (TypeError, ValueError):
+            valid = False
+        if price is None or not valid:
+            return [self._fill_event(order, price or 0.0, STATUS_REJECTED)]
+
+        limit = order.get("price")
+        if order.get("order_type") == "LIMIT" and limit is not None:
+            self._resting.setdefault(symbol, []).append(order)
+            return self.on_tick(symbol, price, self.last_ts)
+        return [self._fill_event(order, price, STATUS_FILLED)]
+
+    def _fill_event(self, order: Dict[str, Any], price: float, status: str) -> Dict[str, Any]:
+        self.stats["filled" if status == STATUS_FILLED else "rejected"] += 1
+        return {
+            "type": FILL_TR_TYPE,
+            "item": order.get("symbol"),
+            "values": {
+                FID_ORDER_ID: order.get("order_id"),
+                FID_SYMBOL: order.get("symbol"),
+                FID_ORDER_STATUS: status,
+                FID_ORDER_SIDE: "+매수" if order.get("side") == OrderSide.BUY.value else "-매도",
+                FID_FILL_PRICE: repr(float(price)),
+                FID_FILL_QUANTITY: str(order.get("quantity") if status == STATUS_FILLED else 0),
+                FID_FILL_TIME: _hhmmss(self.last_ts),
+            },
+        }
+
+
+class _ReplayConnection:
+    """재생 서버에 연결된 클라이언트 하나"""
+
+    def __init__(self, ws):
+        self.ws = ws
+        self.items: Set[str] = set()
+
+
+class MarketReplayServer:
+    """
+    기록/합성 체결 틱을 WebSocketClient 프로토콜로 재생하는 로컬 서버
+
+    첫 구독이 들어오면(autoplay) 재생을 시작하고, 틱 시각 간격을 speed로 나눈 만큼
+    기다리며 같은 시각의 틱을 REAL 프레임 하나로 묶어 보냅니다. 예정 시각보다
+    늦어지면 대기 없이 따라잡습니다. 재생이 끝나면 {"trnm": "REPLAY_END"}를 보냅니다.
+    각 체결 항목의 sent_at은 송신 시각(time.time())으로 수신 측 지연 측정에 사용됩니다.
+    """
+
+    def __init__(
+        self,
+        ticks: Sequence[ReplayTick],
+        speed: float = 1.0,
+        broker: Optional[SimulatedBroker] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        autoplay: bool = True,
+    ):
+        """
+        Args:
+            ticks: 시각순 체결 틱
+            speed: 재생 배속 (MIN_SPEED ~ MAX_SPEED)
+            broker: 주문 체결 브로커 (기본: SimulatedBroker())
+            autoplay: 첫 구독 시 자동 재생 (False면 play() 호출)
+        """
+        if not MIN_SPEED <= speed <= MAX_SPEED:
+            raise ValueError(f"재생 배속은 {MIN_SPEED:g}~{MAX_SPEED:g} 사이여야 합니다: {speed}")
+        self.ticks = ticks
+        self.speed = speed
+        self.broker = broker or SimulatedBroker()
+        self.host = host
+        self.port = port
+        self.autoplay = autoplay
+        self.url: Optional[str] = None
+        self.finished = asyncio.Event()
+        self.stats = {"frames": 0, "ticks": 0, "late_frames": 0, "max_behind_ms": 0.0, "orders": 0}
+        self._connections: List[_ReplayConnection] = []
+        self._server = None
+        self._player: Optional[asyncio.Task] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def start(self) -> "MarketReplayServer":
+        self._server = await websockets.serve(self._handle, self.host, self.port)
+        self.url = f"ws://{self.host}:{self._server.sockets[0].getsockname()[1]}"
+        logger.info(f"시장 재생 서버 시작: {self.url} ({len(self.ticks):,}틱, {self.speed:g}배속)")
+        return self
+
+    async def stop(self) -> None:
+        for task in [self._player, *self._tasks]:
+            if task is not None:
+                task.cancel()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> "MarketReplayServer":
+        return await self.start()
+
+    async def __aexit__(self, *exc):
+        await self.stop()
+
+    def play(self) -> asyncio.Task:
+        """재생 시작 (이미 시작했으면 기존 작업 반환)"""
+        if self._player is None:
+            self._player = asyncio.create_task(self._play(), name="market-replay")
+        return self._player
+
+    # ---- 연결 처리 ----
+
+    async def _handle(self, ws):
+        if not ws.request.headers.get("authorization"):
+            await ws.close(code=1008, reason="authorization required")
+            return
+        connection = _ReplayConnection(ws)
+        self._connections.append(connection)
+        try:
+            async for raw in ws:
+                try:
+                    message = json.loads(raw)
+                except ValueError:
+                    logger.warning(f"재생 서버: 잘못된 메시지 무시 ({raw[:80]!r})")
+                    continue
+                await self._on_message(connection, message)
+        except websockets.exceptions.ConnectionClosed:
+            pass
+        finally:
+            self._connections.remove(connection)
+
+    async def _on_message(self, connection: _ReplayConnection, message: Dict[str, Any]):
+        if message.get("trnm") == ORDER_TRNM:
+            self.stats["orders"] += 1
+            self._ack(connection, self.broker.submit(message))
+            return
+        if TRADE_TR_TYPE not in (message.get("tr_type") or ()):
+            return  # PING 응답, 기타 TR 구독
+        items = message.get("items") or []
+        if message.get("unsubscribe"):
+            connection.items.difference_update(items or connection.items)
+            return
+        if message.get("refresh") == "0":
+            connection.items.clear()
+        connection.items.update(items)
+        if self.autoplay:
+            self.play()
+
+    def _ack(self, connection: _ReplayConnection, events: List[Dict[str, Any]]):
+        if not events:
+            return
+        task = asyncio.create_task(self._send_events(connection, events, self.broker.fill_latency))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send_events(self, connection: _ReplayConnection, events: List[Dict[str, Any]], delay: float = 0.0):
+        if delay > 0:
+            await asyncio.sleep(delay)
+        try:
+            await connection.ws.send(json.dumps({"trnm": "REAL", "data": events}))
+        except websockets.exceptions.ConnectionClosed:
+            pass
+
+    # ---- 재생 ----
+
+    async def _play(self):
+        loop = asyncio.get_running_loop()
+        ticks = self.ticks
+        if not ticks:
+            await self._finish()
+            return
+        first_ts = ticks[0].ts
+        started = loop.time()
+        i = 0
+        while i < len(ticks):
+            ts = ticks[i].ts
+            j = i
+            while j < len(ticks) and ticks[j].ts == ts:
+                j += 1
+            delay = started + (ts - first_ts) / self.speed - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            else:
+                behind = -delay * 1000
+                if behind > 1.0:
+                    self.stats["late_frames"] += 1
+                if behind > self.stats["max_behind_ms"]:
+                    self.stats["max_behind_ms"] = behind
+                await asyncio.sleep(0)
+            await self._send_ticks(ticks[i:j])
+            i = j
+        await self._finish()
+
+    async def _send_ticks(self, group: Sequence[ReplayTick]):
+        broker = self.broker
+        hhmmss = _hhmmss(group[0].ts)
+        sent_at = time.time()
+        entries = []
+        for tick in group:
+            for fill in broker.on_tick(tick.symbol, tick.price, tick.ts):
+                for connection in self._connections:
+                    self._ack(connection, [fill])
+            entries.append({
+                "type": TRADE_TR_TYPE,
+                "item": tick.symbol,
+                "values": {
+                    FID_PRICE: repr(float(tick.price)),
+                    FID_TRADE_VOLUME: repr(float(tick.volume)),
+                    FID_TRADE_TIME: hhmmss,
+                },
+                "sent_at": sent_at,
+            })
+        self.stats["ticks"] += len(group)
+        for connection in list(self._connections):
+            data = [entry for entry in entries if entry["item"] in connection.items]
+            if not data:
+                continue
+            try:
+                await connection.ws.send(json.dumps({"trnm": "REAL", "data": data}))
+                self.stats["frames"] += 1
+            except websockets.exceptions.ConnectionClosed:
+                pass
+
+    async def _finish(self):
+        for connection in list(self._connections):
+            try:
+                await connection.ws.send(json.dumps({"trnm": REPLAY_END_TRNM, "ticks": self.stats["ticks"]}))
+            except websockets.exceptions.ConnectionClosed:
+                pass
+        self.finished.set()
+        logger.info(f"시장 재생 완료: {self.stats}")
+
+
+# ---- 모의투자 세션 ----
+
+
+@dataclass
+class PaperTradingConfig:
+    """모의투자 세션 설정"""
+
+    interval: str = "1m"  # 신호를 판정할 봉 주기
+    initial_cash: float = 10_000_000.0
+    position_size: float = 0.1  # 매수 1건 금액 (초기 자본 대비 비율)
+    commission_rate: float = 0.00015
+    slippage_rate: float = 0.0
+    tax_rate: float = 0.0025
+    min_confidence: float = 0.0  # 이 신뢰도 미만 신호는 주문하지 않음
+    ack_timeout: float = 5.0  # 재생 종료 후 미체결 주문 응답 대기 (초)
+
+
+class PaperTradingSession:
+    """
+    재생 서버(또는 같은 프로토콜의 피드)에 붙는 모의투자 세션
+
+    종목마다 진행 중인 주문은 하나만 허용하고, 매수 신호는 미보유 종목에서
+    position_size 금액만큼, 매도 신호는 보유 수량 전량으로 시장가 주문합니다.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        strategies: Iterable[BaseStrategy],
+        config: Optional[PaperTradingConfig] = None,
+        pipeline_config: Optional[PipelineConfig] = None,
+        reconnect: Optional[ReconnectPolicy] = None,
+    ):
+        self.config = config or PaperTradingConfig()
+        cfg = self.config
+        self.client = WebSocketClient(
+            pipeline_config=pipeline_config or PipelineConfig(frame_policy="block"),
+            url=url,
+            reconnect=reconnect or ReconnectPolicy(initial_delay=0.1, max_attempts=3, stale_timeout=None),
+            token_cache=TokenCache(lambda: {"token": PAPER_TOKEN}),
+        )
+        self.aggregator = TickBarAggregator(intervals=(cfg.interval,))
+        self.engine = LiveSignalEngine(strategies, on_signal=self._on_signal, interval=cfg.interval)
+        self.order_manager = OrderManager(cfg.commission_rate, cfg.slippage_rate)
+        self.portfolio = Portfolio(cfg.initial_cash, cfg.commission_rate, cfg.tax_rate)
+        self.latency: Dict[str, LatencyHistogram] = {stage: LatencyHistogram(stage) for stage in LATENCY_STAGES}
+        self.stats = {"ticks": 0, "bars": 0, "signals": 0, "orders": 0, "fills": 0, "rejected": 0, "skipped": 0}
+
+        self.aggregator.subscribe(self._on_bars, intervals=[cfg.interval])
+        self.client.add_handler(TRADE_TR_TYPE, self._on_ticks, policy="block")
+        self.client.add_handler(FILL_TR_TYPE, self._on_fills, policy="block")
+        self.client.add_handler(REPLAY_END_TRNM, self._on_replay_end, policy="block")
+
+        self._batch_received: Optional[float] = None  # 처리 중인 틱 묶음의 수신 시각
+        self._batch_sent: Optional[float] = None  # 처리 중인 틱 묶음의 가장 이른 송신 시각
+        self._signals: List[tuple] = []  # (strategy_name, signal, 신호 시각)
+        self._in_flight: Dict[str, str] = {}  # symbol -> order_id
+        self._order_context: Dict[str, tuple] = {}  # order_id -> (주문 전송 시각, 틱 송신 시각, 신호 시각)
+        self._replay_ended = asyncio.Event()
+
+    def warm_up(self, symbol: str, history: pd.DataFrame) -> int:
+        """과거 봉으로 신호 엔진 지표 상태를 채움 (LiveSignalEngine.warm_up)"""
+        return self.engine.warm_up(symbol, history)
+
+    async def run(self, symbols: List[str], timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        구독 후 재생 종료(REPLAY_END)와 미체결 응답까지 대기하고 결과 보고서 반환
+
+        Raises:
+            ConnectionError: 재연결 한도를 넘어 피드에 연결하지 못한 경우
+        """
+        await self.client.subscribe([TRADE_TR_TYPE], symbols)
+        runner = asyncio.create_task(self.client.run_forever())
+        waiter = asyncio.create_task(self._wait_finished())
+        try:
+            done, _ = await asyncio.wait({runner, waiter}, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                logger.warning(f"모의투자 세션 시간 초과 ({timeout}초)")
+        finally:
+            waiter.cancel()
+            await self.client.disconnect()
+            await runner
+        return self.report()
+
+    async def _wait_finished(self):
+        await self._replay_ended.wait()
+        # 다른 TR 채널에 남은 틱을 먼저 처리한 뒤 진행 중인 봉을 마감
+        await self.client.pipeline.drain()
+        self.aggregator.close_all()
+        await self._submit_signals()
+        deadline = time.monotonic() + self.config.ack_timeout
+        while self._in_flight and time.monotonic() < deadline:
+            await asyncio.sleep(0.005)
+        if self._in_flight:
+            logger.warning(f"체결 응답 없는 주문 {len(self._in_flight)}건")
+
+    # ---- 파이프라인 핸들러 ----
+
+    async def _on_ticks(self, events: List[Dict[str, Any]]):
+        received = time.time()
+        feed = self.latency["feed"]
+        earliest = received
+        for event in events:
+            sent_at = event.get("sent_at")
+            if sent_at is not None:
+                feed.record(received - sent_at)
+                if sent_at < earliest:
+                    earliest = sent_at
+        self.stats["ticks"] += len(events)
+
+        self._batch_received, self._batch_sent = received, earliest
+        try:
+            self.aggregator.on_events(events)
+        finally:
+            self._batch_received = self._batch_sent = None
+        await self._submit_signals(received, earliest)
+
+    def _on_bars(self, bars: List[Bar]):
+        received = self._batch_received
+        if received is not None:
+            elapsed = time.time() - received
+            for _ in bars:
+                self.latency["bar"].record(elapsed)
+        self.stats["bars"] += len(bars)
+        self.engine.on_bars(bars)
+        self.portfolio.update_prices(
+            {bar.symbol: bar.close for bar in bars}, bar_start_to_datetime(bars[-1].start)
+        )
+
+    def _on_signal(self, name: str, signal: TradeSignal):
+        self.stats["signals"] += 1
+        now = time.time()
+        if self._batch_received is not None:
+            self.latency["signal"].record(now - self._batch_received)
+        self._signals.append((name, signal, now))
+
+    async def _submit_signals(self, received: Optional[float] = None, tick_sent: Optional[float] = None):
+        signals, self._signals = self._signals, []
+        for name, signal, signaled_at in signals:
+            order = self._order_for(signal)
+            if order is None:
+                self.stats["skipped"] += 1
+                continue
+            self._in_flight[order.symbol] = order.order_id
+            self._order_context[order.order_id] = (time.time(), tick_sent, signal.timestamp)
+            self.stats["orders"] += 1
+            await self.client.send_message({
+                "trnm": ORDER_TRNM,
+                "order_id": order.order_id,
+                "symbol": order.symbol,
+                "side": order.side.value,
+                "order_type": order.order_type.value,
+                "quantity": order.quantity,
+                "price": order.price,
+                "strategy": name,
+            })
+
+    def _order_for(self, signal: TradeSignal):
+        """신호를 시장가 주문으로 변환 (주문할 수 없으면 None)"""
+        symbol = signal.symbol
+        if symbol in self._in_flight or signal.confidence < self.config.min_confidence:
+            return None
+        position = self.portfolio.positions.get(symbol)
+        if signal.signal_type == "BUY" and position is None:
+            budget = min(self.config.initial_cash * self.config.position_size, self.portfolio.cash)
+            quantity = int(budget / (signal.price * (1 + self.config.commission_rate + self.config.slippage_rate)))
+            if quantity <= 0:
+                return None
+            return self.order_manager.create_market_order(symbol, OrderSide.BUY, quantity)
+        if signal.signal_type == "SELL" and position is not None:
+            return self.order_manager.create_market_order(symbol, OrderSide.SELL, position.quantity)
+        return None
+
+    async def _on_fills(self, events: List[Dict[str, Any]]):
+        received = time.time()
+        for event in events:
+            values = event.get("values") or {}
+            order_id = values.get(FID_ORDER_ID)
+            context = self._order_context.pop(order_id, None)
+            order = self.order_manager.get_order(order_id)
+            if context is None or order is None:
+                logger.warning(f"알 수 없는 주문 체결 응답: {order_id}")
+                continue
+            self._in_flight.pop(order.symbol, None)
+            sent_at, tick_sent, timestamp = context
+            self.latency["order_ack"].record(received - sent_at)
+            if tick_sent is not None:
+                self.latency["tick_to_ack"].record(received - tick_sent)
+
+            if values.get(FID_ORDER_STATUS) != STATUS_FILLED:
+                self.order_manager.execute_order(order_id, float(values.get(FID_FILL_PRICE) or 0), available_quantity=0)
+                self.stats["rejected"] += 1
+                continue
+            filled = self.order_manager.execute_order(
+                order_id, float(values[FID_FILL_PRICE]), int(values.get(FID_FILL_QUANTITY) or 0)
+            )
+            if not filled or order.status != OrderStatus.FILLED:
+                self.stats["rejected"] += 1
+                continue
+            if order.side == OrderSide.BUY:
+                booked = self.portfolio.buy(order.symbol, order.filled_quantity, order.filled_price, timestamp)
+            else:
+                booked = self.portfolio.sell(order.symbol, order.filled_quantity, order.filled_price, timestamp)
+            self.stats["fills" if booked else "rejected"] += 1
+
+    async def _on_replay_end(self, events: List[Dict[str, Any]]):
+        self._replay_ended.set()
+
+    # ---- 결과 ----
+
+    def report(self) -> Dict[str, Any]:
+        """세션 통계, 단계별 지연 요약, 주문/포트폴리오/파이프라인 지표"""
+        return {
+            "session": dict(self.stats),
+            "latency": {stage: histogram.summary() for stage, histogram in self.latency.items()},
+            "orders": self.order_manager.get_order_summary(),
+            "portfolio": {
+                "cash": self.portfolio.cash,
+                "total_value": self.portfolio.get_total_value(),
+                "positions": len(self.portfolio.positions),
+                "trades": len(self.portfolio.trades),
+            },
+            "engine": dict(self.engine.stats),
+            "aggregator": dict(self.aggregator.stats),
+            "pipeline": self.client.metrics(),
+        }
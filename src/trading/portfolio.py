@@ -5,6 +5,7 @@
 - 자산 평가 및 수익률 계산
 - 매매 기록 관리
 - 리스크 메트릭 계산
+- 대규모 종목용 배열 기반 포트폴리오 (ArrayPortfolio)
 """
 
 import logging
@@ -399,5 +400,332 @@ class Portfolio:
         self.logger.info("포트폴리오 초기화 완료")
 
 
+class ArrayPortfolio:
+    """
+    배열 기반 포트폴리오 (수천 종목 x 수천 거래일용)
+
+    종목마다 슬롯 번호를 부여하고 보유 수량, 매입 원가 합계, 최근 가격을 NumPy 배열에
+    보관합니다. 평가는 수량 배열과 가격 배열의 내적 한 번이며, 자산 가치는 미리 할당한
+    버퍼(가득 차면 2배로 확장)에 기록합니다. 매매마다 Position 객체를 만들지 않습니다.
+
+    Portfolio와 같은 buy/sell/update_prices 및 조회 메서드를 제공하고, 전 종목 가격
+    배열로 평가하는 mark_to_market()을 추가로 제공합니다. 승률은 매도가가 그 시점의
+    평균 매입 단가보다 높은 매도의 비율입니다.
+    """
+
+    def __init__(
+        self,
+        initial_cash: float = 1000000.0,
+        commission_rate: float = 0.00015,
+        tax_rate: float = 0.0025,
+        symbols: Optional[List[str]] = None,
+        capacity: int = 1024,
+        equity_capacity: int = 4096,
+    ):
+        """
+        Args:
+            initial_cash: 초기 현금
+            commission_rate: 매매 수수료율 (기본: 0.015%)
+            tax_rate: 거래세율 (기본: 0.25%, 매도시만 적용)
+            symbols: 미리 슬롯을 배정할 종목 (mark_to_market 가격 배열 순서)
+            capacity: 초기 종목 슬롯 수 (초과 시 2배로 확장)
+            equity_capacity: 초기 자산 기록 버퍼 크기 (초과 시 2배로 확장)
+        """
+        self.initial_cash = initial_cash
+        self.commission_rate = commission_rate
+        self.tax_rate = tax_rate
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        self._slots: Dict[str, int] = {}
+        self._symbols: List[str] = []
+        capacity = max(capacity, len(symbols or ()), 1)
+        self._quantity = np.zeros(capacity, dtype=np.int64)
+        self._cost = np.zeros(capacity)  # 보유 수량의 매입 원가 합계 (평균 단가 x 수량)
+        self._price = np.zeros(capacity)
+        self._entry_dates: List[Optional[datetime]] = [None] * capacity
+
+        self._equity_capacity = max(equity_capacity, 2)
+        self.reset()
+        for symbol in symbols or ():
+            self.slot(symbol)
+
+    # ---- 슬롯 ----
+
+    @property
+    def symbols(self) -> List[str]:
+        """슬롯 순서 종목 목록"""
+        return list(self._symbols)
+
+    def slot(self, symbol: str) -> int:
+        """종목 슬롯 번호 (없으면 배정)"""
+        slot = self._slots.get(symbol)
+        if slot is None:
+            slot = len(self._symbols)
+            if slot >= len(self._quantity):
+                self._grow_slots(2 * len(self._quantity))
+            self._slots[symbol] = slot
+            self._symbols.append(symbol)
+        return slot
+
+    def _grow_slots(self, capacity: int):
+        extra = capacity - len(self._quantity)
+        self._quantity = np.concatenate([self._quantity, np.zeros(extra, dtype=np.int64)])
+        self._cost = np.concatenate([self._cost, np.zeros(extra)])
+        self._price = np.concatenate([self._price, np.zeros(extra)])
+        self._entry_dates.extend([None] * extra)
+
+    # ---- 매매 ----
+
+    def buy(self, symbol: str, quantity: int, price: float, date: datetime = None) -> bool:
+        """매수 주문 실행"""
+        if date is None:
+            date = datetime.now()
+
+        gross_amount = quantity * price
+        commission = gross_amount * self.commission_rate
+        total_cost = gross_amount + commission
+
+        if total_cost > self.cash:
+            self.logger.warning(
+                f"현금 부족: 필요 {total_cost:,.0f}원, 보유 {self.cash:,.0f}원"
+            )
+            return False
+
+        self.cash -= total_cost
+        slot = self.slot(symbol)
+        if self._quantity[slot] == 0:
+            self._entry_dates[slot] = date
+        self._quantity[slot] += quantity
+        self._cost[slot] += gross_amount
+        self._price[slot] = price
+
+        self.trades.append(
+            Trade(symbol=symbol, action="BUY", quantity=quantity, price=price, date=date, commission=commission)
+        )
+        self.logger.debug(
+            f"매수 완료: {symbol} {quantity}주 @ {price:,.0f}원 (수수료: {commission:,.0f}원)"
+        )
+        return True
+
+    def sell(self, symbol: str, quantity: int, price: float, date: datetime = None) -> bool:
+        """매도 주문 실행"""
+        if date is None:
+            date = datetime.now()
+
+        slot = self._slots.get(symbol)
+        held = int(self._quantity[slot]) if slot is not None else 0
+        if held == 0:
+            self.logger.warning(f"보유하지 않은 종목: {symbol}")
+            return False
+        if held < quantity:
+            self.logger.warning(f"보유 수량 부족: 요청 {quantity}주, 보유 {held}주")
+            return False
+
+        gross_amount = quantity * price
+        commission = gross_amount * self.commission_rate
+        tax = gross_amount * self.tax_rate
+        self.cash += gross_amount - commission - tax
+
+        average_price = self._cost[slot] / held
+        if held == quantity:
+            self._quantity[slot] = 0
+            self._cost[slot] = 0.0
+            self._entry_dates[slot] = None
+        else:
+            self._quantity[slot] = held - quantity
+            self._cost[slot] -= average_price * quantity
+        self._price[slot] = price
+
+        self._completed_trades += 1
+        if price > average_price:
+            self._profitable_trades += 1
+        self.trades.append(
+            Trade(symbol=symbol, action="SELL", quantity=quantity, price=price, date=date, commission=commission, tax=tax)
+        )
+        self.logger.debug(
+            f"매도 완료: {symbol} {quantity}주 @ {price:,.0f}원 (수수료: {commission:,.0f}원, 세금: {tax:,.0f}원)"
+        )
+        return True
+
+    # ---- 평가 ----
+
+    def update_prices(self, prices: Dict[str, float], date: datetime = None):
+        """현재 가격 업데이트 (종목별 dict) 후 자산 가치 기록"""
+        slots = self._slots
+        for symbol, price in prices.items():
+            slot = slots.get(symbol)
+            if slot is not None:
+                self._price[slot] = price
+        self._record(date)
+
+    def mark_to_market(self, prices: np.ndarray, date: datetime = None) -> float:
+        """
+        슬롯 순서 가격 배열로 전 종목 평가 후 자산 가치 기록
+
+        Args:
+            prices: symbols 순서 가격 (NaN은 직전 가격 유지)
+
+        Returns:
+            총 자산 가치
+        """
+        count = len(self._symbols)
+        prices = np.asarray(prices, dtype=float)[:count]
+        current = self._price[:count]
+        np.copyto(current, prices, where=~np.isnan(prices))
+        return self._record(date)
+
+    def _record(self, date: Optional[datetime]) -> float:
+        total_value = self.get_total_value()
+        size = self._equity_size
+        if size == len(self._equity_values):
+            self._equity_values = np.concatenate([self._equity_values, np.empty(size)])
+            self._equity_dates = np.concatenate([self._equity_dates, np.empty(size, dtype="datetime64[us]")])
+        self._equity_values[size] = total_value
+        self._equity_dates[size] = np.datetime64(date or datetime.now(), "us")
+        self._equity_size = size + 1
+        return total_value
+
+    def get_total_value(self) -> float:
+        """총 포트폴리오 가치 (현금 + 수량 · 가격)"""
+        count = len(self._symbols)
+        return self.cash + float(self._quantity[:count] @ self._price[:count])
+
+    @property
+    def positions(self) -> Dict[str, Position]:
+        """보유 종목 Position 사본 (Portfolio 호환 조회용)"""
+        return {symbol: self.get_position(symbol) for symbol in self._held_symbols()}
+
+    def get_position(self, symbol: str) -> Optional[Position]:
+        slot = self._slots.get(symbol)
+        if slot is None or self._quantity[slot] == 0:
+            return None
+        quantity = int(self._quantity[slot])
+        return Position(
+            symbol=symbol,
+            quantity=quantity,
+            entry_price=self._cost[slot] / quantity,
+            entry_date=self._entry_dates[slot],
+            current_price=float(self._price[slot]),
+        )
+
+    def _held_symbols(self) -> List[str]:
+        held = np.flatnonzero(self._quantity[:len(self._symbols)])
+        return [self._symbols[slot] for slot in held.tolist()]
+
+    @property
+    def portfolio_values(self) -> List[Tuple[datetime, float]]:
+        """(일시, 자산 가치) 목록 (Portfolio 호환)"""
+        size = self._equity_size
+        dates = self._equity_dates[:size].astype(datetime).tolist()
+        return list(zip(dates, self._equity_values[:size].tolist()))
+
+    @property
+    def equity_values(self) -> np.ndarray:
+        """기록된 자산 가치 배열 (복사 없는 읽기 전용 뷰)"""
+        view = self._equity_values[:self._equity_size]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def daily_returns(self) -> np.ndarray:
+        values = self._equity_values[:self._equity_size]
+        return np.diff(values) / values[:-1]
+
+    # ---- 조회 ----
+
+    def get_positions_summary(self) -> pd.DataFrame:
+        """포지션 요약 정보"""
+        held = np.flatnonzero(self._quantity[:len(self._symbols)])
+        if not len(held):
+            return pd.DataFrame()
+
+        quantity = self._quantity[held]
+        entry_price = self._cost[held] / quantity
+        current_price = self._price[held]
+        return pd.DataFrame(
+            {
+                "종목코드": [self._symbols[slot] for slot in held.tolist()],
+                "수량": quantity,
+                "평균단가": entry_price,
+                "현재가": current_price,
+                "평가금액": quantity * current_price,
+                "손익금액": (current_price - entry_price) * quantity,
+                "손익률": np.where(entry_price != 0, (current_price - entry_price) / entry_price, 0.0) * 100,
+                "진입일": [self._entry_dates[slot].strftime("%Y-%m-%d") for slot in held.tolist()],
+            }
+        )
+
+    def get_trades_summary(self) -> pd.DataFrame:
+        """매매 기록 요약"""
+        return Portfolio.get_trades_summary(self)
+
+    def get_performance_metrics(self) -> Dict[str, float]:
+        """성과 지표 계산 (Portfolio.get_performance_metrics와 같은 항목)"""
+        if self._equity_size < 2:
+            return {}
+
+        current_value = self.get_total_value()
+        total_return = (current_value - self.initial_cash) / self.initial_cash
+        returns_array = self.daily_returns
+
+        trading_days = 252
+        annualized_return = np.mean(returns_array) * trading_days
+        annualized_volatility = np.std(returns_array) * np.sqrt(trading_days)
+
+        risk_free_rate = 0.03
+        sharpe_ratio = (
+            (annualized_return - risk_free_rate) / annualized_volatility
+            if annualized_volatility > 0
+            else 0
+        )
+
+        values = self._equity_values[:self._equity_size]
+        peaks = np.maximum.accumulate(values)
+        max_drawdown = float(np.max((peaks - values) / peaks))
+
+        completed = self._completed_trades
+        return {
+            "total_return": total_return,
+            "annualized_return": annualized_return,
+            "annualized_volatility": annualized_volatility,
+            "sharpe_ratio": sharpe_ratio,
+            "max_drawdown": max_drawdown,
+            "win_rate": self._profitable_trades / completed if completed > 0 else 0,
+            "current_value": current_value,
+            "total_pnl": current_value - self.initial_cash,
+            "cash": self.cash,
+            "total_trades": len(self.trades),
+            "completed_trades": completed,
+        }
+
+    def get_equity_curve(self) -> pd.DataFrame:
+        """자산 곡선 데이터"""
+        size = self._equity_size
+        values = self._equity_values[:size]
+        return pd.DataFrame(
+            {
+                "date": self._equity_dates[:size].astype("datetime64[ns]"),
+                "portfolio_value": values,
+                "return_pct": (values - self.initial_cash) / self.initial_cash * 100,
+            }
+        )
+
+    def reset(self):
+        """포트폴리오 초기화 (종목 슬롯 배정은 유지)"""
+        self.cash = self.initial_cash
+        self.trades: List[Trade] = []
+        self._quantity[:] = 0
+        self._cost[:] = 0.0
+        self._price[:] = 0.0
+        self._entry_dates = [None] * len(self._entry_dates)
+        self._completed_trades = 0
+        self._profitable_trades = 0
+
+        self._equity_values = np.empty(self._equity_capacity)
+        self._equity_dates = np.empty(self._equity_capacity, dtype="datetime64[us]")
+        self._equity_size = 0
+        self._record(None)
+
+
 # 하위 호환성을 위한 별칭
 PortfolioManager = Portfolio
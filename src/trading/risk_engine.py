@@ -0,0 +1,458 @@
+#!/usr/bin/env python3
+"""
+공분산 기반 포트폴리오 위험 엔진
+- 일간 수익률의 EWMA 공분산 행렬 (새 거래일마다 점진 갱신, 디스크 캐시)
+- 포트폴리오 VaR/CVaR (정규분포 모수적 방식)
+- 종목별 한계/기여 VaR
+- 상관관계를 반영한 종목별 추가 매수 한도
+
+공분산은 RiskMetrics 방식(평균 0 가정)으로 매일 Σ ← λΣ + (1-λ)rrᵀ 한 번만 갱신하고,
+위험 계산은 보유 종목(+매수 후보)의 부분 행렬만 사용하므로 백테스트 루프와 주문 전
+점검에서 밀리초 이내로 호출할 수 있습니다.
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from statistics import NormalDist
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+from scipy.linalg import blas
+
+logger = logging.getLogger(__name__)
+
+PriceInput = Union[np.ndarray, Dict[str, float]]
+MIN_SCALE = 1e-100  # 감쇠 배율 하한 (이하이면 행렬에 반영)
+
+
+@dataclass
+class RiskEngineConfig:
+    """위험 엔진 설정"""
+
+    decay: float = 0.94  # EWMA 감쇠 계수 λ (RiskMetrics 일간 기준)
+    confidence: float = 0.95  # VaR/CVaR 신뢰수준
+    horizon_days: int = 1  # 보유 기간 (√h 배 확장)
+    max_portfolio_var: float = 0.03  # 포트폴리오 가치 대비 VaR 한도 (3%)
+    default_volatility: float = 0.02  # 관측 이력이 없는 종목의 일간 변동성 가정 (2%)
+    cache_dir: str = "data/risk_cache"
+
+
+class EWMACovariance:
+    """
+    일간 수익률 EWMA 공분산 (종목 슬롯 배열)
+
+    종가가 들어올 때마다 직전 종가 대비 수익률로 rank-1 갱신합니다. 시세가 없는(NaN)
+    종목은 수익률 0으로 두고 감쇠만 적용하며, 종목별 누적 가중치 w로 나눠 이력이 짧은
+    구간의 편향을 보정합니다 (Σ_ij / √(w_i w_j)).
+
+    감쇠 λ는 행렬 전체에 곱하지 않고 배율(_scale)에 누적하고, 일별 갱신은 BLAS dsyr로
+    상삼각만 갱신합니다 (Σ = _scale · triu(_cov) 대칭화). 배율이 너무 작아지면 행렬에
+    반영 후 1로 되돌립니다.
+    """
+
+    def __init__(self, symbols: Optional[List[str]] = None, decay: float = 0.94, capacity: int = 64):
+        if not 0.0 < decay < 1.0:
+            raise ValueError(f"감쇠 계수는 0과 1 사이여야 합니다: {decay}")
+        self.decay = decay
+        self.observations = 0
+        self.last_date: Optional[datetime] = None
+
+        self._slots: Dict[str, int] = {}
+        self._symbols: List[str] = []
+        capacity = max(capacity, len(symbols or ()), 1)
+        self._cov = np.zeros((capacity, capacity), order="F")  # dsyr 제자리 갱신용 열 우선 배열
+        self._scale = 1.0
+        self._weight = np.zeros(capacity)
+        self._last_price = np.full(capacity, np.nan)
+        self._debiased: Optional[np.ndarray] = None
+        for symbol in symbols or ():
+            self.slot(symbol)
+
+    # ---- 슬롯 ----
+
+    @property
+    def symbols(self) -> List[str]:
+        return list(self._symbols)
+
+    def __len__(self) -> int:
+        return len(self._symbols)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._slots
+
+    def slot(self, symbol: str) -> int:
+        """종목 슬롯 번호 (없으면 배정)"""
+        slot = self._slots.get(symbol)
+        if slot is None:
+            slot = len(self._symbols)
+            if slot >= len(self._weight):
+                self._resize(2 * len(self._weight))
+            self._slots[symbol] = slot
+            self._symbols.append(symbol)
+            self._debiased = None
+        return slot
+
+    def _resize(self, capacity: int):
+        size = min(len(self._weight), capacity)
+        cov = np.zeros((capacity, capacity), order="F")
+        cov[:size, :size] = self._cov[:size, :size]
+        self._cov = cov
+        weight, last_price = np.zeros(capacity), np.full(capacity, np.nan)
+        weight[:size], last_price[:size] = self._weight[:size], self._last_price[:size]
+        self._weight, self._last_price = weight, last_price
+
+    # ---- 갱신 ----
+
+    def update(self, prices: PriceInput, date: datetime = None) -> np.ndarray:
+        """
+        하루치 종가로 공분산 갱신
+
+        Args:
+            prices: 슬롯 순서 종가 배열 또는 {종목: 종가} (새 종목은 슬롯 배정)
+            date: 거래일
+
+        Returns:
+            슬롯 순서 일간 수익률 (관측되지 않은 종목은 0)
+        """
+        row = self._price_row(prices)
+        count = len(row)
+        if count != len(self._weight):
+            self._resize(count)  # dsyr는 연속 배열 전체를 갱신
+        returns, observed = self._returns(self._last_price[:count], row)
+
+        self._scale *= self.decay
+        if self._scale < MIN_SCALE:
+            self._normalize()
+        # 관측되지 않은 종목은 수익률 0이라 해당 행/열은 감쇠만 적용됨
+        self._cov = blas.dsyr((1.0 - self.decay) / self._scale, returns, a=self._cov, overwrite_a=True)
+        self._weight[:count] = self.decay * self._weight[:count] + (1.0 - self.decay) * observed
+
+        self._store_prices(row, date)
+        return returns
+
+    def update_many(self, prices: pd.DataFrame) -> int:
+        """
+        (거래일 x 종목) 종가 DataFrame 중 last_date 이후 행을 한 번에 반영
+
+        Σ_T = λ^T Σ_0 + Σ_t λ^(T-1-t) (1-λ) r_t r_tᵀ 를 가중 행렬곱 한 번으로 계산하므로
+        초기 적재와 캐시 이후 누락분 보충에 같이 씁니다.
+
+        Returns:
+            반영한 거래일 수
+        """
+        frame = prices.sort_index()
+        if self.last_date is not None:
+            frame = frame[pd.to_datetime(frame.index) > pd.Timestamp(self.last_date)]
+        if frame.empty:
+            return 0
+
+        slots = np.array([self.slot(str(symbol)) for symbol in frame.columns], dtype=np.intp)
+        count = len(self._symbols)
+        matrix = np.full((len(frame), count), np.nan)
+        matrix[:, slots] = frame.to_numpy(dtype=float)
+
+        previous = np.vstack([self._last_price[:count], matrix[:-1]])
+        # 결측일 직후에도 직전 관측 종가 대비 수익률이 되도록 앞 방향 채움
+        previous = pd.DataFrame(previous).ffill().to_numpy()
+        returns, observed = self._returns(previous, matrix)
+
+        days = len(frame)
+        weights = (1.0 - self.decay) * self.decay ** np.arange(days - 1, -1, -1)
+        self._normalize()
+        cov = self._cov[:count, :count]
+        cov *= self.decay ** days
+        cov += (returns * weights[:, None]).T @ returns
+        self._weight[:count] = self.decay ** days * self._weight[:count] + weights @ observed
+
+        last = pd.DataFrame(matrix).ffill().to_numpy()[-1]
+        self._store_prices(last, pd.Timestamp(frame.index[-1]).to_pydatetime())
+        self.observations += days - 1
+        return days
+
+    def _normalize(self):
+        """누적 감쇠 배율을 행렬에 반영"""
+        if self._scale != 1.0:
+            self._cov *= self._scale
+            self._scale = 1.0
+
+    def _price_row(self, prices: PriceInput) -> np.ndarray:
+        if isinstance(prices, dict):
+            for symbol in prices:
+                self.slot(symbol)
+            row = np.full(len(self._symbols), np.nan)
+            for symbol, price in prices.items():
+                row[self._slots[symbol]] = price
+            return row
+        row = np.asarray(prices, dtype=float)
+        if len(row) != len(self._symbols):
+            raise ValueError(f"가격 배열 길이 {len(row)} != 종목 수 {len(self._symbols)}")
+        return row
+
+    @staticmethod
+    def _returns(previous: np.ndarray, current: np.ndarray):
+        with np.errstate(invalid="ignore", divide="ignore"):
+            returns = current / previous - 1.0
+        observed = np.isfinite(returns) & (previous > 0)
+        return np.where(observed, returns, 0.0), observed.astype(float)
+
+    def _store_prices(self, row: np.ndarray, date: Optional[datetime]):
+        count = len(row)
+        np.copyto(self._last_price[:count], row, where=np.isfinite(row))
+        self.observations += 1
+        self.last_date = date
+        self._debiased = None
+
+    # ---- 조회 ----
+
+    def _block(self, slots: Optional[np.ndarray] = None) -> np.ndarray:
+        """슬롯 순서 공분산 블록 (상삼각에서 대칭 복원, 배율 반영, None이면 전 종목)"""
+        if slots is None:
+            block = self._cov[:len(self._symbols), :len(self._symbols)]
+            return self._scale * (np.triu(block) + np.triu(block, 1).T)
+        order = np.argsort(slots, kind="stable")
+        ordered = slots[order]
+        block = self._cov[np.ix_(ordered, ordered)]
+        block = np.triu(block) + np.triu(block, 1).T
+        inverse = np.empty_like(order)
+        inverse[order] = np.arange(len(order))
+        return self._scale * block[np.ix_(inverse, inverse)]
+
+    @staticmethod
+    def _debias(cov: np.ndarray, weight: np.ndarray) -> np.ndarray:
+        scale = np.sqrt(np.outer(weight, weight))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(scale > 0, cov / scale, 0.0)
+
+    def matrix(self) -> np.ndarray:
+        """편향 보정된 전 종목 공분산 행렬 (다음 갱신 전까지 캐시)"""
+        if self._debiased is None:
+            count = len(self._symbols)
+            self._debiased = self._debias(self._block(), self._weight[:count])
+        return self._debiased
+
+    def submatrix(self, symbols: List[str], default_volatility: float = 0.0) -> np.ndarray:
+        """
+        지정 종목 순서의 공분산 부분 행렬 (전체 행렬을 만들지 않음)
+
+        미등록/무이력 종목은 default_volatility 분산, 다른 종목과 상관 0으로 둡니다.
+        """
+        index = np.array([self._slots.get(symbol, -1) for symbol in symbols], dtype=np.intp)
+        valid = index >= 0
+        sub = np.zeros((len(symbols), len(symbols)))
+        if valid.any():
+            slots = index[valid]
+            sub[np.ix_(valid, valid)] = self._debias(self._block(slots), self._weight[slots])
+        if default_volatility:
+            diagonal = np.diagonal(sub).copy()
+            diagonal[diagonal <= 0] = default_volatility ** 2
+            np.fill_diagonal(sub, diagonal)
+        return sub
+
+    def volatility(self) -> pd.Series:
+        """종목별 일간 변동성"""
+        return pd.Series(np.sqrt(np.diagonal(self.matrix())), index=self._symbols)
+
+    def correlation(self, symbols: Optional[List[str]] = None) -> pd.DataFrame:
+        """상관계수 행렬"""
+        symbols = list(symbols) if symbols is not None else self._symbols
+        cov = self.submatrix(symbols)
+        std = np.sqrt(np.diagonal(cov))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            corr = cov / np.outer(std, std)
+        return pd.DataFrame(np.nan_to_num(corr), index=symbols, columns=symbols)
+
+    # ---- 캐시 ----
+
+    def save(self, path: Union[str, Path]):
+        """상태를 .npz 파일로 저장"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        count = len(self._symbols)
+        last_date = np.datetime64(self.last_date, "us") if self.last_date else np.datetime64("NaT", "us")
+        with open(path, "wb") as f:  # np.savez가 확장자를 덧붙이지 않도록 파일 객체로 저장
+            np.savez(
+                f,
+                symbols=np.array(self._symbols, dtype=str),
+                cov=self._block(),
+                weight=self._weight[:count],
+                last_price=self._last_price[:count],
+                decay=self.decay,
+                observations=self.observations,
+                last_date=last_date,
+            )
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "EWMACovariance":
+        """save()로 저장한 상태 복원"""
+        with np.load(path) as state:
+            symbols = state["symbols"].tolist()
+            instance = cls(symbols, decay=float(state["decay"]))
+            count = len(symbols)
+            instance._cov[:count, :count] = state["cov"]
+            instance._weight[:count] = state["weight"]
+            instance._last_price[:count] = state["last_price"]
+            instance.observations = int(state["observations"])
+            last_date = state["last_date"]
+            instance.last_date = None if np.isnat(last_date) else last_date.item()
+        return instance
+
+
+class RiskEngine:
+    """
+    포트폴리오 위험 엔진
+
+    노출(exposure)은 {종목: 평가금액(원)} 으로 받습니다. VaR/CVaR는 정규분포 가정의
+    보유 기간 손실 금액이며, 한계 VaR는 ∂VaR/∂x_i, 기여 VaR는 x_i · 한계 VaR로 합이
+    포트폴리오 VaR와 같습니다.
+    """
+
+    def __init__(self, config: Optional[RiskEngineConfig] = None, covariance: Optional[EWMACovariance] = None):
+        self.config = config or RiskEngineConfig()
+        self.covariance = covariance or EWMACovariance(decay=self.config.decay)
+        distribution = NormalDist()
+        alpha = self.config.confidence
+        self._z = distribution.inv_cdf(alpha)
+        self._cvar_z = distribution.pdf(self._z) / (1.0 - alpha)
+        self._horizon = np.sqrt(max(self.config.horizon_days, 1))
+
+    # ---- 캐시/갱신 ----
+
+    def cache_path(self, name: str) -> Path:
+        return Path(self.config.cache_dir) / f"{name}.npz"
+
+    @classmethod
+    def from_cache(cls, name: str, config: Optional[RiskEngineConfig] = None) -> "RiskEngine":
+        """디스크 캐시가 있으면 복원, 없으면 빈 엔진 생성"""
+        engine = cls(config)
+        path = engine.cache_path(name)
+        if path.exists():
+            try:
+                engine.covariance = EWMACovariance.load(path)
+                logger.info(
+                    f"공분산 캐시 로드: {path} ({len(engine.covariance)}종목, 마지막 {engine.covariance.last_date})"
+                )
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"공분산 캐시 로드 실패, 새로 계산합니다: {path} - {e}")
+        return engine
+
+    def save(self, name: str):
+        path = self.cache_path(name)
+        self.covariance.save(path)
+        logger.debug(f"공분산 캐시 저장: {path}")
+
+    def update(self, prices: PriceInput, date: datetime = None) -> np.ndarray:
+        """하루치 종가 반영"""
+        return self.covariance.update(prices, date)
+
+    def update_from_prices(self, prices: pd.DataFrame, cache_name: Optional[str] = None) -> int:
+        """(거래일 x 종목) 종가 중 새 거래일만 반영하고, cache_name이 있으면 캐시 저장"""
+        days = self.covariance.update_many(prices)
+        if days and cache_name:
+            self.save(cache_name)
+        return days
+
+    # ---- 위험 계산 ----
+
+    def _exposure_vector(self, exposures: Dict[str, float]):
+        symbols = [symbol for symbol, value in exposures.items() if value]
+        values = np.array([exposures[symbol] for symbol in symbols], dtype=float)
+        return symbols, values
+
+    def portfolio_risk(self, exposures: Dict[str, float], portfolio_value: Optional[float] = None) -> Dict[str, float]:
+        """
+        포트폴리오 변동성/VaR/CVaR
+
+        Args:
+            exposures: {종목: 평가금액}
+            portfolio_value: 비율 계산 기준 (기본: 노출 합계)
+        """
+        symbols, values = self._exposure_vector(exposures)
+        cov = self.covariance.submatrix(symbols, self.config.default_volatility)
+        volatility = float(np.sqrt(max(values @ cov @ values, 0.0))) * self._horizon
+        base = portfolio_value if portfolio_value else float(np.abs(values).sum())
+        var = self._z * volatility
+        cvar = self._cvar_z * volatility
+        return {
+            "volatility": volatility,
+            "var": var,
+            "cvar": cvar,
+            "var_pct": var / base if base else 0.0,
+            "cvar_pct": cvar / base if base else 0.0,
+            "confidence": self.config.confidence,
+            "horizon_days": self.config.horizon_days,
+        }
+
+    def risk_contributions(self, exposures: Dict[str, float]) -> pd.DataFrame:
+        """
+        종목별 한계 VaR, 기여 VaR, 기여 비중
+
+        Returns:
+            index=종목, columns=[exposure, marginal_var, component_var, share]
+        """
+        symbols, values = self._exposure_vector(exposures)
+        cov = self.covariance.submatrix(symbols, self.config.default_volatility)
+        cov_x = cov @ values
+        sigma = np.sqrt(max(values @ cov_x, 0.0))
+        marginal = self._z * self._horizon * (cov_x / sigma if sigma > 0 else np.zeros_like(cov_x))
+        component = values * marginal
+        total = component.sum()
+        return pd.DataFrame(
+            {
+                "exposure": values,
+                "marginal_var": marginal,
+                "component_var": component,
+                "share": component / total if total else np.zeros_like(component),
+            },
+            index=pd.Index(symbols, name="symbol"),
+        )
+
+    def max_position_value(
+        self,
+        symbol: str,
+        exposures: Dict[str, float],
+        portfolio_value: float,
+        max_var: Optional[float] = None,
+    ) -> float:
+        """
+        VaR 한도를 넘지 않고 symbol에 추가로 매수할 수 있는 최대 금액
+
+        (x + a·e)ᵀΣ(x + a·e) ≤ σ_max² 를 a에 대한 이차식으로 풀므로 기존 보유 종목과의
+        상관이 높을수록 한도가 작아지고, 음의 상관이면 커집니다.
+
+        Args:
+            max_var: 포트폴리오 가치 대비 VaR 한도 (기본: config.max_portfolio_var)
+        """
+        max_var = self.config.max_portfolio_var if max_var is None else max_var
+        symbols, values = self._exposure_vector(exposures)
+        if symbol in symbols:
+            target = symbols.index(symbol)
+        else:
+            symbols.append(symbol)
+            values = np.append(values, 0.0)
+            target = len(symbols) - 1
+
+        cov = self.covariance.submatrix(symbols, self.config.default_volatility)
+        scale = (self._z * self._horizon) ** 2
+        variance = cov[target, target] * scale
+        if variance <= 0:
+            return float("inf")
+        cov_x = cov[target] @ values * scale
+        excess = values @ cov @ values * scale - (max_var * portfolio_value) ** 2
+
+        # a²·s + 2a·b + c ≤ 0 의 큰 근
+        discriminant = cov_x ** 2 - variance * excess
+        if discriminant < 0:
+            return 0.0
+        return max(0.0, float((-cov_x + np.sqrt(discriminant)) / variance))
+
+    def average_correlation(self, symbols: List[str]) -> float:
+        """종목 간 평균 상관계수 (대각 제외)"""
+        symbols = list(dict.fromkeys(symbols))
+        if len(symbols) < 2:
+            return 0.0
+        corr = self.covariance.correlation(symbols).to_numpy()
+        count = len(symbols)
+        return float((corr.sum() - np.trace(corr)) / (count * (count - 1)))
@@ -57,6 +57,15 @@ class DataService:
             logging.error(f"종목 데이터 조회 실패 {symbol}: {e}")
             return pd.DataFrame()
     
+    @st.cache_data
+    def get_panel_data(_self, symbols: Tuple[str, ...], start_date: str, end_date: str) -> Dict[str, pd.DataFrame]:
+        """여러 종목 데이터를 단일 쿼리로 일괄 조회"""
+        try:
+            return _self.data_manager.load_panel(list(symbols), start_date, end_date)
+        except Exception as e:
+            logging.error(f"다종목 데이터 조회 실패: {e}")
+            return {}
+    
     @st.cache_data
     def get_stock_data_with_indicators(_self, symbol: str, start_date: str, end_date: str) -> pd.DataFrame:
         """기술적 지표가 포함된 종목 데이터 조회"""
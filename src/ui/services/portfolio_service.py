@@ -9,6 +9,8 @@ from datetime import datetime
 from typing import Dict, List, Optional, Any, Tuple
 import logging
 
+from src.trading.risk_engine import RiskEngine
+
 
 class PortfolioService:
     """포트폴리오 관련 서비스"""
@@ -17,6 +19,7 @@ class PortfolioService:
         self.max_portfolio_value = 1000000  # 100만원
         self.max_positions = 5  # 최대 5종목
         self.max_position_size = 0.25  # 종목당 최대 25%
+        self.risk_engine: Optional[RiskEngine] = None  # 설정 시 공분산 기반 VaR 한도 추가 점검
     
     def calculate_position_size(
         self,
@@ -97,8 +100,13 @@ class PortfolioService:
             logging.error(f"포트폴리오 지표 계산 실패: {e}")
             return {}
     
-    def check_risk_limits(self, positions: Dict[str, Dict], new_investment: float) -> Tuple[bool, str]:
-        """리스크 한도 체크"""
+    def check_risk_limits(
+        self,
+        positions: Dict[str, Dict],
+        new_investment: float,
+        symbol: Optional[str] = None
+    ) -> Tuple[bool, str]:
+        """리스크 한도 체크 (symbol과 risk_engine이 있으면 상관관계 반영 VaR 한도 포함)"""
         try:
             current_metrics = self.calculate_portfolio_metrics(positions)
             current_value = current_metrics.get('total_value', 0)
@@ -117,6 +125,16 @@ class PortfolioService:
                 if position_ratio > self.max_position_size:
                     return False, f"개별 포지션 크기 초과: 최대 {self.max_position_size*100}%"
             
+            # 공분산 기반 VaR 한도 (보유 종목과의 상관 반영)
+            if self.risk_engine is not None and symbol:
+                exposures = {
+                    held: position.get('shares', 0) * position.get('current_price', 0)
+                    for held, position in positions.items()
+                }
+                limit = self.risk_engine.max_position_value(symbol, exposures, self.max_portfolio_value)
+                if new_investment > limit:
+                    return False, f"VaR 한도 초과: {symbol} 추가 가능 {limit:,.0f}원"
+            
             return True, "리스크 한도 내"
             
         except Exception as e:
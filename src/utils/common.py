@@ -7,7 +7,8 @@ import plotly.graph_objects as go
 from src.utils.dataframe_utils import standardize_dataframe
 from src.data.updater import StockDataUpdater
 from src.data.stock_data_manager import StockDataManager  # StockDataManager 추가 임포트
-from datetime import datetime, timedelta
+from src.data.trading_calendar import lookback_start_date
+from datetime import datetime
 import sqlite3
 from pathlib import Path
 import logging
@@ -31,9 +32,8 @@ def load_stock_data(symbols: list, limit: int = 500) -> Dict[str, pd.DataFrame]:
     dm = StockDataManager(db_path=updater.db_path)
 
     end_date = datetime.now().strftime("%Y%m%d")
-    start_date = (datetime.now() - timedelta(days=limit + 30)).strftime(
-        "%Y%m%d"
-    )  # 여유 기간 추가
+    # 최근 limit 거래일 (달력일로 잡으면 주말/휴일만큼 봉 수가 모자람)
+    start_date = lookback_start_date(limit, db_path=updater.db_path, fmt="%Y%m%d")
 
     # StockDataUpdater를 사용하여 데이터 업데이트 (필요시)
     # force_update=False로 설정하여 이미 최신 데이터가 있으면 건너뛰도록 함
@@ -41,12 +41,14 @@ def load_stock_data(symbols: list, limit: int = 500) -> Dict[str, pd.DataFrame]:
         symbols=symbols, start_date=start_date, end_date=end_date, force_update=False
     )
 
+    # 전체 종목을 단일 쿼리로 일괄 로드
+    panel = dm.load_panel(symbols, start_date=f"{start_date[:4]}-{start_date[4:6]}-{start_date[6:]}")
+
     data = {}
     for symbol in symbols:
-        # StockDataManager를 사용하여 데이터베이스에서 데이터 로드
-        df = dm.get_latest_data(symbol, days=limit)
-        if not df.empty:
-            data[symbol] = standardize_dataframe(df)
+        df = panel.get(symbol)
+        if df is not None and not df.empty:
+            data[symbol] = standardize_dataframe(df.tail(limit))
         else:
             data[symbol] = pd.DataFrame()
     return data
@@ -0,0 +1,177 @@
+"""
+토큰 버킷 기반 API 호출 속도 제한
+
+- 프로세스 전역으로 공유되는 제공자별 limiter (pykrx, kiwoom 등)
+- burst: 유휴 후 연속 호출 허용량
+- 적응형 백오프: 오류 시 속도를 배수로 낮추고(AIMD), 성공이 이어지면 기준 속도까지 점진 회복
+
+스레드마다 고정 sleep을 하면 워커 수와 배치 구성에 따라 실제 호출 속도가 달라지지만,
+공유 버킷은 워커 수와 무관하게 전체 호출 속도를 허용 속도에 맞춥니다.
+
+사용 예시:
+    limiter = get_rate_limiter("pykrx", rate=3.0, burst=5)
+    limiter.acquire()
+    try:
+        df = stock.get_market_ohlcv_by_date(start, end, symbol)
+        limiter.report_success()
+    except Exception:
+        limiter.report_error()
+        raise
+"""
+
+import time
+import logging
+import threading
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucketRateLimiter:
+    """스레드 안전 토큰 버킷
+
+    토큰이 부족하면 잔량을 음수로 예약하고 그만큼 대기하므로,
+    동시에 요청한 스레드들은 바쁜 대기 없이 허용 속도 간격으로 순서대로 통과합니다.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        min_rate: Optional[float] = None,
+        backoff_factor: float = 0.5,
+        recovery_step: float = 0.1,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Args:
+            rate: 기준 허용 속도 (초당 호출 수)
+            burst: 버킷 용량 (최대 연속 호출 수)
+            min_rate: 백오프 하한 (기본: rate의 10%)
+            backoff_factor: 오류 시 속도 배수
+            recovery_step: 성공 시 기준 속도 대비 회복 비율
+        """
+        if rate <= 0:
+            raise ValueError(f"rate는 0보다 커야 합니다: {rate}")
+        self.base_rate = float(rate)
+        self.rate = float(rate)
+        self.burst = max(1, int(burst))
+        self.min_rate = float(min_rate) if min_rate else self.base_rate * 0.1
+        self.backoff_factor = backoff_factor
+        self.recovery_step = recovery_step
+
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._last = clock()
+
+        self.stats = {
+            "acquired": 0,
+            "total_wait": 0.0,
+            "errors": 0,
+            "backoffs": 0,
+        }
+
+    def _refill(self, now: float):
+        """경과 시간만큼 토큰 보충 (self._lock 보유 상태에서 호출)"""
+        elapsed = now - self._last
+        if elapsed > 0:
+            self._tokens = min(float(self.burst), self._tokens + elapsed * self.rate)
+            self._last = now
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """토큰 획득 (필요 시 대기). 대기한 시간(초) 반환"""
+        with self._lock:
+            self._refill(self._clock())
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            self.stats["acquired"] += 1
+            self.stats["total_wait"] += wait
+
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """대기 없이 토큰 획득 시도"""
+        with self._lock:
+            self._refill(self._clock())
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                self.stats["acquired"] += 1
+                return True
+            return False
+
+    def report_success(self):
+        """호출 성공: 기준 속도까지 가산 회복"""
+        if self.rate >= self.base_rate:
+            return
+        with self._lock:
+            self._refill(self._clock())
+            self.rate = min(self.base_rate, self.rate + self.base_rate * self.recovery_step)
+
+    def report_error(self):
+        """호출 실패(제한 초과, 타임아웃 등): 속도를 배수로 감소하고 남은 버스트 제거"""
+        with self._lock:
+            self._refill(self._clock())
+            self.stats["errors"] += 1
+            new_rate = max(self.min_rate, self.rate * self.backoff_factor)
+            if new_rate < self.rate:
+                self.stats["backoffs"] += 1
+                logger.debug(f"호출 속도 감소: {self.rate:.2f} -> {new_rate:.2f}/s")
+            self.rate = new_rate
+            self._tokens = min(self._tokens, 0.0)
+
+    def configure(self, rate: float, burst: Optional[int] = None):
+        """기준 속도/버킷 용량 변경 (백오프 중이면 현재 속도는 새 기준 이하로 유지)"""
+        if rate <= 0:
+            raise ValueError(f"rate는 0보다 커야 합니다: {rate}")
+        with self._lock:
+            self._refill(self._clock())
+            backing_off = self.rate < self.base_rate
+            self.base_rate = float(rate)
+            self.rate = min(self.rate, self.base_rate) if backing_off else self.base_rate
+            self.min_rate = self.base_rate * 0.1
+            if burst is not None:
+                self.burst = max(1, int(burst))
+
+    def call(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """토큰 획득 후 호출하고 결과에 따라 속도 조정"""
+        self.acquire()
+        try:
+            result = func(*args, **kwargs)
+        except Exception:
+            self.report_error()
+            raise
+        self.report_success()
+        return result
+
+    def get_stats(self) -> Dict[str, Any]:
+        """통계 반환"""
+        with self._lock:
+            stats = self.stats.copy()
+            stats["rate"] = self.rate
+            stats["base_rate"] = self.base_rate
+        return stats
+
+
+_limiters: Dict[str, TokenBucketRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(name: str, rate: Optional[float] = None, burst: int = 1) -> TokenBucketRateLimiter:
+    """제공자 이름별 전역 limiter 반환 (최초 생성 시 rate 필수)
+
+    이미 생성된 limiter에 다른 rate가 주어지면 기준 속도를 갱신합니다.
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(name)
+        if limiter is None:
+            if rate is None:
+                raise ValueError(f"'{name}' limiter가 없어 rate 지정이 필요합니다.")
+            limiter = _limiters[name] = TokenBucketRateLimiter(rate, burst=burst)
+        elif rate is not None and rate != limiter.base_rate:
+            limiter.configure(rate, burst)
+        return limiter
@@ -0,0 +1,80 @@
+import unittest
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+from src.trading.portfolio import ArrayPortfolio, Portfolio
+
+SYMBOLS = [f"{i:06d}" for i in range(5)]
+
+
+class TestArrayPortfolio(unittest.TestCase):
+    def test_matches_portfolio_on_random_trades(self):
+        rng = np.random.default_rng(7)
+        legacy = Portfolio(initial_cash=10_000_000)
+        # 슬롯 1개로 시작해 종목 배정과 자산 기록 버퍼가 확장되도록 함
+        portfolio = ArrayPortfolio(initial_cash=10_000_000, capacity=1, equity_capacity=2)
+
+        start = datetime(2024, 1, 2)
+        for day in range(40):
+            date = start + timedelta(days=day)
+            prices = {s: float(rng.integers(9_000, 11_000)) for s in SYMBOLS}
+            for _ in range(3):
+                symbol = SYMBOLS[rng.integers(len(SYMBOLS))]
+                quantity = int(rng.integers(1, 50))
+                action = "buy" if rng.random() < 0.6 else "sell"
+                expected = getattr(legacy, action)(symbol, quantity, prices[symbol], date)
+                self.assertEqual(getattr(portfolio, action)(symbol, quantity, prices[symbol], date), expected)
+            legacy.update_prices(prices, date)
+            portfolio.update_prices(prices, date)
+
+        self.assertAlmostEqual(portfolio.cash, legacy.cash, places=4)
+        self.assertAlmostEqual(portfolio.get_total_value(), legacy.get_total_value(), places=4)
+        self.assertEqual(set(portfolio.positions), set(legacy.positions))
+        for symbol, position in legacy.positions.items():
+            mine = portfolio.get_position(symbol)
+            self.assertEqual((mine.quantity, mine.entry_date), (position.quantity, position.entry_date))
+            self.assertAlmostEqual(mine.entry_price, position.entry_price)
+
+        pd.testing.assert_frame_equal(portfolio.get_trades_summary(), legacy.get_trades_summary())
+        pd.testing.assert_frame_equal(
+            portfolio.get_positions_summary().sort_values("종목코드").reset_index(drop=True),
+            legacy.get_positions_summary().sort_values("종목코드").reset_index(drop=True),
+            check_dtype=False,
+        )
+        np.testing.assert_allclose(portfolio.daily_returns, legacy.daily_returns)
+        np.testing.assert_allclose(
+            portfolio.get_equity_curve()["portfolio_value"], legacy.get_equity_curve()["portfolio_value"]
+        )
+
+        expected = legacy.get_performance_metrics()
+        metrics = portfolio.get_performance_metrics()
+        self.assertEqual(set(metrics), set(expected))
+        for key in ("total_return", "annualized_return", "annualized_volatility", "sharpe_ratio", "max_drawdown"):
+            self.assertAlmostEqual(metrics[key], expected[key])
+        self.assertEqual(metrics["completed_trades"], expected["completed_trades"])
+
+    def test_mark_to_market_with_price_array(self):
+        portfolio = ArrayPortfolio(initial_cash=1_000_000, commission_rate=0.0, tax_rate=0.0, symbols=SYMBOLS)
+        self.assertEqual(portfolio.symbols, SYMBOLS)
+        portfolio.buy(SYMBOLS[1], 10, 1000.0, datetime(2024, 1, 2))
+        portfolio.buy(SYMBOLS[3], 5, 2000.0, datetime(2024, 1, 2))
+
+        prices = np.array([np.nan, 1100.0, 500.0, np.nan, 700.0])  # NaN은 직전 가격 유지
+        value = portfolio.mark_to_market(prices, datetime(2024, 1, 3))
+        self.assertEqual(value, 1_000_000 - 20_000 + 10 * 1100.0 + 5 * 2000.0)
+        self.assertEqual(portfolio.equity_values.tolist(), [1_000_000, value])
+        self.assertEqual(portfolio.portfolio_values[-1], (datetime(2024, 1, 3), value))
+
+        self.assertTrue(portfolio.sell(SYMBOLS[1], 10, 1100.0))
+        self.assertFalse(portfolio.sell(SYMBOLS[1], 1, 1100.0))
+        self.assertEqual(portfolio.get_performance_metrics()["win_rate"], 1.0)
+
+        portfolio.reset()
+        self.assertEqual((portfolio.get_total_value(), portfolio.positions, len(portfolio.equity_values)), (1_000_000, {}, 1))
+        self.assertEqual(portfolio.symbols, SYMBOLS)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from src.strategies.base_strategy import TradeSignal
+from src.trading.backtest import BacktestConfig, BacktestEngine, allocate_by_group, match_intraday_orders
+
+
+def signal(ts, symbol, signal_type, order_type, limit_price=None, stop_price=None, valid_days=None):
+    return TradeSignal(
+        timestamp=ts, symbol=symbol, signal_type=signal_type, price=0.0, confidence=1.0,
+        reason=f"{order_type} {signal_type}", indicators={}, risk_level="LOW",
+        order_type=order_type, limit_price=limit_price, stop_price=stop_price, valid_days=valid_days,
+    )
+
+
+class FixedSignals:
+    def __init__(self, signals):
+        self.signals = signals
+
+    def generate_signals(self, data, symbol):
+        return [s for s in self.signals if s.symbol == symbol]
+
+
+class TestIntradayMatching(unittest.TestCase):
+    def test_match_and_allocate(self):
+        #                 매수지정가 매수지정가 매도지정가 매수스탑 매도스탑 매도스탑 시세없음
+        is_buy = np.array([True, True, False, True, False, False, True])
+        is_stop = np.array([False, False, False, True, True, True, False])
+        price = np.array([95.0, 90.0, 98.0, 102.0, 99.0, 92.0, 95.0])
+        open_ = np.array([100.0, 100.0, 100.0, 100.0, 97.0, 100.0, np.nan])
+        high = np.array([101.0, 101.0, 101.0, 103.0, 98.0, 101.0, np.nan])
+        low = np.array([94.0, 94.0, 94.0, 99.0, 96.0, 94.0, np.nan])
+        filled, fill_price = match_intraday_orders(is_buy, is_stop, price, open_, high, low)
+        self.assertEqual(filled.tolist(), [True, False, True, True, True, False, False])
+        # 매도 지정가 98과 매도 스탑 99는 갭으로 시가 체결
+        np.testing.assert_array_equal(fill_price[filled], [95.0, 100.0, 102.0, 97.0])
+
+        groups = np.array([1, 0, 1, 1, 0])
+        allocated = allocate_by_group(groups, np.array([5.0, 3.0, 4.0, 6.0, 0.0]), np.array([8.0, 2.0, 8.0, 8.0, 2.0]))
+        np.testing.assert_array_equal(allocated, [5.0, 2.0, 3.0, 0.0, 0.0])
+
+
+class TestBacktestWorkingOrders(unittest.TestCase):
+    def test_limit_and_stop_orders_with_gaps_and_volume_cap(self):
+        dates = pd.bdate_range("2024-01-02", periods=6)
+        bars = [  # open, high, low, close, volume
+            (100, 101, 99, 100, 100_000),
+            (99, 100, 95, 97, 100),  # 매수 지정가 96 터치, 거래량 10%(10주)만 체결
+            (94, 98, 93, 97, 100_000),  # 갭 하락 시작: 나머지를 시가 94에 체결
+            (97, 99, 96, 98, 100_000),
+            (90, 92, 89, 91, 100_000),  # 매도 스탑 95 아래 갭 하락: 시가 90에 체결
+            (91, 92, 90, 91, 100_000),
+        ]
+        frame = pd.DataFrame(bars, index=dates, columns=["open", "high", "low", "close", "volume"], dtype=float)
+        data = {"005930": frame, "000660": frame.copy()}
+        strategy = FixedSignals([
+            signal(dates[0], "005930", "BUY", "LIMIT", limit_price=96.0, valid_days=2),
+            signal(dates[3], "005930", "SELL", "STOP", stop_price=95.0),
+            signal(dates[0], "000660", "BUY", "LIMIT", limit_price=50.0),  # 미체결 후 만료
+            signal(dates[1], "000660", "BUY", "TRAILING", limit_price=50.0),  # 지원하지 않는 주문
+        ])
+        engine = BacktestEngine(BacktestConfig(enable_take_profit=False))
+        results = engine.run_backtest(strategy, data)
+
+        quantity = np.floor(1_000_000 * 0.2 / 96.0)
+        self.assertEqual(results["order_stats"], {"placed": 3, "filled": 2, "partial": 1, "expired": 1, "rejected": 1})
+        self.assertEqual(len(engine.trades), 1)
+        trade = engine.trades[0]
+        self.assertEqual(trade.quantity, quantity)
+        self.assertAlmostEqual(trade.entry_price, (10 * 96.0 + (quantity - 10) * 94.0) / quantity)
+        self.assertEqual(trade.exit_price, 90.0)
+        self.assertEqual((trade.entry_date, trade.exit_date), (dates[1], dates[4]))
+
+        costs = 1 + engine.config.commission_rate + engine.config.slippage_rate
+        proceeds = 1 - engine.config.commission_rate - engine.config.slippage_rate
+        expected_cash = 1_000_000 - (10 * 96.0 + (quantity - 10) * 94.0) * costs + quantity * 90.0 * proceeds
+        self.assertAlmostEqual(engine.cash, expected_cash, places=6)
+        self.assertEqual(engine.positions, {})
+
+    def test_market_order_stop_loss_on_gap_down(self):
+        dates = pd.bdate_range("2024-01-02", periods=3)
+        bars = [(100, 101, 99, 100, 100_000), (90, 92, 89, 91, 100_000), (91, 92, 90, 91, 100_000)]
+        frame = pd.DataFrame(bars, index=dates, columns=["open", "high", "low", "close", "volume"], dtype=float)
+        strategy = FixedSignals([signal(dates[0], "005930", "BUY", "MARKET")])
+
+        # 기본값은 손절가에 청산, gap_exit_at_open이면 갭 하락 시가에 청산
+        for gap_exit_at_open, expected in ((False, None), (True, 90.0)):
+            engine = BacktestEngine(BacktestConfig(enable_take_profit=False, gap_exit_at_open=gap_exit_at_open))
+            engine.run_backtest(strategy, {"005930": frame})
+            self.assertEqual(len(engine.trades), 1)
+            trade = engine.trades[0]
+            stop_loss = trade.entry_price * (1 - engine.config.risk_per_trade)
+            self.assertEqual(trade.exit_date, dates[1])
+            self.assertAlmostEqual(trade.exit_price, expected or stop_loss)
+
+
+if __name__ == "__main__":
+    unittest.main()
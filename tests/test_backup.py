@@ -0,0 +1,83 @@
+import os
+import tempfile
+import unittest
+
+from src.data.backup import DatabaseBackupManager
+from src.data.connection_manager import connection_manager, get_pooled_connection
+from src.data.ohlcv_schema import migrate_to_compact
+
+
+class TestDatabaseBackup(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp_dir.name, "trading.db")
+        self.conn = get_pooled_connection(self.db_path)
+        with self.conn:
+            self.conn.execute("CREATE TABLE stock_info (symbol TEXT PRIMARY KEY, name TEXT NOT NULL)")
+            self.conn.execute(
+                "CREATE TABLE stock_ohlcv (symbol TEXT NOT NULL, date TEXT NOT NULL, open INTEGER, "
+                "high INTEGER, low INTEGER, close INTEGER, volume INTEGER, PRIMARY KEY (symbol, date))"
+            )
+            self.conn.executemany("INSERT INTO stock_info VALUES (?, ?)", [("005930", "삼성전자"), ("000660", "SK하이닉스")])
+            self.conn.executemany(
+                "INSERT INTO stock_ohlcv VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(sym, f"2024-01-{d:02d}", 10, 12, 9, 11, 100) for sym in ("005930", "000660") for d in range(2, 30)],
+            )
+        self.manager = DatabaseBackupManager(self.db_path, pages_per_step=1)
+
+    def tearDown(self):
+        connection_manager.close_all(self.db_path)
+        self.tmp_dir.cleanup()
+
+    def count(self, symbol):
+        return self.conn.execute("SELECT COUNT(*) FROM stock_ohlcv WHERE symbol = ?", (symbol,)).fetchone()[0]
+
+    def test_compressed_backup_with_progress_and_full_restore(self):
+        steps = []
+        path = self.manager.backup("full", compress=True, progress=lambda done, total: steps.append((done, total)))
+
+        self.assertTrue(path.endswith("full.db.gz"))
+        self.assertGreater(len(steps), 1)
+        self.assertEqual(steps[-1][0], steps[-1][1])
+
+        with self.conn:
+            self.conn.execute("DELETE FROM stock_ohlcv")
+        self.assertTrue(self.manager.restore(path))
+        self.assertEqual(self.count("005930"), 28)
+        self.assertEqual([b["compressed"] for b in self.manager.list_backups()], [True])
+
+    def test_snapshot_restores_only_selected_symbols(self):
+        point = self.manager.snapshot("before_update")
+        with self.conn:
+            self.conn.execute("UPDATE stock_ohlcv SET close = 0")
+            self.conn.execute("INSERT INTO stock_ohlcv VALUES ('005930', '2024-02-01', 1, 1, 1, 1, 1)")
+
+        self.assertTrue(self.manager.restore(point, symbols=["005930"]))
+        self.assertEqual(self.count("005930"), 28)
+        closes = dict(self.conn.execute("SELECT symbol, MAX(close) FROM stock_ohlcv GROUP BY symbol").fetchall())
+        self.assertEqual(closes, {"005930": 11, "000660": 0})
+        names = self.conn.execute("SELECT COUNT(*) FROM stock_info").fetchone()[0]
+        self.assertEqual(names, 2)
+
+    def test_symbol_restore_on_compact_schema(self):
+        legacy_point = self.manager.snapshot("legacy")
+        migrate_to_compact(self.db_path, vacuum=False)
+        compact_point = self.manager.snapshot("compact")
+
+        for point in (compact_point, legacy_point):
+            with self.conn:
+                self.conn.execute("UPDATE stock_ohlcv_days SET close = 0")
+                self.conn.execute("DELETE FROM stock_ohlcv_days WHERE symbol = '005930' AND day % 2 = 0")
+
+            self.assertTrue(self.manager.restore(point, symbols=["005930"]))
+            self.assertEqual(self.count("005930"), 28)
+            closes = dict(self.conn.execute("SELECT symbol, MAX(close) FROM stock_ohlcv GROUP BY symbol").fetchall())
+            self.assertEqual(closes, {"005930": 11, "000660": 0})
+            self.assertEqual(
+                self.conn.execute("SELECT MIN(date), MAX(date) FROM stock_ohlcv WHERE symbol = '005930'").fetchone(),
+                ("2024-01-02", "2024-01-29"),
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
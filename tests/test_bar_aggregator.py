@@ -0,0 +1,106 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from src.data.bar_aggregator import TickBarAggregator, bar_start_to_datetime, load_bars, local_epoch_seconds
+from src.data.connection_manager import connection_manager
+
+SESSION_START = local_epoch_seconds(datetime(2024, 3, 4, 9, 0))
+
+
+def random_ticks(n, symbols, seconds, seed=7):
+    rng = np.random.default_rng(seed)
+    ts = np.sort(SESSION_START + rng.uniform(0, seconds, n)).round(3)
+    return pd.DataFrame({
+        "symbol": rng.choice(symbols, n),
+        "ts": ts,
+        "price": rng.integers(100, 200, n).astype(float),
+        "volume": rng.integers(1, 50, n).astype(float),
+    })
+
+
+def expected_bars(ticks, seconds):
+    frame = ticks.assign(start=(ticks["ts"] - ticks["ts"] % seconds).astype(int))
+    grouped = frame.groupby(["symbol", "start"], sort=True)
+    return grouped.agg(
+        open=("price", "first"), high=("price", "max"), low=("price", "min"),
+        close=("price", "last"), volume=("volume", "sum"),
+    )
+
+
+class TestTickBarAggregator(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp_dir.name, "trading.db")
+
+    def tearDown(self):
+        connection_manager.close_all(self.db_path)
+        self.tmp_dir.cleanup()
+
+    def test_bars_match_batch_resample_and_flush(self):
+        ticks = random_ticks(20_000, ["005930", "000660", "035720"], 3600)
+        aggregator = TickBarAggregator(db_path=self.db_path, max_symbols=2, depth=16)
+        emitted = []
+        aggregator.subscribe(emitted.extend, intervals=["5m"])
+
+        half = len(ticks) // 2
+        for row in ticks.iloc[:half].itertuples():
+            aggregator.on_tick(row.symbol, row.ts, row.price, row.volume)
+        aggregator.on_ticks(*(ticks.iloc[half:][col].tolist() for col in ["symbol", "ts", "price", "volume"]))
+        aggregator.close_all()
+
+        for interval, seconds in [("1m", 60), ("5m", 300), ("1d", 86400)]:
+            expected = expected_bars(ticks, seconds)
+            for symbol in aggregator.symbols:
+                history = aggregator.history(symbol, interval)
+                want = expected.loc[symbol].tail(16)
+                np.testing.assert_array_equal(history[:, 0], want.index.to_numpy())
+                np.testing.assert_array_equal(history[:, 1:], want.to_numpy())
+
+        self.assertEqual(len(emitted), len(expected_bars(ticks, 300)))
+        self.assertEqual({bar.interval for bar in emitted}, {"5m"})
+
+        self.assertEqual(aggregator.flush(), 3 * (60 + 12 + 1))
+        stored = load_bars(self.db_path, "005930", "1m")
+        expected = expected_bars(ticks, 60).loc["005930"]
+        np.testing.assert_array_equal(stored[:, 1:], expected.to_numpy())
+        self.assertEqual(bar_start_to_datetime(int(stored[0, 0])), datetime(2024, 3, 4, 9, 0))
+
+    def test_advance_late_ticks_and_events(self):
+        aggregator = TickBarAggregator(intervals=("1m", "5m"))
+        self.assertEqual(aggregator.on_tick("005930", SESSION_START + 10, 100, 1), [])
+        aggregator.on_tick("005930", SESSION_START + 20, 105, 2)
+
+        # 다음 틱 없이 시간이 지나면 1분봉만 완성, 5분봉은 진행 중
+        bars = aggregator.advance(SESSION_START + 61)
+        self.assertEqual([(b.interval, b.open, b.high, b.close, b.volume) for b in bars], [("1m", 100, 105, 105, 3)])
+        self.assertEqual(aggregator.current("005930", "5m").volume, 3)
+
+        aggregator.on_tick("005930", SESSION_START + 30, 999, 1)
+        self.assertEqual(aggregator.stats["late_ticks"], 1)
+
+        # 5분 경계를 넘는 틱은 진행 중인 5분봉을 완성
+        bars = aggregator.on_tick("005930", SESSION_START + 300, 110, 5)
+        self.assertEqual([(b.interval, b.start - SESSION_START, b.volume) for b in bars], [("5m", 0, 3)])
+        aggregator.on_tick("005930", SESSION_START + 130, 90, 1)  # 지연 틱
+        bars = aggregator.on_tick("005930", SESSION_START + 360, 111, 1)
+        self.assertEqual([(b.interval, b.start - SESSION_START) for b in bars], [("1m", 300)])
+        self.assertEqual(aggregator.history("005930", "5m").shape, (1, 6))
+
+        # WebSocketClient 체결 이벤트 (부호 있는 가격/체결량)
+        aggregator.on_events([
+            {"type": "0B", "item": "000660", "values": {"10": "-150000", "15": "+7", "20": "090001"}},
+            {"type": "0B", "item": "000660", "values": {"10": "+151000", "15": "-3", "20": "090030"}},
+            {"type": "0B", "item": "000660", "values": {}},
+        ])
+        bar = aggregator.current("000660", "1m")
+        self.assertEqual((bar.open, bar.high, bar.low, bar.volume), (150000, 151000, 150000, 10))
+        self.assertEqual(bar_start_to_datetime(bar.start).time().isoformat(), "09:00:00")
+
+
+if __name__ == "__main__":
+    unittest.main()
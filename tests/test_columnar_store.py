@@ -0,0 +1,76 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from src.data.columnar_store import ColumnarOHLCVStore, date_to_day
+from src.data.connection_manager import connection_manager, get_pooled_connection
+
+
+class TestColumnarStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp_dir.name, "trading.db")
+        self.conn = get_pooled_connection(self.db_path)
+        with self.conn:
+            self.conn.execute(
+                "CREATE TABLE stock_ohlcv (symbol TEXT NOT NULL, date TEXT NOT NULL, open INTEGER, "
+                "high INTEGER, low INTEGER, close INTEGER, volume INTEGER, PRIMARY KEY (symbol, date))"
+            )
+            self.conn.executemany(
+                "INSERT INTO stock_ohlcv VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    ("005930", "2024-01-02", 70, 72, 69, 71, 300),
+                    ("005930", "2024-01-03", 71, 73, 70, 72, 400),
+                    ("000660", "2024-01-02", 10, 12, 9, 11, 100),
+                    ("000660", "2024-01-03", 11, 13, 10, 12, 5_000_000_000),
+                ],
+            )
+        self.store = ColumnarOHLCVStore.for_database(self.db_path)
+
+    def tearDown(self):
+        connection_manager.close_all(self.db_path)
+        self.tmp_dir.cleanup()
+
+    def test_export_layout(self):
+        self.assertEqual(self.store.export(), 4)
+        data = self.store.open()
+
+        self.assertEqual(data.symbols, ["000660", "005930"])
+        self.assertEqual(data.offsets.tolist(), [0, 2, 4])
+        self.assertEqual(data.day.dtype, np.int32)
+        self.assertEqual(data.columns["close"].dtype, np.int32)
+        self.assertEqual(data.columns["volume"].dtype, np.int64)
+        self.assertIsInstance(data.day, np.memmap)
+
+        df = data.get_frame("000660", start="2024-01-03")
+        self.assertEqual(df["close"].tolist(), [12])
+        self.assertEqual(df["volume"].tolist(), [5_000_000_000])
+        self.assertEqual(str(df.index[0].date()), "2024-01-03")
+
+    def test_sync_merges_changed_rows(self):
+        self.store.export()
+        with self.conn:
+            self.conn.execute("UPDATE stock_ohlcv SET close = 99 WHERE symbol = '005930' AND date = '2024-01-03'")
+            self.conn.executemany(
+                "INSERT INTO stock_ohlcv VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    ("005930", "2024-01-04", 72, 74, 71, 73, 500),
+                    ("035720", "2024-01-04", 50, 51, 49, 50, 600),
+                ],
+            )
+
+        self.assertEqual(self.store.sync(since="2024-01-03"), 4)
+        data = self.store.open()
+
+        self.assertEqual(data.symbols, ["000660", "005930", "035720"])
+        self.assertEqual(data.get_frame("005930")["close"].tolist(), [71, 99, 73])
+        self.assertEqual(data.get_arrays("000660")["day"].tolist(),
+                         [date_to_day("2024-01-02"), date_to_day("2024-01-03")])
+        self.assertEqual(data.last_date, "2024-01-04")
+        self.assertEqual(len(list(self.store.root.glob("gen-*"))), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
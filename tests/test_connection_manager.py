@@ -0,0 +1,69 @@
+import os
+import tempfile
+import threading
+import unittest
+
+from src.data.connection_manager import ConnectionManager
+
+
+class TestConnectionManager(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp_dir.name, "test.db")
+        self.manager = ConnectionManager()
+
+    def tearDown(self):
+        self.manager.close_all()
+        self.tmp_dir.cleanup()
+
+    def test_same_thread_reuses_connection(self):
+        conn1 = self.manager.get_connection(self.db_path)
+        conn2 = self.manager.get_connection(self.db_path)
+        self.assertIs(conn1, conn2)
+        self.assertEqual(conn1.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+
+    def test_threads_get_separate_connections(self):
+        main_conn = self.manager.get_connection(self.db_path)
+        other = {}
+
+        def worker():
+            other["conn"] = self.manager.get_connection(self.db_path)
+
+        t = threading.Thread(target=worker)
+        t.start()
+        t.join()
+        self.assertIsNot(main_conn, other["conn"])
+
+    def test_reader_not_blocked_by_open_write_transaction(self):
+        writer = self.manager.get_connection(self.db_path)
+        with writer:
+            writer.execute("CREATE TABLE t (v INTEGER)")
+            writer.execute("INSERT INTO t VALUES (1)")
+
+        writer.execute("BEGIN IMMEDIATE")
+        writer.execute("INSERT INTO t VALUES (2)")
+
+        result = {}
+
+        def reader():
+            conn = self.manager.get_connection(self.db_path)
+            result["count"] = conn.execute("SELECT COUNT(*) FROM t").fetchone()[0]
+
+        t = threading.Thread(target=reader)
+        t.start()
+        t.join(timeout=5)
+        writer.commit()
+
+        # 커밋 전 스냅샷을 즉시 읽어야 함
+        self.assertEqual(result.get("count"), 1)
+
+    def test_close_all_reopens_on_next_request(self):
+        conn1 = self.manager.get_connection(self.db_path)
+        self.manager.close_all(self.db_path)
+        conn2 = self.manager.get_connection(self.db_path)
+        self.assertIsNot(conn1, conn2)
+        self.assertEqual(conn2.execute("SELECT 1").fetchone()[0], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from src.data.connection_manager import connection_manager, get_pooled_connection
+from src.data.consistency_audit import SUMMARY_TABLE, DataConsistencyAuditor
+from src.data.updater import StockDataUpdater
+
+# 2024-01-01은 신정 -> 1/2~1/12 거래일 9일
+DAYS = ["2024-01-02", "2024-01-03", "2024-01-04", "2024-01-05", "2024-01-08",
+        "2024-01-09", "2024-01-10", "2024-01-11", "2024-01-12"]
+
+
+def make_rows():
+    rows = [("005930", d, 70 + i, 72 + i, 69 + i, 71 + i, 300) for i, d in enumerate(DAYS)]
+
+    # 000660: 1/4 누락, 1/5 고가 < 저가, 1/9 종가 +50%
+    for i, d in enumerate(DAYS):
+        if d == "2024-01-04":
+            continue
+        close = 150 if d >= "2024-01-09" else 100
+        high, low = (90, 95) if d == "2024-01-05" else (close + 5, close - 5)
+        rows.append(("000660", d, close, high, low, close, 100))
+
+    # 035720: 마지막 적재일 1/10, 6일 연속 동일 종가, 2일 거래량 0
+    for i, d in enumerate(DAYS[:7]):
+        rows.append(("035720", d, 50, 53, 49, 50 if i < 6 else 52, 0 if i in (2, 3) else 10))
+    return rows
+
+
+class TestConsistencyAudit(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp_dir.name, "trading.db")
+        self.updater = StockDataUpdater(db_path=self.db_path, data_source=mock.Mock())
+        conn = get_pooled_connection(self.db_path)
+        with conn:
+            conn.executemany("INSERT INTO stock_ohlcv VALUES (?, ?, ?, ?, ?, ?, ?)", make_rows())
+
+    def tearDown(self):
+        connection_manager.close_all(self.db_path)
+        self.tmp_dir.cleanup()
+
+    def test_full_audit_is_independent_of_chunking(self):
+        auditor = DataConsistencyAuditor(self.db_path, chunk_rows=4)
+        summary = auditor.audit("2024-01-01", "2024-01-12")
+        unchunked = DataConsistencyAuditor(self.db_path).audit("2024-01-01", "2024-01-12", save=False)
+        cols = ["rows", "missing_days", "invalid_ohlc", "stale_days", "outlier_returns"]
+        self.assertTrue(summary[cols].equals(unchunked[cols]))
+
+        self.assertEqual(list(summary.index), ["000660", "005930", "035720"])
+        samsung, hynix, kakao = (summary.loc[s] for s in ("005930", "000660", "035720"))
+        self.assertTrue(samsung["is_consistent"])
+        self.assertEqual(samsung["missing_days"], 0)
+
+        self.assertFalse(hynix["is_consistent"])
+        self.assertEqual((hynix["missing_days"], hynix["interior_missing_days"]), (1, 1))
+        self.assertEqual(hynix["invalid_ohlc"], 1)
+        self.assertEqual(hynix["outlier_returns"], 1)
+
+        self.assertEqual((kakao["missing_days"], kakao["interior_missing_days"]), (2, 0))
+        self.assertEqual(kakao["zero_volume_days"], 2)
+        self.assertEqual((kakao["stale_days"], kakao["max_stale_run"]), (6, 6))
+        self.assertEqual(kakao["last_date"], "2024-01-10")
+
+        stored = auditor.load_summary()
+        self.assertEqual(len(stored), 3)
+        self.assertEqual(stored.loc["000660", "invalid_ohlc"], 1)
+
+    def test_subset_audit_updates_only_touched_rows(self):
+        auditor = self.updater.auditor
+        auditor.audit("2024-01-01", "2024-01-12")
+        with get_pooled_connection(self.db_path) as conn:
+            conn.execute("INSERT INTO stock_ohlcv VALUES ('000660', '2024-01-04', 100, 105, 95, 100, 100)")
+
+        summary = auditor.audit("2024-01-01", "2024-01-12", ["000660", "999999"])
+        self.assertEqual(list(summary.index), ["000660", "999999"])
+        self.assertEqual(summary.loc["000660", "missing_days"], 0)
+        self.assertEqual(summary.loc["999999", "missing_days"], len(DAYS))
+        self.assertFalse(summary.loc["999999", "is_consistent"])
+
+        audited = get_pooled_connection(self.db_path).execute(
+            f"SELECT symbol FROM {SUMMARY_TABLE} ORDER BY symbol").fetchall()
+        self.assertEqual([r[0] for r in audited], ["000660", "005930", "035720", "999999"])
+
+    def test_updater_wrappers_keep_legacy_format(self):
+        stats = self.updater.get_incremental_update_stats(["005930", "000660", "035720"], "2024-01-01", "2024-01-12")
+        self.assertEqual(stats["total_symbols"], 3)
+        self.assertEqual(stats["symbols_with_missing_data"], 2)
+        self.assertEqual(stats["symbols_with_quality_issues"], 1)
+        self.assertEqual(stats["total_missing_days"], 3)
+        actions = sorted((r["symbol"], r["action"]) for r in stats["update_recommendations"])
+        self.assertEqual(actions, [("000660", "data_quality_fix"), ("000660", "incremental_update"),
+                                   ("035720", "incremental_update")])
+
+        result = self.updater.check_data_consistency("000660", "2024-01-01", "2024-01-12")
+        self.assertFalse(result["is_consistent"])
+        self.assertEqual(result["missing_days"], 1)
+        self.assertEqual(result["actual_days"], 8)
+        self.assertEqual(result["missing_ranges"], [("2024-01-04", "2024-01-04")])
+        self.assertEqual(len(result["data_quality_issues"]), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import tempfile
+import unittest
+from unittest import mock
+
+import pandas as pd
+
+from src.data.data_source import RecordingDataSource, ReplayDataSource, SimulatedProviderError
+
+
+def daily_frame(closes, start="2024-01-02"):
+    index = pd.bdate_range(start, periods=len(closes), name="날짜")
+    return pd.DataFrame(
+        {"시가": closes, "고가": closes, "저가": closes, "종가": closes, "거래량": [100] * len(closes)},
+        index=index,
+    )
+
+
+class TestRecordReplay(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        inner = mock.Mock()
+        inner.get_market_ohlcv_by_date.side_effect = lambda f, t, ticker: {
+            "005930": daily_frame([70, 71, 72]),
+            "000660": daily_frame([10, 11], start="2024-01-03"),
+        }[ticker]
+        recorder = RecordingDataSource(inner, self.tmp_dir.name)
+        recorder.get_market_ohlcv_by_date("20240102", "20240104", "005930")
+        recorder.get_market_ohlcv_by_date("20240102", "20240104", "000660")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_replay_slices_recorded_range(self):
+        replay = ReplayDataSource(self.tmp_dir.name)
+        df = replay.get_market_ohlcv_by_date("2024-01-03", "2024-01-04", "005930")
+        self.assertEqual(df["종가"].tolist(), [71, 72])
+        self.assertTrue(replay.get_market_ohlcv_by_date("20240102", "20240104", "999999").empty)
+
+    def test_replay_builds_market_cross_section(self):
+        replay = ReplayDataSource(self.tmp_dir.name)
+        df = replay.get_market_ohlcv("20240103")
+        self.assertEqual(df["종가"].to_dict(), {"000660": 10, "005930": 71})
+
+    def test_simulated_errors(self):
+        replay = ReplayDataSource(self.tmp_dir.name, error_rate=1.0, seed=1)
+        with self.assertRaises(SimulatedProviderError):
+            replay.get_market_ohlcv_by_date("20240102", "20240104", "005930")
+        self.assertEqual(replay.stats["errors"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+import asyncio
+import json
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.api.kiwoom_client import AsyncKiwoomApiClient, KiwoomApiClient
+from src.utils.rate_limiter import TokenBucketRateLimiter
+
+PAGE_SIZE = 3
+
+
+class FakeKiwoomServer:
+    """키움 REST API를 흉내 내는 로컬 HTTP/1.1 서버 (keep-alive, 연속조회, 토큰 발급)"""
+
+    def __init__(self, rows_per_symbol=8, delay=0.0):
+        self.rows_per_symbol = rows_per_symbol
+        self.delay = delay
+        self.connections = 0
+        self.tokens_issued = 0
+        self.expired_tokens = set()
+        self.requests = []  # (api-id, cont-yn, next-key, authorization)
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                with fake._lock:
+                    fake.connections += 1
+
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                status, payload, headers = fake.handle(self.path, self.headers, body)
+                raw = json.dumps(payload).encode()
+                self.send_response(status)
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(raw)))
+                self.end_headers()
+                self.wfile.write(raw)
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def handle(self, path, headers, body):
+        if path == "/oauth2/token":
+            with self._lock:
+                self.tokens_issued += 1
+                token = f"token-{self.tokens_issued}"
+            expires = time.strftime("%Y%m%d%H%M%S", time.localtime(time.time() + 3600))
+            return 200, {"token": token, "expires_dt": expires, "return_code": 0}, {}
+
+        auth = headers.get("authorization")
+        with self._lock:
+            self.requests.append((headers.get("api-id"), headers.get("cont-yn"), headers.get("next-key"), auth))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if auth.split()[-1] in self.expired_tokens:
+                return 401, {"return_code": 3, "return_msg": "token expired"}, {}
+            time.sleep(self.delay)
+            if path == "/api/dostk/acnt":
+                return 200, {"return_code": 0, "acnt_nm": "test"}, {}
+
+            offset = int(headers.get("next-key") or 0)
+            rows = [{"symbol": body["symbol"], "seq": i} for i in range(offset, min(offset + PAGE_SIZE, self.rows_per_symbol))]
+            following = offset + PAGE_SIZE
+            more = following < self.rows_per_symbol
+            page_headers = {"cont-yn": "Y" if more else "N", "next-key": str(following) if more else ""}
+            return 200, {"return_code": 0, "output": rows}, page_headers
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+def make_client(server, **kwargs):
+    limiter = TokenBucketRateLimiter(rate=1000, burst=100)
+    return KiwoomApiClient("key", "secret", rate_limiter=limiter, base_url=server.url, **kwargs)
+
+
+class TestKiwoomApiClient(unittest.TestCase):
+    def test_paging_keep_alive_and_token_cache(self):
+        with FakeKiwoomServer(rows_per_symbol=8) as server, make_client(server) as client:
+            frames = list(client.iter_daily_ohlcv("005930", "20240101", "20241231"))
+            self.assertEqual([len(frame) for frame in frames], [3, 3, 2])
+            self.assertEqual(sum((frame["seq"].tolist() for frame in frames), []), list(range(8)))
+            self.assertEqual(
+                [(cont, key) for _, cont, key, _ in server.requests], [("N", ""), ("Y", "3"), ("Y", "6")]
+            )
+
+            result = client.get_daily_ohlcv(None, "000660", "20240101", "20241231")
+            self.assertEqual([row["seq"] for row in result["output"]], list(range(8)))
+            self.assertEqual(client.get_account_info()["acnt_nm"], "test")
+
+            # 토큰 1회 발급, 데이터 요청 7건은 하나의 keep-alive 연결 재사용
+            self.assertEqual(server.tokens_issued, 1)
+            self.assertEqual({auth for *_, auth in server.requests}, {"Bearer token-1"})
+            self.assertEqual(server.connections, 2)  # 토큰 발급(requests.post) 1 + 세션 1
+
+            # 같은 base_url/api_key 클라이언트는 공용 토큰 캐시 사용 (재발급 없음)
+            with make_client(server) as other:
+                self.assertIs(other.token_cache, client.token_cache)
+                self.assertEqual(other.get_account_info()["acnt_nm"], "test")
+            self.assertEqual(server.tokens_issued, 1)
+
+            # 서버에서 토큰이 만료되면 한 번 재발급 후 재시도
+            server.expired_tokens.add("token-1")
+            self.assertEqual(client.get_account_info()["acnt_nm"], "test")
+            self.assertEqual(server.tokens_issued, 2)
+
+            # 명시적으로 준 토큰은 재발급하지 않고 실패 처리
+            self.assertIsNone(client.get_account_info("token-1"))
+
+    def test_async_client_limits_concurrency(self):
+        symbols = [f"{i:06d}" for i in range(12)]
+        with FakeKiwoomServer(rows_per_symbol=5, delay=0.02) as server, make_client(server, pool_size=4) as client:
+            async_client = AsyncKiwoomApiClient(client, max_concurrency=4)
+
+            async def run():
+                frames = [frame async for frame in async_client.iter_daily_ohlcv("005930", "20240101", "20241231")]
+                results = await async_client.gather_daily_ohlcv(symbols, "20240101", "20241231")
+                return frames, results
+
+            start = time.perf_counter()
+            frames, results = asyncio.run(run())
+            elapsed = time.perf_counter() - start
+
+        self.assertEqual([len(frame) for frame in frames], [3, 2])
+        self.assertEqual(list(results), symbols)
+        for symbol, result in results.items():
+            self.assertEqual([row["seq"] for row in result["output"]], list(range(5)))
+            self.assertEqual({row["symbol"] for row in result["output"]}, {symbol})
+        self.assertEqual(server.max_in_flight, 4)
+        self.assertLessEqual(server.connections, 1 + 4)
+        # 순차 실행이면 26요청 x 20ms 이상
+        self.assertLess(elapsed, 26 * 0.02)
+
+
+if __name__ == "__main__":
+    unittest.main()
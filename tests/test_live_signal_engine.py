@@ -0,0 +1,113 @@
+import queue
+import unittest
+
+import numpy as np
+import pandas as pd
+import talib
+
+from src.data.bar_aggregator import Bar, local_epoch_seconds
+from src.data.streaming_indicators import EWMMean, RollingMean, TalibATR, TalibBBands, TalibMACD, TalibRSI
+from src.strategies import BollingerBandStrategy, LiveSignalEngine, MACDStrategy, MovingAverageStrategy, RSIStrategy
+from src.strategies.base_strategy import create_default_config
+from src.strategies.moving_average_strategy import MovingAverageConfig
+
+
+def random_ohlcv(n, seed):
+    rng = np.random.default_rng(seed)
+    close = 10000 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+    high = close * (1 + np.abs(rng.normal(0, 0.01, n)))
+    low = close * (1 - np.abs(rng.normal(0, 0.01, n)))
+    return pd.DataFrame({
+        "open": low + (high - low) * rng.random(n),
+        "high": high,
+        "low": low,
+        "close": close,
+        "volume": rng.integers(1000, 100000, n).astype(float),
+    }, index=pd.date_range("2022-01-03", periods=n, freq="B"))
+
+
+def signal_key(signal):
+    return (
+        signal.timestamp, signal.symbol, signal.signal_type, signal.reason, signal.risk_level,
+        round(float(signal.confidence), 9), round(float(signal.price), 6),
+    )
+
+
+def make_strategies():
+    macd_params = {"fast_period": 8, "slow_period": 21, "signal_period": 5, "use_trend_filter": True}
+    return [
+        RSIStrategy(),
+        MACDStrategy(),
+        MACDStrategy(create_default_config("MACD_Fast", macd_params)),
+        BollingerBandStrategy(),
+        MovingAverageStrategy(),
+        MovingAverageStrategy(MovingAverageConfig(name="MA_Dual", fast_period=5, slow_period=15, use_triple_ma=False)),
+    ]
+
+
+class TestStreamingIndicators(unittest.TestCase):
+    def test_matches_talib_and_pandas(self):
+        data = random_ohlcv(300, seed=3)
+        close, high, low = (data[col].to_numpy() for col in ["close", "high", "low"])
+
+        rolling, ewm, rsi, atr = RollingMean(20), EWMMean(10), TalibRSI(14), TalibATR(14)
+        macd, bands = TalibMACD(12, 26, 9), TalibBBands(20, 2.0, 2.0)
+        values = np.array([
+            (rolling.update(c), ewm.update(c), rsi.update(c), atr.update(h, l, c), *macd.update(c), *bands.update(c))
+            for h, l, c in zip(high, low, close)
+        ])
+
+        # pandas 호환 지표는 비트 단위 일치
+        np.testing.assert_array_equal(values[:, 0], data["close"].rolling(20).mean())
+        np.testing.assert_array_equal(values[:, 1], data["close"].ewm(span=10).mean())
+        # TA-Lib 호환 지표는 NaN 구간이 같고 반올림 오차 범위에서 일치
+        expected = np.column_stack([
+            talib.RSI(close, 14), talib.ATR(high, low, close, 14), *talib.MACD(close, 12, 26, 9), *talib.BBANDS(close, 20, 2.0, 2.0),
+        ])
+        np.testing.assert_allclose(values[:, 2:], expected, rtol=1e-10, atol=1e-10)
+        np.testing.assert_array_equal(np.isnan(values[:, 2:]), np.isnan(expected))
+
+
+class TestLiveSignalEngine(unittest.TestCase):
+    def test_replay_matches_batch_signals(self):
+        for seed in range(3):
+            data = random_ohlcv(250, seed)
+            strategies = make_strategies()
+            engine = LiveSignalEngine(strategies)
+            live = engine.replay("005930", data)
+
+            for strategy in strategies:
+                batch = strategy.generate_signals(data, "005930")
+                self.assertTrue(batch, strategy.name)
+                streamed = [signal for name, signal in live if name == strategy.name]
+                self.assertEqual([signal_key(s) for s in streamed], [signal_key(s) for s in batch], strategy.name)
+            self.assertEqual(engine.stats["errors"], 0)
+
+    def test_warm_up_then_stream_bars(self):
+        data = random_ohlcv(200, seed=11)
+        strategy = MACDStrategy()
+        expected = [s for s in strategy.generate_signals(data, "000660") if s.timestamp >= data.index[150]]
+
+        received, signal_queue = [], queue.Queue()
+        engine = LiveSignalEngine([strategy], on_signal=lambda name, signal: received.append(signal), queue=signal_queue)
+        engine.warm_up("000660", data.iloc[:150])
+        self.assertEqual(engine.stats["signals"], 0)
+
+        bars = [
+            Bar("000660", interval, int(local_epoch_seconds(ts.to_pydatetime())), *row)
+            for ts, row in zip(data.index[150:], data.iloc[150:].itertuples(index=False))
+            for interval in ("1m", "1d")
+        ]
+        engine.on_bars(bars)
+
+        self.assertEqual([signal_key(s)[2:] for s in received], [signal_key(s)[2:] for s in expected])
+        self.assertEqual([s.timestamp for s in received], [ts.to_pydatetime() for ts in (s.timestamp for s in expected)])
+        self.assertEqual(signal_queue.qsize(), len(expected))
+        self.assertEqual(signal_queue.get_nowait()[0], strategy.name)
+
+        with self.assertRaises(ValueError):
+            engine.add_strategy(MACDStrategy())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import pandas as pd
+
+from src.data.connection_manager import connection_manager, get_pooled_connection
+from src.data.stock_filter import StockFilter
+from src.data.updater import StockDataUpdater
+
+
+def cap_frame(rows):
+    """pykrx get_market_cap(date, market='ALL') 형식 (인덱스=티커)"""
+    return pd.DataFrame(rows, columns=["티커", "종가", "시가총액", "거래량", "거래대금", "상장주식수"]).set_index("티커")
+
+
+CAPS = {
+    "20240102": cap_frame([
+        ("005930", 70, 400_000, 1, 1, 5000),
+        ("000660", 10, 300_000, 1, 1, 30000),
+        ("035720", 5, 100_000, 1, 1, 20000),
+        ("999999", 0, 0, 0, 0, 0),
+    ]),
+    "20240103": cap_frame([
+        ("005930", 60, 350_000, 1, 1, 5000),
+        ("000660", 13, 390_000, 1, 1, 30000),
+        ("035720", 4, 80_000, 1, 1, 20000),
+    ]),
+}
+
+
+class TestMarketCapHistory(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp_dir.name, "trading.db")
+        self.source = mock.Mock()
+        self.source.get_market_cap.side_effect = lambda date, market: CAPS[date]
+        self.updater = StockDataUpdater(db_path=self.db_path, data_source=self.source)
+        self.conn = get_pooled_connection(self.db_path)
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO stock_info (symbol, name, market) VALUES (?, ?, ?)",
+                [("005930", "삼성전자", "KOSPI"), ("000660", "SK하이닉스", "KOSPI"), ("035720", "카카오", "KOSDAQ")],
+            )
+        self.filter = StockFilter(db_path=self.db_path)
+
+    def tearDown(self):
+        connection_manager.close_all(self.db_path)
+        self.tmp_dir.cleanup()
+
+    def test_bulk_load_keeps_history_and_latest_snapshot(self):
+        self.assertEqual(self.updater.update_market_cap_data("20240103"), 3)
+        # 과거일 백필은 stock_info의 최신 스냅샷을 덮어쓰지 않음
+        self.assertEqual(self.updater.update_market_cap_data("20240102"), 3)
+
+        rows = self.conn.execute(
+            "SELECT symbol, date, market_cap, shares FROM stock_market_cap WHERE symbol = '000660' ORDER BY date"
+        ).fetchall()
+        self.assertEqual(rows, [("000660", "2024-01-02", 300_000, 30000), ("000660", "2024-01-03", 390_000, 30000)])
+        snapshot = dict(self.conn.execute("SELECT symbol, market_cap FROM stock_info").fetchall())
+        self.assertEqual(snapshot["005930"], 350_000)
+
+    def test_top_n_as_of_date_without_look_ahead(self):
+        self.updater.update_market_cap_data("20240102")
+        self.updater.update_market_cap_data("20240103")
+
+        self.assertEqual(self.filter.get_market_cap_top(2, "ALL", date="20240102"), ["005930", "000660"])
+        # 1/5(미저장일)는 1/3 스냅샷 사용
+        self.assertEqual(self.filter.get_market_cap_top(2, "ALL", date="20240105"), ["000660", "005930"])
+        self.assertEqual(self.filter.get_market_cap_top(5, "KOSDAQ"), ["035720"])
+        self.assertEqual(self.filter.get_market_cap_top(5, "ALL", date="20231229"), [])
+
+        caps = self.filter.get_market_caps("20240102", symbols=["035720", "005930"])
+        self.assertEqual(caps["symbol"].tolist(), ["005930", "035720"])
+        self.assertEqual(caps["shares"].tolist(), [5000, 20000])
+
+        plan = " ".join(row[3] for row in self.conn.execute(
+            "EXPLAIN QUERY PLAN SELECT symbol FROM stock_market_cap WHERE date = ? ORDER BY market_cap DESC LIMIT 5",
+            ("2024-01-03",),
+        ))
+        self.assertIn("COVERING INDEX idx_market_cap_date_cap", plan)
+
+    def test_history_fetches_only_missing_days(self):
+        self.updater.update_market_cap_data("20240102")
+        self.source.get_market_cap.reset_mock()
+
+        results = self.updater.update_market_cap_history("20240101", "20240103")
+
+        self.assertEqual(results, {"20240103": 3})
+        self.source.get_market_cap.assert_called_once_with("20240103", market="ALL")
+
+
+if __name__ == "__main__":
+    unittest.main()
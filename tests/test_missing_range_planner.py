@@ -0,0 +1,43 @@
+import os
+import tempfile
+import unittest
+
+from src.data.connection_manager import connection_manager, get_pooled_connection
+from src.data.updater import DataUpdateCacheManager, OptimizedDataUpdateConfig
+
+
+class TestMissingRangePlanner(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp_dir.name, "trading.db")
+        conn = get_pooled_connection(self.db_path)
+        with conn:
+            conn.execute(
+                "CREATE TABLE stock_ohlcv (symbol TEXT NOT NULL, date TEXT NOT NULL, open INTEGER, "
+                "high INTEGER, low INTEGER, close INTEGER, volume INTEGER, PRIMARY KEY (symbol, date))"
+            )
+            rows = [("A", d) for d in ("2024-01-02", "2024-01-03", "2024-01-05")]
+            rows += [("B", d) for d in ("2024-01-03", "2024-01-04", "2024-01-05", "2024-01-08")]
+            conn.executemany(
+                "INSERT INTO stock_ohlcv (symbol, date, close) VALUES (?, ?, 1)", rows
+            )
+        self.manager = DataUpdateCacheManager(self.db_path, OptimizedDataUpdateConfig())
+
+    def tearDown(self):
+        connection_manager.close_all(self.db_path)
+        self.tmp_dir.cleanup()
+
+    def test_plan_reports_only_trading_day_gaps(self):
+        plan = self.manager.plan_missing_ranges(["A", "B", "C"], "2024-01-01", "20240109")
+
+        # 01-01(신정), 01-06~07(주말)은 누락으로 보지 않음
+        self.assertEqual(plan["A"], [("2024-01-04", "2024-01-04"), ("2024-01-08", "2024-01-09")])
+        self.assertEqual(plan["B"], [("2024-01-02", "2024-01-02"), ("2024-01-09", "2024-01-09")])
+        self.assertEqual(plan["C"], [("2024-01-02", "2024-01-09")])
+
+    def test_complete_symbol_has_no_ranges(self):
+        self.assertEqual(self.manager.get_missing_date_ranges("B", "2024-01-03", "2024-01-08"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from src.data.connection_manager import connection_manager, get_pooled_connection
+from src.data.consistency_audit import DataConsistencyAuditor
+from src.data.ohlcv_schema import migrate_to_compact, ohlcv_layout, revert_to_legacy
+from src.data.panel_loader import load_panel
+from src.data.stock_filter import StockFilter
+from src.data.updater import StockDataUpdater
+
+DATES = [str(d) for d in np.arange("2024-01-02", "2024-02-01", dtype="datetime64[D]") if np.is_busday(d)]
+
+
+class TestCompactOHLCVSchema(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp_dir.name, "trading.db")
+        self.updater = StockDataUpdater(db_path=self.db_path)
+        self.updater._bulk_upsert_ohlcv([
+            (symbol, day, 10 + i, 12 + i, 9 + i, 11 + i, 100 * (i + 1))
+            for symbol in ("005930", "000660") for i, day in enumerate(DATES)
+        ])
+        self.conn = get_pooled_connection(self.db_path)
+
+    def tearDown(self):
+        connection_manager.close_all(self.db_path)
+        self.tmp_dir.cleanup()
+
+    def rows(self):
+        return self.conn.execute("SELECT * FROM stock_ohlcv ORDER BY symbol, date").fetchall()
+
+    def test_migration_keeps_readers_and_writers_working(self):
+        before_rows = self.rows()
+        before_panel = load_panel(None, "2024-01-05", "2024-01-19", db_path=self.db_path, as_array=True)
+
+        stats = migrate_to_compact(self.db_path)
+
+        self.assertEqual(stats["rows"], len(before_rows))
+        self.assertEqual(ohlcv_layout(self.conn), "compact")
+        self.assertEqual(self.rows(), before_rows)
+        self.assertEqual(self.conn.execute("SELECT MIN(day) FROM stock_ohlcv_days").fetchone()[0], 19724)
+        after_panel = load_panel(None, "2024-01-05", "2024-01-19", db_path=self.db_path, as_array=True)
+        np.testing.assert_array_equal(after_panel.values, before_panel.values)
+        self.assertTrue(after_panel.dates.equals(before_panel.dates))
+
+        # 업데이터 UPSERT는 압축 테이블에 직접, 호환 뷰는 트리거로 쓰기
+        self.updater._bulk_upsert_ohlcv([("005930", "2024-01-02", 1, 1, 1, 1, 1), ("005930", "2024-02-01", 2, 2, 2, 2, 2)])
+        with self.conn:
+            self.conn.execute("INSERT INTO stock_ohlcv VALUES ('000660', '2024-02-01', 3, 3, 3, 3, 3)")
+            self.conn.execute("UPDATE stock_ohlcv SET close = 4 WHERE symbol = '000660' AND date = '2024-02-01'")
+            self.conn.execute("DELETE FROM stock_ohlcv WHERE symbol = '000660' AND date = '2024-01-02'")
+        changed = dict(self.conn.execute(
+            "SELECT symbol || date, close FROM stock_ohlcv WHERE date IN ('2024-01-02', '2024-02-01')"
+        ).fetchall())
+        self.assertEqual(changed, {"0059302024-01-02": 1, "0059302024-02-01": 2, "0006602024-02-01": 4})
+
+        summary = DataConsistencyAuditor(self.db_path).audit("2024-01-02", "2024-02-01", save=False)
+        self.assertEqual(summary.loc["005930", "rows"], len(DATES) + 1)
+        self.assertEqual(summary.loc["000660", "missing_days"], 1)
+
+        plan = " ".join(row[3] for row in self.conn.execute(
+            "EXPLAIN QUERY PLAN SELECT symbol, close FROM stock_ohlcv_days WHERE day = 19724"
+        ))
+        self.assertIn("idx_ohlcv_days_day_symbol", plan)
+
+    def test_stock_filter_reads_compact_table(self):
+        with self.conn:
+            self.conn.execute("UPDATE stock_ohlcv SET volume = volume * 2, close = close - 5 WHERE symbol = '000660'")
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO stock_info (symbol, name, market) VALUES (?, ?, 'KOSPI')",
+                [("005930", "삼성전자"), ("000660", "SK하이닉스")],
+            )
+
+        def query():
+            stock_filter = StockFilter(db_path=self.db_path)
+            return (
+                stock_filter._get_latest_trading_date(),
+                stock_filter.get_volume_top(top_n=2, date="20240131", days_avg=1),
+                stock_filter.get_volume_top(top_n=2, date="20240131", days_avg=5, min_volume=3000),
+                stock_filter.get_price_change_top(top_n=2, date="20240103"),
+                stock_filter.get_stock_info(["005930"], date="20240103")[["close", "change_rate"]].values.tolist(),
+            )
+
+        before = query()
+        migrate_to_compact(self.db_path, vacuum=False)
+        # 호환 뷰 없이도 동작해야 압축 테이블을 직접 조회하는 것
+        with self.conn:
+            self.conn.execute("DROP VIEW stock_ohlcv")
+        self.assertEqual(query(), before)
+        self.assertEqual(before[:4], ("20240131", ["000660", "005930"], ["000660"], ["000660", "005930"]))
+
+    def test_revert_and_invalid_dates(self):
+        before_rows = self.rows()
+        migrate_to_compact(self.db_path)
+        with self.assertRaises(ValueError):
+            migrate_to_compact(self.db_path)
+
+        self.assertEqual(revert_to_legacy(self.db_path), len(before_rows))
+        self.assertEqual(ohlcv_layout(self.conn), "legacy")
+        self.assertEqual(self.rows(), before_rows)
+
+        with self.conn:
+            self.conn.execute("INSERT INTO stock_ohlcv VALUES ('005930', '20240201', 1, 1, 1, 1, 1)")
+        with self.assertRaises(ValueError):
+            migrate_to_compact(self.db_path)
+        self.assertEqual(ohlcv_layout(self.conn), "legacy")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+from unittest import mock
+
+from src.trading.order_manager import OrderManager, OrderSide, OrderStatus
+
+
+class TestOrderManagerIndexes(unittest.TestCase):
+    def setUp(self):
+        self.manager = OrderManager(slippage_rate=0.0)
+
+    def test_ids_and_status_indexes(self):
+        orders = [self.manager.create_market_order(f"00000{i % 3}", OrderSide.BUY, 10) for i in range(300)]
+        self.assertEqual(len({order.order_id for order in orders}), 300)
+        self.assertEqual([o.sequence for o in orders], sorted(o.sequence for o in orders))
+        self.assertEqual(len(self.manager.orders), 300)
+
+        for order in orders[:100]:
+            self.assertTrue(self.manager.execute_order(order.order_id, 1000.0))
+        self.manager.cancel_order(orders[100].order_id)
+        self.assertFalse(self.manager.execute_order(orders[101].order_id, 1000.0, available_quantity=0))
+
+        pending = self.manager.get_pending_orders("000001")
+        self.assertEqual(pending, [o for o in orders[102:] if o.symbol == "000001"])
+        self.assertEqual(self.manager.get_filled_orders(), orders[:100])
+        self.assertEqual(self.manager.get_filled_orders("000002"), [o for o in orders[:100] if o.symbol == "000002"])
+        self.assertEqual(
+            self.manager.get_order_summary(),
+            {"total": 300, "pending": 198, "filled": 100, "cancelled": 1, "rejected": 0},
+        )
+
+        # 정리 후 활성 인덱스에는 대기 주문만 남고, 체결/취소 내역은 이력에서 그대로 조회
+        self.manager.clear_completed_orders()
+        self.assertEqual(
+            self.manager.get_order_summary(),
+            {"total": 198, "pending": 198, "filled": 100, "cancelled": 1, "rejected": 0},
+        )
+        self.assertEqual(self.manager.get_filled_orders(), orders[:100])
+        self.assertEqual(self.manager.get_filled_orders("000002"), [o for o in orders[:100] if o.symbol == "000002"])
+        self.assertEqual(len(self.manager.get_pending_orders()), 198)
+        self.assertEqual(sum(len(bucket) for bucket in self.manager._by_status.values()), 198)
+        self.manager.reset()
+        self.assertEqual(self.manager.get_order_summary(), dict.fromkeys(["total", "pending", "filled", "cancelled", "rejected"], 0))
+
+    def test_limit_queues_touch_only_fillable_orders(self):
+        manager = self.manager
+        buys = [manager.create_limit_order("005930", OrderSide.BUY, 10, 100.0 + i) for i in range(10)]
+        sells = [manager.create_limit_order("005930", OrderSide.SELL, 10, 110.0 + i) for i in range(10)]
+        extra = manager.create_limit_order("005930", OrderSide.BUY, 10, 109.0)  # 같은 가격은 시간 우선
+        manager.create_limit_order("000660", OrderSide.BUY, 10, 500.0)
+
+        queue = manager.get_pending_limit_orders("005930", OrderSide.BUY)
+        self.assertEqual([o.price for o in queue], [109.0, 109.0] + [108.0 - i for i in range(9)])
+        self.assertIs(queue[1], extra)
+
+        manager.cancel_order(buys[8].order_id)
+        with mock.patch.object(manager, "execute_order", wraps=manager.execute_order) as execute:
+            filled = manager.match_limit_orders("005930", 106.5)
+        self.assertEqual(filled, [buys[9], extra, buys[7]])
+        self.assertEqual(execute.call_count, 3)
+        self.assertTrue(all(o.filled_price <= o.price for o in filled))
+
+        # 매도는 낮은 지정가부터, 가용 수량 안에서만 체결
+        filled = manager.match_limit_orders("005930", 113.0, available_quantity=25)
+        self.assertEqual(filled, sells[:3])
+        self.assertEqual([o.filled_quantity for o in filled], [10, 10, 5])
+        self.assertEqual([o.price for o in manager.get_pending_limit_orders("005930", OrderSide.SELL)], [113.0 + i for i in range(7)])
+        self.assertEqual(manager.match_limit_orders("005930", 107.0), [])
+        self.assertEqual(len(manager.get_pending_orders("005930")), 7 + 7)
+        self.assertEqual(manager.get_order_summary()["filled"], 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from src.data.connection_manager import get_pooled_connection
+from src.data.panel_loader import load_panel
+
+
+class TestPanelLoader(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp_dir.name, "panel.db")
+        conn = get_pooled_connection(self.db_path)
+        with conn:
+            conn.execute(
+                "CREATE TABLE stock_ohlcv (symbol TEXT NOT NULL, date TEXT NOT NULL, open INTEGER, "
+                "high INTEGER, low INTEGER, close INTEGER, volume INTEGER, PRIMARY KEY (symbol, date))"
+            )
+            conn.executemany(
+                "INSERT INTO stock_ohlcv VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    ("000660", "2024-01-02", 10, 12, 9, 11, 100),
+                    ("000660", "2024-01-03", 11, 13, 10, 12, 200),
+                    ("005930", "2024-01-03", 70, 72, 69, 71, 300),
+                    ("005930", "2024-01-04", 71, 73, 70, 72, 400),
+                ],
+            )
+
+    def tearDown(self):
+        from src.data.connection_manager import connection_manager
+
+        connection_manager.close_all(self.db_path)
+        self.tmp_dir.cleanup()
+
+    def test_dict_of_frames(self):
+        frames = load_panel(["005930", "000660", "999999"], "2024-01-01", "2024-12-31", db_path=self.db_path)
+        self.assertEqual(set(frames.keys()), {"005930", "000660"})
+        self.assertEqual(frames["000660"]["close"].tolist(), [11, 12])
+        self.assertEqual(str(frames["005930"].index[0].date()), "2024-01-03")
+
+    def test_aligned_array(self):
+        panel = load_panel(
+            ["005930", "000660"], "2024-01-01", "2024-01-03",
+            fields=["close", "volume"], db_path=self.db_path, as_array=True,
+        )
+        self.assertEqual(panel.values.shape, (2, 2, 2))
+        closes = panel.field("close")
+        self.assertTrue(np.isnan(closes.loc["2024-01-02", "005930"]))
+        self.assertEqual(closes.loc["2024-01-03", "000660"], 12)
+
+
+if __name__ == "__main__":
+    unittest.main()
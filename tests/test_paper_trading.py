@@ -0,0 +1,100 @@
+import os
+import tempfile
+import time
+import unittest
+
+from src.strategies import RSIStrategy
+from src.trading.order_manager import OrderStatus
+from src.trading.paper_trading import (
+    FID_FILL_PRICE,
+    FID_FILL_QUANTITY,
+    FID_ORDER_STATUS,
+    STATUS_FILLED,
+    STATUS_REJECTED,
+    LatencyHistogram,
+    MarketReplayServer,
+    PaperTradingSession,
+    SimulatedBroker,
+    load_recorded_ticks,
+    save_ticks,
+    synthetic_ticks,
+)
+
+SYMBOLS = [f"{i:06d}" for i in range(8)]
+
+
+class TestPaperTradingComponents(unittest.TestCase):
+    def test_broker_histogram_and_recorded_ticks(self):
+        broker = SimulatedBroker()
+        rejected = broker.submit({"order_id": "1", "symbol": "005930", "side": "BUY", "quantity": 10})
+        self.assertEqual(rejected[0]["values"][FID_ORDER_STATUS], STATUS_REJECTED)
+
+        broker.on_tick("005930", 70000.0, 32400)
+        fill = broker.submit({"order_id": "2", "symbol": "005930", "side": "BUY", "quantity": 10})[0]["values"]
+        self.assertEqual((fill[FID_ORDER_STATUS], fill[FID_FILL_PRICE], fill[FID_FILL_QUANTITY]), (STATUS_FILLED, "70000.0", "10"))
+
+        limit = {"order_id": "3", "symbol": "005930", "side": "SELL", "order_type": "LIMIT", "quantity": 5, "price": 70500.0}
+        self.assertEqual(broker.submit(limit), [])
+        self.assertEqual(broker.on_tick("005930", 70400.0, 32401), [])
+        fills = broker.on_tick("005930", 70600.0, 32402)
+        self.assertEqual([f["values"][FID_FILL_PRICE] for f in fills], ["70500.0"])
+        self.assertEqual(broker.stats, {"orders": 3, "filled": 2, "rejected": 1})
+
+        histogram = LatencyHistogram("test")
+        for ms in range(1, 101):
+            histogram.record(ms / 1000)
+        summary = histogram.summary()
+        self.assertEqual(summary["count"], 100)
+        self.assertAlmostEqual(summary["mean_ms"], 50.5)
+        # 로그 구간(10배당 10칸, 약 26%) 상한으로 추정
+        self.assertTrue(50 <= summary["p50_ms"] <= 50 * 1.26)
+        self.assertTrue(99 <= summary["p99_ms"] <= 100)
+        self.assertEqual(summary["max_ms"], 100)
+
+        ticks = synthetic_ticks(SYMBOLS, minutes=1, ticks_per_second=5)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "ticks.csv")
+            save_ticks(ticks, path)
+            self.assertEqual(load_recorded_ticks(path), ticks)
+
+        with self.assertRaises(ValueError):
+            MarketReplayServer(ticks, speed=5000)
+
+
+class TestPaperTradingSession(unittest.IsolatedAsyncioTestCase):
+    async def test_replay_end_to_end(self):
+        minutes, speed = 30, 1000
+        ticks = synthetic_ticks(SYMBOLS, minutes=minutes, ticks_per_second=20, volatility=0.004, seed=2)
+
+        async with MarketReplayServer(ticks, speed=speed) as server:
+            session = PaperTradingSession(server.url, [RSIStrategy()])
+            start = time.perf_counter()
+            report = await session.run(SYMBOLS, timeout=20)
+            elapsed = time.perf_counter() - start
+
+        self.assertTrue(server.finished.is_set())
+        self.assertGreaterEqual(elapsed, (ticks[-1].ts - ticks[0].ts) / speed)
+
+        stats = report["session"]
+        self.assertEqual(stats["ticks"], len(ticks))
+        self.assertEqual(stats["bars"], len(SYMBOLS) * minutes)
+        self.assertGreater(stats["orders"], 0)
+        self.assertEqual(stats["orders"], stats["fills"] + stats["rejected"])
+        self.assertEqual(server.broker.stats["orders"], stats["orders"])
+
+        # 단계별 지연: 틱마다 feed, 주문마다 order_ack/tick_to_ack
+        latency = report["latency"]
+        self.assertEqual(latency["feed"]["count"], len(ticks))
+        self.assertEqual(latency["order_ack"]["count"], stats["orders"])
+        self.assertEqual(latency["tick_to_ack"]["count"], stats["orders"])
+        self.assertGreater(latency["signal"]["count"], 0)
+
+        filled = [o for o in session.order_manager.order_history if o.status == OrderStatus.FILLED]
+        self.assertEqual(len(filled), stats["orders"])
+        self.assertEqual(len(session.portfolio.trades), stats["fills"])
+        self.assertEqual(report["pipeline"]["frames_dropped"], 0)
+        self.assertFalse(report["pipeline"]["connected"])
+
+
+if __name__ == "__main__":
+    unittest.main()
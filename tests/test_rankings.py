@@ -0,0 +1,113 @@
+import os
+import tempfile
+import unittest
+
+import pandas as pd
+
+from src.data.connection_manager import connection_manager, get_pooled_connection
+from src.data.rankings import DailyRankingBuilder
+from src.data.stock_filter import StockFilter
+from src.data.updater import StockDataUpdater
+
+# 1/5(금) 다음 거래일은 1/8(월)
+DATES = [d.strftime("%Y-%m-%d") for d in pd.bdate_range("2024-01-02", periods=25)]
+
+# symbol: (market, 종가 함수, 거래량 함수)
+SERIES = {
+    "005930": ("KOSPI", lambda i: 100 + i, lambda i: 1000),
+    "000660": ("KOSPI", lambda i: 200 - 2 * i, lambda i: 3000 if i % 2 else 1000),
+    "035720": ("KOSDAQ", lambda i: 50 + (i % 3), lambda i: 500 * (i + 1)),
+}
+
+
+def ohlcv_rows(day_indexes):
+    rows = []
+    for symbol, (_, close, volume) in SERIES.items():
+        for i in day_indexes:
+            c = close(i)
+            rows.append((symbol, DATES[i], c, c, c, c, volume(i)))
+    return rows
+
+
+class TestDailyRankings(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp_dir.name, "trading.db")
+        self.updater = StockDataUpdater(db_path=self.db_path)
+        self.conn = get_pooled_connection(self.db_path)
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO stock_info (symbol, name, market) VALUES (?, ?, ?)",
+                [(symbol, symbol, market) for symbol, (market, _, _) in SERIES.items()],
+            )
+            self.conn.executemany(
+                "INSERT INTO stock_ohlcv (symbol, date, open, high, low, close, volume) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                ohlcv_rows(range(20)),
+            )
+        self.builder = DailyRankingBuilder(self.db_path)
+
+    def tearDown(self):
+        connection_manager.close_all(self.db_path)
+        self.tmp_dir.cleanup()
+
+    def row(self, symbol, date):
+        cursor = self.conn.execute("SELECT * FROM stock_daily_rankings WHERE symbol = ? AND date = ?", (symbol, date))
+        return dict(zip([c[0] for c in cursor.description], cursor.fetchone()))
+
+    def test_windows_and_market_ranks(self):
+        self.assertEqual(self.builder.refresh(), 20)
+
+        day = DATES[19]
+        row = self.row("035720", day)
+        self.assertAlmostEqual(row["avg_volume_5"], 500 * (16 + 17 + 18 + 19 + 20) / 5)
+        self.assertAlmostEqual(row["change_rate_5"], (50 + 19 % 3) / (50 + 14 % 3) * 100 - 100)
+        self.assertEqual(row["market"], "KOSDAQ")
+        self.assertEqual(row["avg_volume_1_rank"], 1)
+
+        # 월요일 등락률은 직전 거래일(금요일) 대비
+        monday = self.row("005930", "2024-01-08")
+        self.assertAlmostEqual(monday["change_rate_1"], 104 / 103 * 100 - 100)
+
+        kospi = self.row("000660", day)
+        self.assertEqual((kospi["avg_volume_20_rank"], kospi["change_rate_5_rank"]), (1, 2))
+        # 창보다 이력이 짧으면 값과 순위 모두 NULL
+        self.assertIsNone(kospi["change_rate_20_rank"])
+        self.assertIsNone(self.row("000660", DATES[0])["change_rate_1"])
+
+    def test_incremental_refresh_after_ingestion(self):
+        self.builder.refresh()
+        with self.conn:
+            self.conn.execute("UPDATE stock_daily_rankings SET close = -1 WHERE date = ?", (DATES[5],))
+
+        self.updater._bulk_upsert_ohlcv(ohlcv_rows(range(20, 25)))
+        result = self.updater.finalize_ingestion()
+
+        self.assertEqual(result["ranking_days"], 5)
+        self.assertEqual(self.builder.last_date(), DATES[24])
+        # 이전 날짜는 다시 계산하지 않음
+        self.assertEqual(self.row("005930", DATES[5])["close"], -1)
+        self.assertAlmostEqual(self.row("005930", DATES[24])["change_rate_1"], 124 / 123 * 100 - 100)
+
+    def test_stock_filter_screens_use_rankings(self):
+        self.builder.refresh()
+        stock_filter = StockFilter(db_path=self.db_path)
+        date = DATES[19].replace("-", "")
+
+        self.assertEqual(stock_filter.get_volume_top(3, "ALL", date=date, days_avg=20), ["035720", "000660", "005930"])
+        self.assertEqual(stock_filter.get_volume_top(3, "KOSPI", date=date, days_avg=5, min_volume=1500), ["000660"])
+        self.assertEqual(stock_filter.get_price_change_top(3, "ALL", date=date, change_type="rise"), ["035720", "005930"])
+        self.assertEqual(stock_filter.get_price_change_top(3, "ALL", date=date, change_type="fall"), ["000660"])
+        self.assertEqual(
+            stock_filter.get_price_change_top(1, "ALL", date=date, change_type="abs", days=5), ["000660"]
+        )
+
+        plan = " ".join(row[3] for row in self.conn.execute(
+            "EXPLAIN QUERY PLAN SELECT symbol FROM stock_daily_rankings "
+            "WHERE date = ? AND market = ? ORDER BY avg_volume_5_rank LIMIT 3",
+            (DATES[19], "KOSPI"),
+        ))
+        self.assertIn("idx_rankings_avg_volume_5_rank", plan)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+
+from src.utils.rate_limiter import TokenBucketRateLimiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class TestTokenBucketRateLimiter(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.limiter = TokenBucketRateLimiter(rate=2.0, burst=3, clock=self.clock, sleep=self.clock.sleep)
+
+    def test_burst_then_paced_at_rate(self):
+        waits = [self.limiter.acquire() for _ in range(5)]
+        self.assertEqual(waits[:3], [0.0, 0.0, 0.0])
+        self.assertAlmostEqual(waits[3], 0.5)
+        self.assertAlmostEqual(waits[4], 0.5)
+        self.assertAlmostEqual(self.clock.now, 1.0)
+
+    def test_error_backoff_and_recovery(self):
+        self.limiter.report_error()
+        self.assertAlmostEqual(self.limiter.rate, 1.0)
+        # 오류 후 버스트가 제거되어 바로 속도 제한
+        self.assertAlmostEqual(self.limiter.acquire(), 1.0)
+
+        for _ in range(20):
+            self.limiter.report_success()
+        self.assertAlmostEqual(self.limiter.rate, 2.0)
+
+    def test_call_reports_errors(self):
+        def failing():
+            raise RuntimeError("rate limited")
+
+        with self.assertRaises(RuntimeError):
+            self.limiter.call(failing)
+        self.assertEqual(self.limiter.get_stats()["errors"], 1)
+        self.assertEqual(self.limiter.call(lambda: 42), 42)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+import tempfile
+import unittest
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+
+from src.strategies.base_strategy import TradeSignal
+from src.trading.backtest import BacktestConfig, BacktestEngine
+from src.trading.risk_engine import EWMACovariance, RiskEngine, RiskEngineConfig
+from src.trading.risk_manager import RiskManager, RiskParams
+
+
+def random_prices(symbols, days, seed=0):
+    rng = np.random.default_rng(seed)
+    common = rng.normal(0, 0.01, size=(days, 1))
+    returns = 0.8 * common + rng.normal(0, 0.01, size=(days, len(symbols)))
+    returns[:, -1] = -common[:, 0] + rng.normal(0, 0.003, size=days)  # 마지막 종목은 음의 상관
+    prices = 10000 * np.exp(np.cumsum(returns, axis=0))
+    return pd.DataFrame(prices, index=pd.bdate_range("2024-01-02", periods=days), columns=symbols)
+
+
+class TestEWMACovariance(unittest.TestCase):
+    def test_incremental_batch_and_cache_agree(self):
+        symbols = [f"{i:06d}" for i in range(6)]
+        prices = random_prices(symbols, 120)
+        prices.iloc[10:13, 2] = np.nan  # 결측일은 감쇠만, 이후 직전 종가 대비 수익률
+
+        daily = EWMACovariance(symbols, decay=0.94, capacity=2)
+        for date, row in prices.iterrows():
+            daily.update(row.to_numpy(), date.to_pydatetime())
+
+        batch = EWMACovariance(decay=0.94)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = f"{tmp}/universe.npz"
+            self.assertEqual(batch.update_many(prices.iloc[:80]), 80)
+            batch.save(path)
+            restored = EWMACovariance.load(path)
+            # 캐시 이후 거래일만 반영
+            self.assertEqual(restored.update_many(prices), 40)
+            self.assertEqual(restored.update_many(prices), 0)
+
+        np.testing.assert_allclose(restored.matrix(), daily.matrix(), rtol=1e-10, atol=1e-14)
+        self.assertEqual((restored.observations, restored.last_date), (daily.observations, daily.last_date))
+
+        # 완전한 이력 구간은 정의식과 같음
+        returns = prices.iloc[:, :2].pct_change().dropna().to_numpy()
+        weights = 0.06 * 0.94 ** np.arange(len(returns) - 1, -1, -1)
+        expected = (returns * weights[:, None]).T @ returns / weights.sum()
+        np.testing.assert_allclose(daily.submatrix(symbols[:2]), expected, rtol=1e-10)
+
+
+class TestRiskEngine(unittest.TestCase):
+    def setUp(self):
+        self.symbols = [f"{i:06d}" for i in range(5)]
+        self.engine = RiskEngine(RiskEngineConfig(confidence=0.99, max_portfolio_var=0.02))
+        self.engine.update_from_prices(random_prices(self.symbols, 250, seed=1))
+
+    def test_var_contributions_and_position_cap(self):
+        engine, symbols = self.engine, self.symbols
+        exposures = {symbols[0]: 300_000.0, symbols[1]: 200_000.0, symbols[4]: 100_000.0}
+        cov = engine.covariance.submatrix(list(exposures))
+        values = np.array(list(exposures.values()))
+        sigma = np.sqrt(values @ cov @ values)
+        z = NormalDist().inv_cdf(0.99)
+
+        risk = engine.portfolio_risk(exposures, 1_000_000)
+        self.assertAlmostEqual(risk["var"], z * sigma)
+        self.assertAlmostEqual(risk["cvar"], sigma * NormalDist().pdf(z) / 0.01)
+        self.assertGreater(risk["cvar"], risk["var"])
+        self.assertAlmostEqual(risk["var_pct"], z * sigma / 1_000_000)
+
+        contributions = engine.risk_contributions(exposures)
+        self.assertAlmostEqual(contributions["component_var"].sum(), risk["var"])
+        self.assertAlmostEqual(contributions["share"].sum(), 1.0)
+
+        # 한도까지 추가하면 VaR가 정확히 한도, 음의 상관 종목은 양의 상관 종목보다 한도가 큼
+        correlated = engine.max_position_value(symbols[2], exposures, 1_000_000)
+        hedge = engine.max_position_value(symbols[4], exposures, 1_000_000)
+        self.assertGreater(hedge, correlated)
+        after = dict(exposures, **{symbols[2]: correlated})
+        self.assertAlmostEqual(engine.portfolio_risk(after)["var"], 0.02 * 1_000_000, places=4)
+        self.assertEqual(engine.max_position_value(symbols[2], exposures, 100_000), 0.0)
+        # 이력이 없는 종목은 기본 변동성, 상관 0
+        self.assertGreater(engine.max_position_value("999999", exposures, 1_000_000), 0.0)
+
+        manager = RiskManager(RiskParams(max_portfolio_var=0.02, max_avg_correlation=0.3), risk_engine=engine)
+        self.assertTrue(manager.check_var_limit(symbols[2], correlated * 0.99, exposures, 1_000_000))
+        self.assertFalse(manager.check_var_limit(symbols[2], correlated * 1.01, exposures, 1_000_000))
+        self.assertFalse(manager.check_correlation_risk(symbols[:4]))
+        self.assertTrue(manager.check_correlation_risk([symbols[0], symbols[4]]))
+
+    def test_backtest_caps_buys_by_var(self):
+        prices = random_prices(self.symbols, 60, seed=3)
+        data = {
+            symbol: pd.DataFrame(
+                {"open": close, "high": close * 1.001, "low": close * 0.999, "close": close, "volume": 1e9},
+                index=prices.index,
+            )
+            for symbol, close in prices.items()
+        }
+
+        class BuyAll:
+            def generate_signals(self, df, symbol):
+                ts = df.index[40]
+                return [TradeSignal(ts, symbol, "BUY", float(df["close"].iloc[40]), 1.0, "buy", {}, "LOW")]
+
+        base = dict(enable_stop_loss=False, enable_take_profit=False, position_size_method="percent")
+        unlimited = BacktestEngine(BacktestConfig(**base))
+        unlimited.run_backtest(BuyAll(), data)
+        limited = BacktestEngine(BacktestConfig(max_portfolio_var=0.01, **base))
+        results = limited.run_backtest(BuyAll(), data)
+
+        self.assertGreater(results["risk_stats"]["capped"] + results["risk_stats"]["blocked"], 0)
+        self.assertLess(sum(t.quantity * t.entry_price for t in limited.trades),
+                        sum(t.quantity * t.entry_price for t in unlimited.trades))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+import asyncio
+import json
+import unittest
+
+from src.api.stream_pipeline import MessagePipeline, PipelineConfig
+from src.api.websocket_client import WebSocketClient
+
+
+def real_frame(*entries):
+    return json.dumps({
+        "trnm": "REAL",
+        "data": [{"type": tr_type, "item": item, "values": {"10": price}} for tr_type, item, price in entries],
+    })
+
+
+class FakeSocket:
+    """수신 프레임 목록을 비동기로 돌려주는 가짜 WebSocket"""
+
+    def __init__(self, frames):
+        self.frames = frames
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for frame in self.frames:
+            yield frame
+
+
+class TestMessagePipeline(unittest.IsolatedAsyncioTestCase):
+    async def test_routes_batches_and_coalesces_prices(self):
+        pipeline = MessagePipeline(PipelineConfig(queue_size=100, batch_size=100))
+        trades, orders = [], []
+        release = asyncio.Event()
+
+        async def on_trades(events):
+            await release.wait()
+            trades.append([(e["item"], e["values"]["10"]) for e in events])
+
+        pipeline.add_handler("0B", on_trades, policy="coalesce")
+        pipeline.add_handler("00", lambda events: orders.extend(events))
+
+        async with pipeline:
+            # 첫 배치가 핸들러에서 막혀 있는 동안 같은 종목 시세가 병합되어야 함
+            await pipeline.put(real_frame(("0B", "005930", 1)))
+            await asyncio.sleep(0.01)
+            for price in range(2, 6):
+                await pipeline.put(real_frame(("0B", "005930", price), ("0B", "000660", price * 10)))
+            await pipeline.put(real_frame(("00", "005930", 0)))
+            await pipeline.put("{not json")
+            await asyncio.sleep(0.01)
+            release.set()
+
+        self.assertEqual(trades, [[("005930", 1)], [("005930", 5), ("000660", 50)]])
+        self.assertEqual(len(orders), 1)
+        m = pipeline.metrics()
+        self.assertEqual(m["frames_received"], 7)
+        self.assertEqual(m["events_coalesced"], 6)
+        self.assertEqual(m["decode_errors"], 1)
+        self.assertEqual(m["queue_depth"], 0)
+
+    async def test_frame_queue_drops_oldest_when_full(self):
+        pipeline = MessagePipeline(PipelineConfig(queue_size=3, frame_policy="drop_oldest"))
+        received = []
+        pipeline.add_handler("0B", lambda events: received.extend(e["values"]["10"] for e in events))
+        # 작업자 시작 전 투입하여 큐를 가득 채움
+        for price in range(5):
+            await pipeline.put(real_frame(("0B", "005930", price)))
+        async with pipeline:
+            pass
+        self.assertEqual(received, [2, 3, 4])
+        self.assertEqual(pipeline.metrics()["frames_dropped"], 2)
+
+    async def test_default_policies_never_drop(self):
+        pipeline = MessagePipeline(PipelineConfig(queue_size=2, max_pending=1))
+        orders = []
+        pipeline.add_handler("00", lambda events: orders.extend(e["values"]["10"] for e in events))
+        for price in range(2):
+            await pipeline.put(real_frame(("00", "005930", price)))
+        # 기본(block) 프레임 큐는 가득 차면 드롭 대신 대기
+        blocked = asyncio.ensure_future(pipeline.put(real_frame(("00", "005930", 2))))
+        await asyncio.sleep(0.01)
+        self.assertFalse(blocked.done())
+        async with pipeline:
+            await blocked
+            for price in range(3, 20):
+                await pipeline.put(real_frame(("00", "005930", price)))
+        self.assertEqual(orders, list(range(20)))
+        m = pipeline.metrics()
+        self.assertEqual(m["frames_dropped"] + m["events_dropped"], 0)
+
+    async def test_client_receive_loop_uses_pipeline(self):
+        client = WebSocketClient()
+        received = []
+
+        async def on_message(message):
+            received.append(message)
+
+        client.set_on_message(on_message)
+        client.ws = FakeSocket([real_frame(("0B", "005930", 1), ("0B", "000660", 2)), json.dumps({"trnm": "REG"})])
+        await client.receive_messages()
+
+        self.assertEqual([m.get("item", m.get("trnm")) for m in received], ["005930", "000660", "REG"])
+        self.assertEqual(client.metrics()["events_dispatched"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import pandas as pd
+
+from src.data.connection_manager import connection_manager, get_pooled_connection
+from src.data.updater import StockDataUpdater
+
+NAMES = pd.Series({"005930": "삼성전자", "000660": "SK하이닉스", "035720": "카카오", "091990": "셀트리온헬스케어"})
+KOSPI = ["005930", "000660"]
+
+
+class TestSymbolInfoBulkRefresh(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp_dir.name, "trading.db")
+        self.source = mock.Mock()
+        self.source.get_market_ticker_and_name.return_value = NAMES
+        self.source.get_market_ticker_list.side_effect = lambda date, market="ALL": KOSPI if market == "KOSPI" else list(NAMES.index)
+        self.updater = StockDataUpdater(db_path=self.db_path, data_source=self.source)
+        self.conn = get_pooled_connection(self.db_path)
+
+        # 업종 CSV는 KRX 형식(cp949, 앞자리 0 생략된 종목코드)
+        self.kospi_csv = os.path.join(self.tmp_dir.name, "kospi.csv")
+        self.kosdaq_csv = os.path.join(self.tmp_dir.name, "kosdaq.csv")
+        pd.DataFrame({"종목코드": ["5930"], "업종명": ["전기전자"]}).to_csv(self.kospi_csv, index=False, encoding="cp949")
+        pd.DataFrame({"종목코드": ["35720"], "업종명": ["서비스업"]}).to_csv(self.kosdaq_csv, index=False, encoding="cp949")
+
+    def tearDown(self):
+        connection_manager.close_all(self.db_path)
+        self.tmp_dir.cleanup()
+
+    def refresh(self):
+        return self.updater.update_all_symbol_info_with_krx(self.kospi_csv, self.kosdaq_csv)
+
+    def test_single_bulk_upsert_with_name_and_market_mapping(self):
+        with self.conn:
+            self.conn.execute(
+                "INSERT INTO stock_info (symbol, name, market, sector, market_cap) VALUES ('000660', '하이닉스', 'KOSPI', '', 123)"
+            )
+
+        with mock.patch.object(self.updater, "_save_symbol_info_bulk", wraps=self.updater._save_symbol_info_bulk) as save:
+            merged = self.refresh()
+        save.assert_called_once()
+        self.assertEqual(len(merged), 4)
+        # 종목명은 시장 전체 1회 조회, 종목별 조회 없음
+        self.source.get_market_ticker_and_name.assert_called_once()
+        self.source.get_market_ticker_name.assert_not_called()
+
+        rows = {
+            row[0]: row[1:]
+            for row in self.conn.execute("SELECT symbol, name, market, sector, market_cap FROM stock_info")
+        }
+        self.assertEqual(rows, {
+            "005930": ("삼성전자", "KOSPI", "전기전자", None),
+            "000660": ("SK하이닉스", "KOSPI", "", 123),  # UPSERT라 시가총액 보존
+            "035720": ("카카오", "KOSDAQ", "서비스업", None),
+            "091990": ("셀트리온헬스케어", "KOSDAQ", "", None),
+        })
+
+        # 바뀐 내용이 없으면 저장하지 않고, 바뀐 종목만 다시 저장
+        self.assertEqual(self.updater._save_symbol_info_bulk(merged), 0)
+        self.source.get_market_ticker_and_name.return_value = NAMES.replace("카카오", "카카오(주)")
+        saved = []
+        save_bulk = self.updater._save_symbol_info_bulk
+        with mock.patch.object(self.updater, "_save_symbol_info_bulk", side_effect=lambda df: saved.append(save_bulk(df))):
+            self.refresh()
+        self.assertEqual(saved, [1])
+        self.assertEqual(
+            self.conn.execute("SELECT name FROM stock_info WHERE symbol = '035720'").fetchone()[0], "카카오(주)"
+        )
+
+    def test_fallback_fetches_only_uncached_names(self):
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO stock_info (symbol, name, market) VALUES (?, ?, ?)",
+                [("005930", "삼성전자", "KOSPI"), ("000660", "SK하이닉스", "KOSPI")],
+            )
+        self.source.get_market_ticker_and_name.side_effect = AttributeError("지원하지 않는 pykrx 버전")
+        self.source.get_market_ticker_name.side_effect = lambda ticker: NAMES[ticker]
+
+        merged = self.refresh()
+        self.assertEqual(dict(zip(merged["symbol"], merged["name"])), NAMES.to_dict())
+        self.assertEqual(
+            sorted(call.args[0] for call in self.source.get_market_ticker_name.call_args_list), ["035720", "091990"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from src.data.connection_manager import connection_manager
+from src.data.trading_calendar import (
+    TradingCalendar,
+    TradingDayIndex,
+    day_number_to_str,
+    get_trading_day_index,
+    lookback_start_date,
+    reset_trading_day_index,
+    to_day_number,
+)
+from src.data.updater import StockDataUpdater
+
+HOLIDAYS = ["20240101", "20240209", "20240212"]
+
+
+class TestTradingDayIndex(unittest.TestCase):
+    def setUp(self):
+        # 1/2~1/31 적재, 1/15(월)는 임시 휴장으로 적재되지 않음
+        observed = [d for d in np.arange("2024-01-02", "2024-02-01", dtype="datetime64[D]")
+                    if np.is_busday(d) and str(d) != "2024-01-15"]
+        self.index = TradingDayIndex(observed, holidays=HOLIDAYS, rule_end="20241231")
+
+    def test_lookup_uses_observed_days_then_calendar_rule(self):
+        self.assertTrue(self.index.is_trading_day("20240102"))
+        self.assertFalse(self.index.is_trading_day("2024-01-06"))
+        self.assertFalse(self.index.is_trading_day("20240115"))
+        # 적재 구간 밖은 달력 규칙
+        self.assertTrue(self.index.is_trading_day("20240208"))
+        self.assertFalse(self.index.is_trading_day("20240209"))
+        self.assertFalse(self.index.is_trading_day("20240101"))
+        self.assertFalse(self.index.is_observed("20240208"))
+        np.testing.assert_array_equal(
+            self.index.contains(["20240112", "20240113", "20240115", "20240116"]), [True, False, False, True]
+        )
+
+    def test_offsets_and_ranges(self):
+        def offset(date, n):
+            return day_number_to_str(self.index.offset(date, n))
+
+        self.assertEqual(offset("20240112", 1), "20240116")
+        self.assertEqual(offset("20240113", 1), "20240116")
+        self.assertEqual(offset("20240113", -1), "20240112")
+        self.assertEqual(offset("20240208", 1), "20240213")
+        self.assertEqual(offset("20240131", -3), "20240126")
+        self.assertIsNone(self.index.offset("20240115", 0))
+        self.assertIsNone(self.index.next("20241231"))
+
+        days = self.index.range("20240110", "20240119")
+        self.assertEqual([day_number_to_str(d) for d in days],
+                         ["20240110", "20240111", "20240112", "20240116", "20240117", "20240118", "20240119"])
+        self.assertEqual(day_number_to_str(self.index.latest_observed("20240210")), "20240131")
+
+    def test_observe_extends_observed_range(self):
+        self.assertEqual(self.index.observe(["2024-02-01", "2024-02-03", "2024-01-31"]), 2)
+
+        self.assertEqual(self.index.observed_last, to_day_number("20240203"))
+        # 토요일 적재분은 거래일로, 적재되지 않은 2/2(금)는 휴장으로 반영
+        self.assertTrue(self.index.is_trading_day("20240203"))
+        self.assertFalse(self.index.is_trading_day("20240202"))
+        self.assertTrue(self.index.is_trading_day("20240205"))
+
+
+class TestSharedTradingDayIndex(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp_dir.name, "trading.db")
+        self.updater = StockDataUpdater(db_path=self.db_path)
+        self.updater._bulk_upsert_ohlcv([("005930", "2024-01-02", 1, 1, 1, 1, 1)])
+        self.calendar = TradingCalendar(
+            db_path=os.path.join(self.tmp_dir.name, "calendar.db"), main_db_path=self.db_path
+        )
+
+    def tearDown(self):
+        reset_trading_day_index(self.db_path)
+        connection_manager.close_all(self.db_path)
+        connection_manager.close_all(os.path.join(self.tmp_dir.name, "calendar.db"))
+        self.tmp_dir.cleanup()
+
+    def test_index_is_shared_and_refreshed_on_ingestion(self):
+        index = get_trading_day_index(self.db_path)
+        self.assertIs(self.calendar.day_index, index)
+        self.assertTrue(self.calendar._verify_trading_day("20240102"))
+        self.assertFalse(self.calendar._verify_trading_day("20240103"))
+
+        self.updater._bulk_upsert_ohlcv([("005930", "2024-01-03", 1, 1, 1, 1, 1)])
+
+        self.assertTrue(self.calendar._verify_trading_day("20240103"))
+
+    def test_calendar_helpers(self):
+        self.assertEqual(self.calendar.get_trading_dates_range("20240208", "20240214"),
+                         ["20240208", "20240213", "20240214"])
+        self.assertEqual(self.calendar.get_previous_trading_date("20240213", 2), "20240207")
+        self.assertEqual(self.calendar.get_next_trading_date("20240208"), "20240213")
+
+    def test_lookback_start_counts_trading_days(self):
+        # 1/5(금)까지 5거래일: 1/2~1/5 + 신정 전 12/29
+        self.assertEqual(lookback_start_date(5, end="20240105", db_path=self.db_path), "2023-12-29")
+        self.assertEqual(lookback_start_date(5, end="20240106", db_path=self.db_path, fmt="%Y%m%d"), "20231229")
+        self.assertEqual(lookback_start_date(1, end="20240105", db_path=self.db_path), "2024-01-05")
+
+
+if __name__ == "__main__":
+    unittest.main()
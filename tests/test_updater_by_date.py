@@ -0,0 +1,89 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import pandas as pd
+
+from src.data.connection_manager import connection_manager, get_pooled_connection
+from src.data.updater import StockDataUpdater
+
+
+def market_frame(rows):
+    """pykrx get_market_ohlcv(date, market='ALL') 형식 (인덱스=티커)"""
+    df = pd.DataFrame(rows, columns=["티커", "시가", "고가", "저가", "종가", "거래량"]).set_index("티커")
+    return df
+
+
+class TestByDateIngestion(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp_dir.name, "trading.db")
+        self.source = mock.Mock()
+        self.updater = StockDataUpdater(db_path=self.db_path, data_source=self.source)
+        conn = get_pooled_connection(self.db_path)
+        with conn:
+            conn.executemany(
+                "INSERT INTO stock_info (symbol, name) VALUES (?, ?)",
+                [("005930", "삼성전자"), ("000660", "SK하이닉스")],
+            )
+            conn.executemany(
+                "INSERT INTO stock_ohlcv VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    ("005930", "2024-01-02", 70, 72, 69, 71, 300),
+                    ("000660", "2024-01-02", 10, 12, 9, 11, 100),
+                    ("005930", "2024-01-03", 71, 73, 70, 72, 400),
+                ],
+            )
+
+    def tearDown(self):
+        connection_manager.close_all(self.db_path)
+        self.tmp_dir.cleanup()
+
+    def test_find_missing_trading_days(self):
+        missing = self.updater.find_missing_trading_days("20240102", "20240105")
+        self.assertEqual(missing, ["20240103", "20240104", "20240105"])
+
+    def test_coverage_counts_only_listed_symbols(self):
+        conn = get_pooled_connection(self.db_path)
+        with conn:
+            # 111111: 2023-12 이후 상장폐지, 222222: 2024-01-03 신규 상장
+            conn.execute("INSERT INTO stock_info (symbol, name) VALUES ('111111', '상장폐지'), ('222222', '신규상장')")
+            conn.executemany(
+                "INSERT INTO stock_ohlcv VALUES (?, ?, 1, 1, 1, 1, 1)",
+                [("111111", f"2023-12-0{d}") for d in range(1, 6)]
+                + [(symbol, f"2023-12-0{d}") for symbol in ("005930", "000660") for d in range(1, 6)]
+                + [("222222", "2024-01-03")],
+            )
+
+        # 01-03은 상장 종목 3개 중 000660 누락, 상장폐지 종목은 이후 날짜의 분모에서 제외
+        self.assertEqual(self.updater.find_missing_trading_days("20240102", "20240103"), ["20240103"])
+        with conn:
+            conn.execute("INSERT INTO stock_ohlcv VALUES ('000660', '2024-01-03', 1, 1, 1, 1, 1)")
+        self.assertEqual(self.updater.find_missing_trading_days("20240102", "20240103"), [])
+
+    def test_fetches_each_missing_day_with_correct_date(self):
+        frames = {
+            "20240103": market_frame([("005930", 71, 73, 70, 72, 400), ("000660", 11, 13, 10, 12, 200),
+                                      ("999999", 1, 1, 1, 1, 1)]),
+            "20240104": market_frame([("005930", 72, 74, 71, 73, 500), ("000660", 0, 0, 0, 0, 0)]),
+        }
+        self.source.get_market_ohlcv.side_effect = lambda date, market: frames[date]
+
+        results = self.updater.update_missing_trading_days("20240102", "20240104")
+
+        self.assertEqual(results, {"20240103": 2, "20240104": 1})
+        self.assertEqual(self.source.get_market_ohlcv.call_count, 2)
+        rows = get_pooled_connection(self.db_path).execute(
+            "SELECT symbol, date, close FROM stock_ohlcv WHERE date >= '2024-01-03' ORDER BY date, symbol"
+        ).fetchall()
+        self.assertEqual(rows, [
+            ("000660", "2024-01-03", 12),
+            ("005930", "2024-01-03", 72),
+            ("005930", "2024-01-04", 73),
+        ])
+        self.assertEqual(self.updater.find_missing_trading_days("20240102", "20240103"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+import os
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+import pandas as pd
+
+from src.data.connection_manager import connection_manager, get_pooled_connection
+from src.data.updater import OptimizedDataUpdateConfig, StockDataUpdater
+
+
+def symbol_frame(close):
+    index = pd.DatetimeIndex(["2024-01-02", "2024-01-03"], name="날짜")
+    return pd.DataFrame(
+        {"시가": [close, close], "고가": [close + 1] * 2, "저가": [close - 1] * 2, "종가": [close, close], "거래량": [10, 20]},
+        index=index,
+    )
+
+
+class TestFetchPipeline(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp_dir.name, "trading.db")
+        config = OptimizedDataUpdateConfig(max_workers=4, requests_per_second=1000, rate_limit_burst=10, max_retries=0)
+        self.source = mock.Mock()
+        self.updater = StockDataUpdater(db_path=self.db_path, optimization_config=config, data_source=self.source)
+
+    def tearDown(self):
+        connection_manager.close_all(self.db_path)
+        self.tmp_dir.cleanup()
+
+    def test_single_writer_saves_fetched_symbols(self):
+        fetch_threads = set()
+
+        def fetch(start, end, symbol):
+            fetch_threads.add(threading.get_ident())
+            if symbol == "BAD":
+                raise RuntimeError("provider error")
+            return symbol_frame(int(symbol))
+
+        self.source.get_market_ohlcv_by_date.side_effect = fetch
+        symbols = ["000100", "000200", "000300", "BAD"]
+
+        results = self.updater.update_multiple_symbols_parallel(symbols, "2024-01-02", "2024-01-03", force_update=True)
+
+        self.assertEqual(results["results"], {"000100": True, "000200": True, "000300": True, "BAD": False})
+        self.assertNotIn(threading.get_ident(), fetch_threads)
+        rows = get_pooled_connection(self.db_path).execute(
+            "SELECT symbol, COUNT(*), MAX(close) FROM stock_ohlcv GROUP BY symbol ORDER BY symbol"
+        ).fetchall()
+        self.assertEqual(rows, [("000100", 2, 100), ("000200", 2, 200), ("000300", 2, 300)])
+        self.assertEqual(results["batch_stats"]["api_calls"], 3)
+
+    def test_symbol_saved_only_when_all_ranges_pass(self):
+        ranges = [("20240102", "20240103"), ("20240104", "20240105")]
+        self.source.get_market_ohlcv_by_date.side_effect = (
+            lambda start, end, symbol: symbol_frame(100) if start == "20240102" or symbol == "000200" else pd.DataFrame()
+        )
+
+        with mock.patch.object(self.updater, "_symbol_fetch_ranges", return_value=ranges):
+            results = self.updater._run_fetch_pipeline(["000100", "000200"], None, None, force_update=False)
+
+        self.assertEqual(results, {"000100": False, "000200": True})
+        symbols = get_pooled_connection(self.db_path).execute("SELECT DISTINCT symbol FROM stock_ohlcv").fetchall()
+        self.assertEqual(symbols, [("000200",)])
+
+    def test_writer_error_does_not_block_fetch_threads(self):
+        self.updater.optimization_config.fetch_queue_size = 1
+        self.updater.optimization_config.progress_callback = mock.Mock(side_effect=RuntimeError("callback error"))
+        self.source.get_market_ohlcv_by_date.side_effect = lambda start, end, symbol: symbol_frame(100)
+        symbols = [f"{i:06d}" for i in range(50)]
+        errors = []
+
+        def run():
+            try:
+                self.updater._run_fetch_pipeline(symbols, "2024-01-02", "2024-01-03", force_update=True)
+            except RuntimeError as e:
+                errors.append(e)
+
+        worker = threading.Thread(target=run, daemon=True)
+        worker.start()
+        worker.join(timeout=10)
+        self.assertFalse(worker.is_alive())
+        self.assertEqual(len(errors), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
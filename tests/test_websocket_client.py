@@ -0,0 +1,160 @@
+import asyncio
+import json
+import socket
+import time
+import unittest
+
+import websockets
+
+from src.api.auth import TokenCache
+from src.api.websocket_client import ReconnectPolicy, WebSocketClient
+
+SYMBOLS = [f"{i:06d}" for i in range(250)]
+
+
+def real_frame(item, price):
+    return json.dumps({"trnm": "REAL", "data": [{"type": "0B", "item": item, "values": {"10": price}}]})
+
+
+class FakeTokenServer:
+    """발급 횟수를 세는 토큰 발급 함수"""
+
+    def __init__(self, ttl=3600):
+        self.calls = 0
+        self.ttl = ttl
+
+    def __call__(self):
+        self.calls += 1
+        expires = time.strftime("%Y%m%d%H%M%S", time.localtime(time.time() + self.ttl))
+        return {"token": f"token-{self.calls}", "expires_dt": expires}
+
+
+class LocalFeedServer:
+    """연결마다 scenario(connection_index, ws)를 실행하는 로컬 WebSocket 서버"""
+
+    def __init__(self, scenario):
+        self.scenario = scenario
+        self.connections = []  # 연결별 (authorization 헤더, 수신 메시지 목록)
+
+    async def __aenter__(self):
+        self.server = await websockets.serve(self._handle, "127.0.0.1", 0)
+        self.url = f"ws://127.0.0.1:{self.server.sockets[0].getsockname()[1]}"
+        return self
+
+    async def __aexit__(self, *exc):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def _handle(self, ws):
+        received = []
+        self.connections.append((ws.request.headers.get("authorization"), received))
+        index = len(self.connections)
+
+        async def read(count):
+            while len(received) < count:
+                received.append(json.loads(await ws.recv()))
+
+        try:
+            await self.scenario(index, ws, read)
+            await ws.wait_closed()
+        except websockets.exceptions.ConnectionClosed:
+            pass
+
+
+class TestWebSocketReconnect(unittest.IsolatedAsyncioTestCase):
+    def make_client(self, url, tokens, **policy):
+        policy = {"initial_delay": 0.01, "jitter": 0.0, "stale_timeout": None, **policy}
+        return WebSocketClient(url=url, reconnect=ReconnectPolicy(**policy), token_cache=TokenCache(tokens))
+
+    async def test_reconnects_replays_subscriptions_and_survives_flood(self):
+        flood = 5000
+
+        async def scenario(index, ws, read):
+            await read(3)  # 250종목 구독 = 100 + 100 + 50
+            if index == 1:
+                for i in range(3):
+                    await ws.send(real_frame(SYMBOLS[i], i))
+                await ws.send(json.dumps({"trnm": "PING"}))
+                await read(4)
+                ws.transport.abort()  # 비정상 끊김
+            else:
+                for i in range(flood):
+                    await ws.send(real_frame(SYMBOLS[i % len(SYMBOLS)], i))
+
+        tokens = FakeTokenServer()
+        async with LocalFeedServer(scenario) as server:
+            client = self.make_client(server.url, tokens)
+            received = []
+
+            async def on_trades(events):
+                received.extend(events)
+                if len(received) == flood + 3:
+                    await client.disconnect()
+
+            client.add_handler("0B", on_trades)
+            await client.subscribe(["0B"], SYMBOLS)
+            await asyncio.wait_for(client.run_forever(), 10)
+
+        self.assertEqual(len(server.connections), 2)
+        self.assertEqual(tokens.calls, 1)
+        for auth, messages in server.connections:
+            self.assertEqual(auth, "Bearer token-1")
+            subscriptions = [m for m in messages if "tr_type" in m]
+            self.assertEqual([len(m["items"]) for m in subscriptions], [100, 100, 50])
+            self.assertEqual(sum((m["items"] for m in subscriptions), []), SYMBOLS)
+        self.assertEqual(server.connections[0][1][3], {"trnm": "PING"})
+        self.assertEqual(len(received), flood + 3)
+        metrics = client.metrics()
+        self.assertEqual(metrics["connects"], 2)
+        self.assertEqual(metrics["reconnects"], 1)
+        self.assertFalse(metrics["connected"])
+
+    async def test_stale_connection_is_replaced(self):
+        async def scenario(index, ws, read):
+            await read(1)
+            if index == 2:
+                await ws.send(real_frame("005930", 1))
+            # 그 외에는 아무것도 보내지 않는 멈춘 피드
+
+        async with LocalFeedServer(scenario) as server:
+            client = self.make_client(server.url, FakeTokenServer(), stale_timeout=0.1)
+
+            async def on_trades(events):
+                await client.disconnect()
+
+            client.add_handler("0B", on_trades)
+            await client.subscribe(["0B"], ["005930"])
+            await asyncio.wait_for(client.run_forever(), 5)
+
+        self.assertEqual(len(server.connections), 2)
+        self.assertEqual(client.metrics()["stale_disconnects"], 1)
+
+    async def test_gives_up_after_max_attempts(self):
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        client = self.make_client(f"ws://127.0.0.1:{port}", FakeTokenServer(), max_attempts=2)
+        with self.assertRaises(ConnectionError):
+            await asyncio.wait_for(client.run_forever(), 5)
+        self.assertEqual(client.metrics()["reconnects"], 2)
+
+    def test_backoff_and_token_cache(self):
+        policy = ReconnectPolicy(initial_delay=1, max_delay=5, jitter=0.5)
+        delays = [policy.delay(attempt) for attempt in range(1, 6)]
+        for delay, base in zip(delays, [1, 2, 4, 5, 5]):
+            self.assertTrue(base * 0.5 <= delay <= base)
+
+        tokens = FakeTokenServer(ttl=3600)
+        cache = TokenCache(tokens, refresh_margin=60)
+        self.assertEqual(cache.get(), "token-1")
+        self.assertEqual(cache.get(), "token-1")
+        cache.invalidate()
+        self.assertEqual(cache.get(), "token-2")
+        # 만료 여유 시간 안으로 들어오면 재발급
+        tokens.ttl = 30
+        self.assertEqual(cache.get(force_refresh=True), "token-3")
+        self.assertEqual(cache.get(), "token-4")
+
+
+if __name__ == "__main__":
+    unittest.main()